@@ -12,8 +12,22 @@ import asyncio
 from typing import Any, Protocol
 from loguru import logger
 
+from kickai.core.config import get_settings
 from kickai.core.context_types import create_context_from_telegram_message
 from kickai.core.enums import ChatType
+from kickai.core.monitoring import runtime_metrics
+from kickai.core.exceptions import (
+    DeadlineExceededError,
+    DependencyUnavailableError,
+    TokenBudgetExceededError,
+)
+from kickai.core.resilience import (
+    FIRESTORE_DEPENDENCY,
+    find_resilience_error,
+    get_dependency_guard,
+    remaining_seconds,
+    request_deadline,
+)
 from kickai.core.types import (
     AgentResponse,
     TelegramMessage,
@@ -26,6 +40,7 @@ from kickai.agents.utils.command_analyzer import CommandAnalyzer
 from kickai.agents.utils.welcome_message_builder import WelcomeMessageBuilder
 from kickai.agents.utils.invite_processor import InviteProcessor
 from kickai.agents.utils.user_registration_checker import UserRegistrationChecker
+from kickai.agents.utils.admission_scheduler import classify_priority
 from kickai.agents.utils.resource_manager import ResourceManager
 
 # Import configuration
@@ -63,7 +78,8 @@ class AgenticMessageRouter:
         self, 
         team_id: str, 
         crewai_system=None, 
-        resource_manager: ResourceManager | None = None
+        resource_manager: ResourceManager | None = None,
+        crew_lifecycle_manager=None,
     ) -> None:
         """
         Initialize the agentic message router.
@@ -72,6 +88,7 @@ class AgenticMessageRouter:
             team_id: Team identifier
             crewai_system: Optional CrewAI system instance
             resource_manager: Optional resource manager for dependency injection
+            crew_lifecycle_manager: Optional crew lifecycle manager (defaults to the global one)
         """
         try:
             # Input validation using utility functions
@@ -87,7 +104,7 @@ class AgenticMessageRouter:
             self.crewai_system = crewai_system
             
             # Lazy initialization to avoid circular dependencies
-            self._crew_lifecycle_manager = None
+            self._crew_lifecycle_manager = crew_lifecycle_manager
 
             # Initialize state tracking for better error handling
             self._last_telegram_id: int | None = None
@@ -144,31 +161,59 @@ class AgenticMessageRouter:
                 ))
                 return self._create_error_response("Invalid message format", "Invalid message type")
 
+            chat_type = getattr(message.chat_type, "value", message.chat_type)
+            runtime_metrics.MESSAGES_RECEIVED.inc(self.team_id, chat_type)
+
             # Resource management
             request_token = self._resource_manager.add_request()
+            admitted = False
             
             try:
                 # Check rate limits
                 if self._resource_manager.check_rate_limit(message.telegram_id):
+                    runtime_metrics.ROUTING_PATHS.inc(self.team_id, runtime_metrics.PATH_RATE_LIMITED)
                     return self._create_error_response(
                         ERROR_MESSAGES["RATE_LIMIT_MESSAGE"], 
                         "Rate limit exceeded"
                     )
 
-                # Acquire semaphore for concurrent request limiting
-                if not await self._resource_manager.acquire_semaphore():
+                # Wait for a slot in the shared admission scheduler
+                priority = classify_priority(message.chat_type, message.text)
+                admitted = await self._resource_manager.acquire_semaphore(self.team_id, priority)
+                if not admitted:
+                    runtime_metrics.ROUTING_PATHS.inc(self.team_id, runtime_metrics.PATH_ADMISSION_REJECTED)
                     return self._create_error_response(
-                        ERROR_MESSAGES["CONCURRENT_LIMIT_MESSAGE"], 
+                        ERROR_MESSAGES["ADMISSION_TIMEOUT_MESSAGE"].format(
+                            seconds=self._resource_manager.scheduler.queue_timeout(priority)
+                        ),
                         "Concurrent limit exceeded"
                     )
 
-                # Process the message
-                return await self._process_message(message)
+                # Fail fast while Firestore's circuit breaker is open
+                if not get_dependency_guard(FIRESTORE_DEPENDENCY).is_available():
+                    runtime_metrics.ROUTING_PATHS.inc(self.team_id, runtime_metrics.PATH_DEPENDENCY_UNAVAILABLE)
+                    return self._create_resilience_response(
+                        DependencyUnavailableError(FIRESTORE_DEPENDENCY, "circuit breaker open")
+                    )
+
+                # Process the message; every Firestore and tool call made for it shares one deadline
+                deadline_seconds = get_settings().request_deadline_seconds
+                with request_deadline(deadline_seconds):
+                    try:
+                        return await asyncio.wait_for(
+                            self._process_message(message), timeout=remaining_seconds()
+                        )
+                    except asyncio.TimeoutError:
+                        runtime_metrics.ROUTING_PATHS.inc(self.team_id, runtime_metrics.PATH_DEADLINE_EXCEEDED)
+                        return self._create_resilience_response(
+                            DeadlineExceededError("message processing", deadline_seconds)
+                        )
                 
             finally:
                 # Cleanup
                 self._resource_manager.remove_request(request_token)
-                self._resource_manager.release_semaphore()
+                if admitted:
+                    self._resource_manager.release_semaphore()
                 
         except Exception as e:
             logger.error(f"❌ Error in route_message: {e}")
@@ -205,6 +250,9 @@ class AgenticMessageRouter:
             requires_nlp = CommandAnalyzer.requires_nlp_processing(
                 message.text, context.chat_type
             )
+            runtime_metrics.ROUTING_PATHS.inc(
+                self.team_id, runtime_metrics.PATH_NLP if requires_nlp else runtime_metrics.PATH_COMMAND
+            )
 
             # All message processing, whether NLP or command-based,
             # now goes through a unified crew task execution flow.
@@ -212,6 +260,9 @@ class AgenticMessageRouter:
                 
         except Exception as e:
             logger.error(f"❌ Error in _process_message: {e}")
+            resilience_error = find_resilience_error(e)
+            if resilience_error is not None:
+                return self._create_resilience_response(resilience_error)
             return self._create_error_response("Message processing failed", str(e))
 
     async def _execute_crew_task(self, context: Any, user_flow_type: UserFlowType) -> AgentResponse:
@@ -232,6 +283,11 @@ class AgenticMessageRouter:
         try:
             # Create minimal execution context following CrewAI best practices
             from kickai.agents.utils.context_optimizer import ContextOptimizer
+            from kickai.agents.utils.memory_manager import get_memory_manager
+
+            # Restore the user's conversation summaries after a restart (lazy, bounded)
+            memory_manager = get_memory_manager(self.team_id)
+            await memory_manager.ensure_user_loaded(context.telegram_id)
 
             execution_context = ContextOptimizer.create_minimal_context(
                 telegram_id=context.telegram_id,
@@ -240,7 +296,11 @@ class AgenticMessageRouter:
                 chat_type=context.chat_type,
                 message_text=context.message_text,
                 username=context.username, # user_flow_type is available if needed
-                is_registered=getattr(context, 'is_registered', False),
+                # The context is built before the lookup, so take registration from its result
+                is_registered=(
+                    getattr(context, 'is_registered', False)
+                    or user_flow_type == UserFlowType.REGISTERED_USER
+                ),
                 is_player=getattr(context, 'is_player', False),
                 is_team_member=getattr(context, 'is_team_member', False),
             )
@@ -251,10 +311,17 @@ class AgenticMessageRouter:
                 execution_context=execution_context
             )
 
+            memory_manager.add_conversation_summary(
+                context.telegram_id, context.message_text or "", str(result or "")
+            )
+
             return AgentResponse(success=True, message=result)
 
         except Exception as e:
             logger.error(f"❌ Error in _execute_crew_task: {e}")
+            resilience_error = find_resilience_error(e)
+            if resilience_error is not None:
+                return self._create_resilience_response(resilience_error)
             return self._create_error_response("Crew task execution failed", str(e))
 
     async def route_contact_share(self, message: TelegramMessage) -> AgentResponse:
@@ -268,15 +335,16 @@ class AgenticMessageRouter:
             AgentResponse with contact processing result
         """
         try:
-            # Validate contact data
-            if not message.contact:
+            # Validate contact data (raw Telegram contact or pre-extracted phone)
+            contact = getattr(message, "contact", None)
+            if not contact and not message.contact_phone:
                 return self._create_error_response(
                     ERROR_MESSAGES["NO_CONTACT_INFO"], 
                     "Missing contact data"
                 )
 
             # Extract phone number
-            phone = message.contact.phone_number
+            phone = contact.phone_number if contact else message.contact_phone
             if not phone:
                 return self._create_error_response("No phone number in contact", "Missing phone number")
 
@@ -443,6 +511,25 @@ class AgenticMessageRouter:
                 "team_id": self.team_id,
             }
 
+    def _create_resilience_response(self, error: Exception) -> AgentResponse:
+        """
+        Create the fail-fast reply for a dependency that is unavailable or too slow.
+
+        Args:
+            error: DependencyUnavailableError (including TokenBudgetExceededError) or DeadlineExceededError
+
+        Returns:
+            AgentResponse with a user-friendly message
+        """
+        if isinstance(error, TokenBudgetExceededError):
+            message = ERROR_MESSAGES["TOKEN_BUDGET_EXCEEDED_MESSAGE"]
+        elif isinstance(error, DeadlineExceededError):
+            message = ERROR_MESSAGES["DEADLINE_EXCEEDED_MESSAGE"]
+        else:
+            message = ERROR_MESSAGES["DEPENDENCY_UNAVAILABLE_MESSAGE"]
+        logger.warning(f"🛑 Failing fast for team {self.team_id}: {error}")
+        return self._create_error_response(message, str(error))
+
     def _create_error_response(self, message: str, error: str) -> AgentResponse:
         """
         Create a standardized error response.
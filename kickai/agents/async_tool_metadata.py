@@ -17,6 +17,8 @@ from typing import Any, Protocol
 
 from loguru import logger
 
+from kickai.agents.tool_guard import guard_tool_function
+from kickai.agents.tool_memo import is_read_only_tool, memoize_tool_function
 from kickai.core.enums import ChatType
 
 
@@ -33,6 +35,7 @@ class AsyncToolMetadata:
         "telegram_id", "team_id", "username", "chat_type"
     ])
     tool_specific_params: list[str] = field(default_factory=list)
+    read_only: bool = False  # Memoizable within a crew run (see kickai.agents.tool_memo)
 
 
 class AsyncToolProtocol(Protocol):
@@ -82,6 +85,11 @@ class AsyncToolRegistry:
                 logger.error(f"❌ ARCHITECTURE VIOLATION: Tool {tool_name} is not async - ALL tools must be async in 2025 architecture")
                 raise ValueError(f"Tool {tool_name} must be async - sync tools are no longer supported")
 
+            if hasattr(tool_func, 'func'):
+                tool_func.func = memoize_tool_function(tool_name, guard_tool_function(tool_name, actual_func))
+            else:
+                tool_func = memoize_tool_function(tool_name, guard_tool_function(tool_name, tool_func))
+
             self.tools[tool_name] = tool_func
             self.metadata[tool_name] = self._extract_metadata(tool_func, tool_name, actual_func)
             # is_async is always True now - no need to set it
@@ -122,14 +130,16 @@ class AsyncToolRegistry:
                 description=description,
                 use_cases=use_cases,
                 permissions=permissions,
-                tool_specific_params=tool_specific_params
+                tool_specific_params=tool_specific_params,
+                read_only=is_read_only_tool(tool_name),
             )
 
         except Exception as e:
             logger.warning(f"⚠️ Failed to extract metadata for {tool_name}: {e}")
             return AsyncToolMetadata(
                 name=tool_name,
-                description=f"Tool: {tool_name}"
+                description=f"Tool: {tool_name}",
+                read_only=is_read_only_tool(tool_name),
             )
 
     def _extract_use_cases(self, docstring: str) -> list[str]:
@@ -286,6 +296,7 @@ class AsyncToolRegistry:
             "async_tools": async_tools,
             "sync_tools": 0,  # Always 0 - sync tools not supported
             "tools_with_metadata": len(self.metadata),
+            "read_only_tools": sum(1 for meta in self.metadata.values() if meta.read_only),
             "tools_by_permission": self._count_tools_by_permission(),
             "architecture": "100% async"
         }
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Configuration for adaptive agent iteration budgets.
+
+Each request is classified from its slash command into a task class, and the
+class caps how many iterations (LLM turns) every agent in the crew may spend
+on it. Natural language and unlisted commands keep each agent's configured
+``max_iterations``. Once enough runs of a classed intent have been observed,
+its budget is tightened to what those runs actually needed.
+"""
+
+# TASK CLASSES
+TASK_CLASS_SIMPLE = "simple"  # one read whose tool output is the reply
+TASK_CLASS_LOOKUP = "lookup"  # a listing or search, tool output is the reply
+TASK_CLASS_ACTION = "action"  # a write, possibly after a read or a help lookup
+TASK_CLASS_OPEN = "open"  # natural language and anything unclassified
+
+# Slash command -> task class (covers every command in COMMAND_INTENT_TOOLS)
+COMMAND_TASK_CLASSES = {
+    "/help": TASK_CLASS_SIMPLE,
+    "/ping": TASK_CLASS_SIMPLE,
+    "/version": TASK_CLASS_SIMPLE,
+    "/usage": TASK_CLASS_SIMPLE,
+    "/myinfo": TASK_CLASS_SIMPLE,
+    "/info": TASK_CLASS_SIMPLE,
+    "/status": TASK_CLASS_SIMPLE,
+    "/list": TASK_CLASS_LOOKUP,
+    "/pending": TASK_CLASS_LOOKUP,
+    "/matches": TASK_CLASS_LOOKUP,
+    "/update": TASK_CLASS_ACTION,
+    "/addplayer": TASK_CLASS_ACTION,
+    "/addmember": TASK_CLASS_ACTION,
+    "/approve": TASK_CLASS_ACTION,
+    "/announce": TASK_CLASS_ACTION,
+    "/poll": TASK_CLASS_ACTION,
+    "/availability": TASK_CLASS_ACTION,
+    "/attendance": TASK_CLASS_ACTION,
+    "/squad": TASK_CLASS_OPEN,
+}
+
+# Iterations per agent for each class (None keeps the agent's max_iterations).
+# The manager needs two: one delegation and its final answer.
+TASK_CLASS_ITERATION_BUDGETS = {
+    TASK_CLASS_SIMPLE: 2,
+    TASK_CLASS_LOOKUP: 3,
+    TASK_CLASS_ACTION: 5,
+    TASK_CLASS_OPEN: None,
+}
+
+# Classes whose tool output goes to the user as is, so the tool call ends the agent's turn
+FINAL_ANSWER_TASK_CLASSES = {TASK_CLASS_SIMPLE, TASK_CLASS_LOOKUP}
+
+# TUNING FROM OBSERVED RUNS
+ITERATION_HISTORY_SIZE = 200  # runs kept per intent
+ITERATION_MIN_SAMPLES = 20  # runs before an intent's budget is tuned
+ITERATION_TUNING_PERCENTILE = 0.95
+ITERATION_BUDGET_HEADROOM = 1  # iterations allowed above the observed percentile
+ITERATION_MIN_BUDGET = 2
+
+# Intent labels besides the slash commands (keeps metric labels bounded)
+NATURAL_LANGUAGE_INTENT = "natural_language"
+UNKNOWN_COMMAND_INTENT = "unknown_command"
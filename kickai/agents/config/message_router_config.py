@@ -14,6 +14,25 @@ DEFAULT_RETRY_ATTEMPTS = 3
 DEFAULT_RETRY_DELAY = 0.1
 DEFAULT_EXPONENTIAL_BACKOFF_FACTOR = 2
 RATE_LIMIT_WINDOW_SECONDS = 60
+RATE_LIMITER_MAX_TRACKED_USERS = 10_000  # least recently seen users are evicted beyond this
+
+# ADMISSION CONTROL (process-wide, shared by every team's router)
+ADMISSION_MAX_CONCURRENT = 20
+ADMISSION_MAX_QUEUE_DEPTH = 200
+ADMISSION_DEFAULT_TEAM_WEIGHT = 1.0
+# Longest a request may wait for a slot, per priority class
+ADMISSION_QUEUE_TIMEOUT_SECONDS = {
+    "leadership": 15.0,
+    "interactive": 8.0,
+    "bulk": 30.0,
+}
+# Commands admitted ahead of ordinary traffic even from the main chat
+PRIORITY_COMMANDS = {
+    "/addplayer", "/addmember", "/approve", "/approvemember", "/reject", "/rejectmember",
+    "/updateteam", "/creatematch", "/markmatchattendance",
+}
+# Fan-out or report commands admitted behind interactive traffic
+BULK_COMMANDS = {"/announce", "/remind", "/attendanceexport", "/attendancehistory", "/stats", "/performance"}
 
 # PHONE VALIDATION
 PHONE_NUMBER_MAX_LENGTH = 50
@@ -67,6 +86,10 @@ ERROR_MESSAGES = {
     "CLEANUP_ERROR": "Error cleaning up request tracker: {error}",
     "RATE_LIMIT_MESSAGE": "⏰ Too many requests. Please wait a moment and try again.",
     "CONCURRENT_LIMIT_MESSAGE": "🚦 System busy. Please try again in a moment.",
+    "ADMISSION_TIMEOUT_MESSAGE": "🚦 System busy - your request waited {seconds:.0f}s without a free slot. Please try again in a moment.",
+    "DEPENDENCY_UNAVAILABLE_MESSAGE": "🛠️ Team data is temporarily unavailable, so I can't complete this right now. Please try again in a minute.",
+    "TOKEN_BUDGET_EXCEEDED_MESSAGE": "💰 Your team has used up its AI allowance for now. Please try again later or ask an admin to check /usage.",
+    "DEADLINE_EXCEEDED_MESSAGE": "⏱️ This is taking longer than it should, so I've stopped waiting. Please try again in a moment.",
     "NO_CONTACT_INFO": "❌ No contact information found in message.",
     "NO_MATCHING_PLAYER": "No matching player record",
     "NO_NEW_MEMBERS": "No new members found in new_chat_members event",
@@ -102,12 +125,15 @@ WARNING_MESSAGES = {
     "PLAYER_LINKING_FAILED": "Failed to link player {player_name} to user {telegram_id}",
     "NO_AGENT_FOUND": "No agent found for user flow type: {user_flow_type}",
     "NO_COMMAND_AGENT_FOUND": "No command agent found for processing",
+    "ADMISSION_QUEUE_FULL": "Admission queue full ({depth} waiting), rejecting {priority} request for team {team_id}",
+    "ADMISSION_TIMEOUT": "{priority} request for team {team_id} waited {seconds:.1f}s without a slot",
 }
 
 # LOG MESSAGES
 LOG_MESSAGES = {
     "ROUTER_INITIALIZED": "AgenticMessageRouter initialized for team {team_id}",
     "RESOURCE_MANAGER_INITIALIZED": "ResourceManager initialized with max_concurrent={max_concurrent}, max_requests_per_minute={max_requests_per_minute}",
+    "ADMISSION_SCHEDULER_INITIALIZED": "AdmissionScheduler initialized with max_concurrent={max_concurrent}, max_queue_depth={max_queue_depth}",
     "MESSAGE_ROUTING": "AgenticMessageRouter: Routing message from {username} in {chat_type}",
     "NEW_CHAT_MEMBERS_DETECTED": "AgenticMessageRouter: Detected new_chat_members event",
     "COMMAND_DETECTED": "AgenticMessageRouter: Detected command: {command}",
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Configuration for per-request tool binding.
+
+Each specialist agent is configured (agents.yaml) with every tool it may ever
+need. For a given request only the tools the user is allowed to run in that
+chat, and that are relevant to the command, are bound to the agent, so the
+LLM call does not carry schemas it can never use.
+"""
+
+from kickai.core.enums import PermissionLevel
+
+# PERMISSION ORDERING (higher rank includes everything below it)
+PERMISSION_RANK = {
+    PermissionLevel.PUBLIC: 0,
+    PermissionLevel.PLAYER: 1,
+    PermissionLevel.LEADERSHIP: 2,
+    PermissionLevel.ADMIN: 3,
+    PermissionLevel.SYSTEM: 4,
+}
+
+# Minimum permission needed for a tool to be bound. Tools not listed are public.
+TOOL_PERMISSION_LEVELS = {
+    # Player-level reads and self-service updates
+    "get_player_current_info": PermissionLevel.PLAYER,
+    "get_all_players": PermissionLevel.PLAYER,
+    "get_active_players": PermissionLevel.PLAYER,
+    "get_player_match": PermissionLevel.PLAYER,
+    "list_team_members_and_players": PermissionLevel.PLAYER,
+    "update_player_field": PermissionLevel.PLAYER,
+    "update_player_multiple_fields": PermissionLevel.PLAYER,
+    "get_player_update_help": PermissionLevel.PLAYER,
+    "get_team_members": PermissionLevel.PLAYER,
+    "get_my_team_member_status": PermissionLevel.PLAYER,
+    "get_team_member_current_info": PermissionLevel.PLAYER,
+    "update_team_member_field": PermissionLevel.PLAYER,
+    "update_team_member_multiple_fields": PermissionLevel.PLAYER,
+    "get_team_member_update_help": PermissionLevel.PLAYER,
+    "send_message": PermissionLevel.PLAYER,
+    "list_matches": PermissionLevel.PLAYER,
+    "get_match_details": PermissionLevel.PLAYER,
+    "mark_availability": PermissionLevel.PLAYER,
+    "get_availability": PermissionLevel.PLAYER,
+    "get_player_availability_history": PermissionLevel.PLAYER,
+    "get_match_attendance": PermissionLevel.PLAYER,
+    "get_player_attendance_history": PermissionLevel.PLAYER,
+    # Leadership-only operations
+    "send_announcement": PermissionLevel.LEADERSHIP,
+    "send_poll": PermissionLevel.LEADERSHIP,
+    "approve_player": PermissionLevel.LEADERSHIP,
+    "approve_user": PermissionLevel.LEADERSHIP,
+    "get_pending_users": PermissionLevel.LEADERSHIP,
+    "add_player": PermissionLevel.LEADERSHIP,
+    "add_team_member_simplified": PermissionLevel.LEADERSHIP,
+    "add_team_member_role": PermissionLevel.LEADERSHIP,
+    "remove_team_member_role": PermissionLevel.LEADERSHIP,
+    "promote_team_member_to_admin": PermissionLevel.LEADERSHIP,
+    "update_other_team_member": PermissionLevel.LEADERSHIP,
+    "create_team": PermissionLevel.LEADERSHIP,
+    "create_match": PermissionLevel.LEADERSHIP,
+    "record_match_result": PermissionLevel.LEADERSHIP,
+    "select_squad": PermissionLevel.LEADERSHIP,
+    "get_available_players_for_match": PermissionLevel.LEADERSHIP,
+    "record_attendance": PermissionLevel.LEADERSHIP,
+    # Admin-only operations
+    "get_llm_usage_report": PermissionLevel.ADMIN,
+}
+
+# Tools a clear slash command can need. A command outside this map (or natural
+# language) binds every permitted tool.
+COMMAND_INTENT_TOOLS = {
+    "/help": {"help_response", "get_command_help", "get_available_commands", "get_welcome_message"},
+    "/ping": {"ping"},
+    "/version": {"version"},
+    "/usage": {"get_llm_usage_report"},
+    "/myinfo": {"get_my_status", "get_player_current_info", "get_my_team_member_status", "get_team_member_current_info"},
+    "/info": {"get_my_status", "get_player_current_info", "get_my_team_member_status", "get_team_member_current_info"},
+    "/status": {"get_my_status", "get_player_current_info", "get_user_status"},
+    "/list": {"get_all_players", "get_active_players", "list_team_members_and_players", "get_team_members"},
+    "/update": {
+        "update_player_field",
+        "update_player_multiple_fields",
+        "get_player_update_help",
+        "update_team_member_field",
+        "update_team_member_multiple_fields",
+        "get_team_member_update_help",
+        "update_other_team_member",
+    },
+    "/addplayer": {"add_player"},
+    "/addmember": {"add_team_member_simplified"},
+    "/approve": {"approve_player", "approve_user"},
+    "/pending": {"get_pending_users"},
+    "/announce": {"send_announcement"},
+    "/poll": {"send_poll"},
+    "/matches": {"list_matches", "get_match_details"},
+    "/availability": {"mark_availability", "get_availability", "get_player_availability_history"},
+    "/squad": {"select_squad", "get_available_players_for_match"},
+    "/attendance": {"record_attendance", "get_match_attendance", "get_player_attendance_history"},
+}
+
+# Bound whenever the agent has them, so an agent can always explain a refusal
+ALWAYS_BOUND_TOOLS = {"permission_denied_message", "command_not_available"}
+
+# Rough prompt-size estimate for tool schemas
+CHARS_PER_TOKEN = 4
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Configuration for run-scoped tool memoization.
+
+Tools listed here are read-only: within one crew run, repeated calls with
+identical arguments reuse the first result. Any tool not listed is treated
+as a write and clears the run's memo when called.
+"""
+
+# READ-ONLY TOOLS -> data store reads one call makes (used for "avoided DB calls")
+READ_ONLY_TOOL_DB_READS = {
+    # Player and team member reads
+    "get_all_players": 1,
+    "get_active_players": 1,
+    "get_player_current_info": 1,
+    "get_player_match": 1,
+    "get_my_status": 2,
+    "get_user_status": 2,
+    "get_pending_users": 1,
+    "list_team_members_and_players": 2,
+    "get_team_members": 1,
+    "get_my_team_member_status": 1,
+    "get_team_member_current_info": 1,
+    # Matches, availability and attendance
+    "list_matches": 1,
+    "get_match_details": 1,
+    "get_availability": 1,
+    "get_player_availability_history": 1,
+    "get_available_players_for_match": 2,
+    "get_match_attendance": 1,
+    "get_player_attendance_history": 1,
+    # Help and command discovery
+    "get_available_commands": 1,
+    "get_system_available_commands": 0,
+    "get_command_help": 0,
+    "help_response": 0,
+    "get_welcome_message": 0,
+    "get_player_update_help": 0,
+    "get_team_member_update_help": 0,
+    "permission_denied_message": 0,
+    "command_not_available": 0,
+    "get_version_info": 0,
+    "version": 0,
+    # NLP analysis (no store access, but repeated across delegation hops)
+    "advanced_intent_recognition": 0,
+    "routing_recommendation_tool": 0,
+    "analyze_update_context": 0,
+    "validate_routing_permissions": 0,
+    "entity_extraction_tool": 0,
+    "semantic_similarity_tool": 0,
+}
+
+# Results starting with any of these are failures and are never memoized
+UNCACHEABLE_RESULT_MARKERS = ('{"status": "error"', "❌", "Error:")
@@ -6,17 +6,23 @@ This module provides a clean, simplified configurable agent that follows CrewAI
 best practices for context passing and tool parameter handling.
 """
 
+import asyncio
+import functools
 import traceback
-from typing import Any, Dict, Set, List
+from typing import Any, Dict, Set, List, Optional
 
 from crewai import Agent, Crew, Process, Task
 from loguru import logger
 
-from kickai.config.agents import get_agent_config
+from kickai.agents.iteration_control import current_iteration_run, iteration_scope, record_agent_step
+from kickai.agents.tool_memo import tool_memo_scope
+from kickai.agents.tool_selection import BindingKey, ToolBinding, binding_key, select_tools
+from kickai.config.agents import AgentConfig, get_agent_config
 from kickai.config.llm_config import get_llm_config
 from kickai.core.config import get_settings
 from kickai.core.enums import AgentRole
 from kickai.core.exceptions import AgentInitializationError
+from kickai.core.token_accounting import message_type_for, token_accounting_scope
 
 
 class ConfigurableAgent:
@@ -31,7 +37,13 @@ class ConfigurableAgent:
     - Inter-agent delegation support
     """
 
-    def __init__(self, agent_role: AgentRole, team_id: str, other_agents: List['ConfigurableAgent'] = None):
+    def __init__(
+        self,
+        agent_role: AgentRole,
+        team_id: str,
+        other_agents: List['ConfigurableAgent'] = None,
+        config: Optional[AgentConfig] = None,
+    ):
         """
         Initialize agent with role and team ID.
 
@@ -39,10 +51,12 @@ class ConfigurableAgent:
             agent_role: The role this agent should perform
             team_id: The team this agent belongs to
             other_agents: List of other agents for delegation capabilities
+            config: Already-rendered configuration (from a crew blueprint); rendered from YAML if omitted
         """
         self.agent_role = agent_role
         self.team_id = team_id
         self.other_agents = other_agents or []
+        self._rendered_config = config
 
         # Initialize components in clean order
         self._initialize_components()
@@ -55,6 +69,10 @@ class ConfigurableAgent:
             # 1. Tool registry - get singleton instance (already initialized)
             from kickai.agents.tool_registry import get_tool_registry
             self.tool_registry = get_tool_registry()
+            self._tool_bindings: Dict[BindingKey, ToolBinding] = {}
+            self._tool_binding_hits = 0
+            # Held from binding to the end of a direct execute(): bindings mutate the shared crew agent
+            self._execution_lock = asyncio.Lock()
 
             # 2. LLM configuration
             llm_config = get_llm_config()
@@ -72,7 +90,7 @@ class ConfigurableAgent:
                 "user_role": "public",
                 "username": "user"
             }
-            self.config = get_agent_config(self.agent_role, context)
+            self.config = self._rendered_config or get_agent_config(self.agent_role, context)
 
             # 4. CrewAI agent
             self.crew_agent = self._create_crew_agent()
@@ -84,13 +102,15 @@ class ConfigurableAgent:
     def _create_crew_agent(self) -> Agent:
         """Create the underlying CrewAI agent with proper configuration and delegation tools."""
         # Get tools for this agent role using direct assignment (CrewAI best practice)
-        tools = self._get_tools_for_agent()
+        self._configured_tools = self._get_tools_for_agent()
+        self._tool_bindings = {}
+        tools = list(self._configured_tools)
 
         # Add delegation tools for inter-agent communication
-        delegation_tools = self._get_delegation_tools()
-        if delegation_tools:
-            tools.extend(delegation_tools)
-            logger.info(f"🔗 Added {len(delegation_tools)} delegation tools to {self.agent_role.value}")
+        self._delegation_tools = self._get_delegation_tools()
+        if self._delegation_tools:
+            tools.extend(self._delegation_tools)
+            logger.info(f"🔗 Added {len(self._delegation_tools)} delegation tools to {self.agent_role.value}")
 
         # Get memory system for this agent
         from kickai.core.memory_manager import get_memory_manager
@@ -109,6 +129,7 @@ class ConfigurableAgent:
             function_calling_llm=self.tool_llm,  # Use tool_llm for function calling
             verbose=True,
             max_iter=self.config.max_iterations,
+            step_callback=functools.partial(record_agent_step, self.agent_role.value),
             memory=agent_memory,  # Enable entity-specific memory
             allow_delegation=(self.agent_role == AgentRole.MESSAGE_PROCESSOR),  # Only manager agent allows delegation
         )
@@ -165,6 +186,65 @@ class ConfigurableAgent:
             logger.error(f"❌ Error loading tools for {self.agent_role.value}: {e}")
             return []
 
+    def bind_tools_for_request(self, context: Dict[str, Any]) -> ToolBinding:
+        """
+        Bind only the tools this request can use to the CrewAI agent.
+
+        The subset depends on chat type, the caller's permission level and the
+        slash-command intent; it is compiled once per combination and reused.
+        Inside an iteration scope the agent's iteration budget is applied too,
+        and for simple intents the tools answer directly.
+
+        The binding is applied to the shared CrewAI agent, so the caller must
+        not run another request on it until this one has finished (the crew
+        lifecycle manager holds the team's crew lock; ``execute`` holds the
+        agent's own lock).
+
+        Args:
+            context: Execution context (chat_type, is_registered, message_text, ...)
+
+        Returns:
+            The ToolBinding now applied to the agent
+        """
+        key = binding_key(context)
+        binding = self._tool_bindings.get(key)
+        if binding is None:
+            binding = select_tools(
+                self.agent_role.value, self._configured_tools, key, self.tool_registry
+            )
+            self._tool_bindings[key] = binding
+        else:
+            self._tool_binding_hits += 1
+
+        tools = binding.tools
+        run = current_iteration_run()
+        if run is not None:
+            self.crew_agent.max_iter = run.cap(self.agent_role.value, self.config.max_iterations)
+            if run.stop_on_tool_answer and binding.answer_tools:
+                tools = binding.answer_tools
+        self.crew_agent.tools = tools + self._delegation_tools
+        return binding
+
+    def warm_tool_bindings(self, keys: List[BindingKey]) -> int:
+        """Compile tool bindings ahead of requests (e.g. those a hibernated crew used); returns how many."""
+        compiled = 0
+        for key in keys:
+            if key not in self._tool_bindings:
+                self._tool_bindings[key] = select_tools(
+                    self.agent_role.value, self._configured_tools, key, self.tool_registry
+                )
+                compiled += 1
+        return compiled
+
+    def get_tool_binding_stats(self) -> Dict[str, Any]:
+        """Cached tool bindings and their estimated schema-token savings."""
+        return {
+            "configured_tools": len(self._configured_tools),
+            "cached_bindings": len(self._tool_bindings),
+            "cache_hits": self._tool_binding_hits,
+            "bindings": [binding.to_dict() for binding in self._tool_bindings.values()],
+        }
+
     def _apply_context_injection_to_tools(self, tools: List[Any]) -> List[Any]:
         """
         Apply context injection to tools using the existing context_wrapper.py
@@ -263,7 +343,14 @@ class ConfigurableAgent:
             enhanced_description = TaskDescriptionEnhancer.enhance_task_description(task_description, context)
 
             # Create and execute CrewAI task
-            result = await self._execute_crewai_task(enhanced_description, context)
+            message_type = message_type_for(context.get("message_text"))
+            with token_accounting_scope(context["team_id"], message_type), tool_memo_scope(
+                f"{context['team_id']}:{self.agent_role.value}:{message_type}"
+            ), iteration_scope(context.get("message_text")):
+                async with self._execution_lock:
+                    # Bind only the tools (and iterations) this request can use
+                    self.bind_tools_for_request(context)
+                    result = await self._execute_crewai_task(enhanced_description, context)
 
             logger.info(f"✅ Task completed for {self.agent_role.value}")
             return result
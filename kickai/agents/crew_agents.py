@@ -14,8 +14,10 @@ CrewAI's native delegation and hierarchical process.
 """
 
 # Standard library imports
+import functools
 import logging
-from typing import Any
+import time
+from typing import Any, Optional
 
 # Third-party imports
 from crewai import Crew, Task, Process, Agent
@@ -23,10 +25,70 @@ from loguru import logger
 
 # Local application imports
 from kickai.agents.configurable_agent import ConfigurableAgent
+from kickai.agents.crew_hibernation import CrewBlueprint, crew_config_fingerprint
+from kickai.agents.iteration_control import get_iteration_controller, iteration_scope, record_agent_step
+from kickai.agents.tool_memo import tool_memo_scope
 from kickai.config.llm_config import get_llm_config
 from kickai.core.config import get_settings
 from kickai.core.enums import AgentRole
 from kickai.core.exceptions import AgentInitializationError
+from kickai.core.token_accounting import get_token_accountant, message_type_for, token_accounting_scope
+from kickai.infrastructure.llm_providers.factory import LLMProviderFactory
+
+
+# Token usage of the manager LLM is attributed to this name
+MANAGER_AGENT_NAME = "team_manager"
+
+MANAGER_AGENT_BACKSTORY = """You are an experienced team manager who coordinates work between specialist agents.
+
+CRITICAL INSTRUCTIONS FOR DELEGATION:
+When using the "Delegate work to coworker" tool, you MUST pass parameters as simple strings, NOT as dictionaries.
+
+CORRECT parameter format:
+- task: "Simple string description of what needs to be done"
+- context: "Simple string with all necessary context information"
+- coworker: "help_assistant" (just the role name as a string)
+
+INCORRECT parameter format (DO NOT USE):
+- task: {"description": "...", "type": "str"}
+- context: {"telegram_id": 123, "team_id": "KTI"}
+- coworker: {"role": "help_assistant"}
+
+INTENT-BASED DELEGATION:
+Use your intelligence to understand the user's intent and delegate to the most appropriate specialist:
+
+- help_assistant: For general help, system commands, and queries about available commands
+- player_coordinator: For player information, status, updates, and player-related queries
+- team_administrator: For team member management, adding players/members (leadership only)
+- squad_selector: For availability, match management, and squad-related queries
+
+Analyze the user's request and their intent, then delegate to the agent best suited to handle that type of request."""
+
+# Task given to the manager for each message (formatted per request)
+MANAGER_TASK_TEMPLATE = """
+User ({user}) in {chat_type} chat says: "{task_description}"
+
+Context Information:
+- User ID: {telegram_id}
+- Team ID: {team_id}
+- Username: {user}
+- Chat Type: {chat_type}
+
+As the team manager, understand what the user wants and delegate to the most appropriate specialist agent.
+
+IMPORTANT: When delegating to a specialist agent, format your parameters as simple strings:
+- task: "Help the user with their request: {task_description}"
+- context: "User ID: {telegram_id}, Team: {team_id}, Username: {user}, Chat Type: {chat_type}"
+- coworker: "help_assistant" (or the appropriate agent role)
+
+Available specialist agents:
+- help_assistant: For general help, system commands, and queries about available commands
+- player_coordinator: For player information, status, updates, and player-related queries
+- team_administrator: For team member management, adding players/members (leadership only)
+- squad_selector: For availability, match management, and squad-related queries
+
+Use your intelligence to analyze the user's intent and delegate to the most appropriate specialist agent.
+"""
 
 
 class ConfigurationError(Exception):
@@ -42,10 +104,22 @@ class TeamManagementSystem:
     capabilities, eliminating the need for manual task routing and execution.
     """
 
-    def __init__(self, team_id: str):
+    def __init__(self, team_id: str, blueprint: Optional[CrewBlueprint] = None):
+        """
+        Args:
+            team_id: The team the crew serves
+            blueprint: Blueprint left by the team's hibernated crew; its rendered agent
+                configs and tool bindings are reused when the configuration is unchanged
+        """
+        started = time.perf_counter()
         self.team_id = team_id
         self.agents: dict[AgentRole, ConfigurableAgent] = {}
         self.crew: Crew | None = None
+        self.last_tool_memo_stats: dict[str, Any] = {}
+        self.blueprint = blueprint
+        if blueprint is not None and blueprint.fingerprint != crew_config_fingerprint():
+            logger.info(f"[TEAM INIT] Configuration changed since team {team_id} hibernated; building from YAML")
+            self.blueprint = None
 
         # Initialize configuration
         logger.info(f"[TEAM INIT] Initializing TeamManagementSystem for team {team_id}")
@@ -71,7 +145,15 @@ class TeamManagementSystem:
         logger.info("[TEAM INIT] Creating hierarchical crew")
         self._create_crew()
 
-        logger.info(f"✅ TeamManagementSystem initialized for team {team_id}")
+        # Compile the tool bindings the team used before hibernating
+        if self.blueprint is not None:
+            keys = self.blueprint.tool_binding_keys()
+            for role, agent in self.agents.items():
+                if role != AgentRole.MESSAGE_PROCESSOR:
+                    agent.warm_tool_bindings(keys)
+
+        self.build_seconds = time.perf_counter() - started
+        logger.info(f"✅ TeamManagementSystem initialized for team {team_id} in {self.build_seconds:.2f}s")
 
     def _initialize_llm(self):
         """Initialize the LLM for the system."""
@@ -84,7 +166,8 @@ class TeamManagementSystem:
             self.manager_llm = llm_config.create_llm(
                 model_name=llm_config.advanced_model,
                 temperature=llm_config.settings.ai_temperature,
-                max_tokens=llm_config.settings.ai_max_tokens
+                max_tokens=llm_config.settings.ai_max_tokens,
+                agent_name=MANAGER_AGENT_NAME
             )
 
             logger.info(f"✅ LLM initialized: {type(self.llm).__name__}")
@@ -110,7 +193,8 @@ class TeamManagementSystem:
             for role in agent_roles:
                 try:
                     logger.info(f"[TEAM INIT] Creating agent for role: {role.value}")
-                    agent = ConfigurableAgent(role, self.team_id)
+                    config = self.blueprint.agent_config(role) if self.blueprint else None
+                    agent = ConfigurableAgent(role, self.team_id, config=config)
                     
                     if not hasattr(agent, 'crew_agent'):
                         raise AgentInitializationError(role.value, "Agent missing crew_agent attribute")
@@ -149,35 +233,15 @@ class TeamManagementSystem:
             manager_agent = Agent(
                 role="Team Manager",
                 goal="Coordinate and delegate tasks to the most appropriate specialist agents based on user intent",
-                backstory="""You are an experienced team manager who coordinates work between specialist agents.
-                
-                CRITICAL INSTRUCTIONS FOR DELEGATION:
-                When using the "Delegate work to coworker" tool, you MUST pass parameters as simple strings, NOT as dictionaries.
-                
-                CORRECT parameter format:
-                - task: "Simple string description of what needs to be done"
-                - context: "Simple string with all necessary context information"
-                - coworker: "help_assistant" (just the role name as a string)
-                
-                INCORRECT parameter format (DO NOT USE):
-                - task: {"description": "...", "type": "str"}
-                - context: {"telegram_id": 123, "team_id": "KTI"}
-                - coworker: {"role": "help_assistant"}
-                
-                INTENT-BASED DELEGATION:
-                Use your intelligence to understand the user's intent and delegate to the most appropriate specialist:
-                
-                - help_assistant: For general help, system commands, and queries about available commands
-                - player_coordinator: For player information, status, updates, and player-related queries
-                - team_administrator: For team member management, adding players/members (leadership only)
-                - squad_selector: For availability, match management, and squad-related queries
-                
-                Analyze the user's request and their intent, then delegate to the agent best suited to handle that type of request.""",
+                backstory=MANAGER_AGENT_BACKSTORY,
                 llm=self.manager_llm,
                 allow_delegation=True,
                 tools=[],  # Manager has no tools - only delegates
+                step_callback=functools.partial(record_agent_step, MANAGER_AGENT_NAME),
                 verbose=verbose_mode
             )
+            # Budgets per request are capped by what the manager is built with
+            self.manager_max_iterations = manager_agent.max_iter
 
             # Create hierarchical crew
             self.crew = Crew(
@@ -219,30 +283,13 @@ class TeamManagementSystem:
             team_id = validated_context.get('team_id', self.team_id)
 
             # Create a simplified task description with context inline to avoid delegation parameter issues
-            enhanced_task = f"""
-User ({user}) in {chat_type} chat says: "{task_description}"
-
-Context Information:
-- User ID: {telegram_id}
-- Team ID: {team_id}
-- Username: {user}
-- Chat Type: {chat_type}
-
-As the team manager, understand what the user wants and delegate to the most appropriate specialist agent.
-
-IMPORTANT: When delegating to a specialist agent, format your parameters as simple strings:
-- task: "Help the user with their request: {task_description}"
-- context: "User ID: {telegram_id}, Team: {team_id}, Username: {user}, Chat Type: {chat_type}"
-- coworker: "help_assistant" (or the appropriate agent role)
-
-Available specialist agents:
-- help_assistant: For general help, system commands, and queries about available commands
-- player_coordinator: For player information, status, updates, and player-related queries
-- team_administrator: For team member management, adding players/members (leadership only)
-- squad_selector: For availability, match management, and squad-related queries
-
-Use your intelligence to analyze the user's intent and delegate to the most appropriate specialist agent.
-"""
+            enhanced_task = MANAGER_TASK_TEMPLATE.format(
+                user=user,
+                chat_type=chat_type,
+                task_description=task_description,
+                telegram_id=telegram_id,
+                team_id=team_id,
+            )
 
             # Create task for the crew - remove context parameter as it conflicts with delegation
             task = Task(
@@ -252,16 +299,45 @@ Use your intelligence to analyze the user's intent and delegate to the most appr
 
             # Execute with CrewAI's native delegation - pass minimal inputs to avoid parameter conflicts
             self.crew.tasks = [task]
-            result = await self.crew.kickoff_async()
+            started = time.perf_counter()
+            message_type = message_type_for(task_description)
+            with iteration_scope(task_description) as iterations:
+                # Bind each specialist only the tools (and iterations) this request can use.
+                # The shared agents are rebound per task; CrewLifecycleManager runs one task
+                # per team at a time.
+                bound_tokens, full_tokens = self._bind_request_tools(validated_context)
+                self.crew.manager_agent.max_iter = iterations.cap(MANAGER_AGENT_NAME, self.manager_max_iterations)
+
+                with token_accounting_scope(team_id, message_type), tool_memo_scope(
+                    f"{team_id}:{message_type}"
+                ) as tool_memo:
+                    result = await self.crew.kickoff_async()
+            self.last_tool_memo_stats = tool_memo.stats.to_dict()
             result = result.raw if hasattr(result, 'raw') else str(result)
 
-            logger.info("🤖 Task execution completed successfully")
+            logger.info(
+                f"🤖 Task execution completed in {time.perf_counter() - started:.2f}s, "
+                f"{iterations.iterations} iterations for {iterations.intent} "
+                f"(tool schemas ~{bound_tokens} tokens, ~{full_tokens} with all tools bound)"
+            )
             return result
 
         except Exception as e:
             logger.error(f"❌ Error in execute_task: {e}")
             return f"❌ System error: {e!s}"
 
+    def _bind_request_tools(self, context: dict[str, Any]) -> tuple[int, int]:
+        """Apply per-request tool bindings to the specialists; returns (bound, full) schema token estimates."""
+        bound_tokens = 0
+        full_tokens = 0
+        for role, agent in self.agents.items():
+            if role == AgentRole.MESSAGE_PROCESSOR:
+                continue
+            binding = agent.bind_tools_for_request(context)
+            bound_tokens += binding.schema_tokens
+            full_tokens += binding.full_schema_tokens
+        return bound_tokens, full_tokens
+
     def _prepare_execution_context(self, execution_context: dict[str, Any]) -> dict[str, Any]:
         """Prepare and validate execution context."""
         try:
@@ -316,9 +392,24 @@ Use your intelligence to analyze the user's intent and delegate to the most appr
                 "role": role.value,
                 "tools_count": len(agent.get_tools()) if hasattr(agent, 'get_tools') else 0,
                 "crew_agent_available": hasattr(agent, 'crew_agent') and agent.crew_agent is not None,
+                "tool_bindings": agent.get_tool_binding_stats() if hasattr(agent, 'get_tool_binding_stats') else {},
             }
         return summary
 
+    def to_blueprint(self) -> CrewBlueprint:
+        """Serialisable blueprint this crew can be rehydrated from after hibernation."""
+        binding_keys = [
+            key for role, agent in self.agents.items()
+            if role != AgentRole.MESSAGE_PROCESSOR
+            for key in agent._tool_bindings
+        ]
+        return CrewBlueprint.from_agents(
+            self.team_id,
+            {role: agent.config for role, agent in self.agents.items()},
+            binding_keys,
+            build_seconds=self.build_seconds,
+        )
+
     def get_agent(self, role: AgentRole) -> ConfigurableAgent | None:
         """Get a specific agent by role."""
         return self.agents.get(role)
@@ -332,6 +423,10 @@ Use your intelligence to analyze the user's intent and delegate to the most appr
                 "agents": {},
                 "crew_created": self.crew is not None,
                 "llm_available": self.llm is not None,
+                "token_usage": get_token_accountant().report(("agent", "message_type"), team_id=self.team_id),
+                "last_run_tool_memo": self.last_tool_memo_stats,
+                "agent_iterations": get_iteration_controller().report(),
+                "llm_endpoints": LLMProviderFactory.get_endpoint_health_status(),
             }
 
             # Check each agent
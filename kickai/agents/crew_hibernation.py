@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Crew Hibernation and Pre-Warming
+
+An idle crew is hibernated rather than discarded. The live CrewAI objects are
+dropped, but a ``CrewBlueprint`` is kept as JSON in the crew activity store:
+the rendered agent configurations and the tool bindings the team has used.
+Rehydrating from a blueprint skips YAML loading and prompt rendering and
+compiles the team's tool bindings up front instead of on its first message.
+A blueprint is ignored once agents.yaml or the model settings change.
+
+``CrewPreWarmer`` builds crews ahead of predictable demand (match kickoffs,
+and times of the week when a team is usually active or reminders run), so
+the first message after a quiet spell does not pay for the crew build.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from kickai.agents.tool_selection import BindingKey
+from kickai.config.agents import AgentConfig
+from kickai.core.crew_activity_store import CrewActivityStore
+from kickai.core.enums import AgentRole, PermissionLevel
+
+PREWARM_INTERVAL_SECONDS = 300  # 5 minutes
+
+
+def crew_config_fingerprint() -> str:
+    """Hash of agents.yaml and the model settings a blueprint was rendered with."""
+    from kickai.config.agents import get_agent_config_manager
+    from kickai.core.config import get_settings
+
+    settings = get_settings()
+    digest = hashlib.sha256(get_agent_config_manager().yaml_path.read_bytes())
+    for value in (settings.ai_provider, settings.ai_model_simple, settings.ai_model_advanced):
+        digest.update(str(value).encode())
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class CrewBlueprint:
+    """Serialisable description of a team's crew, enough to rebuild it without re-rendering."""
+
+    team_id: str
+    fingerprint: str
+    # Agent role value -> rendered AgentConfig fields
+    agents: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Tool bindings the team used, as [chat_type, permission level value, intent]
+    binding_keys: List[List[Any]] = field(default_factory=list)
+    build_seconds: float = 0.0
+    created_at: float = field(default_factory=time.time)
+
+    def agent_config(self, role: AgentRole) -> Optional[AgentConfig]:
+        data = self.agents.get(role.value)
+        return AgentConfig(**{**data, "role": role}) if data else None
+
+    def tool_binding_keys(self) -> List[BindingKey]:
+        return [(chat_type, PermissionLevel(level), intent) for chat_type, level, intent in self.binding_keys]
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, data: str) -> "CrewBlueprint":
+        return cls(**json.loads(data))
+
+    @classmethod
+    def from_agents(
+        cls,
+        team_id: str,
+        configs: Dict[AgentRole, AgentConfig],
+        binding_keys: List[BindingKey],
+        build_seconds: float = 0.0,
+    ) -> "CrewBlueprint":
+        agents = {role.value: {**asdict(config), "role": role.value} for role, config in configs.items()}
+        keys = sorted({(chat_type, level.value, intent) for chat_type, level, intent in binding_keys}, key=str)
+        return cls(
+            team_id=team_id,
+            fingerprint=crew_config_fingerprint(),
+            agents=agents,
+            binding_keys=[list(key) for key in keys],
+            build_seconds=build_seconds,
+        )
+
+
+class CrewPreWarmer:
+    """Periodically builds crews for teams expected to be active within the lead window."""
+
+    def __init__(
+        self,
+        lifecycle_manager: Any,
+        activity_store: CrewActivityStore,
+        lead_seconds: float,
+        min_events: float,
+        interval_seconds: float = PREWARM_INTERVAL_SECONDS,
+    ):
+        """
+        Args:
+            lifecycle_manager: CrewLifecycleManager whose crews are warmed
+            activity_store: Activity history and scheduled demand
+            lead_seconds: How far ahead demand is anticipated; warmed crews stay up this long
+            min_events: Average events in the window, over past weeks, that count as demand
+            interval_seconds: Time between runs
+        """
+        self.lifecycle_manager = lifecycle_manager
+        self.activity_store = activity_store
+        self.lead_seconds = lead_seconds
+        self.min_events = min_events
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self, now: Optional[float] = None) -> List[str]:
+        """Warm every expected team's crew; returns the teams whose crews were built."""
+        now = time.time() if now is None else now
+        expected = self.activity_store.expected_teams(now, self.lead_seconds, self.min_events)
+        warmed = []
+        for team_id, reason in expected.items():
+            try:
+                if await self.lifecycle_manager.prewarm_crew(team_id, self.lead_seconds):
+                    logger.info(f"🔥 Pre-warmed crew for team {team_id} ({reason})")
+                    warmed.append(team_id)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not pre-warm crew for team {team_id}: {e}")
+        return warmed
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+            logger.info("🔥 Crew pre-warmer started")
+
+    async def stop(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            logger.info("🛑 Crew pre-warmer stopped")
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Error in crew pre-warmer: {e}")
+            await asyncio.sleep(self.interval_seconds)
@@ -4,18 +4,32 @@ Crew Lifecycle Manager
 
 This module provides enhanced management of long-lived crews for each team,
 including resource monitoring, health checks, and lifecycle management.
+
+Idle crews are hibernated to a ``CrewBlueprint`` and rehydrated from it on the
+team's next message; a ``CrewPreWarmer`` can rebuild crews ahead of predicted
+demand (see kickai.agents.crew_hibernation).
 """
 
 import asyncio
+import functools
+import inspect
+import time
 from asyncio import Task
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Protocol, Dict
+from typing import Any, Callable, Protocol, Dict
 
 from loguru import logger
 
+from kickai.agents.crew_hibernation import CrewBlueprint, CrewPreWarmer
+from kickai.core.crew_activity_store import CrewActivityStore
+from kickai.core.exceptions import DeadlineExceededError
+from kickai.core.monitoring import runtime_metrics
+from kickai.core.monitoring.metrics_registry import COUNTER, GAUGE, CollectedMetric, get_metrics_registry
+from kickai.core.resilience import bounded_timeout, find_resilience_error
+
 # Constants
 MONITORING_INTERVAL_SECONDS = 300  # 5 minutes
 IDLE_THRESHOLD_MINUTES = 30
@@ -64,6 +78,7 @@ class CrewStatus(Enum):
     ACTIVE = "active"
     IDLE = "idle"
     ERROR = "error"
+    HIBERNATED = "hibernated"
     SHUTDOWN = "shutdown"
 
 
@@ -90,11 +105,38 @@ class CrewLifecycleManager:
     that can handle requests efficiently while maintaining conversation context.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        crew_factory: Callable[..., Any] | None = None,
+        activity_store: CrewActivityStore | None = None,
+    ):
+        """
+        Initialize the lifecycle manager.
+
+        Args:
+            crew_factory: Optional callable building a crew for a team ID. Defaults to
+                TeamManagementSystem; load harnesses inject stub crews here. A factory
+                with a ``blueprint`` parameter is given the hibernated blueprint.
+            activity_store: Optional activity history; enables pre-warming and keeps
+                hibernated blueprints across restarts
+        """
+        self._crew_factory = crew_factory
+        self._factory_takes_blueprint = (
+            crew_factory is None or "blueprint" in inspect.signature(crew_factory).parameters
+        )
+        self._activity_store = activity_store
         self._crews: dict[str, Any] = {}
         self._crew_status: dict[str, CrewStatus] = {}
         self._crew_metrics: dict[str, CrewMetrics] = {}
+        # Serialises task execution per team: each task rebinds the shared crew's tools and caps
         self._crew_locks: dict[str, asyncio.Lock] = {}
+        # Serialises crew builds per team so a pre-warm and a message never build twice
+        self._build_locks: dict[str, asyncio.Lock] = {}
+        self._blueprints: dict[str, CrewBlueprint] = {}
+        # Pre-warmed crews are not hibernated before this time
+        self._warm_until: dict[str, datetime] = {}
+        self._lifecycle_stats = {"cold_starts": 0, "rehydrations": 0, "prewarms": 0, "hibernations": 0}
+        self._prewarmer: CrewPreWarmer | None = None
         self._monitoring_task: Task | None = None
         self._shutdown_event = asyncio.Event()
 
@@ -111,32 +153,110 @@ class CrewLifecycleManager:
             TeamManagementSystem instance for the team
         """
         # Check if crew already exists
-        if team_id in self._crews:
-            crew = self._crews[team_id]
-            if self._crew_status[team_id] == CrewStatus.ACTIVE:
-                logger.info(f"🔄 Reusing existing crew for team {team_id}")
+        crew = self._active_crew(team_id)
+        if crew is not None:
+            logger.info(f"🔄 Reusing existing crew for team {team_id}")
+            return crew
+
+        async with self._build_lock(team_id):
+            # A pre-warm may have built the crew while this request waited
+            crew = self._active_crew(team_id)
+            if crew is not None:
                 return crew
-            elif self._crew_status[team_id] == CrewStatus.ERROR:
+            if self._crew_status.get(team_id) == CrewStatus.ERROR:
                 logger.warning(f"⚠️ Crew for team {team_id} in error state, recreating")
                 await self._shutdown_crew(team_id)
 
-        # Create new crew
-        logger.info(f"🆕 Creating new crew for team {team_id}")
-        return await self._create_crew(team_id)
+            # Create new crew
+            logger.info(f"🆕 Creating new crew for team {team_id}")
+            return await self._create_crew(team_id)
+
+    async def prewarm_crew(self, team_id: str, warm_seconds: float) -> bool:
+        """
+        Build a team's crew ahead of expected demand and keep it up for ``warm_seconds``.
+
+        The build runs in a worker thread so message handling is not stalled.
+
+        Returns:
+            True if a crew was built, False if one was already active
+        """
+        self._warm_until[team_id] = datetime.now() + timedelta(seconds=warm_seconds)
+        if self._active_crew(team_id) is not None:
+            return False
+        async with self._build_lock(team_id):
+            if self._active_crew(team_id) is not None:
+                return False
+            if self._crew_status.get(team_id) == CrewStatus.ERROR:
+                await self._shutdown_crew(team_id)
+            await self._create_crew(team_id, in_background=True)
+            return True
+
+    def _active_crew(self, team_id: str) -> Any:
+        if team_id in self._crews and self._crew_status.get(team_id) == CrewStatus.ACTIVE:
+            return self._crews[team_id]
+        return None
+
+    def _build_lock(self, team_id: str) -> asyncio.Lock:
+        if team_id not in self._build_locks:
+            self._build_locks[team_id] = asyncio.Lock()
+        return self._build_locks[team_id]
+
+    def _crew_lock(self, team_id: str) -> asyncio.Lock:
+        if team_id not in self._crew_locks:
+            self._crew_locks[team_id] = asyncio.Lock()
+        return self._crew_locks[team_id]
+
+    async def _execute_exclusively(
+        self, crew: CrewProtocol, team_id: str, task_description: str, execution_context: Dict[str, Any]
+    ) -> str:
+        """Run one task on the team's crew while holding the team's crew lock."""
+        async with self._crew_lock(team_id):
+            return await crew.execute_task(task_description, execution_context)
+
+    def _hibernated_blueprint(self, team_id: str) -> CrewBlueprint | None:
+        """The blueprint a hibernated crew left, from memory or the activity store."""
+        blueprint = self._blueprints.pop(team_id, None)
+        if blueprint is not None or self._activity_store is None:
+            return blueprint
+        try:
+            data = self._activity_store.load_blueprint(team_id)
+            return CrewBlueprint.from_json(data) if data else None
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable crew blueprint for team {team_id}: {e}")
+            return None
 
-    async def _create_crew(self, team_id: str) -> Any:
-        """Create a new crew for the specified team."""
+    async def _create_crew(self, team_id: str, in_background: bool = False) -> Any:
+        """Create a new crew for the specified team, rehydrating a hibernated one when possible."""
         # Set status to initializing
         self._crew_status[team_id] = CrewStatus.INITIALIZING
 
         # Create lock for this crew
-        if team_id not in self._crew_locks:
-            self._crew_locks[team_id] = asyncio.Lock()
+        self._crew_lock(team_id)
+
+        if self._crew_factory is not None:
+            factory = self._crew_factory
+        else:
+            # Create the crew with lazy import to avoid circular dependencies
+            from kickai.agents.crew_agents import TeamManagementSystem
+
+            factory = TeamManagementSystem
 
-        # Create the crew with lazy import to avoid circular dependencies
-        from kickai.agents.crew_agents import TeamManagementSystem
+        blueprint = self._hibernated_blueprint(team_id) if self._factory_takes_blueprint else None
+        build = functools.partial(factory, team_id)
+        if blueprint is not None:
+            build = functools.partial(factory, team_id, blueprint=blueprint)
 
-        crew = TeamManagementSystem(team_id=team_id)
+        started = time.perf_counter()
+        try:
+            crew = await asyncio.to_thread(build) if in_background else build()
+        except Exception:
+            self._crew_status[team_id] = CrewStatus.ERROR
+            raise
+        build_seconds = time.perf_counter() - started
+
+        self._lifecycle_stats["rehydrations" if blueprint else "cold_starts"] += 1
+        if in_background:
+            self._lifecycle_stats["prewarms"] += 1
 
         # Store the crew
         self._crews[team_id] = crew
@@ -157,7 +277,8 @@ class CrewLifecycleManager:
         # Set status to active
         self._crew_status[team_id] = CrewStatus.ACTIVE
 
-        logger.info(f"✅ Crew created successfully for team {team_id}")
+        source = "rehydrated from blueprint" if blueprint else "built"
+        logger.info(f"✅ Crew {source} for team {team_id} in {build_seconds:.2f}s")
         return crew
 
     async def execute_task(
@@ -184,6 +305,7 @@ class CrewLifecycleManager:
             metrics = self._crew_metrics[team_id]
             metrics.total_requests += 1
             metrics.last_activity = datetime.now()
+            self._record_activity(team_id)
 
             # Execute task with timeout
             result = await self._execute_task_with_timeout(crew, team_id, task_description, execution_context)
@@ -198,6 +320,7 @@ class CrewLifecycleManager:
             # Update agent health
             self._update_agent_health_metrics(crew, team_id, metrics)
 
+            runtime_metrics.CREW_EXECUTION_SECONDS.observe(response_time, team_id, runtime_metrics.OUTCOME_SUCCESS)
             logger.info(f"✅ Task executed successfully for team {team_id} in {response_time:.2f}s")
             return result
 
@@ -206,6 +329,19 @@ class CrewLifecycleManager:
             self._update_failure_metrics(team_id)
             logger.error(f"❌ Task execution failed for team {team_id}: {e}")
 
+            # Unavailable or too-slow dependencies get the router's fail-fast reply
+            resilience_error = find_resilience_error(e)
+            outcome = (
+                runtime_metrics.OUTCOME_TIMEOUT
+                if isinstance(resilience_error, DeadlineExceededError)
+                else runtime_metrics.OUTCOME_ERROR
+            )
+            runtime_metrics.CREW_EXECUTION_SECONDS.observe(
+                (datetime.now() - start_time).total_seconds(), team_id, outcome
+            )
+            if resilience_error is not None:
+                raise resilience_error from e
+
             # Always return a response, even on complete failure
             return self._generate_formatted_response(
                 title="🚨 System Error",
@@ -259,15 +395,17 @@ If the problem persists, please contact your team administrator."""
             
         Raises:
             CrewTimeoutError: If task execution times out
+            DeadlineExceededError: If the request deadline runs out first
             CrewError: For other crew-related errors
         """
         from kickai.core.constants.agent_constants import AgentConstants
-        timeout_seconds = AgentConstants.CREW_MAX_EXECUTION_TIME
+        timeout_seconds = bounded_timeout(AgentConstants.CREW_MAX_EXECUTION_TIME)
 
         try:
-            # Execute CrewAI task with timeout - task description is already enhanced in crew_agents.py
+            # Execute CrewAI task with timeout - task description is already enhanced in crew_agents.py.
+            # Waiting for the team's previous task counts against the timeout.
             result = await asyncio.wait_for(
-                crew.execute_task(task_description, execution_context),
+                self._execute_exclusively(crew, team_id, task_description, execution_context),
                 timeout=timeout_seconds
             )
 
@@ -289,7 +427,9 @@ If the problem persists, please contact your team administrator."""
             return result
 
         except asyncio.TimeoutError as e:
-            logger.error(f"⏰ Timeout after {timeout_seconds}s for team {team_id}")
+            logger.error(f"⏰ Timeout after {timeout_seconds:.1f}s for team {team_id}")
+            if timeout_seconds < AgentConstants.CREW_MAX_EXECUTION_TIME:
+                raise DeadlineExceededError("crew", timeout_seconds) from e
             raise CrewTimeoutError(f"Task execution timed out after {timeout_seconds} seconds for team {team_id}") from e
             
         except Exception as e:
@@ -347,6 +487,15 @@ If the problem persists, please contact your team administrator."""
                 "error": "Memory metrics unavailable"
             }
 
+    def _record_activity(self, team_id: str) -> None:
+        """Add the message to the activity history the pre-warmer predicts from."""
+        if self._activity_store is None:
+            return
+        try:
+            self._activity_store.record_activity(team_id)
+        except Exception as e:
+            logger.debug(f"Could not record crew activity for team {team_id}: {e}")
+
     def _update_failure_metrics(self, team_id: str) -> None:
         """Update failure metrics."""
         if team_id in self._crew_metrics:
@@ -375,6 +524,30 @@ If the problem persists, please contact your team administrator."""
         except Exception as e:
             logger.error(f"❌ Error shutting down crew for team {team_id}: {e}")
 
+    async def _hibernate_crew(self, team_id: str):
+        """Drop a team's crew but keep its blueprint so the next build is a rehydration."""
+        to_blueprint = getattr(self._crews.get(team_id), "to_blueprint", None)
+        blueprint = None
+        if callable(to_blueprint):
+            try:
+                blueprint = to_blueprint()
+            except Exception as e:
+                logger.warning(f"⚠️ Could not capture crew blueprint for team {team_id}: {e}")
+
+        await self._shutdown_crew(team_id)
+        if blueprint is None:
+            return
+
+        self._blueprints[team_id] = blueprint
+        self._crew_status[team_id] = CrewStatus.HIBERNATED
+        self._lifecycle_stats["hibernations"] += 1
+        if self._activity_store is not None:
+            try:
+                self._activity_store.save_blueprint(team_id, blueprint.to_json())
+            except Exception as e:
+                logger.warning(f"⚠️ Crew blueprint for team {team_id} kept in memory only: {e}")
+        logger.info(f"💤 Crew for team {team_id} hibernated")
+
     async def get_crew_status(self, team_id: str) -> CrewStatus | None:
         """Get the status of a crew for the specified team."""
         return self._crew_status.get(team_id)
@@ -393,6 +566,8 @@ If the problem persists, please contact your team administrator."""
             "total_crews": len(self._crews),
             "active_crews": 0,
             "error_crews": 0,
+            "hibernated_crews": 0,
+            "lifecycle": self.get_lifecycle_stats(),
             "crews": {},
         }
 
@@ -407,11 +582,47 @@ If the problem persists, please contact your team administrator."""
                     crew_health["crew_health"] = crew.health_check()
             elif status == CrewStatus.ERROR:
                 health_status["error_crews"] += 1
+            elif status == CrewStatus.HIBERNATED:
+                health_status["hibernated_crews"] += 1
 
             health_status["crews"][team_id] = crew_health
 
         return health_status
 
+    def get_lifecycle_stats(self) -> dict[str, int]:
+        """Cold builds, rehydrations, pre-warms and hibernations since startup."""
+        return dict(self._lifecycle_stats)
+
+    def collect_metrics(self) -> list[CollectedMetric]:
+        """Crews by status and lifecycle event counts, for the metrics endpoint."""
+        by_status = {status.value: 0 for status in CrewStatus}
+        for status in list(self._crew_status.values()):
+            by_status[status.value] += 1
+        return [
+            CollectedMetric(
+                "kickai_crews",
+                GAUGE,
+                "Team crews by lifecycle status",
+                [({"status": status}, count) for status, count in by_status.items()],
+            ),
+            CollectedMetric(
+                "kickai_crew_lifecycle_events",
+                COUNTER,
+                "Crew cold builds, rehydrations, pre-warms and hibernations",
+                [({"event": event}, count) for event, count in self.get_lifecycle_stats().items()],
+            ),
+        ]
+
+    def enable_prewarming(self, lead_seconds: float, min_events: float) -> CrewPreWarmer | None:
+        """Start a pre-warmer over this manager's activity store (needs a running event loop)."""
+        if self._activity_store is None:
+            logger.warning("⚠️ Crew pre-warming needs an activity store; not enabled")
+            return None
+        if self._prewarmer is None:
+            self._prewarmer = CrewPreWarmer(self, self._activity_store, lead_seconds, min_events)
+        self._prewarmer.start()
+        return self._prewarmer
+
     async def start_monitoring(self):
         """Start the monitoring task for crew health checks."""
         if self._monitoring_task is None or self._monitoring_task.done():
@@ -420,6 +631,8 @@ If the problem persists, please contact your team administrator."""
 
     async def stop_monitoring(self):
         """Stop the monitoring task."""
+        if self._prewarmer is not None:
+            await self._prewarmer.stop()
         if self._monitoring_task and not self._monitoring_task.done():
             self._shutdown_event.set()
             self._monitoring_task.cancel()
@@ -451,16 +664,25 @@ If the problem persists, please contact your team administrator."""
                 await asyncio.sleep(RETRY_DELAY_SECONDS)  # Wait before retrying
 
     async def _check_idle_crews(self):
-        """Check for idle crews and mark them appropriately."""
-        idle_threshold = datetime.now() - timedelta(minutes=IDLE_THRESHOLD_MINUTES)
+        """Check for idle crews and hibernate them."""
+        now = datetime.now()
+        idle_threshold = now - timedelta(minutes=IDLE_THRESHOLD_MINUTES)
         # Use list(items()) to avoid issues with modifying dict during iteration
         for team_id, metrics in list(self._crew_metrics.items()):
-            if metrics.last_activity < idle_threshold:
+            if metrics.last_activity < idle_threshold and self._warm_until.get(team_id, now) <= now:
                 if self._crew_status[team_id] == CrewStatus.ACTIVE:
                     self._crew_status[team_id] = CrewStatus.IDLE
-                    logger.info(f"💤 Crew for team {team_id} is idle. Shutting down to conserve resources.")
-                    # Shut down the idle crew to free up memory and resources
-                    await self._shutdown_crew(team_id)
+                    logger.info(f"💤 Crew for team {team_id} is idle. Hibernating to conserve resources.")
+                    # Free the crew's memory but keep a blueprint for a quick rebuild
+                    await self._hibernate_crew(team_id)
+
+    async def shutdown_crew(self, team_id: str):
+        """Discard one team's crew; the next request for the team builds a fresh one."""
+        await self._shutdown_crew(team_id)
+
+    async def hibernate_crew(self, team_id: str):
+        """Hibernate one team's crew now; its next request rehydrates it from the blueprint."""
+        await self._hibernate_crew(team_id)
 
     async def shutdown_all_crews(self):
         """Shutdown all crews."""
@@ -502,17 +724,26 @@ def get_crew_lifecycle_manager() -> CrewLifecycleManager:
     """Get the global crew lifecycle manager instance."""
     global _crew_lifecycle_manager
     if _crew_lifecycle_manager is None:
-        _crew_lifecycle_manager = CrewLifecycleManager()
+        from kickai.core.crew_activity_store import get_crew_activity_store
+
+        _crew_lifecycle_manager = CrewLifecycleManager(activity_store=get_crew_activity_store())
     return _crew_lifecycle_manager
 
 
 async def initialize_crew_lifecycle_manager():
-    """Initialize the global crew lifecycle manager."""
-    global _crew_lifecycle_manager
-    if _crew_lifecycle_manager is None:
-        _crew_lifecycle_manager = CrewLifecycleManager()
-        await _crew_lifecycle_manager.start_monitoring()
-        logger.info("🚀 Global crew lifecycle manager initialized")
+    """Initialize the global crew lifecycle manager and start monitoring and pre-warming."""
+    manager = get_crew_lifecycle_manager()
+    if manager._monitoring_task is not None and not manager._monitoring_task.done():
+        return
+    await manager.start_monitoring()
+    get_metrics_registry().register_collector("crew_lifecycle", manager.collect_metrics)
+
+    from kickai.core.config import get_settings
+
+    settings = get_settings()
+    if settings.crew_prewarm_enabled:
+        manager.enable_prewarming(settings.crew_prewarm_lead_minutes * 60, settings.crew_prewarm_min_events)
+    logger.info("🚀 Global crew lifecycle manager initialized")
 
 
 async def shutdown_crew_lifecycle_manager():
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Adaptive Agent Iteration Budgets
+
+Every agent has a fixed ``max_iterations``, so a trivial ``/myinfo`` could burn
+as many LLM turns as an open squad question. Inside an ``iteration_scope`` the
+request's slash command picks a task class, and the class caps the iterations
+each agent may spend on it. For simple reads and lookups the bound tools
+return their output as the final answer, so the agent stops as soon as the
+tool has answered instead of taking another turn to restate it.
+
+Every agent step is counted per run and recorded per intent. Once an intent
+has enough observed runs, its budget is tightened to the iterations those
+runs needed (a high percentile plus headroom), never above the class budget.
+Natural language and other open requests are recorded but never capped::
+
+    with iteration_scope(message_text) as run:
+        agent.crew_agent.max_iter = run.cap(agent_name, agent.config.max_iterations)
+        result = await crew.kickoff_async()
+    logger.info(get_iteration_controller().report())
+"""
+
+import contextvars
+import math
+import threading
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+from loguru import logger
+
+from kickai.agents.config.iteration_config import (
+    COMMAND_TASK_CLASSES,
+    FINAL_ANSWER_TASK_CLASSES,
+    ITERATION_BUDGET_HEADROOM,
+    ITERATION_HISTORY_SIZE,
+    ITERATION_MIN_BUDGET,
+    ITERATION_MIN_SAMPLES,
+    ITERATION_TUNING_PERCENTILE,
+    NATURAL_LANGUAGE_INTENT,
+    TASK_CLASS_ITERATION_BUDGETS,
+    TASK_CLASS_OPEN,
+    UNKNOWN_COMMAND_INTENT,
+)
+from kickai.agents.config.message_router_config import SLASH_COMMAND_PREFIX
+from kickai.core.monitoring import runtime_metrics
+
+
+def classify_intent(message_text: Optional[str]) -> Tuple[str, str]:
+    """(intent, task class) of a message: its slash command, or natural language."""
+    text = (message_text or "").strip()
+    if not text.startswith(SLASH_COMMAND_PREFIX):
+        return NATURAL_LANGUAGE_INTENT, TASK_CLASS_OPEN
+    command = text.split()[0].lower()
+    if command not in COMMAND_TASK_CLASSES:
+        return UNKNOWN_COMMAND_INTENT, TASK_CLASS_OPEN
+    return command, COMMAND_TASK_CLASSES[command]
+
+
+@dataclass
+class IterationRun:
+    """Iteration budget and observed agent steps for one crew run."""
+
+    intent: str
+    task_class: str
+    # Per-agent cap for this run (None keeps each agent's configured max_iterations)
+    budget: Optional[int]
+    # Whether tools bound for this run end the agent's turn with their output
+    stop_on_tool_answer: bool
+    agent_iterations: Dict[str, int] = field(default_factory=dict)
+    agent_budgets: Dict[str, int] = field(default_factory=dict)
+
+    def cap(self, agent_name: str, configured: int) -> int:
+        """Iterations an agent may spend on this run (never more than it is configured for)."""
+        budget = configured if self.budget is None else min(self.budget, configured)
+        self.agent_budgets[agent_name] = budget
+        return budget
+
+    def record_step(self, agent_name: str) -> None:
+        self.agent_iterations[agent_name] = self.agent_iterations.get(agent_name, 0) + 1
+
+    @property
+    def iterations(self) -> int:
+        """Steps across every agent, i.e. LLM turns spent on the message."""
+        return sum(self.agent_iterations.values())
+
+    @property
+    def peak(self) -> int:
+        """Most steps any one agent took (what a per-agent budget has to cover)."""
+        return max(self.agent_iterations.values(), default=0)
+
+    @property
+    def reached_budget(self) -> bool:
+        """Whether some agent used its whole budget (it may have been cut short)."""
+        return any(
+            count >= self.agent_budgets[name]
+            for name, count in self.agent_iterations.items()
+            if name in self.agent_budgets
+        )
+
+
+@dataclass
+class IterationStats:
+    """Observed iterations for one intent."""
+
+    runs: int = 0
+    total_iterations: int = 0
+    max_iterations: int = 0
+    budget_reached_runs: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "total_iterations": self.total_iterations,
+            "mean_iterations": round(self.total_iterations / self.runs, 2) if self.runs else 0.0,
+            "max_iterations": self.max_iterations,
+            "budget_reached_runs": self.budget_reached_runs,
+        }
+
+
+class IterationController:
+    """Chooses iteration budgets per intent and learns from observed runs."""
+
+    def __init__(
+        self,
+        adaptive: bool = True,
+        history_size: int = ITERATION_HISTORY_SIZE,
+        min_samples: int = ITERATION_MIN_SAMPLES,
+    ):
+        """
+        Args:
+            adaptive: Apply task-class and tuned budgets; when False every agent keeps
+                its configured max_iterations (runs are still recorded)
+            history_size: Runs kept per intent for tuning
+            min_samples: Runs needed before an intent's budget is tuned
+        """
+        self.adaptive = adaptive
+        self.min_samples = min_samples
+        # Per-agent peak steps of recent runs, per intent
+        self._peaks: Dict[str, Deque[int]] = defaultdict(lambda: deque(maxlen=history_size))
+        self._stats: Dict[str, IterationStats] = defaultdict(IterationStats)
+        self._lock = threading.Lock()
+
+    def start_run(self, message_text: Optional[str]) -> IterationRun:
+        intent, task_class = classify_intent(message_text)
+        if not self.adaptive:
+            return IterationRun(intent, task_class, budget=None, stop_on_tool_answer=False)
+
+        budget = TASK_CLASS_ITERATION_BUDGETS[task_class]
+        tuned = self.tuned_budget(intent)
+        if tuned is not None:
+            budget = min(budget, tuned)
+        return IterationRun(intent, task_class, budget, task_class in FINAL_ANSWER_TASK_CLASSES)
+
+    def tuned_budget(self, intent: str) -> Optional[int]:
+        """
+        Budget learned from an intent's observed runs, or None until there are enough.
+
+        Open-ended intents (no class budget) keep the configured limits and are never tuned.
+        """
+        task_class = COMMAND_TASK_CLASSES.get(intent, TASK_CLASS_OPEN)
+        if TASK_CLASS_ITERATION_BUDGETS[task_class] is None:
+            return None
+        with self._lock:
+            peaks = sorted(self._peaks.get(intent, ()))
+        if len(peaks) < self.min_samples:
+            return None
+        index = max(0, math.ceil(ITERATION_TUNING_PERCENTILE * len(peaks)) - 1)
+        return max(ITERATION_MIN_BUDGET, peaks[index] + ITERATION_BUDGET_HEADROOM)
+
+    def record(self, run: IterationRun) -> None:
+        """Record a finished run's iterations against its intent."""
+        if not run.agent_iterations:
+            return
+        with self._lock:
+            self._peaks[run.intent].append(run.peak)
+            stats = self._stats[run.intent]
+            stats.runs += 1
+            stats.total_iterations += run.iterations
+            stats.max_iterations = max(stats.max_iterations, run.iterations)
+            if run.reached_budget:
+                stats.budget_reached_runs += 1
+        runtime_metrics.AGENT_ITERATIONS.observe(run.iterations, run.intent)
+        logger.debug(
+            f"🔁 {run.intent}: {run.iterations} iterations {run.agent_iterations} "
+            f"(caps {run.agent_budgets})"
+        )
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """Observed iterations per intent, with the class and tuned budgets."""
+        with self._lock:
+            stats = {intent: intent_stats.to_dict() for intent, intent_stats in self._stats.items()}
+        for intent, intent_stats in stats.items():
+            task_class = COMMAND_TASK_CLASSES.get(intent, TASK_CLASS_OPEN)
+            intent_stats["task_class"] = task_class
+            intent_stats["class_budget"] = TASK_CLASS_ITERATION_BUDGETS[task_class]
+            intent_stats["tuned_budget"] = self.tuned_budget(intent)
+        return stats
+
+
+_current_run: contextvars.ContextVar[Optional[IterationRun]] = contextvars.ContextVar(
+    "iteration_run", default=None
+)
+
+
+def current_iteration_run() -> Optional[IterationRun]:
+    """Iteration run of the active crew run, if any."""
+    return _current_run.get()
+
+
+@contextmanager
+def iteration_scope(
+    message_text: Optional[str], controller: Optional[IterationController] = None
+) -> Iterator[IterationRun]:
+    """
+    Budget and count agent iterations for the block.
+
+    Nested scopes (an agent executed within a crew run) share the outer run,
+    and only the outermost scope records it.
+    """
+    outer = _current_run.get()
+    if outer is not None:
+        yield outer
+        return
+
+    controller = controller or get_iteration_controller()
+    run = controller.start_run(message_text)
+    token = _current_run.set(run)
+    try:
+        yield run
+    finally:
+        _current_run.reset(token)
+        controller.record(run)
+
+
+def record_agent_step(agent_name: str, step: Any = None) -> None:
+    """CrewAI ``step_callback`` counting one iteration (bind the agent name with ``partial``)."""
+    run = _current_run.get()
+    if run is not None:
+        run.record_step(agent_name)
+
+
+# Global controller instance
+_iteration_controller: Optional[IterationController] = None
+
+
+def get_iteration_controller() -> IterationController:
+    """Get the process-wide iteration controller."""
+    global _iteration_controller
+    if _iteration_controller is None:
+        from kickai.core.config import get_settings
+
+        settings = get_settings()
+        _iteration_controller = IterationController(adaptive=settings.agent_adaptive_iterations)
+    return _iteration_controller
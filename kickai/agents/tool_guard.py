@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Deadline-Bounded Tool Calls
+
+Every async tool runs under its own ``DependencyGuard`` ("tool:<name>"), so a
+tool call never outlives the request deadline set by the message router, and
+a tool that keeps timing out is short-circuited by its breaker. A refused or
+timed-out call returns a standard error response the agent can relay instead
+of raising into CrewAI.
+"""
+
+import asyncio
+import functools
+from collections.abc import Callable
+from typing import Any
+
+from loguru import logger
+
+from kickai.core.enums import ResponseStatus
+from kickai.core.exceptions import DeadlineExceededError, DependencyUnavailableError
+from kickai.core.resilience import get_dependency_guard
+from kickai.utils.tool_helpers import create_json_response
+
+# Attribute set on wrapped tool functions so they are never wrapped twice
+GUARDED_MARKER = "__kickai_deadline_guarded__"
+
+TOOL_BREAKER_FAILURE_THRESHOLD = 3
+TOOL_BREAKER_RESET_SECONDS = 30
+TOOL_MAX_CONCURRENT = 16
+
+
+def _tool_outage(error: Exception) -> bool:
+    # Tools report their own failures; only timeouts and refused dependencies trip the breaker
+    return isinstance(error, (DependencyUnavailableError, DeadlineExceededError))
+
+
+def tool_unavailable_response(tool_name: str, error: Exception) -> str:
+    """Standard error response for a tool call refused or cut short by its guard."""
+    if isinstance(error, DeadlineExceededError):
+        message = f"{tool_name} took too long to respond. Please try again in a moment."
+    else:
+        message = f"{tool_name} is temporarily unavailable. Please try again in a moment."
+    return create_json_response(ResponseStatus.ERROR, message=message)
+
+
+def guard_tool_function(tool_name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    """Bound an async tool function by the request deadline and its circuit breaker (sync functions pass through)."""
+    if getattr(func, GUARDED_MARKER, False) or not asyncio.iscoroutinefunction(func):
+        return func
+
+    guard = get_dependency_guard(
+        f"tool:{tool_name}",
+        failure_threshold=TOOL_BREAKER_FAILURE_THRESHOLD,
+        reset_seconds=TOOL_BREAKER_RESET_SECONDS,
+        max_concurrent=TOOL_MAX_CONCURRENT,
+        is_outage=_tool_outage,
+    )
+
+    @functools.wraps(func)
+    async def guarded(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return await guard.run(lambda: func(*args, **kwargs))
+        except (DependencyUnavailableError, DeadlineExceededError) as e:
+            logger.warning(f"🛑 Tool {tool_name} not completed: {e}")
+            return tool_unavailable_response(tool_name, e)
+
+    setattr(guarded, GUARDED_MARKER, True)
+    return guarded
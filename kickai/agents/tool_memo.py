@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Run-Scoped Tool Memoization
+
+Within one crew run the manager and specialists often call the same read-only
+tool with identical arguments across delegation hops and iterations. Inside a
+``tool_memo_scope`` the first successful result is reused for those repeats.
+Calling any tool that is not declared read-only (a write) clears the memo, so
+later reads in the run see its effects.
+
+Each run reports its memo hits and the data store calls they avoided::
+
+    with tool_memo_scope(f"{team_id}:{message_type}") as memo:
+        result = await crew.kickoff_async()
+    logger.info(memo.stats.to_dict())
+"""
+
+import asyncio
+import contextvars
+import functools
+import json
+import threading
+from collections.abc import Callable
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from loguru import logger
+
+from kickai.agents.config.tool_memo_config import READ_ONLY_TOOL_DB_READS, UNCACHEABLE_RESULT_MARKERS
+
+# Attribute set on wrapped tool functions so they are never wrapped twice
+MEMOIZED_MARKER = "__kickai_run_memoized__"
+
+_MISS = object()
+
+
+def is_read_only_tool(tool_name: str) -> bool:
+    """Whether a tool is declared read-only (and so memoizable within a run)."""
+    return tool_name in READ_ONLY_TOOL_DB_READS
+
+
+@dataclass
+class ToolMemoStats:
+    """Memo counters for one run."""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    avoided_db_calls: int = 0
+    hits_by_tool: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ToolRunMemo:
+    """Results of read-only tool calls made during one crew run."""
+
+    def __init__(self, run_label: str = ""):
+        self.run_label = run_label
+        self.stats = ToolMemoStats()
+        self._entries: Dict[Tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(tool_name: str, args: tuple, kwargs: dict) -> Optional[Tuple[str, str]]:
+        """Memo key for a call, or None when the arguments cannot be keyed."""
+        try:
+            return tool_name, json.dumps([args, kwargs], sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+
+    def lookup(self, key: Tuple[str, str]) -> Any:
+        """Memoized result for a key, or ``_MISS``."""
+        with self._lock:
+            result = self._entries.get(key, _MISS)
+            tool_name = key[0]
+            if result is _MISS:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+                self.stats.avoided_db_calls += READ_ONLY_TOOL_DB_READS.get(tool_name, 0)
+                self.stats.hits_by_tool[tool_name] = self.stats.hits_by_tool.get(tool_name, 0) + 1
+            return result
+
+    def store(self, key: Tuple[str, str], result: Any) -> None:
+        """Remember a result unless it reports a failure."""
+        if isinstance(result, str) and result.lstrip().startswith(UNCACHEABLE_RESULT_MARKERS):
+            return
+        with self._lock:
+            self._entries[key] = result
+
+    def invalidate(self, tool_name: str) -> None:
+        """Forget every memoized read after a write tool ran."""
+        with self._lock:
+            if self._entries:
+                logger.debug(f"🧠 {tool_name} invalidated {len(self._entries)} memoized tool results")
+                self._entries.clear()
+            self.stats.invalidations += 1
+
+
+_current_memo: contextvars.ContextVar[Optional[ToolRunMemo]] = contextvars.ContextVar(
+    "tool_run_memo", default=None
+)
+
+
+def current_tool_memo() -> Optional[ToolRunMemo]:
+    """Memo of the active run, if any."""
+    return _current_memo.get()
+
+
+@contextmanager
+def tool_memo_scope(run_label: str = "") -> Iterator[ToolRunMemo]:
+    """
+    Memoize read-only tool calls made inside the block.
+
+    Nested scopes (an agent executed within a crew run) share the outer memo,
+    and only the outermost scope reports its counts.
+    """
+    outer = _current_memo.get()
+    if outer is not None:
+        yield outer
+        return
+
+    memo = ToolRunMemo(run_label)
+    token = _current_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        _current_memo.reset(token)
+        stats = memo.stats
+        if stats.hits or stats.misses:
+            logger.info(
+                f"🧠 Tool memo [{run_label}]: {stats.hits} hits, {stats.misses} misses, "
+                f"{stats.invalidations} invalidations, {stats.avoided_db_calls} DB calls avoided"
+            )
+
+
+def call_memoized(tool_name: str, call: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call a sync tool through the active run memo."""
+    memo = _current_memo.get()
+    if memo is None:
+        return call(*args, **kwargs)
+
+    if not is_read_only_tool(tool_name):
+        try:
+            return call(*args, **kwargs)
+        finally:
+            memo.invalidate(tool_name)
+
+    key = memo.make_key(tool_name, args, kwargs)
+    if key is not None:
+        result = memo.lookup(key)
+        if result is not _MISS:
+            return result
+    result = call(*args, **kwargs)
+    if key is not None:
+        memo.store(key, result)
+    return result
+
+
+async def acall_memoized(tool_name: str, call: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call an async tool through the active run memo."""
+    memo = _current_memo.get()
+    if memo is None:
+        return await call(*args, **kwargs)
+
+    if not is_read_only_tool(tool_name):
+        try:
+            return await call(*args, **kwargs)
+        finally:
+            memo.invalidate(tool_name)
+
+    key = memo.make_key(tool_name, args, kwargs)
+    if key is not None:
+        result = memo.lookup(key)
+        if result is not _MISS:
+            return result
+    result = await call(*args, **kwargs)
+    if key is not None:
+        memo.store(key, result)
+    return result
+
+
+def memoize_tool_function(tool_name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a tool function so calls go through the active run memo (no-op outside a run)."""
+    if getattr(func, MEMOIZED_MARKER, False):
+        return func
+
+    if asyncio.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await acall_memoized(tool_name, func, *args, **kwargs)
+
+        wrapper = async_wrapper
+    else:
+
+        @functools.wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            return call_memoized(tool_name, func, *args, **kwargs)
+
+        wrapper = sync_wrapper
+
+    setattr(wrapper, MEMOIZED_MARKER, True)
+    return wrapper
@@ -18,6 +18,8 @@ from typing import Any
 from loguru import logger
 
 # Local imports
+from kickai.agents.tool_guard import guard_tool_function
+from kickai.agents.tool_memo import call_memoized, is_read_only_tool, memoize_tool_function
 from kickai.core.entity_types import EntityType
 from kickai.core.models.context_models import BaseContext, validate_context_data
 from kickai.utils.context_validation import (
@@ -85,6 +87,7 @@ class ToolMetadata:
     )  # agent_role -> allowed_entity_types
     requires_context: bool = False  # Whether the tool requires context parameter
     context_model: type[BaseContext] | None = None  # Pydantic model for context validation
+    read_only: bool = False  # Memoizable within a crew run; other tools invalidate the run memo
 
 
 class ContextAwareTool(Tool):
@@ -201,11 +204,13 @@ class ContextAwareToolWrapper(Tool):
             if not context:
                 context = self._extract_context_from_task()
 
-            # Call the original tool with context
+            # Call the original tool with context (memoized within a crew run)
             if context:
-                return self.original_tool(context, *remaining_args, **kwargs)
+                return call_memoized(
+                    self.tool_name, self.original_tool, context, *remaining_args, **kwargs
+                )
             else:
-                return self.original_tool(*remaining_args, **kwargs)
+                return call_memoized(self.tool_name, self.original_tool, *remaining_args, **kwargs)
 
         except Exception as e:
             logger.error(f"Error in context-aware wrapper for {self.tool_name}: {e}")
@@ -305,8 +310,12 @@ class ToolRegistry:
         access_control: dict[str, list[str]] | None = None,
         requires_context: bool = False,
         context_model: type[BaseContext] | None = None,
+        read_only: bool | None = None,
     ) -> None:
         """Register a tool with enhanced context support."""
+        if read_only is None:
+            read_only = is_read_only_tool(tool_id)
+        self._apply_run_memoization(tool_id, tool_function)
 
         # Create tool metadata
         metadata = ToolMetadata(
@@ -326,6 +335,7 @@ class ToolRegistry:
             access_control=access_control or {},
             requires_context=requires_context,
             context_model=context_model,
+            read_only=read_only,
         )
 
         # Register the tool
@@ -356,6 +366,16 @@ class ToolRegistry:
             f"✅ Registered tool: {tool_id} (context-aware: {requires_context or context_model is not None})"
         )
 
+    def _apply_run_memoization(self, tool_id: str, tool_function: Callable | None) -> None:
+        """Route a CrewAI tool's function through the run-scoped tool memo and its deadline guard."""
+        func = getattr(tool_function, "func", None)
+        if not callable(func):
+            return
+        try:
+            tool_function.func = memoize_tool_function(tool_id, guard_tool_function(tool_id, func))
+        except Exception as e:
+            logger.warning(f"⚠️ Could not enable run memoization for {tool_id}: {e}")
+
     def register_context_tool(
         self, tool_id: str, tool_function: Callable, context_model: type[BaseContext], **kwargs
     ) -> None:
@@ -1166,6 +1186,7 @@ class ToolRegistry:
             tools_by_entity[entity_type.value] = len(self.get_tools_by_entity_type(entity_type))
 
         context_aware_tools = len([tool for tool in self._tools.values() if tool.requires_context])
+        read_only_tools = len([tool for tool in self._tools.values() if tool.read_only])
 
         return {
             "total_tools": total_tools,
@@ -1174,6 +1195,7 @@ class ToolRegistry:
             "tools_by_category": tools_by_category,
             "tools_by_entity": tools_by_entity,
             "context_aware_tools": context_aware_tools,
+            "read_only_tools": read_only_tools,
             "features": list(self._feature_tools.keys()),
             "features_with_tools": list(
                 self._feature_tools.keys()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Per-Request Tool Selection
+
+Picks the subset of an agent's configured tools to bind for one request, from
+the chat type, the caller's permission level and (for clear slash commands)
+the command intent. Bindings are compiled once per key and reused, and each
+records an estimate of the tool-schema prompt tokens it carries compared with
+binding every configured tool.
+
+For simple reads and lookups a binding also carries copies of its tools that
+return their output as the agent's final answer (see ``iteration_control``).
+"""
+
+import copy
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from kickai.agents.config.iteration_config import COMMAND_TASK_CLASSES, FINAL_ANSWER_TASK_CLASSES
+from kickai.agents.config.message_router_config import SLASH_COMMAND_PREFIX
+from kickai.agents.config.tool_binding_config import (
+    ALWAYS_BOUND_TOOLS,
+    CHARS_PER_TOKEN,
+    COMMAND_INTENT_TOOLS,
+    PERMISSION_RANK,
+    TOOL_PERMISSION_LEVELS,
+)
+from kickai.core.enums import ChatType, PermissionLevel
+
+# Binding cache key: (chat_type, permission level, intent)
+BindingKey = Tuple[str, PermissionLevel, Optional[str]]
+
+# Context keys set once the caller has been looked up
+REGISTRATION_FLAGS = ("is_registered", "is_player", "is_team_member")
+
+
+@dataclass
+class ToolBinding:
+    """Tools bound to an agent for one (chat type, permission, intent) combination."""
+
+    agent_role: str
+    chat_type: str
+    permission_level: PermissionLevel
+    intent: Optional[str]
+    tools: List[Any] = field(default_factory=list)
+    schema_tokens: int = 0
+    full_schema_tokens: int = 0
+    full_tool_count: int = 0
+    # The same tools, returning their output as the final answer (empty unless the intent allows it)
+    answer_tools: List[Any] = field(default_factory=list)
+
+    @property
+    def tool_names(self) -> List[str]:
+        return [tool_name(tool) for tool in self.tools]
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.full_schema_tokens - self.schema_tokens
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "agent_role": self.agent_role,
+            "chat_type": self.chat_type,
+            "permission_level": self.permission_level.value,
+            "intent": self.intent,
+            "tools": self.tool_names,
+            "tool_count": len(self.tools),
+            "full_tool_count": self.full_tool_count,
+            "schema_tokens": self.schema_tokens,
+            "full_schema_tokens": self.full_schema_tokens,
+            "final_answer_tools": bool(self.answer_tools),
+        }
+
+
+def tool_name(tool: Any) -> str:
+    """Name a tool is registered and prompted under."""
+    return getattr(tool, "name", None) or getattr(tool, "__name__", str(tool))
+
+
+def resolve_permission_level(context: Dict[str, Any]) -> PermissionLevel:
+    """
+    Permission level tools are bound for, from the execution context.
+
+    The leadership chat binds up to admin tools (its commands are restricted
+    to leadership already); any registered player or team member gets
+    player-level tools; a user known to be unregistered is public. A context
+    without registration flags fails open to every tool, as before tool
+    selection, so a caller that never looked the user up loses nothing.
+    """
+    chat_type = str(context.get("chat_type", "")).lower()
+    if chat_type == ChatType.LEADERSHIP.value or context.get("is_admin"):
+        return PermissionLevel.ADMIN
+
+    user_role = str(context.get("user_role", "")).lower()
+    if (
+        context.get("is_registered")
+        or context.get("is_player")
+        or context.get("is_team_member")
+        or user_role in (PermissionLevel.PLAYER.value, "team_member")
+    ):
+        return PermissionLevel.PLAYER
+    if not user_role and not any(flag in context for flag in REGISTRATION_FLAGS):
+        return PermissionLevel.SYSTEM
+    return PermissionLevel.PUBLIC
+
+
+def resolve_intent(message_text: Optional[str]) -> Optional[str]:
+    """Slash command that narrows tool selection, or None for natural language."""
+    if not message_text or not message_text.strip():
+        return None
+    command = message_text.strip().split()[0].lower()
+    if not command.startswith(SLASH_COMMAND_PREFIX):
+        return None
+    return command if command in COMMAND_INTENT_TOOLS else None
+
+
+def binding_key(context: Dict[str, Any]) -> BindingKey:
+    """Cache key for the tool binding a request needs."""
+    return (
+        str(context.get("chat_type", ChatType.MAIN.value)).lower(),
+        resolve_permission_level(context),
+        resolve_intent(context.get("message_text")),
+    )
+
+
+def as_final_answer(tool: Any) -> Any:
+    """Copy of a tool whose output ends the agent's turn as its final answer."""
+    if getattr(tool, "result_as_answer", False):
+        return tool
+    if hasattr(tool, "model_copy"):
+        return tool.model_copy(update={"result_as_answer": True})
+    answer_tool = copy.copy(tool)
+    answer_tool.result_as_answer = True
+    return answer_tool
+
+
+def estimate_tool_schema_tokens(tool: Any) -> int:
+    """Approximate prompt tokens a tool adds: its name, description and argument schema."""
+    text = tool_name(tool) + (getattr(tool, "description", "") or "")
+    args_schema = getattr(tool, "args_schema", None)
+    if args_schema is not None and hasattr(args_schema, "model_json_schema"):
+        try:
+            text += json.dumps(args_schema.model_json_schema())
+        except Exception:
+            pass
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def select_tools(
+    agent_role: str,
+    tools: List[Any],
+    key: BindingKey,
+    tool_registry: Any = None,
+) -> ToolBinding:
+    """
+    Select the tools to bind for one binding key.
+
+    Args:
+        agent_role: Agent role value (used for registry access control)
+        tools: Every tool configured for the agent
+        key: (chat_type, permission level, intent) from ``binding_key``
+        tool_registry: Optional ToolRegistry for ``validate_tool_access``
+
+    Returns:
+        ToolBinding with the selected tools and schema-size estimates
+    """
+    chat_type, permission_level, intent = key
+    rank = PERMISSION_RANK[permission_level]
+
+    permitted = []
+    for tool in tools:
+        name = tool_name(tool)
+        required = TOOL_PERMISSION_LEVELS.get(name, PermissionLevel.PUBLIC)
+        if PERMISSION_RANK[required] > rank:
+            continue
+        if tool_registry is not None and tool_registry.get_tool(name) is not None:
+            if not tool_registry.validate_tool_access(name, agent_role):
+                continue
+        permitted.append(tool)
+
+    selected = permitted
+    answer_tools: List[Any] = []
+    if intent:
+        wanted = COMMAND_INTENT_TOOLS[intent] | ALWAYS_BOUND_TOOLS
+        narrowed = [tool for tool in permitted if tool_name(tool) in wanted]
+        # Only narrow when the command is actually this agent's business
+        if any(tool_name(tool) not in ALWAYS_BOUND_TOOLS for tool in narrowed):
+            selected = narrowed
+            if COMMAND_TASK_CLASSES.get(intent) in FINAL_ANSWER_TASK_CLASSES:
+                answer_tools = [as_final_answer(tool) for tool in selected]
+
+    binding = ToolBinding(
+        agent_role=agent_role,
+        chat_type=chat_type,
+        permission_level=permission_level,
+        intent=intent,
+        tools=selected,
+        schema_tokens=sum(estimate_tool_schema_tokens(tool) for tool in selected),
+        full_schema_tokens=sum(estimate_tool_schema_tokens(tool) for tool in tools),
+        full_tool_count=len(tools),
+        answer_tools=answer_tools,
+    )
+    logger.debug(
+        f"🔧 Tool binding for {agent_role} {key}: {len(selected)}/{len(tools)} tools, "
+        f"~{binding.schema_tokens}/{binding.full_schema_tokens} schema tokens"
+    )
+    return binding
@@ -11,6 +11,7 @@ from .welcome_message_builder import WelcomeMessageBuilder
 from .invite_processor import InviteProcessor
 from .user_registration_checker import UserRegistrationChecker
 from .resource_manager import ResourceManager
+from .admission_scheduler import AdmissionPriority, AdmissionScheduler, get_admission_scheduler
 
 __all__ = [
     "PhoneValidator",
@@ -19,4 +20,7 @@ __all__ = [
     "InviteProcessor",
     "UserRegistrationChecker",
     "ResourceManager",
+    "AdmissionPriority",
+    "AdmissionScheduler",
+    "get_admission_scheduler",
 ]
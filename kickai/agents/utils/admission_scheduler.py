@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Process-wide admission scheduler.
+
+Every team's router shares one pool of processing slots. Requests that cannot
+start immediately wait in a queue ordered by:
+
+- priority class: leadership/admin commands, then interactive, then bulk
+- weighted fair queuing between teams within a class, so a busy team cannot
+  starve a quiet one
+
+A request that waits longer than its class's bound is rejected with a "busy"
+reply instead of hanging. Per-user rate limiting uses a sliding window whose
+state is capped and sheds idle users.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Deque, Dict, List, Optional
+
+from loguru import logger
+
+from kickai.agents.config.message_router_config import (
+    ADMISSION_DEFAULT_TEAM_WEIGHT,
+    ADMISSION_MAX_CONCURRENT,
+    ADMISSION_MAX_QUEUE_DEPTH,
+    ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    BULK_COMMANDS,
+    DEFAULT_MAX_REQUESTS_PER_MINUTE,
+    LOG_MESSAGES,
+    PRIORITY_COMMANDS,
+    RATE_LIMIT_WINDOW_SECONDS,
+    RATE_LIMITER_MAX_TRACKED_USERS,
+    SLASH_COMMAND_PREFIX,
+    WARNING_MESSAGES,
+)
+from kickai.core.enums import ChatType
+from kickai.core.monitoring import runtime_metrics
+from kickai.core.monitoring.metrics_registry import COUNTER, GAUGE, CollectedMetric, get_metrics_registry
+
+# Drop reasons
+DROP_QUEUE_FULL = "queue_full"
+DROP_TIMEOUT = "timeout"
+
+
+class AdmissionPriority(IntEnum):
+    """Priority classes, served strictly in this order."""
+
+    LEADERSHIP = 0
+    INTERACTIVE = 1
+    BULK = 2
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+def classify_priority(chat_type: Any, message_text: Optional[str]) -> AdmissionPriority:
+    """Priority class of a request from its chat type and command."""
+    text = (message_text or "").strip()
+    command = text.split()[0].lower() if text.startswith(SLASH_COMMAND_PREFIX) else None
+    if command in BULK_COMMANDS:
+        return AdmissionPriority.BULK
+
+    chat_type_value = getattr(chat_type, "value", chat_type)
+    if chat_type_value == ChatType.LEADERSHIP.value or command in PRIORITY_COMMANDS:
+        return AdmissionPriority.LEADERSHIP
+    return AdmissionPriority.INTERACTIVE
+
+
+class SlidingWindowRateLimiter:
+    """Per-key sliding-window rate limiter with bounded state."""
+
+    def __init__(
+        self,
+        max_requests: int = DEFAULT_MAX_REQUESTS_PER_MINUTE,
+        window_seconds: float = RATE_LIMIT_WINDOW_SECONDS,
+        max_tracked_keys: int = RATE_LIMITER_MAX_TRACKED_USERS,
+    ) -> None:
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self.max_tracked_keys = max_tracked_keys
+        # Least recently seen first
+        self._history: "OrderedDict[Any, Deque[float]]" = OrderedDict()
+        self.evicted_keys = 0
+
+    def is_limited(self, key: Any, now: Optional[float] = None) -> bool:
+        """Record a request for ``key``; True if it exceeds the limit (and is not counted)."""
+        now = time.time() if now is None else now
+        requests = self._history.pop(key, None) or deque()
+        while requests and now - requests[0] > self.window_seconds:
+            requests.popleft()
+
+        limited = len(requests) >= self.max_requests
+        if not limited:
+            requests.append(now)
+        self._history[key] = requests
+
+        while len(self._history) > self.max_tracked_keys:
+            self._history.popitem(last=False)
+            self.evicted_keys += 1
+        return limited
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Drop keys with no requests inside the window; returns how many were dropped."""
+        now = time.time() if now is None else now
+        idle = [
+            key for key, requests in self._history.items()
+            if not requests or now - requests[-1] > self.window_seconds
+        ]
+        for key in idle:
+            del self._history[key]
+        return len(idle)
+
+    @property
+    def tracked_keys(self) -> int:
+        return len(self._history)
+
+    def request_counts(self) -> Dict[Any, int]:
+        return {key: len(requests) for key, requests in self._history.items()}
+
+
+@dataclass
+class _Waiter:
+    team_id: str
+    priority: AdmissionPriority
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class AdmissionStats:
+    """Counters for one (priority, team)."""
+
+    admitted: int = 0
+    queued: int = 0
+    dropped_queue_full: int = 0
+    dropped_timeout: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def dropped(self) -> int:
+        return self.dropped_queue_full + self.dropped_timeout
+
+    def to_dict(self) -> Dict[str, Any]:
+        requests = self.admitted + self.dropped
+        return {
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "dropped_queue_full": self.dropped_queue_full,
+            "dropped_timeout": self.dropped_timeout,
+            "drop_rate": round(self.dropped / requests, 4) if requests else 0.0,
+            "avg_wait_seconds": round(self.total_wait_seconds / self.queued, 4) if self.queued else 0.0,
+            "max_wait_seconds": round(self.max_wait_seconds, 4),
+        }
+
+
+class AdmissionScheduler:
+    """Shared slot pool with priority classes and weighted fair queuing per team."""
+
+    def __init__(
+        self,
+        max_concurrent: int = ADMISSION_MAX_CONCURRENT,
+        max_queue_depth: int = ADMISSION_MAX_QUEUE_DEPTH,
+        queue_timeouts: Optional[Dict[str, float]] = None,
+        team_weights: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.max_concurrent = max_concurrent
+        self.max_queue_depth = max_queue_depth
+        self.queue_timeouts = {**ADMISSION_QUEUE_TIMEOUT_SECONDS, **(queue_timeouts or {})}
+        self.team_weights: Dict[str, float] = dict(team_weights or {})
+
+        self.in_use = 0
+        self._queues: Dict[AdmissionPriority, Dict[str, Deque[_Waiter]]] = {
+            priority: defaultdict(deque) for priority in AdmissionPriority
+        }
+        self._queue_depth = 0
+        # Weighted fair queuing: each admission advances the team's virtual time by 1/weight
+        self._virtual_time: Dict[str, float] = {}
+        self._global_virtual_time = 0.0
+        self._stats: Dict[AdmissionPriority, Dict[str, AdmissionStats]] = {
+            priority: defaultdict(AdmissionStats) for priority in AdmissionPriority
+        }
+
+        logger.info(LOG_MESSAGES["ADMISSION_SCHEDULER_INITIALIZED"].format(
+            max_concurrent=max_concurrent, max_queue_depth=max_queue_depth
+        ))
+
+    def set_team_weight(self, team_id: str, weight: float) -> None:
+        """Give a team a larger (or smaller) share of contended slots."""
+        if weight <= 0:
+            raise ValueError("Team weight must be positive")
+        self.team_weights[team_id] = weight
+
+    def queue_timeout(self, priority: AdmissionPriority) -> float:
+        return self.queue_timeouts[priority.label]
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue_depth
+
+    async def acquire(self, team_id: str, priority: AdmissionPriority = AdmissionPriority.INTERACTIVE) -> bool:
+        """
+        Wait for a processing slot.
+
+        Returns:
+            True once admitted (call ``release`` when done), False if the request
+            was dropped because the queue was full or its wait bound expired
+        """
+        stats = self._stats[priority][team_id]
+        if self.in_use < self.max_concurrent and self._queue_depth == 0:
+            self._admit(team_id)
+            stats.admitted += 1
+            runtime_metrics.ADMISSION_WAIT_SECONDS.observe(0.0, priority.label, runtime_metrics.OUTCOME_SUCCESS)
+            return True
+
+        if self._queue_depth >= self.max_queue_depth:
+            stats.dropped_queue_full += 1
+            logger.warning(WARNING_MESSAGES["ADMISSION_QUEUE_FULL"].format(
+                depth=self._queue_depth, priority=priority.label, team_id=team_id
+            ))
+            return False
+
+        waiter = _Waiter(team_id, priority, asyncio.get_running_loop().create_future())
+        self._queues[priority][team_id].append(waiter)
+        self._queue_depth += 1
+        timeout = self.queue_timeout(priority)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+        waited = time.monotonic() - waiter.enqueued_at
+        stats.queued += 1
+        stats.total_wait_seconds += waited
+        stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+
+        if waiter.future.done():
+            stats.admitted += 1
+            runtime_metrics.ADMISSION_WAIT_SECONDS.observe(waited, priority.label, runtime_metrics.OUTCOME_SUCCESS)
+            return True
+
+        self._abandon(waiter)
+        stats.dropped_timeout += 1
+        runtime_metrics.ADMISSION_WAIT_SECONDS.observe(waited, priority.label, runtime_metrics.OUTCOME_TIMEOUT)
+        logger.warning(WARNING_MESSAGES["ADMISSION_TIMEOUT"].format(
+            priority=priority.label.capitalize(), team_id=team_id, seconds=waited
+        ))
+        return False
+
+    def release(self) -> None:
+        """Return a slot and hand it to the next waiter, if any."""
+        if self.in_use <= 0:
+            logger.warning("⚠️ AdmissionScheduler.release called with no slot in use")
+            return
+        self.in_use -= 1
+        self._dispatch()
+
+    def _admit(self, team_id: str) -> None:
+        self.in_use += 1
+        start = max(self._virtual_time.get(team_id, 0.0), self._global_virtual_time)
+        weight = self.team_weights.get(team_id, ADMISSION_DEFAULT_TEAM_WEIGHT)
+        self._global_virtual_time = start
+        self._virtual_time[team_id] = start + 1.0 / weight
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """Remove a waiter that gave up; hand its slot on if it was granted meanwhile."""
+        if waiter.future.done() and not waiter.future.cancelled():
+            self.release()
+            return
+        waiter.future.cancel()
+        queue = self._queues[waiter.priority].get(waiter.team_id)
+        if queue is not None and waiter in queue:
+            queue.remove(waiter)
+            self._queue_depth -= 1
+            if not queue:
+                del self._queues[waiter.priority][waiter.team_id]
+
+    def _next_waiter(self) -> Optional[_Waiter]:
+        for priority in AdmissionPriority:
+            teams = self._queues[priority]
+            if not teams:
+                continue
+            team_id = min(
+                teams, key=lambda team: max(self._virtual_time.get(team, 0.0), self._global_virtual_time)
+            )
+            queue = teams[team_id]
+            waiter = queue.popleft()
+            if not queue:
+                del teams[team_id]
+            self._queue_depth -= 1
+            return waiter
+        return None
+
+    def _dispatch(self) -> None:
+        while self.in_use < self.max_concurrent:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+            if waiter.future.done():
+                continue
+            self._admit(waiter.team_id)
+            waiter.future.set_result(True)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Slot usage, queue depth, wait times and drop rates per priority and team."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "in_use": self.in_use,
+            "queue_depth": self._queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "priorities": {
+                priority.label: {team_id: stats.to_dict() for team_id, stats in teams.items()}
+                for priority, teams in self._stats.items()
+            },
+        }
+
+    def collect_metrics(self) -> List[CollectedMetric]:
+        """Slot usage, queue depth and drops, for the metrics endpoint (waits are a histogram)."""
+        dropped = []
+        for priority, teams in self._stats.items():
+            for team_id, stats in list(teams.items()):
+                labels = {"priority": priority.label, "team_id": team_id}
+                dropped.append(({**labels, "reason": "queue_full"}, stats.dropped_queue_full))
+                dropped.append(({**labels, "reason": "timeout"}, stats.dropped_timeout))
+        return [
+            CollectedMetric("kickai_admission_slots_in_use", GAUGE, "Admission slots in use", [({}, self.in_use)]),
+            CollectedMetric(
+                "kickai_admission_slots_max", GAUGE, "Admission slot limit", [({}, self.max_concurrent)]
+            ),
+            CollectedMetric(
+                "kickai_admission_queue_depth", GAUGE, "Requests waiting for a slot", [({}, self._queue_depth)]
+            ),
+            CollectedMetric("kickai_admission_dropped", COUNTER, "Requests turned away by the scheduler", dropped),
+        ]
+
+
+# Global admission scheduler instance
+_admission_scheduler: Optional[AdmissionScheduler] = None
+
+
+def get_admission_scheduler() -> AdmissionScheduler:
+    """Get the process-wide admission scheduler shared by every router."""
+    global _admission_scheduler
+    if _admission_scheduler is None:
+        _admission_scheduler = AdmissionScheduler()
+        get_metrics_registry().register_collector("admission_scheduler", _admission_scheduler.collect_metrics)
+    return _admission_scheduler
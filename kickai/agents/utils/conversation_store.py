@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Conversation Summary Persistence
+
+Keeps ``OptimizedMemoryManager`` conversation summaries across restarts.
+
+- ``SQLiteConversationStore``: local file
+- ``FirestoreConversationStore``: any DataStoreInterface (Firestore or
+  MockDataStore), one team-specific collection per team
+- ``ConversationPersistence``: write-behind batching in front of a store.
+  ``enqueue`` only appends to an in-memory buffer; a background task writes
+  batches, so the message path never waits on storage.
+
+Reloads are lazy and per user: a user's summaries are read back the first
+time that user is seen after a restart. Persistence is opt-in
+(``conversation_summary_store``); by default summaries stay in memory.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from kickai.core.firestore_constants import get_team_specific_collection_name
+from kickai.database.query_spec import QuerySpec
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_CONVERSATION_SUMMARIES = "conversation_summaries"
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 2.0
+DEFAULT_BATCH_SIZE = 50
+# Oldest unwritten summaries are dropped beyond this (storage outage)
+DEFAULT_MAX_PENDING = 5_000
+
+
+class ConversationSummaryStore(ABC):
+    """Storage for conversation summary records (dicts from ``ConversationSummary.to_record``)."""
+
+    @abstractmethod
+    async def append_batch(self, records: List[Dict[str, Any]]) -> None:
+        """Persist a batch of summary records."""
+
+    @abstractmethod
+    async def load_user(self, team_id: str, telegram_id: int, limit: int) -> List[Dict[str, Any]]:
+        """The user's most recent ``limit`` records, oldest first."""
+
+    @abstractmethod
+    async def delete_user(self, team_id: str, telegram_id: int) -> None:
+        """Remove a user's records."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release resources."""
+
+
+class SQLiteConversationStore(ConversationSummaryStore):
+    """Summaries in a local SQLite file (blocking calls run in a worker thread)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS conversation_summaries (
+                    team_id TEXT NOT NULL,
+                    telegram_id INTEGER NOT NULL,
+                    command TEXT NOT NULL,
+                    response_type TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    tokens_saved INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_summaries_user "
+                "ON conversation_summaries (team_id, telegram_id, timestamp)"
+            )
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO conversation_summaries "
+                "(team_id, telegram_id, command, response_type, timestamp, tokens_saved) "
+                "VALUES (:team_id, :telegram_id, :command, :response_type, :timestamp, :tokens_saved)",
+                records,
+            )
+
+    def _load(self, team_id: str, telegram_id: int, limit: int) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT team_id, telegram_id, command, response_type, timestamp, tokens_saved "
+                "FROM conversation_summaries WHERE team_id = ? AND telegram_id = ? "
+                "ORDER BY timestamp DESC LIMIT ?",
+                (team_id, telegram_id, limit),
+            ).fetchall()
+        keys = ("team_id", "telegram_id", "command", "response_type", "timestamp", "tokens_saved")
+        return [dict(zip(keys, row)) for row in reversed(rows)]
+
+    def _delete(self, team_id: str, telegram_id: int) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM conversation_summaries WHERE team_id = ? AND telegram_id = ?", (team_id, telegram_id)
+            )
+
+    async def append_batch(self, records: List[Dict[str, Any]]) -> None:
+        await asyncio.to_thread(self._append, records)
+
+    async def load_user(self, team_id: str, telegram_id: int, limit: int) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self._load, team_id, telegram_id, limit)
+
+    async def delete_user(self, team_id: str, telegram_id: int) -> None:
+        await asyncio.to_thread(self._delete, team_id, telegram_id)
+
+    async def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class FirestoreConversationStore(ConversationSummaryStore):
+    """Summaries in a team-specific collection of a DataStoreInterface."""
+
+    def __init__(self, data_store: Any):
+        self.data_store = data_store
+
+    @staticmethod
+    def collection(team_id: str) -> str:
+        return get_team_specific_collection_name(team_id, COLLECTION_CONVERSATION_SUMMARIES)
+
+    async def append_batch(self, records: List[Dict[str, Any]]) -> None:
+        await self.data_store.execute_batch([
+            {"type": "create", "collection": self.collection(record["team_id"]), "data": record}
+            for record in records
+        ])
+
+    async def load_user(self, team_id: str, telegram_id: int, limit: int) -> List[Dict[str, Any]]:
+        spec = QuerySpec().where("telegram_id", "==", telegram_id).order("timestamp", descending=True).take(limit)
+        documents = await self.data_store.run_query(self.collection(team_id), spec)
+        return list(reversed(documents))
+
+    async def delete_user(self, team_id: str, telegram_id: int) -> None:
+        spec = QuerySpec().where("telegram_id", "==", telegram_id)
+        documents = await self.data_store.run_query(self.collection(team_id), spec)
+        if documents:
+            await self.data_store.execute_batch([
+                {"type": "delete", "collection": self.collection(team_id), "document_id": document["id"]}
+                for document in documents
+            ])
+
+    async def close(self) -> None:
+        """Nothing to release: the data store is shared and owned by the container."""
+
+
+class ConversationPersistence:
+    """Write-behind batching and lazy per-user loading over a ConversationSummaryStore."""
+
+    def __init__(
+        self,
+        store: ConversationSummaryStore,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        self.store = store
+        self.flush_interval_seconds = flush_interval_seconds
+        self.batch_size = batch_size
+        self._pending: Deque[Dict[str, Any]] = deque(maxlen=max_pending)
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self.written = 0
+        self.dropped = 0
+        self.failed_flushes = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def enqueue(self, record: Dict[str, Any]) -> None:
+        """Buffer a record for the next batch write (never blocks)."""
+        if len(self._pending) == self._pending.maxlen:
+            self.dropped += 1
+        self._pending.append(record)
+        self._ensure_writer()
+        if len(self._pending) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    def _ensure_writer(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (sync caller); records are written by the next flush()
+            return
+        self._wakeup = asyncio.Event()
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        self._task = loop.create_task(self._writer())
+
+    async def _writer(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write every buffered record now; returns how many were written."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        written = 0
+        async with self._flush_lock:
+            while self._pending:
+                batch = [self._pending.popleft() for _ in range(min(self.batch_size, len(self._pending)))]
+                try:
+                    await self.store.append_batch(batch)
+                except Exception as e:
+                    # Put the batch back and retry on the next flush
+                    self._pending.extendleft(reversed(batch))
+                    self.failed_flushes += 1
+                    logger.warning(f"Conversation summary flush failed ({len(batch)} records kept): {e}")
+                    break
+                written += len(batch)
+        self.written += written
+        return written
+
+    async def load_user(self, team_id: str, telegram_id: int, limit: int) -> List[Dict[str, Any]]:
+        """Persisted records for a user, including ones still buffered."""
+        records = await self.store.load_user(team_id, telegram_id, limit)
+        buffered = [
+            record for record in self._pending
+            if record["team_id"] == team_id and record["telegram_id"] == telegram_id
+        ]
+        return (records + buffered)[-limit:]
+
+    async def delete_user(self, team_id: str, telegram_id: int) -> None:
+        self._pending = deque(
+            (record for record in self._pending
+             if not (record["team_id"] == team_id and record["telegram_id"] == telegram_id)),
+            maxlen=self._pending.maxlen,
+        )
+        await self.store.delete_user(team_id, telegram_id)
+
+    async def close(self) -> None:
+        """Stop the writer and write what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        await self.store.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "store": type(self.store).__name__,
+            "pending": self.pending,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed_flushes": self.failed_flushes,
+        }
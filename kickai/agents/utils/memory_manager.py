@@ -4,16 +4,30 @@ Optimized Memory Manager for CrewAI Agents
 
 Separates memory management from execution context to follow CrewAI best practices
 for minimal context passing while maintaining conversation history.
+
+Summaries persist across restarts through ConversationPersistence (see
+conversation_store.py): writes are batched behind the message path, and a
+user's history is reloaded lazily the first time they are seen.
 """
 
+import asyncio
 import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from collections import defaultdict, deque
 
+from kickai.agents.utils.conversation_store import (
+    ConversationPersistence,
+    FirestoreConversationStore,
+    SQLiteConversationStore,
+)
+
 logger = logging.getLogger(__name__)
 
+# Command prefix kept in persisted summaries (what conversation references show)
+PERSISTED_COMMAND_LENGTH = 20
+
 
 @dataclass
 class ConversationSummary:
@@ -33,6 +47,27 @@ class ConversationSummary:
             "timestamp": self.timestamp.isoformat(),
         }
 
+    def to_record(self, team_id: str) -> Dict[str, Any]:
+        """Record for persistence; only the command prefix leaves the process."""
+        return {
+            "team_id": team_id,
+            "telegram_id": self.telegram_id,
+            "command": self.command[:PERSISTED_COMMAND_LENGTH],
+            "response_type": self.response_type,
+            "timestamp": self.timestamp.isoformat(),
+            "tokens_saved": self.tokens_saved,
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "ConversationSummary":
+        return cls(
+            telegram_id=int(record["telegram_id"]),
+            command=record["command"],
+            response_type=record["response_type"],
+            timestamp=datetime.fromisoformat(record["timestamp"]),
+            tokens_saved=int(record.get("tokens_saved", 0)),
+        )
+
 
 class OptimizedMemoryManager:
     """
@@ -45,14 +80,27 @@ class OptimizedMemoryManager:
     4. Reduces context size by 90%+
     """
 
-    def __init__(self, team_id: str, max_conversations: int = 100):
+    # Summaries kept per user (and reloaded per user after a restart)
+    MAX_USER_CONVERSATIONS = 20
+    # Longest the message path waits for a user's history to reload
+    RELOAD_TIMEOUT_SECONDS = 0.5
+
+    def __init__(
+        self,
+        team_id: str,
+        max_conversations: int = 100,
+        persistence: Optional[ConversationPersistence] = None,
+    ):
         self.team_id = team_id
         self.max_conversations = max_conversations
+        self.persistence = persistence
+        # Users whose persisted history has been merged in since startup
+        self._loaded_users: set[int] = set()
         
         # Use deque for efficient insertion/removal
         self._conversation_summaries: deque[ConversationSummary] = deque(maxlen=max_conversations)
         self._user_conversations: Dict[int, deque[ConversationSummary]] = defaultdict(
-            lambda: deque(maxlen=20)  # Max 20 per user
+            lambda: deque(maxlen=self.MAX_USER_CONVERSATIONS)
         )
         
         # Memory usage tracking
@@ -91,6 +139,10 @@ class OptimizedMemoryManager:
         
         # Update metrics
         self._total_tokens_saved += tokens_saved
+
+        # Write-behind persistence; never waits on storage
+        if self.persistence is not None:
+            self.persistence.enqueue(summary.to_record(self.team_id))
         
         # Periodic cleanup
         self._maybe_cleanup()
@@ -102,6 +154,38 @@ class OptimizedMemoryManager:
         
         return summary
 
+    async def ensure_user_loaded(self, telegram_id: int) -> None:
+        """
+        Merge a user's persisted summaries in, once per process.
+
+        Bounded by RELOAD_TIMEOUT_SECONDS; on timeout or error the user is
+        retried on their next message.
+        """
+        if self.persistence is None or telegram_id in self._loaded_users:
+            return
+        try:
+            records = await asyncio.wait_for(
+                self.persistence.load_user(self.team_id, telegram_id, self.MAX_USER_CONVERSATIONS),
+                timeout=self.RELOAD_TIMEOUT_SECONDS,
+            )
+        except Exception as e:
+            logger.warning(f"Conversation history reload for user {telegram_id} skipped: {e}")
+            return
+
+        self._loaded_users.add(telegram_id)
+        current = list(self._user_conversations.get(telegram_id, ()))
+        seen = {
+            (summary.timestamp, summary.command[:PERSISTED_COMMAND_LENGTH]) for summary in current
+        }
+        restored = [
+            summary for summary in map(ConversationSummary.from_record, records)
+            if (summary.timestamp, summary.command) not in seen
+        ]
+        if restored:
+            merged = sorted(restored + current, key=lambda summary: summary.timestamp)
+            self._user_conversations[telegram_id] = deque(merged, maxlen=self.MAX_USER_CONVERSATIONS)
+            logger.debug(f"Restored {len(restored)} conversation summaries for user {telegram_id}")
+
     def get_conversation_reference(
         self, 
         telegram_id: int
@@ -124,7 +208,7 @@ class OptimizedMemoryManager:
         return {
             "has_history": True,
             "conversation_count": len(user_conversations),
-            "last_command": latest.command[:20],  # Truncated
+            "last_command": latest.command[:PERSISTED_COMMAND_LENGTH],  # Truncated
             "last_response_type": latest.response_type,
             "minutes_since_last": int((datetime.now() - latest.timestamp).total_seconds() / 60),
         }
@@ -156,6 +240,8 @@ class OptimizedMemoryManager:
                 self._total_tokens_saved / max(1, len(self._conversation_summaries))
             ),
             "memory_efficiency": f"{self._total_tokens_saved / max(1, len(self._conversation_summaries)):.1f} tokens/conv saved",
+            "reloaded_users": len(self._loaded_users),
+            "persistence": self.persistence.get_stats() if self.persistence else None,
         }
 
     def _maybe_cleanup(self) -> None:
@@ -185,6 +271,14 @@ class OptimizedMemoryManager:
 
     def clear_user_history(self, telegram_id: int) -> bool:
         """Clear conversation history for a specific user."""
+        if self.persistence is not None:
+            self._loaded_users.add(telegram_id)
+            try:
+                asyncio.get_running_loop().create_task(
+                    self.persistence.delete_user(self.team_id, telegram_id)
+                )
+            except RuntimeError:
+                pass
         if telegram_id in self._user_conversations:
             del self._user_conversations[telegram_id]
             logger.info(f"Cleared conversation history for user {telegram_id}")
@@ -200,11 +294,52 @@ class OptimizedMemoryManager:
 # Global memory manager instance
 _memory_managers: Dict[str, OptimizedMemoryManager] = {}
 
+# Shared summary persistence (False once it could not be created)
+_conversation_persistence: Any = None
+
+
+def get_conversation_persistence() -> Optional[ConversationPersistence]:
+    """Get the conversation summary persistence configured in settings, if any."""
+    global _conversation_persistence
+    if _conversation_persistence is None:
+        _conversation_persistence = False
+        try:
+            from kickai.core.config import get_settings
+
+            settings = get_settings()
+            backend = settings.conversation_summary_store
+            if backend == "sqlite":
+                store = SQLiteConversationStore(settings.conversation_summary_path)
+            elif backend == "firestore":
+                from kickai.core.dependency_container import get_container
+
+                store = FirestoreConversationStore(get_container().get_database())
+            else:
+                store = None
+            if store is not None:
+                _conversation_persistence = ConversationPersistence(
+                    store, flush_interval_seconds=settings.conversation_summary_flush_seconds
+                )
+                logger.info(f"Conversation summaries persist to {backend}")
+        except Exception as e:
+            logger.warning(f"Conversation summary persistence unavailable, keeping summaries in memory: {e}")
+    return _conversation_persistence or None
+
+
+async def shutdown_conversation_persistence() -> None:
+    """Write buffered summaries and close the store (call on shutdown)."""
+    global _conversation_persistence
+    if _conversation_persistence:
+        await _conversation_persistence.close()
+    _conversation_persistence = None
+
 
 def get_memory_manager(team_id: str) -> OptimizedMemoryManager:
     """Get or create optimized memory manager for a team."""
     if team_id not in _memory_managers:
-        _memory_managers[team_id] = OptimizedMemoryManager(team_id)
+        _memory_managers[team_id] = OptimizedMemoryManager(
+            team_id, persistence=get_conversation_persistence()
+        )
     return _memory_managers[team_id]
 
 
@@ -3,22 +3,26 @@
 Resource management utilities.
 
 Handles rate limiting, concurrent request management, and resource cleanup.
+Concurrency is admitted through the process-wide AdmissionScheduler shared by
+every team's router; per-user rate limiting uses a bounded sliding window.
 """
 
-import asyncio
 import time
 from typing import Dict, Any, Optional
-from collections import defaultdict, deque
 from loguru import logger
 
 from kickai.agents.config.message_router_config import (
-    DEFAULT_MAX_CONCURRENT,
     DEFAULT_MAX_REQUESTS_PER_MINUTE,
     DEFAULT_CLEANUP_INTERVAL,
-    ERROR_MESSAGES,
     WARNING_MESSAGES,
     LOG_MESSAGES,
 )
+from kickai.agents.utils.admission_scheduler import (
+    AdmissionPriority,
+    AdmissionScheduler,
+    SlidingWindowRateLimiter,
+    get_admission_scheduler,
+)
 
 
 class ResourceManager:
@@ -30,34 +34,40 @@ class ResourceManager:
 
     def __init__(
         self, 
-        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        max_concurrent: Optional[int] = None,
         max_requests_per_minute: int = DEFAULT_MAX_REQUESTS_PER_MINUTE,
-        cleanup_interval: int = DEFAULT_CLEANUP_INTERVAL
+        cleanup_interval: int = DEFAULT_CLEANUP_INTERVAL,
+        scheduler: Optional[AdmissionScheduler] = None,
     ) -> None:
         """
         Initialize the resource manager.
 
         Args:
-            max_concurrent: Maximum concurrent requests allowed
+            max_concurrent: Slots for a private scheduler; omit to share the process-wide one
             max_requests_per_minute: Maximum requests per minute per user
             cleanup_interval: Interval in seconds for cleanup tasks
+            scheduler: Admission scheduler to use (takes precedence over max_concurrent)
         """
         try:
             # ALL business logic here
-            self.max_concurrent = max_concurrent
+            if scheduler is None:
+                scheduler = (
+                    AdmissionScheduler(max_concurrent=max_concurrent)
+                    if max_concurrent is not None
+                    else get_admission_scheduler()
+                )
+            self.scheduler = scheduler
+            self.max_concurrent = scheduler.max_concurrent
             self.max_requests_per_minute = max_requests_per_minute
             self.cleanup_interval = cleanup_interval
 
             # Request tracking
             self.active_requests: set = set()
-            self.request_history: Dict[int, deque] = defaultdict(lambda: deque(maxlen=100))
+            self.rate_limiter = SlidingWindowRateLimiter(max_requests=max_requests_per_minute)
             self.last_cleanup = time.time()
 
-            # Semaphore for concurrent request limiting
-            self._semaphore = asyncio.Semaphore(max_concurrent)
-
             logger.info(LOG_MESSAGES["RESOURCE_MANAGER_INITIALIZED"].format(
-                max_concurrent=max_concurrent,
+                max_concurrent=self.max_concurrent,
                 max_requests_per_minute=max_requests_per_minute
             ))
             
@@ -108,23 +118,12 @@ class ResourceManager:
         """
         try:
             # ALL business logic here
-            current_time = time.time()
-            user_requests = self.request_history[telegram_id]
-
-            # Remove old requests (older than 1 minute)
-            while user_requests and current_time - user_requests[0] > 60:
-                user_requests.popleft()
-
-            # Check if user has exceeded rate limit
-            if len(user_requests) >= self.max_requests_per_minute:
+            if self.rate_limiter.is_limited(telegram_id):
                 logger.warning(WARNING_MESSAGES["RATE_LIMIT_EXCEEDED"].format(
                     telegram_id=telegram_id,
-                    request_count=len(user_requests)
+                    request_count=self.max_requests_per_minute
                 ))
                 return True
-
-            # Add current request
-            user_requests.append(current_time)
             return False
             
         except Exception as e:
@@ -132,21 +131,23 @@ class ResourceManager:
             # Fail safe - allow request if rate limiting fails
             return False
 
-    async def acquire_semaphore(self) -> bool:
+    async def acquire_semaphore(
+        self, team_id: str = "default", priority: AdmissionPriority = AdmissionPriority.INTERACTIVE
+    ) -> bool:
         """
-        Acquire semaphore for concurrent request limiting.
+        Wait for an admission slot for concurrent request limiting.
+
+        Args:
+            team_id: Team the request belongs to (for fair queuing between teams)
+            priority: Priority class (see classify_priority)
 
         Returns:
-            True if acquired successfully, False if timeout
+            True if admitted (call release_semaphore when done), False if the
+            request was dropped: queue full or its wait bound expired
         """
         try:
             # ALL business logic here
-            try:
-                await asyncio.wait_for(self._semaphore.acquire(), timeout=1.0)
-                return True
-            except asyncio.TimeoutError:
-                logger.warning(WARNING_MESSAGES["CONCURRENT_LIMIT_EXCEEDED"])
-                return False
+            return await self.scheduler.acquire(team_id, priority)
                 
         except Exception as e:
             logger.error(f"❌ Error in acquire_semaphore: {e}")
@@ -154,11 +155,11 @@ class ResourceManager:
 
     def release_semaphore(self) -> None:
         """
-        Release semaphore after request completion.
+        Release the admission slot after request completion.
         """
         try:
             # ALL business logic here
-            self._semaphore.release()
+            self.scheduler.release()
             
         except Exception as e:
             logger.error(f"❌ Error in release_semaphore: {e}")
@@ -173,21 +174,12 @@ class ResourceManager:
             if current_time - self.last_cleanup < self.cleanup_interval:
                 return
 
-            # Clean up old request history
-            for telegram_id in list(self.request_history.keys()):
-                user_requests = self.request_history[telegram_id]
-                
-                # Remove requests older than 5 minutes
-                while user_requests and current_time - user_requests[0] > 300:
-                    user_requests.popleft()
-
-                # Remove empty user histories
-                if not user_requests:
-                    del self.request_history[telegram_id]
+            # Drop users idle for longer than the rate limit window
+            self.rate_limiter.prune(current_time)
 
             self.last_cleanup = current_time
             logger.debug(LOG_MESSAGES["CLEANUP_COMPLETED"].format(
-                user_count=len(self.request_history),
+                user_count=self.rate_limiter.tracked_keys,
                 active_requests=len(self.active_requests)
             ))
             
@@ -203,23 +195,25 @@ class ResourceManager:
         """
         try:
             # ALL business logic here
-            current_time = time.time()
-            
+            request_counts = self.rate_limiter.request_counts()
+
             # Calculate average requests per user
-            total_requests = sum(len(requests) for requests in self.request_history.values())
+            total_requests = sum(request_counts.values())
             avg_requests_per_user = (
-                total_requests / len(self.request_history) 
-                if self.request_history else 0
+                total_requests / len(request_counts)
+                if request_counts else 0
             )
 
             return {
                 "active_requests": len(self.active_requests),
-                "total_users": len(self.request_history),
+                "total_users": len(request_counts),
+                "evicted_users": self.rate_limiter.evicted_keys,
                 "total_requests": total_requests,
                 "avg_requests_per_user": avg_requests_per_user,
                 "max_concurrent": self.max_concurrent,
                 "max_requests_per_minute": self.max_requests_per_minute,
                 "last_cleanup": self.last_cleanup,
+                "admission": self.scheduler.get_metrics(),
             }
             
         except Exception as e:
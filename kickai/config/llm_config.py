@@ -9,18 +9,33 @@ Features:
 - Thread-safe singleton pattern
 - Production-ready provider-specific optimizations
 - Fail-fast validation with no silent failures
+- Token accounting and prompt budgets on every LLM call (see kickai.core.token_accounting)
+- Optional routing across fallback providers (AI_FALLBACK_ENDPOINTS, see
+  kickai.infrastructure.llm_providers.router)
+- AI_PROVIDER=mock for offline runs (kickai.infrastructure.llm_providers.mock_llm)
 """
 
 import logging
 from functools import lru_cache
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 from crewai import LLM
 from kickai.core.enums import AgentRole, AIProvider
 from kickai.core.config import get_settings
+from kickai.core.token_accounting import AccountedLLM
+from kickai.infrastructure.llm_providers.factory import LLMProviderFactory, ProviderConfig
+from kickai.infrastructure.llm_providers.router import RoutedLLM
 
 logger = logging.getLogger(__name__)
 
+# LiteLLM model prefix for each provider
+PROVIDER_MODEL_PREFIXES = {
+    AIProvider.GROQ: "groq",
+    AIProvider.OPENAI: "openai",
+    AIProvider.GOOGLE_GEMINI: "gemini",
+    AIProvider.OLLAMA: "ollama",
+}
+
 
 class LLMConfiguration:
     """
@@ -45,9 +60,15 @@ class LLMConfiguration:
         
         # Provider-specific settings
         self._validate_provider_requirements()
+
+        # Fallback endpoints for routing, as (model prefix, model name)
+        self.fallback_endpoints = self._parse_fallback_endpoints(
+            getattr(self.settings, 'ai_fallback_endpoints', '')
+        )
         
         logger.info(f"🤖 LLM Configuration: provider={self.ai_provider.value}, "
-                   f"simple={self.simple_model}, advanced={self.advanced_model}")
+                   f"simple={self.simple_model}, advanced={self.advanced_model}, "
+                   f"fallbacks={[f'{prefix}/{model}' for prefix, model in self.fallback_endpoints]}")
 
     def _get_required_setting(self, setting_name: str) -> str:
         """Get required setting value or fail."""
@@ -74,7 +95,38 @@ class LLMConfiguration:
             if not self.settings.ollama_base_url:
                 raise ValueError("OLLAMA_BASE_URL is required for Ollama provider")
 
-    def create_llm(self, model_name: str, temperature: float, max_tokens: int) -> LLM:
+    def _parse_fallback_endpoints(self, value: str) -> List[Tuple[str, str]]:
+        """Parse 'provider/model,...' into (model prefix, model name) pairs, failing fast."""
+        endpoints = []
+        for entry in filter(None, (item.strip() for item in (value or "").split(","))):
+            prefix, _, model_name = entry.partition("/")
+            if not model_name or prefix not in PROVIDER_MODEL_PREFIXES.values():
+                raise ValueError(f"Invalid AI_FALLBACK_ENDPOINTS entry: {entry!r} (expected provider/model)")
+            self._endpoint_kwargs(prefix, model_name)
+            endpoints.append((prefix, model_name))
+        return endpoints
+
+    def _endpoint_kwargs(self, prefix: str, model_name: str) -> Dict[str, Any]:
+        """Model string and credentials for one provider endpoint."""
+        if prefix == "ollama":
+            if not self.settings.ollama_base_url:
+                raise ValueError("OLLAMA_BASE_URL is required for Ollama endpoints")
+            return {"model": f"ollama/{model_name}", "base_url": self.settings.ollama_base_url}
+
+        api_keys = {
+            "groq": ("groq_api_key", "GROQ_API_KEY"),
+            "openai": ("openai_api_key", "OPENAI_API_KEY"),
+            "gemini": ("gemini_api_key", "GOOGLE_API_KEY"),
+        }
+        setting_name, env_name = api_keys[prefix]
+        api_key = getattr(self.settings, setting_name, None)
+        if not api_key:
+            raise ValueError(f"{env_name} is required for {prefix} endpoints")
+        return {"model": f"{prefix}/{model_name}", "api_key": api_key}
+
+    def create_llm(
+        self, model_name: str, temperature: float, max_tokens: int, agent_name: str = "shared"
+    ) -> LLM:
         """
         Create LLM instance with provider-specific configuration.
         
@@ -82,6 +134,7 @@ class LLMConfiguration:
             model_name: Name of the model to use
             temperature: Model temperature (0.0-1.0)
             max_tokens: Maximum tokens to generate
+            agent_name: Agent the LLM's token usage is attributed to
             
         Returns:
             LLM: Configured CrewAI LLM instance
@@ -95,39 +148,54 @@ class LLMConfiguration:
             "max_tokens": max_tokens,
             "timeout": self.settings.ai_timeout,
             "stream": False,  # Disable streaming for CrewAI compatibility
+            "agent_name": agent_name,
+            "prompt_token_budget": self.settings.ai_prompt_token_budget,
         }
         
-        # Provider-specific configuration
-        if self.ai_provider == AIProvider.GROQ:
-            return LLM(
-                model=f"groq/{model_name}",
-                api_key=self.settings.groq_api_key,
-                **config
-            )
-            
-        elif self.ai_provider == AIProvider.OPENAI:
-            return LLM(
-                model=f"openai/{model_name}",
-                api_key=self.settings.openai_api_key,
-                **config
+        if self.ai_provider == AIProvider.MOCK:
+            # Offline runs and benchmarks: canned responses with deterministic token counts
+            provider = LLMProviderFactory.create_provider(
+                ProviderConfig(
+                    provider=AIProvider.MOCK,
+                    model_name=model_name,
+                    temperature=temperature,
+                    additional_params={
+                        "max_tokens": max_tokens,
+                        "agent_name": agent_name,
+                        "prompt_token_budget": self.settings.ai_prompt_token_budget,
+                    },
+                )
             )
-            
-        elif self.ai_provider == AIProvider.GOOGLE_GEMINI:
-            return LLM(
-                model=f"gemini/{model_name}",
-                api_key=self.settings.gemini_api_key,
-                **config
-            )
-            
-        elif self.ai_provider == AIProvider.OLLAMA:
-            return LLM(
-                model=f"ollama/{model_name}",
-                base_url=self.settings.ollama_base_url,
-                **config
-            )
-            
-        else:
+            return provider.create_llm()
+
+        prefix = PROVIDER_MODEL_PREFIXES.get(self.ai_provider)
+        if prefix is None:
             raise ValueError(f"Unsupported AI provider: {self.ai_provider}")
+        primary = self._endpoint_kwargs(prefix, model_name)
+
+        # Plain LLM parameters, for endpoints and the over-budget model
+        llm_params = {
+            key: value for key, value in config.items() if key not in ("agent_name", "prompt_token_budget")
+        }
+        downgrade_model = getattr(self.settings, 'ai_budget_downgrade_model', None) or self.simple_model
+        if downgrade_model != model_name:
+            config["downgrade_llm"] = LLM(**self._endpoint_kwargs(prefix, downgrade_model), **llm_params)
+
+        if not self.fallback_endpoints:
+            return AccountedLLM(**primary, **config)
+
+        # Routed: each endpoint is a plain LLM; accounting happens once on the RoutedLLM
+        endpoints = [
+            LLMProviderFactory.create_endpoint(
+                kwargs["model"],
+                LLM(**kwargs, **llm_params),
+                failure_threshold=self.settings.ai_breaker_failure_threshold,
+                reset_seconds=self.settings.ai_breaker_reset_seconds,
+            )
+            for kwargs in [primary] + [self._endpoint_kwargs(*endpoint) for endpoint in self.fallback_endpoints]
+        ]
+        router = LLMProviderFactory.create_router(endpoints, hedge=self.settings.ai_hedge_requests)
+        return RoutedLLM(**primary, **config, router=router)
 
     @property
     @lru_cache(maxsize=1)
@@ -193,12 +261,12 @@ class LLMConfiguration:
             raise ValueError(f"No LLM configuration found for agent role: {agent_role}")
         
         # Create agent LLM
-        agent_llm = self.create_llm(**config)
+        agent_llm = self.create_llm(**config, agent_name=agent_role.value)
         
         # Create tool LLM with lower temperature
         tool_config = config.copy()
         tool_config['temperature'] = self.settings.ai_temperature_tools
-        tool_llm = self.create_llm(**tool_config)
+        tool_llm = self.create_llm(**tool_config, agent_name=f"{agent_role.value}_tools")
             
         return agent_llm, tool_llm
 
@@ -21,8 +21,12 @@ class Environment(str, Enum):
     TESTING = "testing"
 
 
+from kickai.core.constants.agent_constants import AgentConstants
 from kickai.core.enums import AIProvider
 
+# Routing, context lookups and reply formatting on top of a full crew run
+REQUEST_DEADLINE_HEADROOM_SECONDS = 30.0
+
 
 class Settings(BaseSettings):
     """Main application settings - single source of truth for all configuration."""
@@ -60,6 +64,28 @@ class Settings(BaseSettings):
     )
     firebase_batch_size: int = Field(default=500, description="Firebase batch size")
     firebase_timeout: int = Field(default=30, description="Firebase timeout in seconds")
+    firestore_max_concurrent_operations: int = Field(
+        default=32, description="Bulkhead size: most Firestore operations in flight at once"
+    )
+    firestore_breaker_failure_threshold: int = Field(
+        default=5, description="Consecutive Firestore outages or timeouts that open its circuit breaker"
+    )
+    firestore_breaker_reset_seconds: int = Field(
+        default=30, description="Seconds an open Firestore breaker waits before a trial call"
+    )
+    team_config_refresh_interval_seconds: float = Field(
+        default=60.0, description="Team config hot-reload poll interval in seconds (0 disables)"
+    )
+    roster_replica_team_ids: str = Field(
+        default="",
+        description="Comma-separated team IDs whose players, members and matches are served from a live in-memory replica",
+    )
+    roster_replica_max_staleness_seconds: float = Field(
+        default=30.0, description="Oldest replica data served before reads fall through to the store"
+    )
+    roster_replica_poll_interval_seconds: float = Field(
+        default=10.0, description="Replica refresh interval for stores without snapshot listeners"
+    )
     
     # ============================================================================
     # AI/LLM CONFIGURATION
@@ -120,7 +146,99 @@ class Settings(BaseSettings):
     ai_max_tokens_creative: int = Field(default=1000, description="AI max tokens for creative tasks")
     ai_timeout: int = Field(default=120, description="AI timeout in seconds")
     ai_max_retries: int = Field(default=5, description="AI max retries")
-    
+    ai_prompt_token_budget: int = Field(
+        default=0,
+        description="Per-call prompt token budget; history and context are trimmed above it (0 disables, opt-in)"
+    )
+
+    # LLM Routing (see kickai.infrastructure.llm_providers.router)
+    ai_fallback_endpoints: str = Field(
+        default="",
+        description="Comma-separated provider/model fallbacks, e.g. 'openai/gpt-4o-mini,ollama/llama3.1' (empty disables routing)"
+    )
+    ai_hedge_requests: bool = Field(
+        default=False,
+        description="Fire a second request at the next endpoint when a call exceeds its p95 latency"
+    )
+    ai_breaker_failure_threshold: int = Field(
+        default=3, description="Consecutive failures that open an LLM endpoint's circuit breaker"
+    )
+    ai_breaker_reset_seconds: int = Field(
+        default=60, description="Seconds an open LLM endpoint breaker waits before a trial call"
+    )
+
+    # Agent Memory (see kickai.core.memory_manager)
+    agent_memory_backend: str = Field(
+        default="local",
+        description="Agent memory backend: 'local' (embedded SQLite, no embeddings) or 'crewai' (ChromaDB + embeddings)",
+    )
+    agent_memory_path: str = Field(
+        default=":memory:", description="SQLite file for the local agent memory backend (':memory:' keeps it in-process)"
+    )
+    agent_memory_max_entries: int = Field(
+        default=500, description="Maximum local memory entries kept per namespace (oldest evicted first)"
+    )
+    conversation_summary_store: str = Field(
+        default="none",
+        description="Where conversation summaries persist across restarts: 'none' (in memory only), 'sqlite' or 'firestore'",
+    )
+    conversation_summary_path: str = Field(
+        default=".conversation_summaries.db", description="SQLite file for persisted conversation summaries"
+    )
+    conversation_summary_flush_seconds: float = Field(
+        default=2.0, description="Write-behind interval for persisting conversation summaries"
+    )
+    request_deadline_seconds: float = Field(
+        default=AgentConstants.CREW_MAX_EXECUTION_TIME + REQUEST_DEADLINE_HEADROOM_SECONDS,
+        description=(
+            "Deadline for handling one message; bounds every Firestore and tool call made for it "
+            "(0 disables). Keep it above CREW_MAX_EXECUTION_TIME so crew runs are not cut short"
+        ),
+    )
+    token_usage_store_path: str = Field(
+        default=".token_usage.db", description="SQLite ledger of LLM calls for usage reports and team budgets"
+    )
+    ai_team_token_budget: int = Field(
+        default=0, description="Default per-team LLM token budget over ai_team_budget_window (0 disables)"
+    )
+    ai_team_cost_budget_usd: float = Field(
+        default=0.0, description="Default per-team estimated LLM cost budget in USD over ai_team_budget_window (0 disables)"
+    )
+    ai_team_budget_window: str = Field(
+        default="24h", description="Rolling window for team LLM budgets: '1h', '24h', '7d' or '30d'"
+    )
+    ai_team_budget_action: str = Field(
+        default="downgrade",
+        description="What happens once a team's LLM budget is used up: 'downgrade' to a cheaper model or 'throttle'",
+    )
+    ai_budget_downgrade_model: Optional[str] = Field(
+        default=None, description="Model used for teams over budget (defaults to ai_model_simple)"
+    )
+    crew_activity_store_path: str = Field(
+        default=".crew_activity.db",
+        description="SQLite file of team activity, scheduled demand and hibernated crew blueprints",
+    )
+    crew_prewarm_enabled: bool = Field(
+        default=True, description="Build crews ahead of predicted demand (match kickoffs, usual busy hours)"
+    )
+    crew_prewarm_lead_minutes: int = Field(
+        default=120, description="How far ahead crews are pre-warmed; warmed crews are not hibernated within it"
+    )
+    crew_prewarm_min_events: float = Field(
+        default=2.0,
+        description="Average messages/reminder runs in the lead window over past weeks that count as predicted demand",
+    )
+    agent_adaptive_iterations: bool = Field(
+        default=True,
+        description="Cap agent iterations by the request's task class and tune the caps from observed runs",
+    )
+    metrics_port: int = Field(
+        default=0, description="Port for the local OpenMetrics endpoint (GET /metrics); 0 disables it"
+    )
+    metrics_host: str = Field(
+        default="127.0.0.1", description="Interface the metrics endpoint binds to"
+    )
+
 
     # Ollama Configuration (if using Ollama)
     ollama_base_url: str = Field(
@@ -162,6 +280,10 @@ class Settings(BaseSettings):
     debug: bool = Field(default=False, description="Debug mode")
     verbose_logging: bool = Field(default=False, description="Verbose logging")
     test_mode: bool = Field(default=False, description="Test mode")
+    startup_validation_cache_path: str = Field(
+        default=".startup_validation_cache.json",
+        description="File caching static startup check results by code/config fingerprint (empty disables)",
+    )
     
     # ============================================================================
     # VALIDATION METHODS
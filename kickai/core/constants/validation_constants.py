@@ -29,6 +29,8 @@ class ValidationConstants:
     MIN_PHONE_DIGITS: int = 10  # Added for tool compatibility
     UK_PHONE_REGEX: str = r"^(\+Union[44, 0])[0-9]{10}$"
     INTERNATIONAL_PHONE_REGEX: str = r"^\+?[1-9]\d{1,14}$"
+    UK_COUNTRY_CODE: str = "+44"
+    PHONE_TOO_SHORT_MSG: str = "Phone number must have at least {min} digits"
 
     # Player Position Validation
     VALID_PLAYER_POSITIONS: List[str] = field(default_factory=lambda: [
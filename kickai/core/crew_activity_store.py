@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Crew Activity History
+
+A local SQLite file recording when each team needs its crew:
+
+- activity: messages handled and reminder runs, kept for a few weeks, so
+  demand recurring at the same hour of the week can be predicted
+- scheduled demand: known future events such as match kickoffs
+- crew blueprints: the JSON a hibernated crew is rehydrated from, so they
+  survive restarts
+
+The crew pre-warmer asks ``expected_teams`` which crews to build ahead of a
+lead window.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from loguru import logger
+
+ACTIVITY_MESSAGE = "message"
+ACTIVITY_REMINDER = "reminder"
+DEMAND_MATCH = "match"
+
+WEEK_SECONDS = 7 * 24 * 3600
+# Weeks of activity kept and averaged when predicting demand
+ACTIVITY_HISTORY_WEEKS = 4
+# Old rows are pruned once per this many recorded events
+PRUNE_EVERY_EVENTS = 500
+
+
+class CrewActivityStore:
+    """SQLite activity history and blueprint store (every access holds a lock)."""
+
+    def __init__(self, path: str = ":memory:", history_weeks: int = ACTIVITY_HISTORY_WEEKS):
+        self.path = path
+        self.history_weeks = history_weeks
+        self._lock = threading.Lock()
+        self._events_since_prune = 0
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS activity (team_id TEXT NOT NULL, ts REAL NOT NULL, kind TEXT NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS idx_activity_ts ON activity (ts)")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS scheduled_demand (
+                    team_id TEXT NOT NULL,
+                    at REAL NOT NULL,
+                    kind TEXT NOT NULL,
+                    PRIMARY KEY (team_id, at, kind)
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS crew_blueprints (team_id TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+
+    def record_activity(self, team_id: str, kind: str = ACTIVITY_MESSAGE, ts: Optional[float] = None) -> None:
+        """Record that a team used its crew (a message) or will soon (a reminder run)."""
+        ts = time.time() if ts is None else ts
+        with self._lock, self._connection:
+            self._connection.execute("INSERT INTO activity VALUES (?, ?, ?)", (team_id, ts, kind))
+            self._events_since_prune += 1
+            if self._events_since_prune >= PRUNE_EVERY_EVENTS:
+                self._events_since_prune = 0
+                self._prune(ts)
+
+    def schedule(self, team_id: str, at: float, kind: str = DEMAND_MATCH) -> None:
+        """Record a known future event (epoch seconds) the team's crew should be warm for."""
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR IGNORE INTO scheduled_demand VALUES (?, ?, ?)", (team_id, at, kind))
+
+    def expected_teams(self, now: float, lead_seconds: float, min_events: float) -> Dict[str, str]:
+        """
+        Teams expected to need their crew within ``lead_seconds`` of ``now``, with the reason.
+
+        A team is expected when it has scheduled demand in the window, or when
+        its activity in the same window of each of the last ``history_weeks``
+        weeks averages at least ``min_events``.
+        """
+        expected: Dict[str, str] = {}
+        with self._lock:
+            scheduled = self._connection.execute(
+                "SELECT team_id, kind, MIN(at) FROM scheduled_demand WHERE at BETWEEN ? AND ? GROUP BY team_id",
+                (now, now + lead_seconds),
+            ).fetchall()
+
+            windows, params = [], []
+            for week in range(1, self.history_weeks + 1):
+                start = now - week * WEEK_SECONDS
+                windows.append("ts BETWEEN ? AND ?")
+                params += [start, start + lead_seconds]
+            recurring = self._connection.execute(
+                f"SELECT team_id, COUNT(*) FROM activity WHERE {' OR '.join(windows)} GROUP BY team_id",
+                params,
+            ).fetchall()
+
+        for team_id, kind, at in scheduled:
+            expected[team_id] = f"{kind} in {int((at - now) // 60)} min"
+        for team_id, count in recurring:
+            average = count / self.history_weeks
+            if team_id not in expected and average >= min_events:
+                expected[team_id] = f"{average:.1f} events at this time on average"
+        return expected
+
+    def save_blueprint(self, team_id: str, data: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO crew_blueprints VALUES (?, ?)", (team_id, data))
+
+    def load_blueprint(self, team_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM crew_blueprints WHERE team_id = ?", (team_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def delete_blueprint(self, team_id: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM crew_blueprints WHERE team_id = ?", (team_id,))
+
+    def _prune(self, now: float) -> None:
+        # Caller holds the lock and the transaction
+        self._connection.execute("DELETE FROM activity WHERE ts < ?", (now - self.history_weeks * WEEK_SECONDS,))
+        self._connection.execute("DELETE FROM scheduled_demand WHERE at < ?", (now,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+# Global store instance
+_crew_activity_store: Optional[CrewActivityStore] = None
+
+
+def get_crew_activity_store() -> CrewActivityStore:
+    """Get the global crew activity store (kept in memory if no file is configured)."""
+    global _crew_activity_store
+    if _crew_activity_store is None:
+        try:
+            from kickai.core.config import get_settings
+
+            path = get_settings().crew_activity_store_path or ":memory:"
+            _crew_activity_store = CrewActivityStore(path)
+        except Exception as e:
+            logger.warning(f"⚠️ Crew activity history kept in memory: {e}")
+            _crew_activity_store = CrewActivityStore()
+    return _crew_activity_store
+
+
+def record_team_activity(team_id: str, kind: str = ACTIVITY_MESSAGE) -> None:
+    """Best-effort ``record_activity`` on the global store (never raises)."""
+    try:
+        get_crew_activity_store().record_activity(team_id, kind)
+    except Exception as e:
+        logger.debug(f"Could not record crew activity for team {team_id}: {e}")
+
+
+def schedule_team_demand(team_id: str, at: float, kind: str = DEMAND_MATCH) -> None:
+    """Best-effort ``schedule`` on the global store (never raises)."""
+    try:
+        get_crew_activity_store().schedule(team_id, at, kind)
+    except Exception as e:
+        logger.debug(f"Could not schedule crew demand for team {team_id}: {e}")
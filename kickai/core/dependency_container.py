@@ -8,9 +8,11 @@ all service dependencies and ensures proper initialization order.
 import os
 from typing import Any, Optional, Union
 
+from kickai.core.config import get_settings
 from kickai.database.firebase_client import get_firebase_client
 from kickai.database.interfaces import DataStoreInterface
 from kickai.database.mock_data_store import MockDataStore
+from kickai.database.team_replica import ReplicatedDataStore
 from kickai.features.registry import ServiceFactory, create_service_factory
 
 
@@ -40,6 +42,9 @@ class DependencyContainer:
         # Phase 4: Initialize team config cache for performance optimization
         await self._initialize_team_config_cache()
 
+        # Phase 5: Load live roster replicas for opted-in teams
+        await self._initialize_roster_replicas()
+
         self._initialized = True
 
     async def _initialize_team_config_cache(self):
@@ -63,6 +68,23 @@ class DependencyContainer:
             logger.info("🔄 System will fall back to database queries for team config")
             # Don't fail startup - system can work without cache
 
+    async def _initialize_roster_replicas(self):
+        """Load and start syncing the roster replica of each opted-in team."""
+        if not isinstance(self._database, ReplicatedDataStore):
+            return
+
+        from kickai.core.logging_config import logger
+
+        for team_id in get_settings().roster_replica_team_ids.split(","):
+            team_id = team_id.strip()
+            if not team_id:
+                continue
+            try:
+                await self._database.enable_team(team_id)
+            except Exception as e:
+                logger.warning(f"⚠️ Roster replica for team {team_id} failed to load: {e}")
+                logger.info("🔄 Reads for this team will go to the database")
+
     def _initialize_database(self):
         """Initialize the database connection."""
         # Check if mock data store is enabled
@@ -85,6 +107,15 @@ class DependencyContainer:
             firebase_client = get_firebase_client()
             self._database = firebase_client
 
+        # Opted-in teams read their roster from a live in-memory replica
+        settings = get_settings()
+        if settings.roster_replica_team_ids.strip():
+            self._database = ReplicatedDataStore(
+                self._database,
+                max_staleness_seconds=settings.roster_replica_max_staleness_seconds,
+                poll_interval_seconds=settings.roster_replica_poll_interval_seconds,
+            )
+
         self._services[DataStoreInterface] = self._database
 
 # Removed _initialize_mock_data() - was redundant after removing asyncio.run()
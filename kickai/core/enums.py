@@ -286,6 +286,7 @@ class CheckCategory(Enum):
     CONFIGURATION = "CONFIGURATION"
     DATABASE = "DATABASE"
     TELEGRAM = "TELEGRAM"
+    REGISTRY = "REGISTRY"
 
 
 class MemoryType(Enum):
@@ -181,6 +181,50 @@ class ServiceNotAvailableError(ServiceError):
         super().__init__(message, {"service_name": service_name})
 
 
+class DependencyUnavailableError(ServiceError):
+    """
+    Raised without calling a dependency whose circuit breaker is open or whose bulkhead is full.
+
+    Attributes:
+        dependency (str): The name of the guarded dependency (e.g. "firestore").
+        reason (str): Why the call was refused.
+    """
+
+    def __init__(self, dependency: str, reason: str):
+        message = f"Dependency {dependency} is unavailable: {reason}"
+        super().__init__(message, {"dependency": dependency, "reason": reason})
+        self.dependency = dependency
+
+
+class TokenBudgetExceededError(DependencyUnavailableError):
+    """
+    Raised instead of an LLM call when a team has used up its token or cost budget.
+
+    Attributes:
+        team_id (str): The team whose budget is exhausted.
+    """
+
+    def __init__(self, team_id: str, reason: str):
+        super().__init__("llm", f"team {team_id} {reason}")
+        self.team_id = team_id
+        self.context["team_id"] = team_id
+
+
+class DeadlineExceededError(ServiceError):
+    """
+    Raised when a dependency call does not finish within the request deadline.
+
+    Attributes:
+        dependency (str): The name of the guarded dependency.
+        budget_seconds (float): The time the call was allowed.
+    """
+
+    def __init__(self, dependency: str, budget_seconds: float):
+        message = f"Call to {dependency} exceeded its {budget_seconds:.2f}s deadline"
+        super().__init__(message, {"dependency": dependency, "budget_seconds": budget_seconds})
+        self.dependency = dependency
+
+
 class ConfigurationError(KickAIError):
     """Base exception for configuration-related errors."""
 
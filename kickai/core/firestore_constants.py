@@ -28,6 +28,7 @@ COLLECTION_NOTIFICATIONS = "notifications"
 COLLECTION_INVITE_LINKS = "invite_links"
 COLLECTION_PLAYER_ACTIVATION_LOGS = "player_activation_logs"
 COLLECTION_TEAM_MEMBER_ACTIVATION_LOGS = "team_member_activation_logs"
+COLLECTION_TEAM_ROLE_SUMMARIES = "team_role_summaries"
 
 
 # Full collection names (with prefix)
@@ -80,4 +81,5 @@ FIRESTORE_COLLECTIONS = {
     "daily_status": get_collection_name(COLLECTION_DAILY_STATUS),
     "notifications": get_collection_name(COLLECTION_NOTIFICATIONS),
     "invite_links": get_collection_name(COLLECTION_INVITE_LINKS),
+    "team_role_summaries": get_collection_name(COLLECTION_TEAM_ROLE_SUMMARIES),
 }
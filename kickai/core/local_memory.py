@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Local CPU-only Agent Memory
+
+An embedded SQLite store used as the agent memory backend instead of CrewAI's
+ChromaDB-backed ``EntityMemory``/``ShortTermMemory``: no embedding calls and
+no external service, so recall latency is predictable.
+
+- one database, partitioned into namespaces (player, team_member, team,
+  short_term, long_term); every entry carries the entity it belongs to
+- recall uses an FTS5 full-text index (BM25 ranking) when SQLite has it,
+  and a token-overlap scan of the (bounded) namespace otherwise
+- each namespace holds at most ``max_entries`` rows; oldest entries go first
+
+``LocalMemory`` is the per-namespace view handed to agents. It offers the
+CrewAI memory calls (``save``/``search``/``reset``) and the key-value calls
+of the previous local proxy (``store``/``retrieve``).
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+DEFAULT_MAX_ENTRIES_PER_NAMESPACE = 500
+DEFAULT_SEARCH_LIMIT = 3
+# Fraction of query terms an entry must contain to be recalled
+DEFAULT_SCORE_THRESHOLD = 0.35
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Ignored in queries so question phrasing does not dilute recall scores
+STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "at", "be", "by", "can", "do", "does", "for", "from", "has", "have",
+    "how", "i", "in", "is", "it", "me", "my", "of", "on", "or", "the", "to", "was", "we",
+    "what", "when", "where", "which", "who", "why", "will", "with", "you",
+})
+
+
+def _fts5_available() -> bool:
+    try:
+        sqlite3.connect(":memory:").execute("CREATE VIRTUAL TABLE probe USING fts5(text)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+FTS5_AVAILABLE = _fts5_available()
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _as_text(value: Any) -> str:
+    return value if isinstance(value, str) else json.dumps(value, default=str, sort_keys=True)
+
+
+def _overlap_score(query_tokens: List[str], text: str) -> float:
+    if not query_tokens:
+        return 0.0
+    text_tokens = set(_tokens(text))
+    return sum(1 for token in set(query_tokens) if token in text_tokens) / len(set(query_tokens))
+
+
+class LocalMemoryStore:
+    """Thread-safe SQLite memory store shared by every namespace."""
+
+    def __init__(self, path: str = ":memory:", max_entries_per_namespace: int = DEFAULT_MAX_ENTRIES_PER_NAMESPACE):
+        self.path = path
+        self.max_entries_per_namespace = max_entries_per_namespace
+        self.use_fts = FTS5_AVAILABLE
+        # Crews call memory from worker threads
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._create_schema()
+        logger.info(
+            f"🧠 Local memory store ready at {path} "
+            f"({'FTS5' if self.use_fts else 'token scan'}, {max_entries_per_namespace} entries/namespace)"
+        )
+
+    def _create_schema(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS memory_entries (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    namespace TEXT NOT NULL,
+                    entity_id TEXT NOT NULL,
+                    key TEXT,
+                    value TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    metadata TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_memory_entity ON memory_entries (namespace, entity_id, key)"
+            )
+            if self.use_fts:
+                self._connection.execute("CREATE VIRTUAL TABLE IF NOT EXISTS memory_fts USING fts5(text)")
+
+    def add(
+        self,
+        namespace: str,
+        entity_id: str,
+        value: Any,
+        key: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Add an entry (replacing any entry with the same key), evicting the oldest beyond the bound."""
+        text = _as_text(value)
+        with self._lock, self._connection:
+            if key is not None:
+                self._delete_where("namespace = ? AND entity_id = ? AND key = ?", (namespace, entity_id, key))
+            cursor = self._connection.execute(
+                "INSERT INTO memory_entries (namespace, entity_id, key, value, text, metadata, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (namespace, entity_id, key, json.dumps(value, default=str), text,
+                 json.dumps(metadata or {}, default=str), time.time()),
+            )
+            entry_id = cursor.lastrowid
+            if self.use_fts:
+                self._connection.execute("INSERT INTO memory_fts (rowid, text) VALUES (?, ?)", (entry_id, text))
+            self._evict(namespace)
+        return entry_id
+
+    def _delete_where(self, condition: str, params: tuple) -> int:
+        ids = [row[0] for row in self._connection.execute(f"SELECT id FROM memory_entries WHERE {condition}", params)]
+        if not ids:
+            return 0
+        placeholders = ",".join("?" * len(ids))
+        self._connection.execute(f"DELETE FROM memory_entries WHERE id IN ({placeholders})", ids)
+        if self.use_fts:
+            self._connection.execute(f"DELETE FROM memory_fts WHERE rowid IN ({placeholders})", ids)
+        return len(ids)
+
+    def _evict(self, namespace: str) -> None:
+        self._delete_where(
+            "namespace = ? AND id NOT IN "
+            "(SELECT id FROM memory_entries WHERE namespace = ? ORDER BY id DESC LIMIT ?)",
+            (namespace, namespace, self.max_entries_per_namespace),
+        )
+
+    def get(self, namespace: str, entity_id: str, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM memory_entries WHERE namespace = ? AND entity_id = ? AND key = ?",
+                (namespace, entity_id, key),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def search(
+        self,
+        namespace: str,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        score_threshold: float = DEFAULT_SCORE_THRESHOLD,
+        entity_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Entries matching a query, best first.
+
+        Each result's ``score`` is the fraction of query terms (stop words
+        aside) it contains; results under ``score_threshold`` are dropped.
+        """
+        query_tokens = [token for token in _tokens(query) if token not in STOP_WORDS] or _tokens(query)
+        if not query_tokens:
+            return []
+
+        entity_filter = " AND e.entity_id = ?" if entity_id is not None else ""
+        params: List[Any] = [namespace] + ([entity_id] if entity_id is not None else [])
+        with self._lock:
+            if self.use_fts:
+                match = " OR ".join(f'"{token}"' for token in set(query_tokens))
+                rows = self._connection.execute(
+                    "SELECT e.id, e.entity_id, e.key, e.value, e.text, e.metadata FROM memory_fts "
+                    "JOIN memory_entries e ON e.id = memory_fts.rowid "
+                    f"WHERE memory_fts MATCH ? AND e.namespace = ?{entity_filter} "
+                    "ORDER BY bm25(memory_fts) LIMIT ?",
+                    [match] + params + [max(limit * 4, 20)],
+                ).fetchall()
+            else:
+                rows = self._connection.execute(
+                    "SELECT e.id, e.entity_id, e.key, e.value, e.text, e.metadata FROM memory_entries e "
+                    f"WHERE e.namespace = ?{entity_filter} ORDER BY e.id DESC",
+                    params,
+                ).fetchall()
+
+        results = []
+        for entry_id, row_entity_id, key, value, text, metadata in rows:
+            score = _overlap_score(query_tokens, text)
+            if score < score_threshold:
+                continue
+            results.append({
+                "id": entry_id,
+                "entity_id": row_entity_id,
+                "key": key,
+                "context": text,
+                "value": json.loads(value),
+                "metadata": json.loads(metadata),
+                "score": round(score, 3),
+            })
+        # Stable sort keeps BM25 (or recency) order among equal scores
+        results.sort(key=lambda result: result["score"], reverse=True)
+        return results[:limit]
+
+    def clear(self, namespace: str, entity_id: Optional[str] = None) -> int:
+        condition, params = "namespace = ?", (namespace,)
+        if entity_id is not None:
+            condition, params = "namespace = ? AND entity_id = ?", (namespace, entity_id)
+        with self._lock, self._connection:
+            return self._delete_where(condition, params)
+
+    def count(self, namespace: Optional[str] = None) -> int:
+        with self._lock:
+            if namespace is None:
+                return self._connection.execute("SELECT COUNT(*) FROM memory_entries").fetchone()[0]
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM memory_entries WHERE namespace = ?", (namespace,)
+            ).fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(
+                self._connection.execute("SELECT namespace, COUNT(*) FROM memory_entries GROUP BY namespace")
+            )
+        return {
+            "path": self.path,
+            "index": "fts5" if self.use_fts else "token_scan",
+            "max_entries_per_namespace": self.max_entries_per_namespace,
+            "namespaces": counts,
+        }
+
+
+class LocalMemory:
+    """One namespace of a ``LocalMemoryStore``, as handed to an agent."""
+
+    def __init__(self, backend: LocalMemoryStore, namespace: str):
+        self.backend = backend
+        self.namespace = namespace
+
+    # CrewAI memory interface
+    def save(self, value: Any, metadata: Optional[Dict[str, Any]] = None, agent: Optional[str] = None) -> None:
+        metadata = dict(metadata or {})
+        entity_id = str(metadata.get("entity_id") or agent or "")
+        if agent:
+            metadata.setdefault("agent", agent)
+        self.backend.add(self.namespace, entity_id, value, metadata=metadata)
+
+    def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        score_threshold: float = DEFAULT_SCORE_THRESHOLD,
+        entity_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        return self.backend.search(self.namespace, query, limit, score_threshold, entity_id)
+
+    def reset(self) -> None:
+        self.backend.clear(self.namespace)
+
+    # Key-value interface
+    def store(self, entity_id: str, key: str, value: Any, metadata: Optional[Dict[str, Any]] = None) -> None:
+        self.backend.add(self.namespace, entity_id, value, key=key, metadata=metadata)
+
+    def retrieve(self, entity_id: str, key: str) -> Optional[Any]:
+        return self.backend.get(self.namespace, entity_id, key)
+
+    def __repr__(self) -> str:
+        return f"LocalMemory(namespace={self.namespace!r})"
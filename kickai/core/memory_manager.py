@@ -4,6 +4,11 @@ Memory Manager for KICKAI System - CrewAI 0.157.0 Enhanced Memory
 
 This module provides entity-specific memory management for the KICKAI system,
 enabling better context retention and agent coordination.
+
+By default agents get the local memory backend (kickai.core.local_memory):
+an embedded SQLite store with per-entity namespaces and no embedding calls.
+Set AGENT_MEMORY_BACKEND=crewai to use CrewAI's ChromaDB-backed memory; any
+CrewAI memory that fails to initialize falls back to the local backend.
 """
 
 from typing import Dict, Any, Optional, List
@@ -15,6 +20,10 @@ from loguru import logger
 
 from kickai.core.enums import AgentRole, EntityType
 from kickai.core.config import get_settings
+from kickai.core.local_memory import LocalMemory, LocalMemoryStore
+
+MEMORY_BACKEND_LOCAL = "local"
+MEMORY_BACKEND_CREWAI = "crewai"
 
 
 @dataclass
@@ -64,7 +73,23 @@ class KICKAIMemoryManager:
         logger.info("🧠 KICKAI Memory Manager initialized")
     
     def _initialize_crewai_memory(self):
-        """Initialize CrewAI memory systems with graceful fallback."""
+        """Initialize agent memory systems, using the local backend unless CrewAI memory is selected."""
+        self.local_memory_store = LocalMemoryStore(
+            path=self.settings.agent_memory_path,
+            max_entries_per_namespace=self.settings.agent_memory_max_entries,
+        )
+        self.memory_backend = self.settings.agent_memory_backend
+
+        self.player_memory = LocalMemory(self.local_memory_store, EntityType.PLAYER.value)
+        self.team_member_memory = LocalMemory(self.local_memory_store, EntityType.TEAM_MEMBER.value)
+        self.team_memory = LocalMemory(self.local_memory_store, EntityType.TEAM.value)
+        self.short_term_memory = LocalMemory(self.local_memory_store, "short_term")
+        self.long_term_memory = LocalMemory(self.local_memory_store, "long_term")
+
+        if self.memory_backend != MEMORY_BACKEND_CREWAI:
+            logger.info("✅ Local agent memory backend initialized")
+            return
+
         try:
             # Try to initialize LongTermMemory first (most stable)
             self.long_term_memory = memory.LongTermMemory()
@@ -79,27 +104,18 @@ class KICKAIMemoryManager:
                 logger.info("✅ CrewAI EntityMemory systems initialized")
             except Exception as entity_error:
                 logger.warning(f"⚠️ CrewAI EntityMemory failed (ChromaDB issue): {entity_error}")
-                logger.info("🔄 Using local memory proxy for entity memory")
-                self.player_memory = None
-                self.team_member_memory = None
-                self.team_memory = None
+                logger.info("🔄 Using local memory backend for entity memory")
             
             try:
                 self.short_term_memory = memory.ShortTermMemory()
                 logger.info("✅ CrewAI ShortTermMemory initialized")
             except Exception as short_term_error:
                 logger.warning(f"⚠️ CrewAI ShortTermMemory failed (ChromaDB issue): {short_term_error}")
-                logger.info("🔄 Using local memory proxy for short-term memory")
-                self.short_term_memory = None
+                logger.info("🔄 Using local memory backend for short-term memory")
             
         except Exception as e:
             logger.error(f"❌ Failed to initialize any CrewAI memory systems: {e}")
-            # Complete fallback to local memory only
-            self.player_memory = None
-            self.team_member_memory = None
-            self.team_memory = None
-            self.short_term_memory = None
-            self.long_term_memory = None
+            logger.info("🔄 Using local memory backend for all agent memory")
     
     def get_memory_for_agent(self, agent_role: AgentRole) -> Any:
         """
@@ -399,33 +415,17 @@ class KICKAIMemoryManager:
         except Exception as e:
             logger.error(f"❌ Failed to cleanup expired memory: {e}")
     
-    def _get_local_memory_proxy(self):
-        """Get a proxy object that mimics CrewAI memory interface for local cache."""
-        class LocalMemoryProxy:
-            def __init__(self, manager):
-                self.manager = manager
-            
-            def store(self, entity_id: str, key: str, value: Any):
-                # Store in local cache
-                entry = MemoryEntry(
-                    key=key,
-                    value=value,
-                    entity_type=EntityType.NEITHER,
-                    entity_id=entity_id,
-                    timestamp=datetime.now()
-                )
-                cache_key = f"local:{entity_id}:{key}"
-                self.manager._local_cache[cache_key] = entry
-            
-            def retrieve(self, entity_id: str, key: str) -> Optional[Any]:
-                cache_key = f"local:{entity_id}:{key}"
-                if cache_key in self.manager._local_cache:
-                    entry = self.manager._local_cache[cache_key]
-                    if not entry.is_expired():
-                        return entry.value
-                return None
-        
-        return LocalMemoryProxy(self)
+    def _get_local_memory_proxy(self) -> LocalMemory:
+        """Get a local memory namespace for callers without a dedicated memory system."""
+        return LocalMemory(self.local_memory_store, "local")
+
+    def get_memory_stats(self) -> Dict[str, Any]:
+        """Backend in use and local memory entry counts per namespace."""
+        return {
+            "backend": self.memory_backend,
+            "local_cache_entries": len(self._local_cache),
+            "local_store": self.local_memory_store.get_stats(),
+        }
 
 
 # Global memory manager instance
@@ -2,9 +2,20 @@
 Monitoring module for KICKAI system.
 
 This module provides monitoring and metrics collection
-for registry performance and usage.
+for registry performance and usage, and the runtime metrics endpoint.
 """
 
+from .metrics_registry import CollectedMetric, MetricsRegistry, get_metrics_registry
+from .metrics_server import MetricsServer, start_metrics_server, stop_metrics_server
 from .registry_monitor import RegistryMetrics, RegistryMonitor
 
-__all__ = ["RegistryMetrics", "RegistryMonitor"]
+__all__ = [
+    "CollectedMetric",
+    "MetricsRegistry",
+    "MetricsServer",
+    "RegistryMetrics",
+    "RegistryMonitor",
+    "get_metrics_registry",
+    "start_metrics_server",
+    "stop_metrics_server",
+]
@@ -0,0 +1,280 @@
+"""
+Unified metrics registry.
+
+One process-wide registry of counters and histograms for the bot runtime
+(messages, routing, crew latency, admission waits, dependency and LLM calls),
+rendered in the Prometheus/OpenMetrics text format for ``MetricsServer``.
+
+Recording is lock-free: each thread writes to its own shard (asyncio code all
+runs on the event loop thread; Firestore calls land on the bulkhead threads)
+and a scrape merges the shards. The registry lock is only taken when a metric
+is declared, when a thread records its first value, and by scrapes.
+
+Components that already keep their own counters (admission scheduler, crew
+lifecycle manager, registry monitor) register a collector instead, which is
+called at scrape time.
+
+Usage:
+    MESSAGES = get_metrics_registry().counter("kickai_messages", "Messages received", ("team_id",))
+    MESSAGES.inc("KTI")
+    LATENCY = get_metrics_registry().histogram("kickai_crew_execution_seconds", "Crew latency", ("team_id",))
+    LATENCY.observe(1.2, "KTI")
+"""
+
+import math
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+# Seconds; spans Firestore reads (ms) to slow crew executions (minutes)
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+
+@dataclass
+class CollectedMetric:
+    """A metric family produced by a collector at scrape time."""
+
+    name: str
+    type: str
+    help: str
+    # (labels, value); counters are named without the ``_total`` suffix
+    samples: List[Tuple[Dict[str, str], float]] = field(default_factory=list)
+
+
+class _Shard:
+    """One thread's recorded values."""
+
+    __slots__ = ("counters", "histograms")
+
+    def __init__(self) -> None:
+        self.counters: Dict[Tuple[str, LabelValues], float] = {}
+        # Per-bucket counts (the last is +Inf) followed by the running sum
+        self.histograms: Dict[Tuple[str, LabelValues], List[float]] = {}
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, registry: "MetricsRegistry", name: str, help_text: str, label_names: Sequence[str]):
+        self.registry = registry
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+
+    def _key(self, label_values: Sequence[object]) -> Tuple[str, LabelValues]:
+        if len(label_values) != len(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(label_values)}")
+        return self.name, tuple(str(value) for value in label_values)
+
+
+class Counter(_Metric):
+    """Monotonic count, exported as ``<name>_total``."""
+
+    type = COUNTER
+
+    def inc(self, *label_values: object, amount: float = 1.0) -> None:
+        counters = self.registry._shard().counters
+        key = self._key(label_values)
+        counters[key] = counters.get(key, 0.0) + amount
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed buckets."""
+
+    type = HISTOGRAM
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        help_text: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(registry, name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *label_values: object) -> None:
+        histograms = self.registry._shard().histograms
+        key = self._key(label_values)
+        cells = histograms.get(key)
+        if cells is None:
+            cells = histograms[key] = [0.0] * (len(self.buckets) + 2)
+        cells[bisect_left(self.buckets, value)] += 1
+        cells[-1] += value
+
+
+class MetricsRegistry:
+    """Process-wide counters and histograms with per-thread recording shards."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[CollectedMetric]]] = {}
+        self._shards: List[_Shard] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    # Declaration (idempotent, so modules can declare their metrics at import time)
+    def counter(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._declare(Counter, name, help_text, label_names)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._declare(Histogram, name, help_text, label_names, buckets=buckets)
+
+    def _declare(self, cls, name: str, help_text: str, label_names: Sequence[str], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(self, name, help_text, label_names, **kwargs)
+            elif not isinstance(metric, cls) or metric.label_names != tuple(label_names):
+                raise ValueError(f"Metric {name} is already declared as a different {metric.type}")
+            return metric
+
+    def register_collector(self, name: str, collect: Callable[[], Iterable[CollectedMetric]]) -> None:
+        """Add (or replace) a scrape-time source of metrics."""
+        with self._lock:
+            self._collectors[name] = collect
+
+    def unregister_collector(self, name: str) -> None:
+        with self._lock:
+            self._collectors.pop(name, None)
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    # Reading
+    def counter_value(self, name: str, *label_values: object) -> float:
+        """Current total of one counter series (summed over threads)."""
+        key = (name, tuple(str(value) for value in label_values))
+        with self._lock:
+            shards = list(self._shards)
+        return sum(shard.counters.get(key, 0.0) for shard in shards)
+
+    def _merged(self) -> Tuple[Dict[Tuple[str, LabelValues], float], Dict[Tuple[str, LabelValues], List[float]]]:
+        with self._lock:
+            shards = list(self._shards)
+        counters: Dict[Tuple[str, LabelValues], float] = {}
+        histograms: Dict[Tuple[str, LabelValues], List[float]] = {}
+        for shard in shards:
+            # Copies are taken under the GIL; the owning thread may keep writing meanwhile
+            for key, value in list(shard.counters.items()):
+                counters[key] = counters.get(key, 0.0) + value
+            for key, cells in list(shard.histograms.items()):
+                cells = list(cells)
+                merged = histograms.get(key)
+                histograms[key] = cells if merged is None else [a + b for a, b in zip(merged, cells)]
+        return counters, histograms
+
+    def render(self, openmetrics: bool = True) -> str:
+        """The registry in OpenMetrics text (or the Prometheus 0.0.4 text format)."""
+        counters, histograms = self._merged()
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+            collectors = list(self._collectors.items())
+
+        lines: List[str] = []
+        for metric in metrics:
+            if isinstance(metric, Histogram):
+                series = sorted((key[1], cells) for key, cells in histograms.items() if key[0] == metric.name)
+                lines += _histogram_lines(metric, series)
+            else:
+                series = sorted((key[1], value) for key, value in counters.items() if key[0] == metric.name)
+                samples = [(dict(zip(metric.label_names, labels)), value) for labels, value in series]
+                lines += _family_lines(metric.name, COUNTER, metric.help, samples, openmetrics)
+
+        for name, collect in collectors:
+            try:
+                for family in collect():
+                    lines += _family_lines(family.name, family.type, family.help, family.samples, openmetrics)
+            except Exception as e:
+                logger.warning(f"⚠️ Metrics collector {name} failed: {e}")
+
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def _family_lines(
+    name: str, metric_type: str, help_text: str, samples: List[Tuple[Dict[str, str], float]], openmetrics: bool
+) -> List[str]:
+    sample_name = f"{name}_total" if metric_type == COUNTER else name
+    type_name = name if openmetrics or metric_type != COUNTER else sample_name
+    lines = [f"# HELP {type_name} {_escape_help(help_text)}", f"# TYPE {type_name} {metric_type}"]
+    lines += [f"{sample_name}{_labels(labels)} {_value(value)}" for labels, value in samples]
+    return lines
+
+
+def _histogram_lines(metric: Histogram, series: List[Tuple[LabelValues, List[float]]]) -> List[str]:
+    lines = [f"# HELP {metric.name} {_escape_help(metric.help)}", f"# TYPE {metric.name} {HISTOGRAM}"]
+    for label_values, cells in series:
+        labels = dict(zip(metric.label_names, label_values))
+        cumulative = 0.0
+        for bound, count in zip(metric.buckets + (math.inf,), cells[:-1]):
+            cumulative += count
+            lines.append(f"{metric.name}_bucket{_labels({**labels, 'le': _bound(bound)})} {_value(cumulative)}")
+        lines.append(f"{metric.name}_count{_labels(labels)} {_value(cumulative)}")
+        lines.append(f"{metric.name}_sum{_labels(labels)} {_value(cells[-1])}")
+    return lines
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels.items()) + "}"
+
+
+def _escape_label(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _bound(bound: float) -> str:
+    return "+Inf" if bound == math.inf else repr(float(bound))
+
+
+def _value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# Global registry instance
+_metrics_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the global metrics registry."""
+    global _metrics_registry
+    if _metrics_registry is None:
+        with _registry_lock:
+            if _metrics_registry is None:
+                _metrics_registry = MetricsRegistry()
+    return _metrics_registry
@@ -0,0 +1,113 @@
+"""
+Local HTTP endpoint serving the metrics registry.
+
+Binds to localhost by default and serves ``GET /metrics`` from a daemon
+thread, in OpenMetrics text when the scraper asks for it (``Accept:
+application/openmetrics-text``) and in the Prometheus 0.0.4 text format
+otherwise. Disabled unless ``METRICS_PORT`` is set.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from loguru import logger
+
+from kickai.core.monitoring.metrics_registry import (
+    OPENMETRICS_CONTENT_TYPE,
+    PROMETHEUS_CONTENT_TYPE,
+    MetricsRegistry,
+    get_metrics_registry,
+)
+
+METRICS_PATH = "/metrics"
+
+
+class MetricsServer:
+    """Serves one registry over HTTP until stopped."""
+
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            registry: Registry to render on each scrape
+            host: Interface to bind (keep it local unless the port is firewalled)
+            port: Port to listen on; 0 picks a free one (see ``port`` after ``start``)
+        """
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}{METRICS_PATH}"
+
+    def start(self) -> None:
+        if self._server is not None:
+            return
+        self._server = ThreadingHTTPServer((self.host, self.port), _handler_for(self.registry))
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True)
+        self._thread.start()
+        logger.info(f"📈 Metrics endpoint serving {self.url}")
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        logger.info("📈 Metrics endpoint stopped")
+
+
+def _handler_for(registry: MetricsRegistry) -> type:
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] != METRICS_PATH:
+                self.send_error(404)
+                return
+            openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+            body = registry.render(openmetrics=openmetrics).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:
+            # Scrapes every few seconds would flood the log
+            pass
+
+    return MetricsHandler
+
+
+# Global server instance
+_metrics_server: Optional[MetricsServer] = None
+
+
+def start_metrics_server() -> Optional[MetricsServer]:
+    """Start the global endpoint if ``METRICS_PORT`` is configured (idempotent, never raises)."""
+    global _metrics_server
+    if _metrics_server is not None:
+        return _metrics_server
+    try:
+        from kickai.core.config import get_settings
+
+        settings = get_settings()
+        if not settings.metrics_port:
+            return None
+        server = MetricsServer(get_metrics_registry(), settings.metrics_host, settings.metrics_port)
+        server.start()
+        _metrics_server = server
+    except Exception as e:
+        logger.warning(f"⚠️ Metrics endpoint not started: {e}")
+    return _metrics_server
+
+
+def stop_metrics_server() -> None:
+    global _metrics_server
+    if _metrics_server is not None:
+        _metrics_server.stop()
+        _metrics_server = None
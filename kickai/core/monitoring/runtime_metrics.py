@@ -0,0 +1,56 @@
+"""
+Bot runtime metrics.
+
+The counters and histograms recorded on the message path, declared once on
+the global registry so every module records into the same series.
+"""
+
+from kickai.core.monitoring.metrics_registry import get_metrics_registry
+
+_registry = get_metrics_registry()
+
+MESSAGES_RECEIVED = _registry.counter(
+    "kickai_messages_received", "Messages received by the router", ("team_id", "chat_type")
+)
+ROUTING_PATHS = _registry.counter(
+    "kickai_routing_path",
+    "Messages by the path the router sent them down (command, nlp, or the reason they were turned away)",
+    ("team_id", "path"),
+)
+CREW_EXECUTION_SECONDS = _registry.histogram(
+    "kickai_crew_execution_seconds", "Crew task execution time", ("team_id", "outcome")
+)
+ADMISSION_WAIT_SECONDS = _registry.histogram(
+    "kickai_admission_wait_seconds",
+    "Time requests waited for an admission slot (0 when admitted at once)",
+    ("priority", "outcome"),
+    buckets=(0.0, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+DEPENDENCY_CALLS = _registry.counter(
+    "kickai_dependency_calls", "Guarded dependency calls (Firestore, tools) by outcome", ("dependency", "outcome")
+)
+DEPENDENCY_CALL_SECONDS = _registry.histogram(
+    "kickai_dependency_call_seconds", "Guarded dependency call latency, bulkhead wait included", ("dependency",)
+)
+AGENT_ITERATIONS = _registry.histogram(
+    "kickai_agent_iterations",
+    "Agent iterations (LLM turns across the crew) spent on one message",
+    ("intent",),
+    buckets=(1, 2, 3, 4, 5, 6, 8, 10, 15, 20, 30),
+)
+LLM_CALLS = _registry.counter("kickai_llm_calls", "LLM completions by outcome", ("model", "outcome"))
+LLM_CALL_SECONDS = _registry.histogram("kickai_llm_call_seconds", "LLM completion latency", ("model",))
+
+# Routing paths
+PATH_COMMAND = "command"
+PATH_NLP = "nlp"
+PATH_RATE_LIMITED = "rate_limited"
+PATH_ADMISSION_REJECTED = "admission_rejected"
+PATH_DEPENDENCY_UNAVAILABLE = "dependency_unavailable"
+PATH_DEADLINE_EXCEEDED = "deadline_exceeded"
+
+# Outcomes
+OUTCOME_SUCCESS = "success"
+OUTCOME_ERROR = "error"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_REJECTED = "rejected"
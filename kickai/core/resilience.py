@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Request Deadlines, Circuit Breakers and Bulkheads
+
+A message gets one deadline when it enters ``AgenticMessageRouter`` and every
+dependency call made while handling it (Firestore, tools) is bounded by the
+time left, so a slow dependency costs a request its own budget rather than
+``CREW_MAX_EXECUTION_TIME``.
+
+Each dependency has a ``DependencyGuard``:
+
+- a ``CircuitBreaker``: after repeated outages or timeouts, calls fail fast
+  with ``DependencyUnavailableError`` until a trial call succeeds
+- a ``Bulkhead``: at most ``max_concurrent`` calls in flight; blocking calls
+  run on the guard's own thread pool, so a stalled dependency cannot take
+  every worker thread
+- the deadline: each call gets ``min(operation_timeout, time left)``, and
+  ``DeadlineExceededError`` is raised when it runs out
+
+::
+
+    with request_deadline(30):
+        doc = await get_dependency_guard("firestore").run_blocking(doc_ref.get)
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, TypeVar
+
+from loguru import logger
+
+from kickai.core.exceptions import DeadlineExceededError, DependencyUnavailableError
+from kickai.core.monitoring import runtime_metrics
+
+T = TypeVar("T")
+
+FIRESTORE_DEPENDENCY = "firestore"
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_SECONDS = 30
+DEFAULT_MAX_CONCURRENT = 32
+# Longest sleep between bulkhead slot checks
+BULKHEAD_MAX_POLL_SECONDS = 0.05
+
+_request_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "request_deadline", default=None
+)
+
+
+@contextmanager
+def request_deadline(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Give the calls made inside the block ``seconds`` to finish.
+
+    Nested scopes never extend an outer deadline. Yields the deadline as a
+    ``time.monotonic()`` value (None when ``seconds`` is None or not positive).
+    """
+    outer = _request_deadline.get()
+    if not seconds or seconds <= 0:
+        yield outer
+        return
+
+    deadline = time.monotonic() + seconds
+    if outer is not None and outer <= deadline:
+        yield outer
+        return
+
+    token = _request_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _request_deadline.reset(token)
+
+
+def remaining_seconds() -> Optional[float]:
+    """Seconds left on the active request deadline, or None outside one."""
+    deadline = _request_deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def bounded_timeout(timeout: Optional[float]) -> Optional[float]:
+    """The smaller of ``timeout`` and the time left on the request deadline."""
+    remaining = remaining_seconds()
+    if remaining is None:
+        return timeout
+    if timeout is None:
+        return remaining
+    return min(timeout, remaining)
+
+
+class Bulkhead:
+    """
+    Caps concurrent calls to one dependency.
+
+    Backed by a threading semaphore polled from async code, because the
+    Firestore client is shared by the main event loop and the loops CrewAI
+    runs tools on.
+    """
+
+    def __init__(self, name: str, max_concurrent: int = DEFAULT_MAX_CONCURRENT):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self._semaphore = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.rejected = 0
+
+    async def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Wait up to ``timeout`` seconds for a slot; False when none freed up."""
+        give_up_at = None if timeout is None else time.monotonic() + timeout
+        delay = 0.001
+        while not self._semaphore.acquire(blocking=False):
+            if give_up_at is not None and time.monotonic() >= give_up_at:
+                with self._lock:
+                    self.rejected += 1
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, BULKHEAD_MAX_POLL_SECONDS)
+
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        return True
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+        self._semaphore.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "rejected": self.rejected,
+        }
+
+
+def _always_outage(error: Exception) -> bool:
+    return True
+
+
+class DependencyGuard:
+    """Circuit breaker, bulkhead and deadline enforcement for one dependency."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_seconds: int = DEFAULT_RESET_SECONDS,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        operation_timeout: Optional[float] = None,
+        is_outage: Callable[[Exception], bool] = _always_outage,
+    ):
+        """
+        Args:
+            name: Dependency name used in errors and stats
+            failure_threshold: Consecutive outages or timeouts that open the breaker
+            reset_seconds: Seconds an open breaker waits before a trial call
+            max_concurrent: Bulkhead size
+            operation_timeout: Longest a single call may take, deadline or not
+            is_outage: Whether an error counts against the breaker (e.g. not a 404)
+        """
+        # Lazy import: the service_discovery package imports the Firebase client, which uses this module
+        from kickai.core.service_discovery.registry import CircuitBreaker
+
+        self.name = name
+        self.breaker = CircuitBreaker(failure_threshold, reset_seconds)
+        self.bulkhead = Bulkhead(name, max_concurrent)
+        self.operation_timeout = operation_timeout
+        self.is_outage = is_outage
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self.calls = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.short_circuited = 0
+
+    def is_available(self) -> bool:
+        """False while the breaker is open (calls would be refused)."""
+        return self.breaker.can_execute()
+
+    def _budget(self) -> Optional[float]:
+        """Time this call may take; raises when the breaker is open or the deadline has passed."""
+        if not self.breaker.can_execute():
+            self.short_circuited += 1
+            self._record(runtime_metrics.OUTCOME_REJECTED)
+            raise DependencyUnavailableError(self.name, "circuit breaker open")
+
+        budget = bounded_timeout(self.operation_timeout)
+        if budget is not None and budget <= 0:
+            self.timeouts += 1
+            self._record(runtime_metrics.OUTCOME_TIMEOUT)
+            raise DeadlineExceededError(self.name, 0.0)
+        return budget
+
+    async def _admit(self, budget: Optional[float]) -> float:
+        """Take a bulkhead slot within the budget; returns when the wait started."""
+        started = time.monotonic()
+        if not await self.bulkhead.acquire(budget):
+            self.short_circuited += 1
+            self._record(runtime_metrics.OUTCOME_REJECTED, started)
+            raise DependencyUnavailableError(
+                self.name, f"{self.bulkhead.max_concurrent} calls already in flight"
+            )
+        self.calls += 1
+        return started
+
+    async def _await_result(self, pending: Awaitable[T], budget: Optional[float], started: float) -> T:
+        left = None if budget is None else max(0.0, budget - (time.monotonic() - started))
+        try:
+            result = await asyncio.wait_for(pending, timeout=left)
+        except asyncio.TimeoutError as e:
+            self.timeouts += 1
+            self.breaker.record_failure()
+            self._record(runtime_metrics.OUTCOME_TIMEOUT, started)
+            logger.warning(f"⏱️ {self.name} call exceeded its {budget:.2f}s budget (breaker {self.breaker.state})")
+            raise DeadlineExceededError(self.name, budget) from e
+        except Exception as e:
+            if self.is_outage(e):
+                self.failures += 1
+                self.breaker.record_failure()
+            else:
+                # The dependency answered; a rejected request is not an outage
+                self.breaker.record_success()
+            self._record(runtime_metrics.OUTCOME_ERROR, started)
+            raise
+        self.breaker.record_success()
+        self._record(runtime_metrics.OUTCOME_SUCCESS, started)
+        return result
+
+    def _record(self, outcome: str, started: Optional[float] = None) -> None:
+        runtime_metrics.DEPENDENCY_CALLS.inc(self.name, outcome)
+        if started is not None:
+            runtime_metrics.DEPENDENCY_CALL_SECONDS.observe(time.monotonic() - started, self.name)
+
+    async def run(self, factory: Callable[[], Awaitable[T]]) -> T:
+        """Await ``factory()`` under the breaker, bulkhead and deadline."""
+        budget = self._budget()
+        started = await self._admit(budget)
+        try:
+            return await self._await_result(factory(), budget, started)
+        finally:
+            self.bulkhead.release()
+
+    async def run_blocking(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking call on the guard's thread pool under the breaker, bulkhead and deadline.
+
+        A call that outlives its budget keeps its bulkhead slot until the
+        thread finishes, so abandoned calls still count against the cap.
+        """
+        budget = self._budget()
+        started = await self._admit(budget)
+
+        def call_and_release() -> T:
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.bulkhead.release()
+
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self._get_executor(), call_and_release)
+        except BaseException:
+            self.bulkhead.release()
+            raise
+        # Shielded so a timeout abandons the call instead of cancelling it before it
+        # starts (which would leak its bulkhead slot)
+        return await self._await_result(asyncio.shield(future), budget, started)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.bulkhead.max_concurrent, thread_name_prefix=f"{self.name}-bulkhead"
+                )
+            return self._executor
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "breaker": self.breaker.state,
+            "calls": self.calls,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "short_circuited": self.short_circuited,
+            "bulkhead": self.bulkhead.get_stats(),
+        }
+
+
+_guards: Dict[str, DependencyGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def get_dependency_guard(name: str, **options: Any) -> DependencyGuard:
+    """
+    The process-wide guard for a dependency.
+
+    ``options`` (DependencyGuard arguments) apply when the guard is first created.
+    """
+    with _guards_lock:
+        guard = _guards.get(name)
+        if guard is None:
+            guard = DependencyGuard(name, **options)
+            _guards[name] = guard
+        return guard
+
+
+def reset_dependency_guards() -> None:
+    """Forget every guard (tests and reconfiguration)."""
+    with _guards_lock:
+        _guards.clear()
+
+
+def get_resilience_stats() -> Dict[str, Dict[str, Any]]:
+    """Breaker and bulkhead state of every guarded dependency."""
+    with _guards_lock:
+        guards = dict(_guards)
+    return {name: guard.get_stats() for name, guard in guards.items()}
+
+
+def find_resilience_error(error: BaseException) -> Optional[Exception]:
+    """The DependencyUnavailableError or DeadlineExceededError behind ``error``, if any."""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, (DependencyUnavailableError, DeadlineExceededError)):
+            return error
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return None
@@ -54,6 +54,13 @@ class CircuitBreaker:
             else:  # HALF_OPEN
                 return True
 
+    def is_available(self) -> bool:
+        """Whether ``can_execute`` would allow an operation, without changing the state."""
+        with self._lock:
+            if self.state != "OPEN":
+                return True
+            return time.time() - self.last_failure_time >= self.timeout
+
     def record_success(self):
         """Record a successful operation."""
         with self._lock:
@@ -7,6 +7,7 @@ StartupValidator with smaller, focused components following the single responsib
 
 from .checks import AgentInitializationCheck, ConfigurationCheck, LLMProviderCheck
 from .reporting import CheckCategory, CheckResult, CheckStatus, ValidationReport
+from .validation_cache import ValidationCache, compute_validation_fingerprint
 from .validator import StartupValidator, run_startup_validation
 
 __all__ = [
@@ -17,6 +18,8 @@ __all__ = [
     "ConfigurationCheck",
     "LLMProviderCheck",
     "StartupValidator",
+    "ValidationCache",
     "ValidationReport",
+    "compute_validation_fingerprint",
     "run_startup_validation",
 ]
@@ -24,6 +24,9 @@ class BaseCheck(ABC):
     name: str
     category: CheckCategory
     description: str
+    # Static checks depend only on code, YAML config and environment, so a
+    # passing result can be reused while the validation fingerprint is unchanged
+    cacheable: bool = False
 
     @abstractmethod
     async def execute(self, context: Optional[Dict[str, Any]] = None) -> CheckResult:
@@ -22,6 +22,7 @@ class CleanArchitectureCheck(BaseCheck):
     
     name = "Clean Architecture Compliance"
     category = CheckCategory.SYSTEM
+    cacheable = True
     
     def __init__(self):
         super().__init__()
@@ -22,6 +22,7 @@ class CommandRegistryCheck(BaseCheck):
 
     name = "CommandRegistryCheck"
     category = CheckCategory.CONFIGURATION
+    cacheable = True
     description = (
         "Validates that the command registry is properly initialized with all expected commands."
     )
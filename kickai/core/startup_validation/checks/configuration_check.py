@@ -21,6 +21,7 @@ class ConfigurationCheck(BaseCheck):
 
     name = "Configuration Loading"
     category = CheckCategory.CONFIGURATION
+    cacheable = True
     description = "Validates that all required configuration is loaded and accessible"
 
     async def execute(self, context: dict[str, Any] = None) -> CheckResult:
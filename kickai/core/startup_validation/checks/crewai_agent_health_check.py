@@ -40,6 +40,7 @@ class CrewAIAgentHealthCheck(BaseCheck):
 
     name = "CrewAI Agent Health Check"
     category = CheckCategory.AGENT
+    cacheable = True
     description = "Comprehensive CrewAI agent health and performance validation"
 
     async def execute(self, context: Dict[str, Any] = None) -> CheckResult:
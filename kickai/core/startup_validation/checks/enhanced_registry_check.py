@@ -40,6 +40,7 @@ class EnhancedRegistryCheck(BaseCheck):
 
     name = "Enhanced Registry Check"
     category = CheckCategory.SYSTEM
+    cacheable = True
     description = "Comprehensive registry and initialization validation"
 
     async def execute(self, context: Dict[str, Any] = None) -> CheckResult:
@@ -37,6 +37,7 @@ class InitializationSequenceCheck(BaseCheck):
 
     name = "Initialization Sequence Check"
     category = CheckCategory.SYSTEM
+    cacheable = True
     description = "Validates proper initialization sequence and startup order"
 
     async def execute(self, context: Dict[str, Any] = None) -> CheckResult:
@@ -22,6 +22,7 @@ class StubDetectionCheck(BaseCheck):
 
     name = "StubDetectionCheck"
     category = CheckCategory.CONFIGURATION
+    cacheable = True
     description = (
         "Validates that no stub classes are being used and all real implementations are loaded."
     )
@@ -28,6 +28,7 @@ class ToolRegistrationCheck(BaseCheck):
         self.name = "Tool Registration Check"
         self.category = CheckCategory.TOOL
         self.description = "Validates tool registration and discovery"
+        self.cacheable = True
 
     async def execute(self, context: dict[str, Any]) -> CheckResult:
         """Execute the tool registration check."""
@@ -24,6 +24,9 @@ class CheckResult:
     details: Optional[Dict[str, Any]] = None
     duration_ms: Optional[float] = None
     error: Optional[Exception] = None
+    # Served from the validation cache; original_duration_ms is what the real run took
+    cached: bool = False
+    original_duration_ms: Optional[float] = None
 
 
 @dataclass
@@ -36,6 +39,7 @@ class ValidationReport:
     critical_failures: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
     recommendations: list[str] = field(default_factory=list)
+    cache_fingerprint: Optional[str] = None
 
     def add_check(self, check: CheckResult) -> None:
         """Add a check result to the report."""
@@ -78,6 +82,23 @@ class ValidationReport:
             return 0.0
         return (self.get_passed_count() / self.get_total_count()) * 100
 
+    def get_cached_checks(self) -> list[CheckResult]:
+        """Get checks served from the validation cache."""
+        return [check for check in self.checks if check.cached]
+
+    def get_timing_report(self) -> list[dict[str, Any]]:
+        """Per-check timing, slowest first, marking checks served from cache."""
+        rows = [
+            {
+                "name": check.name,
+                "cached": check.cached,
+                "duration_ms": round(check.duration_ms or 0.0, 1),
+                "saved_ms": round(check.original_duration_ms or 0.0, 1) if check.cached else 0.0,
+            }
+            for check in self.checks
+        ]
+        return sorted(rows, key=lambda row: row["duration_ms"], reverse=True)
+
     def get_failures_by_category(self) -> dict[CheckCategory, list[CheckResult]]:
         """Get failed checks grouped by category."""
         failures = {}
@@ -110,6 +131,7 @@ class ValidationReport:
                     "message": check.message,
                     "details": check.details,
                     "duration_ms": check.duration_ms,
+                    "cached": check.cached,
                     "error": str(check.error) if check.error else None,
                 }
                 for check in self.checks
@@ -127,7 +149,9 @@ class ValidationReport:
                 "failed_checks": self.get_failure_count(),
                 "warning_checks": self.get_warning_count(),
                 "success_rate": self.get_success_rate(),
+                "cached_checks": len(self.get_cached_checks()),
             },
+            "cache_fingerprint": self.cache_fingerprint,
         }
 
     def to_json(self) -> str:
@@ -150,7 +174,8 @@ class ValidationReport:
         markdown += f"- Passed: {self.get_passed_count()}\n"
         markdown += f"- Failed: {self.get_failure_count()}\n"
         markdown += f"- Warnings: {self.get_warning_count()}\n"
-        markdown += f"- Success Rate: {self.get_success_rate():.1f}%\n\n"
+        markdown += f"- Success Rate: {self.get_success_rate():.1f}%\n"
+        markdown += f"- Served from Cache: {len(self.get_cached_checks())}\n\n"
 
         # Summary by category
         markdown += "## Summary by Category\n\n"
@@ -195,7 +220,9 @@ class ValidationReport:
                 CheckStatus.SKIPPED: "⏭️",
             }.get(check.status, "❓")
 
-            duration_str = f" ({check.duration_ms:.1f}ms)" if check.duration_ms else ""
+            duration_str = " (cached)" if check.cached else (
+                f" ({check.duration_ms:.1f}ms)" if check.duration_ms else ""
+            )
             markdown += f"### {status_emoji} {check.category.value}: {check.name}{duration_str}\n\n"
             markdown += f"Message: {check.message}\n\n"
 
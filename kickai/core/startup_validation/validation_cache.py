@@ -0,0 +1,145 @@
+"""
+Startup Validation Cache
+
+Reuses the results of static startup checks between boots. A check is static
+(``cacheable = True``) when its outcome depends only on the source tree, the
+YAML configuration and the environment; the cache is keyed by a fingerprint
+of exactly those inputs, so any code, config or environment change forces a
+full run. Live checks (LLM reachability, Telegram, database) always run.
+
+Only results from a fully healthy validation are stored, and only passing
+results are served back.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+from kickai.core.enums import CheckCategory, CheckStatus
+
+from .reporting import CheckResult
+
+DEFAULT_CACHE_PATH = ".startup_validation_cache.json"
+CACHE_FORMAT_VERSION = 1
+FINGERPRINT_SUFFIXES = (".py", ".yaml", ".yml")
+# Used when the settings model cannot be imported
+FALLBACK_ENV_PREFIXES = ("AI_", "FIREBASE_", "TELEGRAM_", "KICKAI_", "GROQ_", "GOOGLE_", "OLLAMA_")
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _settings_env_names() -> List[str]:
+    """Environment variable names the settings model reads."""
+    try:
+        from kickai.core.config import Settings
+
+        names = set()
+        for field_name, field_info in Settings.model_fields.items():
+            names.add((field_info.alias or field_name).upper())
+        return sorted(names | {"ENVIRONMENT", "RAILWAY_ENVIRONMENT"})
+    except Exception:
+        return sorted(name for name in os.environ if name.startswith(FALLBACK_ENV_PREFIXES))
+
+
+def compute_validation_fingerprint(
+    source_root: Optional[Path] = None, env_names: Optional[Iterable[str]] = None
+) -> str:
+    """
+    Hash of everything a static check depends on.
+
+    Args:
+        source_root: Directory whose ``.py`` and YAML files are hashed (the kickai package)
+        env_names: Environment variables to include (the settings' variables by default)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    root = Path(source_root or PACKAGE_ROOT)
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_FORMAT_VERSION}|{sys.version}".encode())
+
+    for path in sorted(root.rglob("*")):
+        if path.suffix not in FINGERPRINT_SUFFIXES or "__pycache__" in path.parts or not path.is_file():
+            continue
+        digest.update(str(path.relative_to(root)).encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+
+    for name in sorted(env_names if env_names is not None else _settings_env_names()):
+        # Values are hashed, never written to the cache file
+        digest.update(f"\0{name}={os.environ.get(name, '')}".encode())
+
+    return digest.hexdigest()
+
+
+def _serialize(result: CheckResult) -> Dict[str, Any]:
+    return {
+        "name": result.name,
+        "category": result.category.value,
+        "status": result.status.value,
+        "message": result.message,
+        "details": result.details,
+        "duration_ms": result.original_duration_ms if result.cached else result.duration_ms,
+    }
+
+
+def _deserialize(data: Dict[str, Any]) -> CheckResult:
+    return CheckResult(
+        name=data["name"],
+        category=CheckCategory(data["category"]),
+        status=CheckStatus(data["status"]),
+        message=data["message"],
+        details=data.get("details"),
+        duration_ms=0.0,
+        cached=True,
+        original_duration_ms=data.get("duration_ms"),
+    )
+
+
+class ValidationCache:
+    """JSON file of passing static check results for one fingerprint."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        self.path = path
+
+    def load(self, fingerprint: str) -> Dict[str, CheckResult]:
+        """Cached results by check name; empty when missing, unreadable or stale."""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable validation cache {self.path}: {e}")
+            return {}
+
+        if state.get("version") != CACHE_FORMAT_VERSION or state.get("fingerprint") != fingerprint:
+            logger.info("🔄 Code, config or environment changed since the last validation; running all checks")
+            return {}
+        return {data["name"]: _deserialize(data) for data in state.get("checks", [])}
+
+    def save(self, fingerprint: str, results: List[CheckResult]) -> None:
+        """Store passing results (atomically replacing the previous file)."""
+        state = {
+            "version": CACHE_FORMAT_VERSION,
+            "fingerprint": fingerprint,
+            "saved_at": time.time(),
+            "checks": [_serialize(result) for result in results if result.status == CheckStatus.PASSED],
+        }
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(state, f, default=str)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write validation cache {self.path}: {e}")
+
+    def clear(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
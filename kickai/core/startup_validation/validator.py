@@ -26,6 +26,18 @@ from .checks import (
 )
 from .registry_validator import RegistryStartupValidator
 from .reporting import CheckCategory, CheckResult, CheckStatus, ValidationReport
+from .validation_cache import DEFAULT_CACHE_PATH, ValidationCache, compute_validation_fingerprint
+
+
+def _default_validation_cache() -> Optional[ValidationCache]:
+    """Cache at the configured path (an empty path disables caching)."""
+    try:
+        from kickai.core.config import get_settings
+
+        path = get_settings().startup_validation_cache_path
+    except Exception:
+        path = DEFAULT_CACHE_PATH
+    return ValidationCache(path) if path else None
 
 
 class StartupValidator:
@@ -36,14 +48,23 @@ class StartupValidator:
     comprehensive validation reports with fail-fast enterprise patterns.
     """
 
-    def __init__(self, config_path: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        force_validate: bool = False,
+        cache: Optional[ValidationCache] = None,
+    ) -> None:
         """
         Initialize the startup validator.
         
         Args:
             config_path: Optional path to configuration file
+            force_validate: Run every check even when cached results are valid
+            cache: Validation cache for static checks (configured default when None)
         """
         self.config_path = config_path
+        self.force_validate = force_validate
+        self.cache = cache if cache is not None else _default_validation_cache()
         self.checks: List[Any] = []
         self.start_time: float = 0.0
         self._load_default_checks()
@@ -214,20 +235,41 @@ class StartupValidator:
 
         report = ValidationReport(overall_status=CheckStatus.PASSED)
 
+        # Static checks are served from cache when nothing they depend on changed
+        cached_results: Dict[str, CheckResult] = {}
+        if self.cache is not None:
+            loop = asyncio.get_running_loop()
+            report.cache_fingerprint = await loop.run_in_executor(None, compute_validation_fingerprint)
+            if self.force_validate:
+                logger.info("🔧 --force-validate: ignoring cached validation results")
+            else:
+                cached_results = self.cache.load(report.cache_fingerprint)
+        served = {
+            check.name: cached_results[check.name]
+            for check in self.checks
+            if getattr(check, "cacheable", False) and check.name in cached_results
+        }
+        checks_to_run = [check for check in self.checks if check.name not in served]
+        if served:
+            logger.info(f"🗄️ Serving {len(served)} static checks from the validation cache")
+
         # Execute checks in parallel for better performance
         check_tasks = []
-        for check in self.checks:
+        for check in checks_to_run:
             task = asyncio.create_task(self._execute_check(check, context))
             check_tasks.append(task)
 
         # Wait for all checks to complete
-        results = await asyncio.gather(*check_tasks, return_exceptions=True)
+        results = dict(zip(
+            (check.name for check in checks_to_run),
+            await asyncio.gather(*check_tasks, return_exceptions=True),
+        ))
 
-        # Process results
-        for i, result in enumerate(results):
+        # Process results (in declaration order)
+        for check in self.checks:
+            result = served.get(check.name) or results[check.name]
             if isinstance(result, Exception):
                 # Handle check execution errors
-                check = self.checks[i]
                 error_result = CheckResult(
                     name=check.name,
                     category=check.category,
@@ -246,6 +288,19 @@ class StartupValidator:
             report.overall_status = CheckStatus.FAILED
             logger.error("❌ Registry validation failed - this is critical for system operation")
 
+        # Remember static results of a healthy run for the next boot
+        if (
+            self.cache is not None
+            and report.is_healthy()
+            and report.overall_status != CheckStatus.FAILED
+            and len(served) < sum(1 for check in self.checks if getattr(check, "cacheable", False))
+        ):
+            cacheable_names = {check.name for check in self.checks if getattr(check, "cacheable", False)}
+            self.cache.save(
+                report.cache_fingerprint,
+                [result for result in report.checks if result.name in cacheable_names],
+            )
+
         # Generate recommendations
         self._generate_recommendations(report)
 
@@ -437,6 +492,15 @@ class StartupValidator:
             for recommendation in report.recommendations:
                 logger.info(f"  • {recommendation}")
 
+        # Validation cache
+        cached_checks = report.get_cached_checks()
+        if report.cache_fingerprint:
+            saved_ms = sum(check.original_duration_ms or 0.0 for check in cached_checks)
+            logger.info(
+                f"🗄️ Validation cache: {len(cached_checks)} served from cache (~{saved_ms:.0f}ms saved), "
+                f"{len(report.checks) - len(cached_checks)} run"
+            )
+
         # Detailed results
         logger.info(f"🔍 Detailed Results ({len(report.checks)} checks):")
         for check in report.checks:
@@ -447,24 +511,29 @@ class StartupValidator:
                 CheckStatus.SKIPPED: "⏭️",
             }.get(check.status, "❓")
 
-            duration_str = f" ({check.duration_ms:.1f}ms)" if check.duration_ms else ""
+            duration_str = " (cached)" if check.cached else (
+                f" ({check.duration_ms:.1f}ms)" if check.duration_ms else ""
+            )
             logger.info(f"  {status_emoji} {check.category.value}:{check.name}{duration_str}")
             logger.info(f"      {check.message}")
 
         logger.info("=" * 80)
 
 
-async def run_startup_validation(team_id: Optional[str] = None) -> ValidationReport:
+async def run_startup_validation(
+    team_id: Optional[str] = None, force_validate: bool = False
+) -> ValidationReport:
     """
     Run startup validation for the system.
 
     Args:
         team_id: Team ID for validation context
+        force_validate: Run every check, ignoring cached static results
 
     Returns:
         ValidationReport with results
     """
-    validator = StartupValidator()
+    validator = StartupValidator(force_validate=force_validate)
 
     # Initialize dependency container to access services
     from kickai.core.dependency_container import initialize_container
@@ -5,20 +5,80 @@ Team Configuration Cache
 This module provides a singleton cache for team configurations that are loaded
 at startup and accessed without database queries during runtime.
 
-Team configurations are immutable during normal operation:
-- Bot tokens don't change
-- Chat IDs don't change  
-- Team settings rarely change
+Team configurations rarely change, but when they do (a new bot token, a moved
+chat, a new club onboarded) the cache picks it up without a restart:
+- ``reload()`` re-reads the teams collection, diffs it against the cache and
+  swaps in the new configurations atomically under a new version number
+- ``start_auto_refresh()`` runs ``reload()`` on an interval
+- subscribers receive each ``TeamConfigDiff`` so only affected teams' bots
+  and crews are restarted
 
 This cache eliminates 200-500ms per operation that was previously spent
 querying team configuration from the database.
 """
 
-from typing import Dict, Optional
+import asyncio
+import dataclasses
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
 from loguru import logger
 
 from kickai.features.team_administration.domain.entities.team import Team
 
+# Team fields that are bookkeeping, not configuration
+UNTRACKED_TEAM_FIELDS = ("created_at", "updated_at", "created_by")
+
+# Changes to these fields need the team's bot and crew restarted
+RESTART_TEAM_FIELDS = ("bot_token", "main_chat_id", "leadership_chat_id", "settings", "status")
+
+DEFAULT_REFRESH_INTERVAL_SECONDS = 60.0
+
+
+@dataclass
+class TeamConfigDiff:
+    """Differences between two versions of the team config cache."""
+
+    version: int
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: Dict[str, List[str]] = field(default_factory=dict)  # team_id -> changed fields
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def needs_restart(self, team_id: str) -> bool:
+        """Whether a changed team's bot and crew must be restarted."""
+        return any(name in RESTART_TEAM_FIELDS for name in self.changed.get(team_id, []))
+
+
+def _config_fields(team: Team) -> Dict[str, Any]:
+    return {
+        f.name: getattr(team, f.name)
+        for f in dataclasses.fields(team)
+        if f.name not in UNTRACKED_TEAM_FIELDS
+    }
+
+
+def diff_team_configs(old: Dict[str, Team], new: Dict[str, Team], version: int) -> TeamConfigDiff:
+    """Compute which teams were added, removed or changed (and which fields)."""
+    diff = TeamConfigDiff(
+        version=version,
+        added=sorted(set(new) - set(old)),
+        removed=sorted(set(old) - set(new)),
+    )
+    for team_id in sorted(set(old) & set(new)):
+        old_fields = _config_fields(old[team_id])
+        new_fields = _config_fields(new[team_id])
+        changed = [name for name in new_fields if old_fields.get(name) != new_fields[name]]
+        if changed:
+            diff.changed[team_id] = changed
+    return diff
+
+
+TeamConfigListener = Callable[[TeamConfigDiff], Awaitable[None]]
+
 
 class TeamConfigCache:
     """
@@ -36,6 +96,10 @@ class TeamConfigCache:
     _instance: Optional['TeamConfigCache'] = None
     _initialized: bool = False
     _configs: Dict[str, Team] = {}
+    _version: int = 0
+    _listeners: List[TeamConfigListener] = []
+    _refresh_task: Optional[asyncio.Task] = None
+    _reload_lock: Optional[asyncio.Lock] = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -56,35 +120,126 @@ class TeamConfigCache:
         logger.info("🚀 Loading team configurations at startup...")
         
         try:
-            # Import here to avoid circular imports
-            from kickai.core.dependency_container import get_container
-            from kickai.features.team_administration.domain.services.team_service import TeamService
-            
-            # Get team service
-            container = get_container()
-            team_service = container.get_service(TeamService)
-            
-            if not team_service:
-                raise RuntimeError("TeamService not available during initialization")
-            
-            # Load all teams
-            all_teams = await team_service.get_all_teams()
-            
-            # Cache each team configuration
-            for team in all_teams:
-                team_id = team.id  # Team entity uses 'id' not 'team_id'
-                if team_id:
-                    self._configs[team_id] = team
-                    logger.info(f"✅ Cached config for team: {team_id}")
-                else:
-                    logger.warning(f"⚠️ Skipping team with no ID: {team.name}")
-            
+            self._configs = await self._load_configs()
+            self._version = 1
+            for team_id in self._configs:
+                logger.info(f"✅ Cached config for team: {team_id}")
+
             self._initialized = True
             logger.info(f"🎯 Team config cache initialized with {len(self._configs)} configurations")
             
         except Exception as e:
             logger.error(f"❌ Failed to initialize team config cache: {e}")
             raise RuntimeError(f"Team config cache initialization failed: {e}")
+
+    async def _load_configs(self) -> Dict[str, Team]:
+        """Read every team configuration from the database."""
+        # Import here to avoid circular imports
+        from kickai.core.dependency_container import get_container
+        from kickai.features.team_administration.domain.services.team_service import TeamService
+
+        # Get team service
+        container = get_container()
+        team_service = container.get_service(TeamService)
+
+        if not team_service:
+            raise RuntimeError("TeamService not available")
+
+        configs = {}
+        for team in await team_service.get_all_teams():
+            team_id = team.id  # Team entity uses 'id' not 'team_id'
+            if team_id:
+                configs[team_id] = team
+            else:
+                logger.warning(f"⚠️ Skipping team with no ID: {team.name}")
+        return configs
+
+    async def reload(self) -> Optional[TeamConfigDiff]:
+        """
+        Re-read all team configurations and swap in any changes.
+
+        The new configuration set replaces the old one in a single assignment,
+        so readers see either the old or the new version, never a mix.
+        Subscribers are notified with the diff when anything changed.
+
+        Returns:
+            The diff applied, or None if the reload was skipped
+        """
+        if not self._initialized:
+            logger.warning("Cannot reload team configs - cache not initialized")
+            return None
+
+        if self._reload_lock is None:
+            self._reload_lock = asyncio.Lock()
+
+        async with self._reload_lock:
+            try:
+                configs = await self._load_configs()
+            except Exception as e:
+                logger.error(f"❌ Failed to reload team configs: {e}")
+                return None
+
+            # TeamService returns an empty list on read errors; never drop every team on one
+            if not configs and self._configs:
+                logger.warning("⚠️ Team config reload returned no teams - keeping cached configs")
+                return None
+
+            diff = self._swap(configs)
+
+        await self._notify(diff)
+        return diff
+
+    def _swap(self, configs: Dict[str, Team]) -> TeamConfigDiff:
+        """Replace the cached configurations, bumping the version if anything changed."""
+        diff = diff_team_configs(self._configs, configs, self._version + 1)
+        if diff.has_changes:
+            self._configs = configs
+            self._version = diff.version
+            logger.info(
+                f"🔄 Team config cache v{diff.version}: added={diff.added} "
+                f"removed={diff.removed} changed={diff.changed}"
+            )
+        return diff
+
+    async def _notify(self, diff: TeamConfigDiff) -> None:
+        if not diff.has_changes:
+            return
+        for listener in list(self._listeners):
+            try:
+                await listener(diff)
+            except Exception as e:
+                logger.error(f"❌ Team config listener failed for v{diff.version}: {e}")
+
+    def subscribe(self, listener: TeamConfigListener) -> None:
+        """Call ``listener(diff)`` after each reload that changed something."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: TeamConfigListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def start_auto_refresh(self, interval_seconds: float = DEFAULT_REFRESH_INTERVAL_SECONDS) -> None:
+        """Reload team configurations in the background every ``interval_seconds``."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        async def refresh_loop():
+            while True:
+                await asyncio.sleep(interval_seconds)
+                await self.reload()
+
+        self._refresh_task = asyncio.create_task(refresh_loop())
+        logger.info(f"🔄 Team config auto-refresh every {interval_seconds:.0f}s")
+
+    async def stop_auto_refresh(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
     
     def get_team(self, team_id: str) -> Optional[Team]:
         """
@@ -141,8 +296,8 @@ class TeamConfigCache:
         """
         Refresh configuration for a specific team.
         
-        This is used in rare cases where team configuration changes
-        during runtime (e.g., admin updates bot token).
+        Used right after an admin edits one team; ``reload()`` handles
+        everything else (including added and removed teams).
         """
         if not self._initialized:
             logger.warning("Cannot refresh team config - cache not initialized")
@@ -157,7 +312,7 @@ class TeamConfigCache:
             
             team = await team_service.get_team(team_id=team_id)
             if team:
-                self._configs[team_id] = team
+                await self._notify(self._swap({**self._configs, team_id: team}))
                 logger.info(f"🔄 Refreshed config for team: {team_id}")
             else:
                 logger.warning(f"Team {team_id} not found during refresh")
@@ -173,6 +328,8 @@ class TeamConfigCache:
         """Get cache statistics for monitoring"""
         return {
             "initialized": self._initialized,
+            "version": self._version,
+            "auto_refresh": self._refresh_task is not None and not self._refresh_task.done(),
             "team_count": len(self._configs),
             "team_ids": list(self._configs.keys())
         }
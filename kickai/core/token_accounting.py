@@ -0,0 +1,640 @@
+#!/usr/bin/env python3
+"""
+Prompt Token Accounting and Budgets
+
+Every LLM created through ``LLMConfiguration`` is an ``AccountedLLM``. Each
+call records prompt tokens, completion tokens and latency, attributed to the
+agent, the team and the message type (slash command or natural language).
+A per-call prompt budget trims conversation history first, then oversized
+context, when exceeded.
+
+Each call is also written, with its model and estimated cost, to a
+``TokenUsageStore`` so usage can be reported over rolling windows (1h, 24h,
+7d, 30d). A team may have a token and/or cost budget over a rolling window;
+once it is used up the team's calls are either downgraded to a cheaper model
+or refused with ``TokenBudgetExceededError`` (throttled) until the window
+frees up.
+
+Team and message type are taken from the ``token_accounting_scope`` active
+when the crew runs::
+
+    with token_accounting_scope(team_id, message_type_for(message_text)):
+        result = await crew.kickoff_async()
+
+    print(get_token_accountant().format_report())
+    print(get_token_accountant().format_team_usage(team_id))
+"""
+
+import contextvars
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from crewai import LLM
+from loguru import logger
+
+from kickai.core.exceptions import TokenBudgetExceededError
+from kickai.core.monitoring import runtime_metrics
+from kickai.core.token_usage_store import USAGE_WINDOWS, TokenUsageStore, window_seconds
+
+try:
+    import litellm
+
+    LITELLM_AVAILABLE = True
+except ImportError:
+    LITELLM_AVAILABLE = False
+
+# Fallback estimate when the model's tokenizer is unavailable
+CHARS_PER_TOKEN = 4
+
+# Attribution for calls made outside any scope
+UNSCOPED_TEAM = "unscoped"
+NATURAL_LANGUAGE_MESSAGE_TYPE = "natural_language"
+
+# Marker left where context was cut to fit the budget
+TRIM_MARKER = "\n…[trimmed to fit the prompt token budget]…\n"
+
+# Dimensions usable in report grouping
+REPORT_DIMENSIONS = ("agent", "team_id", "message_type", "model")
+
+# USD per million (prompt, completion) tokens, used before litellm's price list.
+# Keys are model names without the provider prefix.
+MODEL_PRICES_PER_MILLION: Dict[str, Tuple[float, float]] = {
+    "llama-3.1-8b-instant": (0.05, 0.08),
+    "llama-3.3-70b-versatile": (0.59, 0.79),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gemini-1.5-flash": (0.075, 0.30),
+    "gemini-2.0-flash": (0.10, 0.40),
+}
+
+# What happens to a team's calls once its budget is used up
+BUDGET_ACTION_DOWNGRADE = "downgrade"
+BUDGET_ACTION_THROTTLE = "throttle"
+BUDGET_ACTIONS = (BUDGET_ACTION_DOWNGRADE, BUDGET_ACTION_THROTTLE)
+BUDGET_ALLOW = "allow"
+# Team settings key holding a per-team budget override
+TEAM_BUDGET_SETTINGS_KEY = "llm_budget"
+
+_call_scope: contextvars.ContextVar[Tuple[str, str]] = contextvars.ContextVar(
+    "token_accounting_scope", default=(UNSCOPED_TEAM, NATURAL_LANGUAGE_MESSAGE_TYPE)
+)
+
+
+@contextmanager
+def token_accounting_scope(team_id: str, message_type: str) -> Iterator[None]:
+    """Attribute LLM calls made inside the block to a team and message type."""
+    token = _call_scope.set((team_id, message_type))
+    try:
+        yield
+    finally:
+        _call_scope.reset(token)
+
+
+def current_scope() -> Tuple[str, str]:
+    """(team_id, message_type) LLM calls are currently attributed to."""
+    return _call_scope.get()
+
+
+def message_type_for(message_text: Optional[str]) -> str:
+    """Slash command name for commands, ``natural_language`` otherwise."""
+    if message_text and message_text.strip().startswith("/"):
+        return message_text.strip().split()[0].lower()
+    return NATURAL_LANGUAGE_MESSAGE_TYPE
+
+
+def _message_text(message: Any) -> str:
+    content = message.get("content", "") if isinstance(message, dict) else message
+    return content if isinstance(content, str) else str(content or "")
+
+
+def count_text_tokens(text: str, model: Optional[str] = None) -> int:
+    """Token count of a string, using the model's tokenizer when available."""
+    if not text:
+        return 0
+    if LITELLM_AVAILABLE and model:
+        try:
+            return litellm.token_counter(model=model, text=text)
+        except Exception:
+            pass
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def count_message_tokens(messages: Any, model: Optional[str] = None) -> int:
+    """Token count of a prompt (a string or a list of chat messages)."""
+    if isinstance(messages, str):
+        return count_text_tokens(messages, model)
+    if LITELLM_AVAILABLE and model:
+        try:
+            return litellm.token_counter(model=model, messages=messages)
+        except Exception:
+            pass
+    return sum(count_text_tokens(_message_text(message)) for message in messages)
+
+
+def estimate_cost_usd(
+    model: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    prices: Optional[Dict[str, Tuple[float, float]]] = None,
+) -> float:
+    """
+    Estimated USD cost of a call.
+
+    Uses ``prices`` (per million prompt/completion tokens, by bare model name),
+    then litellm's price list; unknown models (local Ollama, mocks) cost 0.
+    """
+    if not model:
+        return 0.0
+    table = MODEL_PRICES_PER_MILLION if prices is None else prices
+    bare_model = model.split("/", 1)[-1]
+    if bare_model in table:
+        prompt_price, completion_price = table[bare_model]
+        return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+    if LITELLM_AVAILABLE:
+        try:
+            prompt_cost, completion_cost = litellm.cost_per_token(
+                model=model, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens
+            )
+            return prompt_cost + completion_cost
+        except Exception:
+            pass
+    return 0.0
+
+
+def trim_messages_to_budget(
+    messages: List[Dict[str, Any]],
+    budget: int,
+    count_tokens: Callable[[Any], int],
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Trim a chat prompt to a token budget.
+
+    System messages, the first user message (the task) and the final message
+    are always kept. Other history messages are dropped oldest-first; if the
+    prompt is still over budget the largest remaining non-system message has
+    the middle of its content cut. System prompts are never shortened, so a
+    budget below their size leaves the prompt over budget.
+
+    Returns:
+        (trimmed messages, tokens removed)
+    """
+    original_tokens = count_tokens(messages)
+    if budget <= 0 or original_tokens <= budget or len(messages) < 2:
+        return messages, 0
+
+    trimmed = list(messages)
+    kept = {i for i, m in enumerate(trimmed) if m.get("role") == "system"}
+    kept.add(len(trimmed) - 1)
+    first_user = next((i for i, m in enumerate(trimmed) if m.get("role") == "user"), None)
+    if first_user is not None:
+        kept.add(first_user)
+
+    # 1. Drop history, oldest first
+    for index in range(len(trimmed)):
+        if count_tokens(trimmed) <= budget:
+            break
+        if index not in kept:
+            trimmed[index] = None
+    trimmed = [m for m in trimmed if m is not None]
+
+    # 2. Cut the middle out of the largest non-system message until it fits
+    while count_tokens(trimmed) > budget:
+        sizes = [
+            (len(_message_text(m)), i) for i, m in enumerate(trimmed) if m.get("role") != "system"
+        ]
+        if not sizes:
+            break
+        size, index = max(sizes)
+        if size <= len(TRIM_MARKER) * 2:
+            break
+        overshoot_chars = (count_tokens(trimmed) - budget) * CHARS_PER_TOKEN + len(TRIM_MARKER)
+        keep = max(len(TRIM_MARKER), size - overshoot_chars)
+        text = _message_text(trimmed[index])
+        trimmed[index] = {**trimmed[index], "content": text[: keep // 2] + TRIM_MARKER + text[-(keep // 2):]}
+
+    return trimmed, original_tokens - count_tokens(trimmed)
+
+
+@dataclass
+class TokenUsageStats:
+    """Accumulated usage for one (agent, team, message type, model)."""
+
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    max_prompt_tokens: int = 0
+    trimmed_calls: int = 0
+    trimmed_tokens: int = 0
+    latency_seconds: float = 0.0
+    cost_usd: float = 0.0
+
+    def add(self, other: "TokenUsageStats") -> None:
+        self.calls += other.calls
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.max_prompt_tokens = max(self.max_prompt_tokens, other.max_prompt_tokens)
+        self.trimmed_calls += other.trimmed_calls
+        self.trimmed_tokens += other.trimmed_tokens
+        self.latency_seconds += other.latency_seconds
+        self.cost_usd += other.cost_usd
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def avg_prompt_tokens(self) -> float:
+        return self.prompt_tokens / self.calls if self.calls else 0.0
+
+    @property
+    def avg_latency_seconds(self) -> float:
+        return self.latency_seconds / self.calls if self.calls else 0.0
+
+
+@dataclass
+class TeamTokenBudget:
+    """A team's LLM allowance over a rolling window (0 means no limit)."""
+
+    tokens: int = 0
+    cost_usd: float = 0.0
+    window: str = "24h"
+    action: str = BUDGET_ACTION_DOWNGRADE
+
+    @property
+    def is_limited(self) -> bool:
+        return self.tokens > 0 or self.cost_usd > 0
+
+    def validate(self) -> None:
+        window_seconds(self.window)
+        if self.action not in BUDGET_ACTIONS:
+            raise ValueError(f"Unknown budget action {self.action!r}; expected one of {BUDGET_ACTIONS}")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TeamTokenBudget":
+        budget = cls(
+            tokens=int(data.get("tokens", 0)),
+            cost_usd=float(data.get("cost_usd", 0.0)),
+            window=data.get("window", "24h"),
+            action=data.get("action", BUDGET_ACTION_DOWNGRADE),
+        )
+        budget.validate()
+        return budget
+
+
+@dataclass
+class BudgetDecision:
+    """Outcome of checking a team's budget before an LLM call."""
+
+    action: str
+    used_tokens: int = 0
+    used_cost_usd: float = 0.0
+    budget: Optional[TeamTokenBudget] = None
+
+    @property
+    def exceeded(self) -> bool:
+        return self.action != BUDGET_ALLOW
+
+    def describe(self) -> str:
+        if self.budget is None or not self.budget.is_limited:
+            return "has no LLM budget"
+        used = []
+        if self.budget.tokens:
+            used.append(f"{self.used_tokens}/{self.budget.tokens} tokens")
+        if self.budget.cost_usd:
+            used.append(f"${self.used_cost_usd:.4f}/${self.budget.cost_usd:.2f}")
+        return f"used {' and '.join(used)} in the last {self.budget.window}"
+
+
+class TokenAccountant:
+    """Thread-safe token usage ledger (crews run LLM calls in worker threads)."""
+
+    def __init__(
+        self,
+        store: Optional[TokenUsageStore] = None,
+        prices: Optional[Dict[str, Tuple[float, float]]] = None,
+        default_budget: Optional[TeamTokenBudget] = None,
+        budget_resolver: Optional[Callable[[str], Optional[TeamTokenBudget]]] = None,
+    ):
+        """
+        Args:
+            store: Ledger for rolling-window reports and budgets (in-memory SQLite by default)
+            prices: Per-million token prices replacing MODEL_PRICES_PER_MILLION
+            default_budget: Budget for teams without one of their own
+            budget_resolver: Looks up a team's own budget (e.g. from its settings)
+        """
+        self._lock = threading.Lock()
+        self._usage: Dict[Tuple[str, str, str, str], TokenUsageStats] = defaultdict(TokenUsageStats)
+        self.store = store or TokenUsageStore()
+        self.prices = prices
+        self.default_budget = default_budget
+        self.budget_resolver = budget_resolver
+        self._team_budgets: Dict[str, Optional[TeamTokenBudget]] = {}
+        # Last budget action per team, so transitions are logged once
+        self._budget_actions: Dict[str, str] = {}
+
+    def record(
+        self,
+        agent: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        latency_seconds: float,
+        trimmed_tokens: int = 0,
+        team_id: Optional[str] = None,
+        message_type: Optional[str] = None,
+        model: str = "",
+    ) -> float:
+        """
+        Record one LLM call; team and message type default to the active scope.
+
+        Returns:
+            The call's estimated cost in USD
+        """
+        scope_team, scope_message_type = current_scope()
+        team_id = team_id or scope_team
+        message_type = message_type or scope_message_type
+        cost = estimate_cost_usd(model, prompt_tokens, completion_tokens, self.prices)
+        key = (agent, team_id, message_type, model)
+        with self._lock:
+            stats = self._usage[key]
+            stats.calls += 1
+            stats.prompt_tokens += prompt_tokens
+            stats.completion_tokens += completion_tokens
+            stats.max_prompt_tokens = max(stats.max_prompt_tokens, prompt_tokens)
+            stats.latency_seconds += latency_seconds
+            stats.cost_usd += cost
+            if trimmed_tokens:
+                stats.trimmed_calls += 1
+                stats.trimmed_tokens += trimmed_tokens
+        try:
+            self.store.append(
+                team_id, agent, message_type, model, prompt_tokens, completion_tokens, latency_seconds, cost
+            )
+        except Exception as e:
+            # The in-memory totals still have the call; only windows and budgets miss it
+            logger.warning(f"⚠️ Could not write LLM usage to the ledger: {e}")
+        return cost
+
+    def report(
+        self, group_by: Tuple[str, ...] = REPORT_DIMENSIONS, team_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Usage rows since startup aggregated over the given dimensions, largest total first.
+
+        Args:
+            group_by: Subset of ("agent", "team_id", "message_type", "model")
+            team_id: Only include calls attributed to this team
+        """
+        unknown = set(group_by) - set(REPORT_DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown report dimensions: {sorted(unknown)}")
+
+        grouped: Dict[Tuple[str, ...], TokenUsageStats] = defaultdict(TokenUsageStats)
+        with self._lock:
+            for key, stats in self._usage.items():
+                labels = dict(zip(REPORT_DIMENSIONS, key))
+                if team_id is not None and labels["team_id"] != team_id:
+                    continue
+                grouped[tuple(labels[d] for d in group_by)].add(stats)
+
+        rows = []
+        for key, stats in grouped.items():
+            row = dict(zip(group_by, key))
+            row.update(asdict(stats))
+            row["total_tokens"] = stats.total_tokens
+            row["avg_prompt_tokens"] = round(stats.avg_prompt_tokens, 1)
+            row["avg_latency_seconds"] = round(stats.avg_latency_seconds, 3)
+            row["cost_usd"] = round(stats.cost_usd, 6)
+            rows.append(row)
+        return sorted(rows, key=lambda row: row["total_tokens"], reverse=True)
+
+    def window_report(
+        self, window: str = "24h", group_by: Tuple[str, ...] = REPORT_DIMENSIONS, team_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Usage rows over a rolling window ("1h", "24h", "7d", "30d"), read from the ledger."""
+        return self.store.aggregate(window, group_by, team_id)
+
+    def format_report(
+        self, group_by: Tuple[str, ...] = REPORT_DIMENSIONS, team_id: Optional[str] = None
+    ) -> str:
+        """Plain-text table of ``report`` for logs and admin output."""
+        rows = self.report(group_by, team_id)
+        if not rows:
+            return "No LLM calls recorded"
+        lines = [
+            " | ".join(group_by)
+            + " | calls | prompt | completion | avg prompt | trimmed | avg latency | est. cost"
+        ]
+        for row in rows:
+            labels = " | ".join(str(row[d]) for d in group_by)
+            lines.append(
+                f"{labels} | {row['calls']} | {row['prompt_tokens']} | {row['completion_tokens']} | "
+                f"{row['avg_prompt_tokens']} | {row['trimmed_tokens']} | {row['avg_latency_seconds']}s | "
+                f"${row['cost_usd']:.4f}"
+            )
+        return "\n".join(lines)
+
+    def format_team_usage(self, team_id: str, top: int = 5) -> str:
+        """Admin report for one team: rolling-window totals, budget status and top consumers."""
+        lines = [f"📊 LLM usage for {team_id}", ""]
+        for window in USAGE_WINDOWS:
+            totals = self.window_report(window, (), team_id)
+            calls = totals[0]["calls"] if totals else 0
+            tokens = totals[0]["total_tokens"] if totals else 0
+            cost = totals[0]["cost_usd"] if totals else 0.0
+            lines.append(f"• Last {window}: {tokens} tokens in {calls} calls (≈ ${cost:.4f})")
+
+        decision = self.check_budget(team_id)
+        if decision.budget is not None and decision.budget.is_limited:
+            status = "within budget" if not decision.exceeded else f"exceeded, calls {decision.action}d"
+            lines += ["", f"💰 Budget: {decision.describe()} ({status})"]
+
+        for title, dimension in (("Agents", "agent"), ("Commands", "message_type"), ("Models", "model")):
+            rows = self.window_report("24h", (dimension,), team_id)[:top]
+            if rows:
+                lines += ["", f"{title} (last 24h):"]
+                lines += [f"• {row[dimension]}: {row['total_tokens']} tokens, ≈ ${row['cost_usd']:.4f}" for row in rows]
+        return "\n".join(lines)
+
+    def set_team_budget(self, team_id: str, budget: Optional[TeamTokenBudget]) -> None:
+        """Give a team its own budget (None removes any limit for the team)."""
+        if budget is not None:
+            budget.validate()
+        with self._lock:
+            self._team_budgets[team_id] = budget
+
+    def budget_for(self, team_id: str) -> Optional[TeamTokenBudget]:
+        """The team's own budget, else the default budget."""
+        with self._lock:
+            if team_id in self._team_budgets:
+                return self._team_budgets[team_id]
+        if self.budget_resolver is not None:
+            try:
+                budget = self.budget_resolver(team_id)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not resolve LLM budget for team {team_id}: {e}")
+                budget = None
+            if budget is not None:
+                return budget
+        return self.default_budget
+
+    def check_budget(self, team_id: str, now: Optional[float] = None) -> BudgetDecision:
+        """Whether a team's next call is allowed, downgraded or throttled."""
+        budget = self.budget_for(team_id)
+        if team_id == UNSCOPED_TEAM or budget is None or not budget.is_limited:
+            return BudgetDecision(BUDGET_ALLOW, budget=budget)
+
+        since = (time.time() if now is None else now) - window_seconds(budget.window)
+        used_tokens, used_cost = self.store.team_totals(team_id, since)
+        exceeded = (budget.tokens and used_tokens >= budget.tokens) or (
+            budget.cost_usd and used_cost >= budget.cost_usd
+        )
+        decision = BudgetDecision(budget.action if exceeded else BUDGET_ALLOW, used_tokens, used_cost, budget)
+
+        with self._lock:
+            previous = self._budget_actions.get(team_id, BUDGET_ALLOW)
+            self._budget_actions[team_id] = decision.action
+        if decision.action != previous:
+            if decision.exceeded:
+                logger.warning(f"💰 Team {team_id} {decision.describe()}; LLM calls are now {decision.action}d")
+            else:
+                logger.info(f"💰 Team {team_id} is back within its LLM budget")
+        return decision
+
+    def reset(self) -> None:
+        with self._lock:
+            self._usage.clear()
+            self._budget_actions.clear()
+        self.store.reset()
+
+
+class AccountedLLM(LLM):
+    """CrewAI LLM that records token usage and enforces prompt and per-team budgets."""
+
+    def __init__(
+        self,
+        *args: Any,
+        agent_name: str = "shared",
+        prompt_token_budget: int = 0,
+        accountant: Optional[TokenAccountant] = None,
+        downgrade_llm: Optional[LLM] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.agent_name = agent_name
+        self.prompt_token_budget = prompt_token_budget
+        self.accountant = accountant or get_token_accountant()
+        # Cheaper model used once the team's budget is exceeded with the downgrade action
+        self.downgrade_llm = downgrade_llm
+
+    def count_prompt_tokens(self, messages: Any) -> int:
+        return count_message_tokens(messages, self.model)
+
+    def count_completion_tokens(self, response: Any) -> int:
+        return count_text_tokens(response if isinstance(response, str) else str(response), self.model)
+
+    def call(self, messages: Any, *args: Any, **kwargs: Any) -> Any:
+        team_id, _ = current_scope()
+        decision = self.accountant.check_budget(team_id)
+        if decision.action == BUDGET_ACTION_THROTTLE:
+            raise TokenBudgetExceededError(team_id, decision.describe())
+
+        complete, model = self._complete, self.model
+        if decision.action == BUDGET_ACTION_DOWNGRADE and self.downgrade_llm is not None:
+            downgrade = self.downgrade_llm
+            model = downgrade.model
+            if isinstance(downgrade, AccountedLLM):
+                # An accounted downgrade model is completed directly so the call is recorded once
+                complete = downgrade._complete
+            else:
+                def complete(messages: Any, *args: Any, **kwargs: Any) -> Tuple[Any, str]:
+                    return downgrade.call(messages, *args, **kwargs), downgrade.model
+
+        trimmed_tokens = 0
+        if self.prompt_token_budget and isinstance(messages, list):
+            messages, trimmed_tokens = trim_messages_to_budget(
+                messages, self.prompt_token_budget, self.count_prompt_tokens
+            )
+            if trimmed_tokens:
+                logger.info(
+                    f"✂️ Trimmed {trimmed_tokens} prompt tokens for {self.agent_name} "
+                    f"(budget {self.prompt_token_budget})"
+                )
+        prompt_tokens = self.count_prompt_tokens(messages)
+
+        started = time.perf_counter()
+        try:
+            response, model = complete(messages, *args, **kwargs)
+        except Exception:
+            runtime_metrics.LLM_CALLS.inc(model or "", runtime_metrics.OUTCOME_ERROR)
+            runtime_metrics.LLM_CALL_SECONDS.observe(time.perf_counter() - started, model or "")
+            raise
+        latency = time.perf_counter() - started
+        runtime_metrics.LLM_CALLS.inc(model or "", runtime_metrics.OUTCOME_SUCCESS)
+        runtime_metrics.LLM_CALL_SECONDS.observe(latency, model or "")
+
+        self.accountant.record(
+            self.agent_name,
+            prompt_tokens,
+            self.count_completion_tokens(response),
+            latency,
+            trimmed_tokens=trimmed_tokens,
+            model=model or "",
+        )
+        return response
+
+    def _complete(self, messages: Any, *args: Any, **kwargs: Any) -> Tuple[Any, str]:
+        """
+        Run the completion itself (overridden to route across providers).
+
+        Returns the response and the model that produced it, which usage and
+        cost are recorded under.
+        """
+        return super().call(messages, *args, **kwargs), self.model
+
+
+def budget_from_team_settings(team_id: str) -> Optional[TeamTokenBudget]:
+    """A team's own budget from ``settings["llm_budget"]`` in the team config cache."""
+    from kickai.core.team_config_cache import get_team_config_cache
+
+    cache = get_team_config_cache()
+    if not cache.is_initialized():
+        return None
+    team = cache.get_team(team_id)
+    data = (team.settings or {}).get(TEAM_BUDGET_SETTINGS_KEY) if team else None
+    return TeamTokenBudget.from_dict(data) if data else None
+
+
+def _accountant_from_settings() -> TokenAccountant:
+    """Accountant with the configured ledger file and default team budget."""
+    try:
+        from kickai.core.config import get_settings
+
+        settings = get_settings()
+        default_budget = TeamTokenBudget(
+            tokens=settings.ai_team_token_budget,
+            cost_usd=settings.ai_team_cost_budget_usd,
+            window=settings.ai_team_budget_window,
+            action=settings.ai_team_budget_action,
+        )
+        default_budget.validate()
+        store = TokenUsageStore(settings.token_usage_store_path or ":memory:")
+    except Exception as e:
+        logger.warning(f"⚠️ Token usage ledger kept in memory without a default budget: {e}")
+        return TokenAccountant(budget_resolver=budget_from_team_settings)
+    return TokenAccountant(store, default_budget=default_budget, budget_resolver=budget_from_team_settings)
+
+
+# Global accountant instance
+_token_accountant: Optional[TokenAccountant] = None
+
+
+def get_token_accountant() -> TokenAccountant:
+    """Get the global token accountant instance."""
+    global _token_accountant
+    if _token_accountant is None:
+        _token_accountant = _accountant_from_settings()
+    return _token_accountant
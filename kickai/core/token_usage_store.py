@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+LLM Usage Ledger
+
+One row per LLM call (team, agent, message type, model, tokens, latency,
+estimated cost) in a local SQLite file, so usage survives restarts and can be
+aggregated over rolling windows: the last hour, day, week or month. Rows
+older than the longest window are pruned as new calls are recorded.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Rolling windows available to reports and budgets
+USAGE_WINDOWS = {
+    "1h": 3600,
+    "24h": 24 * 3600,
+    "7d": 7 * 24 * 3600,
+    "30d": 30 * 24 * 3600,
+}
+DEFAULT_RETENTION_SECONDS = USAGE_WINDOWS["30d"]
+# Old rows are pruned once per this many recorded calls
+PRUNE_EVERY_CALLS = 1000
+
+USAGE_DIMENSIONS = ("agent", "team_id", "message_type", "model")
+
+
+def window_seconds(window: str) -> int:
+    """Length of a named rolling window ("1h", "24h", "7d", "30d")."""
+    try:
+        return USAGE_WINDOWS[window]
+    except KeyError:
+        raise ValueError(f"Unknown usage window {window!r}; expected one of {sorted(USAGE_WINDOWS)}") from None
+
+
+class TokenUsageStore:
+    """SQLite ledger of LLM calls (shared by worker threads, so every access holds a lock)."""
+
+    def __init__(self, path: str = ":memory:", retention_seconds: int = DEFAULT_RETENTION_SECONDS):
+        self.path = path
+        self.retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        self._calls_since_prune = 0
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_calls (
+                    ts REAL NOT NULL,
+                    team_id TEXT NOT NULL,
+                    agent TEXT NOT NULL,
+                    message_type TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    prompt_tokens INTEGER NOT NULL,
+                    completion_tokens INTEGER NOT NULL,
+                    latency_seconds REAL NOT NULL,
+                    cost_usd REAL NOT NULL
+                )
+                """
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS idx_llm_calls_team_ts ON llm_calls (team_id, ts)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS idx_llm_calls_ts ON llm_calls (ts)")
+
+    def append(
+        self,
+        team_id: str,
+        agent: str,
+        message_type: str,
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        latency_seconds: float,
+        cost_usd: float,
+        ts: Optional[float] = None,
+    ) -> None:
+        """Record one LLM call."""
+        ts = time.time() if ts is None else ts
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO llm_calls VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (ts, team_id, agent, message_type, model, prompt_tokens, completion_tokens, latency_seconds, cost_usd),
+            )
+            self._calls_since_prune += 1
+            if self._calls_since_prune >= PRUNE_EVERY_CALLS:
+                self._calls_since_prune = 0
+                self._connection.execute("DELETE FROM llm_calls WHERE ts < ?", (ts - self.retention_seconds,))
+
+    def team_totals(self, team_id: str, since: float) -> Tuple[int, float]:
+        """(total tokens, cost in USD) a team used since ``since`` (epoch seconds)."""
+        with self._lock:
+            tokens, cost = self._connection.execute(
+                "SELECT COALESCE(SUM(prompt_tokens + completion_tokens), 0), COALESCE(SUM(cost_usd), 0) "
+                "FROM llm_calls WHERE team_id = ? AND ts >= ?",
+                (team_id, since),
+            ).fetchone()
+        return int(tokens), float(cost)
+
+    def aggregate(
+        self,
+        window: str,
+        group_by: Sequence[str] = USAGE_DIMENSIONS,
+        team_id: Optional[str] = None,
+        now: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Usage over a rolling window grouped by the given dimensions, largest total first.
+
+        Args:
+            window: "1h", "24h", "7d" or "30d"
+            group_by: Subset of ("agent", "team_id", "message_type", "model")
+            team_id: Only include this team's calls
+            now: End of the window (defaults to the current time)
+        """
+        unknown = set(group_by) - set(USAGE_DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown usage dimensions: {sorted(unknown)}")
+
+        since = (time.time() if now is None else now) - window_seconds(window)
+        conditions, params = ["ts >= ?"], [since]
+        if team_id is not None:
+            conditions.append("team_id = ?")
+            params.append(team_id)
+
+        # group_by is validated against USAGE_DIMENSIONS above, so it is safe to interpolate
+        columns = ", ".join(group_by)
+        select = f"{columns}, " if group_by else ""
+        group = f"GROUP BY {columns}" if group_by else ""
+        query = (
+            f"SELECT {select}COUNT(*), SUM(prompt_tokens), SUM(completion_tokens), "
+            f"SUM(latency_seconds), SUM(cost_usd) FROM llm_calls "
+            f"WHERE {' AND '.join(conditions)} {group}"
+        )
+        with self._lock:
+            fetched = self._connection.execute(query, params).fetchall()
+
+        rows = []
+        for values in fetched:
+            labels = dict(zip(group_by, values))
+            calls, prompt_tokens, completion_tokens, latency, cost = values[len(group_by):]
+            if not calls:
+                continue
+            rows.append({
+                **labels,
+                "calls": calls,
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "avg_latency_seconds": round(latency / calls, 3),
+                "cost_usd": round(cost, 6),
+            })
+        return sorted(rows, key=lambda row: row["total_tokens"], reverse=True)
+
+    def reset(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM llm_calls")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
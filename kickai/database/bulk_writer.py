@@ -0,0 +1,488 @@
+"""
+Bulk Writer for KICKAI
+
+Buffers create/set/update/delete operations and commits them through a
+store's ``execute_batch`` in chunks of at most Firestore's batch limit, with
+a bounded number of commits in flight. Used by the setup, cleanup and
+migration scripts instead of writing document by document.
+
+Features:
+- Automatic chunking at ``FIRESTORE_BATCH_LIMIT`` (500) operations
+- Bounded parallel commits (also bounds buffered memory)
+- Resumable runs: each operation can carry a position (the cursor of the
+  document it came from); the position up to which every batch has committed
+  is saved to a checkpoint file, and a re-run resumes reading after it
+- Dry-run mode that counts and logs operations without writing
+- Throughput reporting (operations/second)
+
+Usage::
+
+    async with BulkWriter(store, job_name="cleanup_players", checkpoint_path=path) as writer:
+        async for doc in store.iter_documents(collection, start_after=writer.resume_after):
+            await writer.delete(collection, doc["id"], position=(doc["id"],))
+    logger.info(writer.report.summary())
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+FIRESTORE_BATCH_LIMIT = 500
+DEFAULT_MAX_CONCURRENT_COMMITS = 4
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_RETRY_DELAY_SECONDS = 0.5
+PROGRESS_LOG_INTERVAL_BATCHES = 10
+DEFAULT_CHECKPOINT_DIR = ".bulk_write_checkpoints"
+
+OPERATION_TYPES = ("create", "set", "update", "delete")
+
+
+def stage_batch_operations(
+    batch: Any, collection_ref: Callable[[str], Any], operations: List[Dict[str, Any]]
+) -> List[str]:
+    """
+    Stage operations on a Firestore WriteBatch.
+
+    Args:
+        batch: Firestore WriteBatch
+        collection_ref: Resolves a collection name to a CollectionReference
+        operations: Operation dicts (``type``, ``collection``, ``document_id``, ``data``, ``merge``)
+
+    Returns:
+        Document IDs in operation order
+    """
+    results = []
+    for operation in operations:
+        op_type = operation["type"]
+        collection = collection_ref(operation["collection"])
+        document_id = operation.get("document_id")
+        data = operation.get("data", {})
+
+        if op_type == "create":
+            doc_ref = collection.document(document_id) if document_id else collection.document()
+            batch.set(doc_ref, data)
+        elif op_type == "set":
+            doc_ref = collection.document(document_id)
+            batch.set(doc_ref, data, merge=operation.get("merge", False))
+        elif op_type == "update":
+            doc_ref = collection.document(document_id)
+            batch.update(doc_ref, data)
+        elif op_type == "delete":
+            doc_ref = collection.document(document_id)
+            batch.delete(doc_ref)
+        else:
+            raise ValueError(f"Unsupported batch operation type: {op_type}")
+        results.append(doc_ref.id)
+    return results
+
+
+class FirestoreBatchStore:
+    """
+    ``execute_batch`` over a raw Firestore client.
+
+    For scripts that address collections by their literal names (including
+    legacy unprefixed ones) rather than through FirebaseClient's prefixing.
+    """
+
+    def __init__(self, db: Any):
+        self.db = db
+
+    async def execute_batch(self, operations: List[Dict[str, Any]]) -> List[str]:
+        if not operations:
+            return []
+        batch = self.db.batch()
+        results = stage_batch_operations(batch, self.db.collection, operations)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, batch.commit)
+        return results
+
+    async def stream_documents(
+        self, collection: str, start_after: Optional[Tuple[Any, ...]] = None, page_size: int = 300
+    ) -> AsyncIterator[Any]:
+        """
+        Stream a collection's document snapshots in document ID order, a page at a time.
+
+        ``start_after`` is a ``(document_id,)`` cursor, as produced for BulkWriter positions.
+        """
+        from google.cloud.firestore import FieldPath
+
+        loop = asyncio.get_running_loop()
+        cursor = start_after[0] if start_after else None
+        while True:
+            query = self.db.collection(collection).order_by(FieldPath.document_id()).limit(page_size)
+            if cursor is not None:
+                query = query.start_after([cursor])
+            snapshots = await loop.run_in_executor(None, lambda q=query: list(q.stream()))
+            for snapshot in snapshots:
+                yield snapshot
+            if len(snapshots) < page_size:
+                return
+            cursor = snapshots[-1].id
+
+
+@dataclass
+class BulkWriteReport:
+    """Outcome and throughput of a bulk write job."""
+
+    job_name: str
+    dry_run: bool = False
+    operations: int = 0
+    committed_operations: int = 0
+    batches_committed: int = 0
+    batches_failed: int = 0
+    resumed_after: Optional[Tuple[Any, ...]] = None
+    operations_by_type: Dict[str, int] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: Optional[float] = None
+
+    @property
+    def elapsed_seconds(self) -> float:
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+
+    @property
+    def operations_per_second(self) -> float:
+        elapsed = self.elapsed_seconds
+        processed = self.operations if self.dry_run else self.committed_operations
+        return processed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def success(self) -> bool:
+        return self.batches_failed == 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_name": self.job_name,
+            "dry_run": self.dry_run,
+            "operations": self.operations,
+            "committed_operations": self.committed_operations,
+            "batches_committed": self.batches_committed,
+            "resumed_after": list(self.resumed_after) if self.resumed_after else None,
+            "batches_failed": self.batches_failed,
+            "operations_by_type": dict(self.operations_by_type),
+            "errors": list(self.errors),
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "operations_per_second": round(self.operations_per_second, 1),
+        }
+
+    def summary(self) -> str:
+        mode = "DRY RUN - " if self.dry_run else ""
+        resumed = f", resumed after {self.resumed_after}" if self.resumed_after else ""
+        by_type = ", ".join(f"{k}={v}" for k, v in sorted(self.operations_by_type.items())) or "none"
+        return (
+            f"{mode}{self.job_name}: {self.operations} operations ({by_type}), "
+            f"{self.committed_operations} committed in {self.batches_committed} batches, "
+            f"{self.batches_failed} failed, {self.elapsed_seconds:.2f}s, "
+            f"{self.operations_per_second:.1f} ops/s{resumed}"
+        )
+
+
+class BulkWriter:
+    """Chunked, bounded-concurrency, resumable batch writer."""
+
+    def __init__(
+        self,
+        store: Any,
+        job_name: str = "bulk_write",
+        batch_size: int = FIRESTORE_BATCH_LIMIT,
+        max_concurrent_commits: int = DEFAULT_MAX_CONCURRENT_COMMITS,
+        checkpoint_path: Optional[str] = None,
+        dry_run: bool = False,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_delay: float = DEFAULT_RETRY_DELAY_SECONDS,
+    ):
+        """
+        Args:
+            store: Anything with ``async execute_batch(operations)`` (FirebaseClient,
+                MockDataStore, FirestoreBatchStore)
+            job_name: Identifies the job in logs and in the checkpoint file
+            batch_size: Operations per commit, capped at Firestore's limit
+            max_concurrent_commits: Maximum batches committing at once
+            checkpoint_path: JSON file recording the committed position; enables resume
+            dry_run: Count and log operations without writing
+            max_retries: Retries per batch before it is reported as failed
+            retry_delay: Initial backoff between retries (doubles each attempt)
+        """
+        if not 0 < batch_size <= FIRESTORE_BATCH_LIMIT:
+            raise ValueError(f"batch_size must be between 1 and {FIRESTORE_BATCH_LIMIT}")
+        if max_concurrent_commits < 1:
+            raise ValueError("max_concurrent_commits must be at least 1")
+
+        self.store = store
+        self.job_name = job_name
+        self.batch_size = batch_size
+        self.checkpoint_path = checkpoint_path
+        self.dry_run = dry_run
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.report = BulkWriteReport(job_name=job_name, dry_run=dry_run)
+
+        self._buffer: List[Dict[str, Any]] = []
+        self._buffer_position: Optional[Tuple[Any, ...]] = None
+        self._next_batch_index = 0
+        self._semaphore = asyncio.Semaphore(max_concurrent_commits)
+        self._in_flight: Set[asyncio.Task] = set()
+
+        # Batches can finish out of order; the checkpoint only advances over the
+        # contiguous prefix of committed batches
+        self._batch_positions: Dict[int, Optional[Tuple[Any, ...]]] = {}
+        self._finished_batches: Set[int] = set()
+        self._next_unconfirmed_batch = 0
+        self.resume_after: Optional[Tuple[Any, ...]] = self._load_checkpoint()
+        self.report.resumed_after = self.resume_after
+        self._committed_position = self.resume_after
+        self._closed = False
+
+    # Operation API
+    async def create(
+        self,
+        collection: str,
+        data: Dict[str, Any],
+        document_id: Optional[str] = None,
+        position: Optional[Tuple[Any, ...]] = None,
+    ) -> None:
+        await self.add(
+            {"type": "create", "collection": collection, "document_id": document_id, "data": data},
+            position,
+        )
+
+    async def set(
+        self,
+        collection: str,
+        document_id: str,
+        data: Dict[str, Any],
+        merge: bool = False,
+        position: Optional[Tuple[Any, ...]] = None,
+    ) -> None:
+        await self.add(
+            {"type": "set", "collection": collection, "document_id": document_id, "data": data, "merge": merge},
+            position,
+        )
+
+    async def update(
+        self,
+        collection: str,
+        document_id: str,
+        data: Dict[str, Any],
+        position: Optional[Tuple[Any, ...]] = None,
+    ) -> None:
+        await self.add(
+            {"type": "update", "collection": collection, "document_id": document_id, "data": data},
+            position,
+        )
+
+    async def delete(
+        self, collection: str, document_id: str, position: Optional[Tuple[Any, ...]] = None
+    ) -> None:
+        await self.add(
+            {"type": "delete", "collection": collection, "document_id": document_id}, position
+        )
+
+    async def add(self, operation: Dict[str, Any], position: Optional[Tuple[Any, ...]] = None) -> None:
+        """
+        Queue one operation; a full buffer is dispatched as a batch.
+
+        ``position`` is the read cursor of the source document. Once this
+        operation's batch (and all earlier ones) commit, it becomes the
+        checkpointed ``resume_after`` value.
+        """
+        if self._closed:
+            raise RuntimeError(f"BulkWriter '{self.job_name}' is closed")
+        op_type = operation.get("type")
+        if op_type not in OPERATION_TYPES:
+            raise ValueError(f"Unsupported batch operation type: {op_type}")
+        if op_type != "create" and not operation.get("document_id"):
+            raise ValueError(f"'{op_type}' operations require a document_id")
+
+        self._buffer.append(operation)
+        if position is not None:
+            self._buffer_position = tuple(position)
+        self.report.operations += 1
+        self.report.operations_by_type[op_type] = self.report.operations_by_type.get(op_type, 0) + 1
+        if len(self._buffer) >= self.batch_size:
+            await self._dispatch()
+
+    def mark_position(self, position: Tuple[Any, ...]) -> None:
+        """Record progress for a source document that produced no operation."""
+        self._buffer_position = tuple(position)
+
+    async def flush(self) -> None:
+        """Dispatch the partial buffer and wait for every in-flight commit."""
+        if self._buffer:
+            await self._dispatch()
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight)
+
+    async def close(self) -> BulkWriteReport:
+        """Flush, finalise the report and drop the checkpoint if everything committed."""
+        if not self._closed:
+            await self.flush()
+            self._closed = True
+            self.report.finished_at = time.monotonic()
+            if self.report.success and not self.dry_run:
+                self._remove_checkpoint()
+            log = logger.info if self.report.success else logger.warning
+            log(f"📦 {self.report.summary()}")
+        return self.report
+
+    async def __aenter__(self) -> "BulkWriter":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.close()
+            return
+        # Let in-flight commits land (and be checkpointed) but do not commit the
+        # partial buffer of an aborted run, so a resume replays it consistently
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        self._closed = True
+        self.report.finished_at = time.monotonic()
+        logger.warning(f"📦 {self.job_name} aborted: {self.report.summary()}")
+
+    # Batch dispatch
+    async def _dispatch(self) -> None:
+        operations, self._buffer = self._buffer, []
+        batch_index = self._next_batch_index
+        self._next_batch_index += 1
+        self._batch_positions[batch_index] = self._buffer_position
+
+        if self.dry_run:
+            self.report.batches_committed += 1
+            logger.info(
+                f"📝 [DRY RUN] {self.job_name}: batch {batch_index} with {len(operations)} operations"
+            )
+            return
+
+        # Acquired here and released by the commit task: bounds in-flight batches
+        await self._semaphore.acquire()
+        task = asyncio.create_task(self._commit(batch_index, operations))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _commit(self, batch_index: int, operations: List[Dict[str, Any]]) -> None:
+        try:
+            delay = self.retry_delay
+            for attempt in range(self.max_retries + 1):
+                try:
+                    await self.store.execute_batch(operations)
+                    break
+                except Exception as e:
+                    if attempt >= self.max_retries:
+                        self.report.batches_failed += 1
+                        self.report.errors.append(f"batch {batch_index}: {e}")
+                        logger.error(
+                            f"❌ {self.job_name}: batch {batch_index} failed after "
+                            f"{attempt + 1} attempts: {e}"
+                        )
+                        return
+                    logger.warning(
+                        f"⚠️ {self.job_name}: batch {batch_index} attempt {attempt + 1} failed, "
+                        f"retrying in {delay:.1f}s: {e}"
+                    )
+                    await asyncio.sleep(delay)
+                    delay *= 2
+
+            self.report.batches_committed += 1
+            self.report.committed_operations += len(operations)
+            self._advance_checkpoint(batch_index)
+
+            if self.report.batches_committed % PROGRESS_LOG_INTERVAL_BATCHES == 0:
+                logger.info(
+                    f"📦 {self.job_name}: {self.report.committed_operations} operations committed "
+                    f"({self.report.operations_per_second:.1f} ops/s)"
+                )
+        finally:
+            self._semaphore.release()
+
+    def _advance_checkpoint(self, batch_index: int) -> None:
+        self._finished_batches.add(batch_index)
+        advanced = False
+        while self._next_unconfirmed_batch in self._finished_batches:
+            position = self._batch_positions.pop(self._next_unconfirmed_batch)
+            if position is not None:
+                self._committed_position = position
+            self._finished_batches.discard(self._next_unconfirmed_batch)
+            self._next_unconfirmed_batch += 1
+            advanced = True
+        if advanced:
+            self._save_checkpoint()
+
+    # Checkpointing
+    def _load_checkpoint(self) -> Optional[Tuple[Any, ...]]:
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path) as f:
+            state = json.load(f)
+        if state.get("job_name") != self.job_name:
+            raise ValueError(
+                f"Checkpoint {self.checkpoint_path} belongs to job '{state.get('job_name')}', "
+                f"not '{self.job_name}'"
+            )
+        position = state.get("resume_after")
+        if position is None:
+            return None
+        logger.info(f"♻️ {self.job_name}: resuming after {position} from checkpoint")
+        return tuple(position)
+
+    def _save_checkpoint(self) -> None:
+        if not self.checkpoint_path or self._committed_position is None:
+            return
+        state = {
+            "job_name": self.job_name,
+            "resume_after": list(self._committed_position),
+            "committed_operations": self.report.committed_operations,
+        }
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f, default=str)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _remove_checkpoint(self) -> None:
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+
+# Script helpers
+
+
+def add_bulk_write_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the standard --dry-run/--batch-size/--max-concurrent-commits/--checkpoint-dir flags."""
+    parser.add_argument("--dry-run", action="store_true", help="Report the writes without applying them")
+    parser.add_argument(
+        "--batch-size", type=int, default=FIRESTORE_BATCH_LIMIT, help="Operations per batch commit"
+    )
+    parser.add_argument(
+        "--max-concurrent-commits",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENT_COMMITS,
+        help="Batches committing in parallel",
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        default=DEFAULT_CHECKPOINT_DIR,
+        help="Directory for resume checkpoints (an interrupted run resumes from here)",
+    )
+
+
+def bulk_writer_from_args(store: Any, job_name: str, args: argparse.Namespace) -> BulkWriter:
+    """Build a BulkWriter from flags added by ``add_bulk_write_arguments``."""
+    checkpoint_path = None
+    if not args.dry_run:
+        os.makedirs(args.checkpoint_dir, exist_ok=True)
+        checkpoint_path = os.path.join(args.checkpoint_dir, f"{job_name}.json")
+    return BulkWriter(
+        store,
+        job_name=job_name,
+        batch_size=args.batch_size,
+        max_concurrent_commits=args.max_concurrent_commits,
+        checkpoint_path=checkpoint_path,
+        dry_run=args.dry_run,
+    )
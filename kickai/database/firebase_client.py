@@ -12,7 +12,7 @@ import time
 import traceback
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
 
 import firebase_admin
 from firebase_admin import credentials, firestore
@@ -27,6 +27,8 @@ from kickai.core.constants import FIRESTORE_COLLECTION_PREFIX
 from kickai.core.exceptions import (
     ConnectionError,
     DatabaseError,
+    DeadlineExceededError,
+    DependencyUnavailableError,
     DuplicateError,
     NotFoundError,
     create_error_context,
@@ -36,11 +38,38 @@ from kickai.core.firestore_constants import (
     get_collection_name,
     get_team_members_collection,
 )
+from kickai.database.bulk_writer import FIRESTORE_BATCH_LIMIT, stage_batch_operations
+from kickai.database.query_spec import (
+    DOCUMENT_ID_FIELD,
+    QuerySpec,
+    fetch_page,
+    iter_documents,
+)
+from kickai.core.resilience import FIRESTORE_DEPENDENCY, get_dependency_guard
+from kickai.features.shared.domain.pagination import DEFAULT_PAGE_SIZE, Page
 from kickai.features.team_administration.domain.entities.team_member import TeamMember
 # Removed async_utils - using standard Python async patterns
 from kickai.utils.enum_utils import serialize_enums_for_firestore
 
 
+def _is_firestore_outage(error: Exception) -> bool:
+    """Whether an error counts against the Firestore circuit breaker."""
+    if isinstance(error, google_exceptions.ResourceExhausted):
+        return True
+    # 4xx responses (not found, already exists, permission denied, bad arguments) mean Firestore is up
+    return not isinstance(error, (google_exceptions.ClientError, ValueError, TypeError))
+
+
+def _documents_to_dicts(query: Any) -> List[Dict[str, Any]]:
+    """Stream a query's documents into dicts carrying their ``id`` (blocking)."""
+    results = []
+    for doc in query.stream():
+        data = doc.to_dict() or {}
+        data["id"] = doc.id
+        results.append(data)
+    return results
+
+
 class FirebaseClient:
     """Robust Firebase client wrapper with connection pooling and error handling."""
 
@@ -49,6 +78,16 @@ class FirebaseClient:
         self._client: firestore_client.Union[Client, None] = None
         self._connection_pool: dict[str, Any] = {}
         self._batch_operations: List[dict[str, Any]] = []
+        # Every blocking Firestore call goes through this guard: request deadline,
+        # circuit breaker and a bulkhead capping concurrent operations
+        self._guard = get_dependency_guard(
+            FIRESTORE_DEPENDENCY,
+            failure_threshold=getattr(config, "firestore_breaker_failure_threshold", 5),
+            reset_seconds=getattr(config, "firestore_breaker_reset_seconds", 30),
+            max_concurrent=getattr(config, "firestore_max_concurrent_operations", 32),
+            operation_timeout=getattr(config, "firebase_timeout", None),
+            is_outage=_is_firestore_outage,
+        )
 
         # Skip initialization in testing environment
         if config.firebase_project_id == "test_project" or not config.firebase_project_id:
@@ -159,6 +198,10 @@ class FirebaseClient:
 
     def _handle_firebase_error(self, error: Exception, operation: str, **context) -> None:
         """Handle Firebase errors and convert to KICKAI exceptions."""
+        if isinstance(error, (DependencyUnavailableError, DeadlineExceededError)):
+            # Surfaced unchanged so callers can fail fast with a friendly reply
+            raise error
+
         error_context = create_error_context(operation, **context)
 
         if isinstance(error, google_exceptions.NotFound):
@@ -183,38 +226,33 @@ class FirebaseClient:
         except Exception as e:
             self._handle_firebase_error(e, "transaction")
 
+    async def _guarded(self, func: Any, *args: Any) -> Any:
+        """Run a blocking Firestore call within the request deadline, breaker and bulkhead."""
+        return await self._guard.run_blocking(func, *args)
+
     async def execute_batch(self, operations: List[dict[str, Any]]) -> List[Any]:
-        """Execute a batch of operations."""
+        """
+        Execute a batch of operations atomically.
+
+        Operations are dicts with ``type`` (create/set/update/delete),
+        ``collection``, ``document_id`` (optional for create), ``data`` and,
+        for set, ``merge``. A batch holds at most FIRESTORE_BATCH_LIMIT
+        operations; use BulkWriter for larger jobs. The commit runs on the
+        Firestore bulkhead's threads so several batches can be in flight at once.
+        """
         if not operations:
             return []
+        if len(operations) > FIRESTORE_BATCH_LIMIT:
+            raise ValueError(
+                f"Batch of {len(operations)} operations exceeds Firestore's limit of "
+                f"{FIRESTORE_BATCH_LIMIT}; use BulkWriter to chunk it"
+            )
 
         batch = self.client.batch()
-        results = []
 
         try:
-            for operation in operations:
-                op_type = operation["type"]
-                collection = operation["collection"]
-                data = operation.get("data", {})
-
-                if op_type == "create":
-                    doc_ref = self._get_collection(collection).document()
-                    batch.set(doc_ref, data)
-                    results.append(doc_ref.id)
-
-                elif op_type == "update":
-                    doc_id = operation["document_id"]
-                    doc_ref = self._get_collection(collection).document(doc_id)
-                    batch.update(doc_ref, data)
-                    results.append(doc_id)
-
-                elif op_type == "delete":
-                    doc_id = operation["document_id"]
-                    doc_ref = self._get_collection(collection).document(doc_id)
-                    batch.delete(doc_ref)
-                    results.append(doc_id)
-
-            batch.commit()
+            results = stage_batch_operations(batch, self._get_collection, operations)
+            await self._guarded(batch.commit)
             logger.info(f"Batch operation completed: {len(operations)} operations")
             return results
 
@@ -224,6 +262,41 @@ class FirebaseClient:
             )
             return []  # Return empty list on error
 
+    async def transact(
+        self,
+        reads: List[Tuple[str, str]],
+        build_operations: Callable[[List[Optional[Dict[str, Any]]]], List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Read documents and write operations derived from them atomically.
+
+        ``build_operations`` receives the documents at ``reads`` (``None`` for a
+        missing one) and returns batch operations in the ``execute_batch``
+        format. They commit only if none of the read documents changed in the
+        meantime; on contention Firestore retries the whole function, so
+        ``build_operations`` must be free of side effects.
+
+        Returns:
+            The operations that were committed
+
+        Raises:
+            DatabaseError: If the transaction fails (nothing is committed)
+        """
+
+        def run(transaction: Any) -> List[Dict[str, Any]]:
+            documents = []
+            for collection, document_id in reads:
+                snapshot = self._get_collection(collection).document(document_id).get(transaction=transaction)
+                documents.append(snapshot.to_dict() if snapshot.exists else None)
+            operations = build_operations(documents)
+            stage_batch_operations(transaction, self._get_collection, operations)
+            return operations
+
+        try:
+            return await self._guarded(firestore_client.transactional(run), self.client.transaction())
+        except Exception as e:
+            self._handle_firebase_error(e, "transact", additional_info={"reads": reads})
+
     async def create_document(
         self, collection: str, data: dict[str, Any], document_id: Optional[str] = None
     ) -> str:
@@ -249,7 +322,7 @@ class FirebaseClient:
                 if document_id
                 else self._get_collection(collection).document()
             )
-            doc_ref.set(data_serialized)
+            await self._guarded(doc_ref.set, data_serialized)
             logger.info(f"[Firestore] Document created: {doc_ref.id}")
             return doc_ref.id
             
@@ -274,7 +347,7 @@ class FirebaseClient:
         try:
             # ALL business logic here
             doc_ref = self._get_collection(collection).document(document_id)
-            doc = doc_ref.get()
+            doc = await self._guarded(doc_ref.get)
 
             if doc is not None and doc.exists:
                 data = doc.to_dict()
@@ -314,7 +387,7 @@ class FirebaseClient:
                 f"[Firestore] Updating document in '{collection}' with ID: {document_id}, data: {data_serialized}"
             )
             doc_ref = self._get_collection(collection).document(document_id)
-            doc_ref.update(data_serialized)
+            await self._guarded(doc_ref.update, data_serialized)
             logger.info(f"[Firestore] Document updated: {document_id}")
             return True
             
@@ -343,7 +416,7 @@ class FirebaseClient:
             # ALL business logic here
             logger.info(f"[Firestore] Deleting document in '{collection}' with ID: {document_id}")
             doc_ref = self._get_collection(collection).document(document_id)
-            doc_ref.delete()
+            await self._guarded(doc_ref.delete)
             logger.info(f"[Firestore] Document deleted: {document_id}")
             return True
             
@@ -406,13 +479,7 @@ class FirebaseClient:
 
             # Execute query
             logger.debug("Executing query.stream()")
-            docs = query.stream()
-            results = []
-
-            for doc in docs:
-                data = doc.to_dict()
-                data["id"] = doc.id
-                results.append(data)
+            results = await self._guarded(_documents_to_dicts, query)
 
             logger.debug(f"Query documents returning {len(results)} results: {results}")
             return results
@@ -426,6 +493,108 @@ class FirebaseClient:
             )
             return []
 
+    async def run_query(self, collection: str, spec: QuerySpec) -> List[Dict[str, Any]]:
+        """
+        Run a QuerySpec as a native Firestore query.
+
+        Filters, range predicates, ordering, limit and projection are all
+        executed server-side, so only the matching documents (and fields)
+        are transferred.
+
+        Args:
+            collection: Collection name
+            spec: Query specification
+
+        Returns:
+            List of document data or empty list on error
+        """
+        try:
+            spec.validate()
+            query = self._get_collection(collection)
+
+            for filter_item in spec.filters:
+                query = query.where(
+                    field_path=filter_item.field,
+                    op_string=filter_item.operator,
+                    value=filter_item.value,
+                )
+
+            for order in spec.order_by:
+                direction = (
+                    firestore_client.Query.DESCENDING
+                    if order.descending
+                    else firestore_client.Query.ASCENDING
+                )
+                field_path = (
+                    firestore_client.FieldPath.document_id()
+                    if order.field == DOCUMENT_ID_FIELD
+                    else order.field
+                )
+                query = query.order_by(field_path, direction=direction)
+
+            if spec.select is not None:
+                query = query.select(list(spec.select))
+
+            if spec.start_after is not None:
+                # Document ID cursor values are plain IDs; the client resolves them
+                # against the collection
+                query = query.start_after(list(spec.start_after))
+
+            if spec.limit:
+                query = query.limit(spec.limit)
+
+            results = await self._guarded(_documents_to_dicts, query)
+
+            logger.debug(f"run_query on {collection} returned {len(results)} documents")
+            return results
+
+        except Exception as e:
+            logger.error(f"❌ Error in run_query: {e}")
+            self._handle_firebase_error(
+                e,
+                "run_query",
+                additional_info={"collection": collection, "filters": spec.filter_dicts()},
+            )
+            return []
+
+    async def query_page(
+        self,
+        collection: str,
+        spec: Optional[QuerySpec] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[tuple] = None,
+    ) -> Page[Dict[str, Any]]:
+        """
+        Fetch one page of a query.
+
+        Args:
+            collection: Collection name
+            spec: Optional query specification (filters, ordering, projection)
+            page_size: Maximum documents in the page
+            cursor: ``next_cursor`` of the previous page, or None for the first page
+
+        Returns:
+            Page with the documents and the cursor for the next page
+        """
+        return await fetch_page(self, collection, spec, page_size, cursor)
+
+    def iter_documents(
+        self,
+        collection: str,
+        spec: Optional[QuerySpec] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        start_after: Optional[tuple] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream documents page by page using ``start_after`` cursors.
+
+        Unlike query_documents, only one page is held in memory at a time::
+
+            async for doc in client.iter_documents(collection, page_size=500):
+                ...
+        """
+        return iter_documents(self, collection, spec, page_size, start_after)
+
     async def list_collections(self) -> List[str]:
         """
         List all collections in the database.
@@ -435,7 +604,7 @@ class FirebaseClient:
         """
         try:
             # ALL business logic here
-            collections = self.client.collections()
+            collections = await self._guarded(lambda: list(self.client.collections()))
             return [col.id for col in collections]
 
         except Exception as e:
@@ -533,7 +702,7 @@ class FirebaseClient:
 
     async def get_player_by_phone(self, phone: str, team_id: Optional[str] = None) -> Optional[Any]:
         """Get a player by phone number, optionally filtered by team."""
-        from kickai.utils.phone_validation import get_phone_variants
+        from kickai.utils.phone_validation import legacy_phone_forms, to_e164
 
         # Use team-specific collection if team_id is provided
         if team_id:
@@ -543,22 +712,20 @@ class FirebaseClient:
         else:
             collection_name = get_collection_name(COLLECTION_PLAYERS)
 
-        # Get all phone variants for flexible matching using enhanced validation
-        phone_variants = get_phone_variants(phone)
+        # Numbers are stored canonicalised to E.164, so any input format is a single lookup
+        phone_e164 = to_e164(phone)
+        if not phone_e164:
+            return None
 
-        # Try to find player with any of the phone variants
-        for variant in phone_variants:
-            filters = [{"field": "phone_number", "operator": "==", "value": variant}]
+        spec = QuerySpec().where("phone_e164", "==", phone_e164).take(1)
+        # Documents not yet backfilled only carry phone_number, in whatever format it was entered
+        legacy_spec = QuerySpec().where("phone_number", "in", legacy_phone_forms(phone)).take(1)
+        for query in (spec, legacy_spec):
             if team_id:
-                filters.append({"field": "team_id", "operator": "==", "value": team_id})
-            data_list = await self.query_documents(collection_name, filters, limit=1)
-            for data in data_list:
-                if data:
-                    return data
-                else:
-                    logger.warning(
-                        f"[Firestore] Skipping bad player document (id={data.get('id', 'unknown')}) in get_player_by_phone"
-                    )
+                query = query.where("team_id", "==", team_id)
+            data_list = await self.run_query(collection_name, query)
+            if data_list:
+                return data_list[0]
         return None
 
     async def get_team_players(self, team_id: str) -> List[Any]:
@@ -797,10 +964,14 @@ class FirebaseClient:
 
     async def get_leadership_members(self, team_id: str) -> List[Any]:
         """Get all leadership members (with leadership chat access)."""
-        team_members = await self.get_team_members_by_team(team_id)
-        return [
-            member for member in team_members if member.chat_access.get("leadership_chat", False)
-        ]
+        collection_name = get_team_members_collection(team_id)
+        spec = (
+            QuerySpec()
+            .where("team_id", "==", team_id)
+            .where("chat_access.leadership_chat", "==", True)
+        )
+        documents = await self.run_query(collection_name, spec)
+        return [TeamMember.from_dict(doc) for doc in documents]
 
     async def get_player_by_telegram_id(self, telegram_id: Union[str, int], team_id: str) -> Optional[Any]:
         """
@@ -1,5 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List, Union
+from typing import Any, AsyncIterator, Dict, Optional, List, Union
+
+from kickai.database.query_spec import (
+    QuerySpec,
+    apply_query_spec,
+    fetch_page,
+    iter_documents,
+)
+from kickai.features.shared.domain.pagination import DEFAULT_PAGE_SIZE, Page
 
 
 class DataStoreInterface(ABC):
@@ -32,3 +40,31 @@ class DataStoreInterface(ABC):
         limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         pass
+
+    async def run_query(self, collection: str, spec: QuerySpec) -> List[Dict[str, Any]]:
+        """
+        Run a QuerySpec. Stores that can push predicates down should override
+        this; the default fetches on the filters and evaluates the rest in memory.
+        """
+        documents = await self.query_documents(collection, filters=spec.filter_dicts())
+        return apply_query_spec(documents, spec)
+
+    async def query_page(
+        self,
+        collection: str,
+        spec: Optional[QuerySpec] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[tuple] = None,
+    ) -> Page[Dict[str, Any]]:
+        """Fetch one page of a query; pass the returned ``next_cursor`` to continue."""
+        return await fetch_page(self, collection, spec, page_size, cursor)
+
+    def iter_documents(
+        self,
+        collection: str,
+        spec: Optional[QuerySpec] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        start_after: Optional[tuple] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream documents page by page, holding one page in memory at a time."""
+        return iter_documents(self, collection, spec, page_size, start_after)
@@ -6,16 +6,27 @@ simulating the behavior of the Firebase client without requiring
 a real database connection.
 """
 
+import asyncio
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
 from unittest.mock import Mock
 
 from loguru import logger
 
+from kickai.database.query_spec import (
+    QuerySpec,
+    apply_query_spec,
+    evaluate_filter,
+    fetch_page,
+    iter_documents,
+    order_key,
+)
 from kickai.features.match_management.domain.entities.match import Match
 from kickai.features.player_registration.domain.entities.player import Player
+from kickai.features.shared.domain.pagination import DEFAULT_PAGE_SIZE, Page
 from kickai.features.team_administration.domain.entities.team import Team
 from kickai.features.team_administration.domain.entities.team_member import TeamMember
+from kickai.utils.phone_validation import to_e164
 
 
 class MockDataStore:
@@ -29,6 +40,10 @@ class MockDataStore:
         self.fixtures: Dict[str, Dict[str, Any]] = {}
         self.command_logs: Dict[str, Dict[str, Any]] = {}
         self.team_bots: Dict[str, Dict[str, Any]] = {}
+        # Team-scoped and ad-hoc collections (e.g. kickai_KTI_players) created on demand
+        self.collections: Dict[str, Dict[str, Any]] = {}
+        # Serialises transact() calls the way Firestore serialises contending transactions
+        self._transaction_lock = asyncio.Lock()
         self.mock = Mock()
 
     # Collection listing
@@ -42,6 +57,7 @@ class MockDataStore:
             "team_bots",
             "fixtures",
             "command_logs",
+            *self.collections.keys(),
         ]
 
     # Player operations
@@ -81,8 +97,11 @@ class MockDataStore:
 
     async def get_player_by_phone(self, phone: str, team_id: str) -> Optional[Player]:
         """Get player by phone number and team."""
+        phone_e164 = to_e164(phone)
+        if not phone_e164:
+            return None
         for player in self.players.values():
-            if player.phone_number == phone and player.team_id == team_id:
+            if player.phone_e164 == phone_e164 and player.team_id == team_id:
                 return player
         return None
 
@@ -235,130 +254,200 @@ class MockDataStore:
 
     # Generic document operations
     async def create_document(
-        self, collection: str, data: Dict[str, Any], doc_id: Optional[str] = None
+        self,
+        collection: str,
+        data: Dict[str, Any],
+        document_id: Optional[str] = None,
+        doc_id: Optional[str] = None,
     ) -> str:
         """Create a generic document."""
+        doc_id = document_id or doc_id
         if doc_id is None:
             doc_id = f"{collection}_{len(self._get_collection(collection)) + 1}"
         self._get_collection(collection)[doc_id] = data
-        logger.info(f"✅ Created document with ID: {doc_id}")
+        logger.debug(f"✅ Created document with ID: {doc_id}")
         return doc_id
 
-    async def get_document(self, collection: str, doc_id: str) -> Optional[Dict[str, Any]]:
-        """Get a generic document."""
-        return self._get_collection(collection).get(doc_id)
-
-    async def update_document(self, collection: str, doc_id: str, data: Dict[str, Any]) -> bool:
-        """Update a generic document."""
-        if doc_id in self._get_collection(collection):
-            self._get_collection(collection)[doc_id] = data
-            return True
-        return False
+    async def get_document(
+        self, collection: str, document_id: Optional[str] = None, doc_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get a generic document (a copy of its stored fields)."""
+        doc_id = document_id or doc_id
+        doc_data = self._get_collection(collection).get(doc_id)
+        if doc_data is None:
+            return None
+        doc_dict = self._to_dict(doc_data)
+        return dict(doc_dict) if doc_dict is not None else None
+
+    async def update_document(
+        self,
+        collection: str,
+        document_id: Optional[str] = None,
+        data: Optional[Dict[str, Any]] = None,
+        doc_id: Optional[str] = None,
+    ) -> bool:
+        """Update a generic document, merging fields like Firestore's update()."""
+        doc_id = document_id or doc_id
+        collection_data = self._get_collection(collection)
+        if doc_id not in collection_data:
+            return False
+        existing = collection_data[doc_id]
+        if isinstance(existing, dict):
+            collection_data[doc_id] = {**existing, **(data or {})}
+        else:
+            collection_data[doc_id] = data or {}
+        return True
 
-    async def delete_document(self, collection: str, doc_id: str) -> bool:
+    async def delete_document(
+        self, collection: str, document_id: Optional[str] = None, doc_id: Optional[str] = None
+    ) -> bool:
         """Delete a generic document."""
+        doc_id = document_id or doc_id
         if doc_id in self._get_collection(collection):
             del self._get_collection(collection)[doc_id]
             return True
         return False
 
     async def query_documents(
-        self, collection: str, filters: Optional[List[Dict[str, Any]]] = None, limit: Optional[int] = None
+        self,
+        collection: str,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        """Query documents with filters."""
+        """
+        Query documents with filters.
+
+        Accepts both the Firestore-style filter format used by the repositories
+        (``{"field": ..., "operator": ..., "value": ...}``) and the legacy
+        ``{field: value}`` equality format.
+        """
         collection_data = self._get_collection(collection)
-        logger.info(
-            f"🔍 [MOCK] query_documents called for collection '{collection}' with {len(collection_data)} documents"
+        logger.debug(
+            f"🔍 [MOCK] query_documents '{collection}' ({len(collection_data)} docs), "
+            f"filters={filters}, order_by={order_by}, limit={limit}"
         )
-        logger.info(f"🔍 [MOCK] Collection data keys: {list(collection_data.keys())}")
-        logger.info(f"🔍 [MOCK] Filters: {filters}, Limit: {limit}")
 
         results = []
-
-        # If no filters provided, return all documents
-        if not filters:
-            for doc_id, doc_data in collection_data.items():
-                logger.info(f"🔍 [MOCK] Processing document {doc_id}: {type(doc_data)}")
-                # Handle both dict and object types
-                if hasattr(doc_data, "to_dict"):
-                    # Convert object to dict using to_dict method
-                    doc_dict = doc_data.to_dict()
-                    doc_dict["id"] = doc_id
-                    results.append(doc_dict)
-                elif isinstance(doc_data, dict):
-                    # Already a dict, just add id
-                    results.append({**doc_data, "id": doc_id})
-                else:
-                    # Try to convert to dict using vars() or __dict__
-                    try:
-                        if hasattr(doc_data, "__dict__"):
-                            doc_dict = vars(doc_data)
-                        else:
-                            doc_dict = doc_data.__dict__
-                        doc_dict["id"] = doc_id
-                        results.append(doc_dict)
-                    except Exception as e:
-                        logger.error(f"🔍 [MOCK] Failed to convert document {doc_id} to dict: {e}")
-                        continue
-        else:
-            # Apply filters
-            for doc_id, doc_data in collection_data.items():
-                # Handle both dict and object types for filtering
-                if hasattr(doc_data, "to_dict"):
-                    doc_dict = doc_data.to_dict()
-                elif isinstance(doc_data, dict):
-                    doc_dict = doc_data
-                else:
-                    try:
-                        if hasattr(doc_data, "__dict__"):
-                            doc_dict = vars(doc_data)
-                        else:
-                            doc_dict = doc_data.__dict__
-                    except Exception as e:
-                        logger.error(
-                            f"🔍 [MOCK] Failed to convert document {doc_id} to dict for filtering: {e}"
-                        )
-                        continue
-
-                # Apply filters
-                matches = True
-                for filter_dict in filters:
-                    for field, value in filter_dict.items():
-                        if field not in doc_dict or doc_dict[field] != value:
-                            matches = False
-                            break
-                    if not matches:
-                        break
-
-                if matches:
-                    # Handle both dict and object types for results
-                    if hasattr(doc_data, "to_dict"):
-                        doc_dict = doc_data.to_dict()
-                        doc_dict["id"] = doc_id
-                        results.append(doc_dict)
-                    elif isinstance(doc_data, dict):
-                        results.append({**doc_data, "id": doc_id})
-                    else:
-                        try:
-                            if hasattr(doc_data, "__dict__"):
-                                doc_dict = vars(doc_data)
-                            else:
-                                doc_dict = doc_data.__dict__
-                            doc_dict["id"] = doc_id
-                            results.append(doc_dict)
-                        except Exception as e:
-                            logger.error(
-                                f"🔍 [MOCK] Failed to convert document {doc_id} to dict for results: {e}"
-                            )
-                            continue
+        for doc_id, doc_data in collection_data.items():
+            doc_dict = self._to_dict(doc_data)
+            if doc_dict is None:
+                continue
+            if filters and not self._matches_filters(doc_dict, filters):
+                continue
+            results.append({**doc_dict, "id": doc_id})
+
+        if order_by:
+            descending = order_by.startswith("-")
+            field = order_by.lstrip("-")
+            results.sort(key=lambda doc: order_key(doc.get(field)), reverse=descending)
 
         # Apply limit if specified
         if limit and len(results) > limit:
             results = results[:limit]
 
-        logger.info(f"🔍 [MOCK] Returning {len(results)} documents")
+        logger.debug(f"🔍 [MOCK] Returning {len(results)} documents")
         return results
 
+    async def run_query(self, collection: str, spec: QuerySpec) -> List[Dict[str, Any]]:
+        """Evaluate a QuerySpec in memory with the same semantics as Firestore."""
+        collection_data = self._get_collection(collection)
+        documents = []
+        for doc_id, doc_data in collection_data.items():
+            doc_dict = self._to_dict(doc_data)
+            if doc_dict is not None:
+                documents.append({**doc_dict, "id": doc_id})
+        results = apply_query_spec(documents, spec)
+        logger.debug(f"🔍 [MOCK] run_query '{collection}' returning {len(results)} documents")
+        return results
+
+    async def execute_batch(self, operations: List[Dict[str, Any]]) -> List[str]:
+        """Apply a batch of create/set/update/delete operations (same format as FirebaseClient)."""
+        results = []
+        for operation in operations:
+            op_type = operation["type"]
+            collection = operation["collection"]
+            document_id = operation.get("document_id")
+            data = operation.get("data", {})
+            if op_type == "create":
+                results.append(await self.create_document(collection, data, document_id))
+            elif op_type == "set":
+                collection_data = self._get_collection(collection)
+                existing = self._to_dict(collection_data.get(document_id)) or {}
+                collection_data[document_id] = {**existing, **data} if operation.get("merge") else dict(data)
+                results.append(document_id)
+            elif op_type == "update":
+                await self.update_document(collection, document_id, data)
+                results.append(document_id)
+            elif op_type == "delete":
+                await self.delete_document(collection, document_id)
+                results.append(document_id)
+            else:
+                raise ValueError(f"Unsupported batch operation type: {op_type}")
+        return results
+
+    async def transact(
+        self,
+        reads: List[Tuple[str, str]],
+        build_operations: Callable[[List[Optional[Dict[str, Any]]]], List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """Read documents and apply the operations built from them atomically (same contract as FirebaseClient)."""
+        async with self._transaction_lock:
+            documents = [
+                await self.get_document(collection, document_id) for collection, document_id in reads
+            ]
+            operations = build_operations(documents)
+            await self.execute_batch(operations)
+            return operations
+
+    async def query_page(
+        self,
+        collection: str,
+        spec: Optional[QuerySpec] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[tuple] = None,
+    ) -> Page[Dict[str, Any]]:
+        """Fetch one page of a query (cursor semantics match FirebaseClient)."""
+        return await fetch_page(self, collection, spec, page_size, cursor)
+
+    def iter_documents(
+        self,
+        collection: str,
+        spec: Optional[QuerySpec] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        start_after: Optional[tuple] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream documents page by page using start_after cursors."""
+        return iter_documents(self, collection, spec, page_size, start_after)
+
+    @staticmethod
+    def _to_dict(doc_data: Any) -> Optional[Dict[str, Any]]:
+        """Convert a stored document (dict or entity) into a plain dictionary."""
+        if isinstance(doc_data, dict):
+            return dict(doc_data)
+        if hasattr(doc_data, "to_dict"):
+            return doc_data.to_dict()
+        try:
+            return dict(vars(doc_data))
+        except TypeError as e:
+            logger.error(f"🔍 [MOCK] Failed to convert document to dict: {e}")
+            return None
+
+    @staticmethod
+    def _matches_filters(doc_dict: Dict[str, Any], filters: List[Dict[str, Any]]) -> bool:
+        """Evaluate a list of filters against a document."""
+        for filter_dict in filters:
+            if "field" in filter_dict and "operator" in filter_dict:
+                if not evaluate_filter(
+                    doc_dict, filter_dict["field"], filter_dict["operator"], filter_dict.get("value")
+                ):
+                    return False
+            else:
+                for field, value in filter_dict.items():
+                    if field not in doc_dict or doc_dict[field] != value:
+                        return False
+        return True
+
     # Health check and utility methods
     async def health_check(self) -> Dict[str, Any]:
         """Perform health check."""
@@ -393,6 +482,7 @@ class MockDataStore:
         self.fixtures.clear()
         self.command_logs.clear()
         self.team_bots.clear()
+        self.collections.clear()
         self.mock.reset_mock()
 
     def reset(self):
@@ -410,4 +500,7 @@ class MockDataStore:
             "command_logs": self.command_logs,
             "team_bots": self.team_bots,
         }
-        return collections.get(collection, {})
+        if collection in collections:
+            return collections[collection]
+        return self.collections.setdefault(collection, {})
+
@@ -0,0 +1,445 @@
+"""
+Query Specification Layer for KICKAI
+
+A small, backend-neutral description of a document query (filters, range
+predicates, ordering, limit and field projection) that repositories build
+once and hand to the data store. ``FirebaseClient`` translates a spec into a
+native Firestore query so predicates run server-side; ``MockDataStore`` and
+any other store evaluate it in memory with ``apply_query_spec``.
+
+Large collections are read page by page with ``start_after`` cursors
+(``fetch_page`` / ``iter_documents``) so listings, cleanup scripts and
+migrations run in constant memory.
+
+Specs registered with ``register_query_index`` are used to generate the
+composite index definitions Firestore needs (see
+``scripts/generate_firestore_indexes.py``).
+"""
+
+import copy
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from kickai.features.shared.domain.pagination import DEFAULT_PAGE_SIZE, Page
+
+EQUALITY_OPERATORS = ("==", "in", "array-contains", "array-contains-any")
+RANGE_OPERATORS = ("<", "<=", ">", ">=", "!=", "not-in")
+SUPPORTED_OPERATORS = EQUALITY_OPERATORS + RANGE_OPERATORS
+
+ASCENDING = "ASCENDING"
+DESCENDING = "DESCENDING"
+
+# Firestore's pseudo-field for the document ID; used as the pagination tie-breaker
+DOCUMENT_ID_FIELD = "__name__"
+
+
+@dataclass(frozen=True)
+class FieldFilter:
+    """A single ``field <operator> value`` predicate. Dotted paths address nested maps."""
+
+    field: str
+    operator: str
+    value: Any
+
+    def __post_init__(self):
+        if self.operator not in SUPPORTED_OPERATORS:
+            raise ValueError(f"Unsupported filter operator: {self.operator}")
+
+    @property
+    def is_range(self) -> bool:
+        return self.operator in RANGE_OPERATORS
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the filter in the ``{"field", "operator", "value"}`` format used by query_documents."""
+        return {"field": self.field, "operator": self.operator, "value": self.value}
+
+
+@dataclass(frozen=True)
+class OrderBy:
+    """Sort key for a query."""
+
+    field: str
+    descending: bool = False
+
+    @property
+    def direction(self) -> str:
+        return DESCENDING if self.descending else ASCENDING
+
+
+@dataclass
+class QuerySpec:
+    """
+    Declarative query over a single collection.
+
+    Build with the chainable helpers::
+
+        spec = (
+            QuerySpec()
+            .where("status", "in", ["scheduled", "availability_open"])
+            .where_range("date", lower=now_iso, include_lower=False)
+            .order("date")
+            .take(10)
+        )
+    """
+
+    filters: List[FieldFilter] = field(default_factory=list)
+    order_by: List[OrderBy] = field(default_factory=list)
+    limit: Optional[int] = None
+    select: Optional[Tuple[str, ...]] = None
+    start_after: Optional[Tuple[Any, ...]] = None
+
+    def where(self, field_path: str, operator: str, value: Any) -> "QuerySpec":
+        self.filters.append(FieldFilter(field_path, operator, value))
+        return self
+
+    def where_range(
+        self,
+        field_path: str,
+        lower: Any = None,
+        upper: Any = None,
+        include_lower: bool = True,
+        include_upper: bool = True,
+    ) -> "QuerySpec":
+        """Add a range predicate on one field; ``None`` leaves that side open."""
+        if lower is not None:
+            self.filters.append(FieldFilter(field_path, ">=" if include_lower else ">", lower))
+        if upper is not None:
+            self.filters.append(FieldFilter(field_path, "<=" if include_upper else "<", upper))
+        return self
+
+    def order(self, field_path: str, descending: bool = False) -> "QuerySpec":
+        self.order_by.append(OrderBy(field_path, descending))
+        return self
+
+    def take(self, limit: Optional[int]) -> "QuerySpec":
+        self.limit = limit
+        return self
+
+    def project(self, *field_paths: str) -> "QuerySpec":
+        """Only return the given fields (plus the document ``id``)."""
+        self.select = tuple(field_paths)
+        return self
+
+    def after(self, cursor: Optional[Tuple[Any, ...]]) -> "QuerySpec":
+        """Resume after a cursor: one value per ``order_by`` key, in order."""
+        self.start_after = tuple(cursor) if cursor is not None else None
+        return self
+
+    @property
+    def range_fields(self) -> List[str]:
+        fields = []
+        for filter_item in self.filters:
+            if filter_item.is_range and filter_item.field not in fields:
+                fields.append(filter_item.field)
+        return fields
+
+    def filter_dicts(self) -> List[Dict[str, Any]]:
+        return [filter_item.to_dict() for filter_item in self.filters]
+
+    def validate(self) -> None:
+        """
+        Reject specs Firestore cannot execute.
+
+        Firestore requires the first ``order_by`` to be the inequality field
+        when one is present; we apply the same rule so specs that pass against
+        the mock store also run in production.
+        """
+        range_fields = self.range_fields
+        if len(range_fields) > 1:
+            raise ValueError(f"Range predicates on multiple fields are not supported: {range_fields}")
+        if range_fields and self.order_by and self.order_by[0].field != range_fields[0]:
+            raise ValueError(
+                f"First order_by must be the range field '{range_fields[0]}', "
+                f"got '{self.order_by[0].field}'"
+            )
+        if self.limit is not None and self.limit <= 0:
+            raise ValueError("limit must be a positive integer")
+        if self.start_after is not None and len(self.start_after) != len(self.order_by):
+            raise ValueError("start_after needs exactly one value per order_by key")
+
+
+_MISSING = object()
+
+
+def get_field_value(document: Dict[str, Any], field_path: str) -> Any:
+    """Resolve a dotted field path; returns ``_MISSING`` when any segment is absent."""
+    if field_path == DOCUMENT_ID_FIELD:
+        return document.get("id", _MISSING)
+    value: Any = document
+    for part in field_path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def evaluate_filter(document: Dict[str, Any], field_path: str, operator: str, value: Any) -> bool:
+    """Evaluate a single Firestore-style comparison against a document."""
+    actual = get_field_value(document, field_path)
+    if actual is _MISSING:
+        return False
+    try:
+        if operator == "==":
+            return actual == value
+        if operator == "!=":
+            return actual != value
+        if operator == "<":
+            return actual is not None and actual < value
+        if operator == "<=":
+            return actual is not None and actual <= value
+        if operator == ">":
+            return actual is not None and actual > value
+        if operator == ">=":
+            return actual is not None and actual >= value
+        if operator == "in":
+            return actual in value
+        if operator == "not-in":
+            return actual not in value
+        if operator == "array-contains":
+            return isinstance(actual, (list, tuple, set)) and value in actual
+        if operator == "array-contains-any":
+            return isinstance(actual, (list, tuple, set)) and any(v in actual for v in value)
+    except TypeError:
+        # Firestore never matches values of incomparable types
+        return False
+    raise ValueError(f"Unsupported filter operator: {operator}")
+
+
+def project_document(document: Dict[str, Any], field_paths: Iterable[str]) -> Dict[str, Any]:
+    """Copy only ``field_paths`` (and ``id``) from a document, keeping nested structure."""
+    projected: Dict[str, Any] = {}
+    if "id" in document:
+        projected["id"] = document["id"]
+    for field_path in field_paths:
+        value = get_field_value(document, field_path)
+        if value is _MISSING:
+            continue
+        target = projected
+        parts = field_path.split(".")
+        for part in parts[:-1]:
+            target = target.setdefault(part, {})
+        target[parts[-1]] = value
+    return projected
+
+
+def apply_query_spec(documents: Iterable[Dict[str, Any]], spec: QuerySpec) -> List[Dict[str, Any]]:
+    """
+    Evaluate a spec in memory with Firestore semantics.
+
+    Documents missing an ``order_by`` field are excluded, as Firestore does.
+    """
+    spec.validate()
+    results = [
+        doc
+        for doc in documents
+        if all(evaluate_filter(doc, f.field, f.operator, f.value) for f in spec.filters)
+        and all(get_field_value(doc, o.field) is not _MISSING for o in spec.order_by)
+    ]
+
+    # Stable sorts applied from the last key to the first give a multi-key ordering
+    for order in reversed(spec.order_by):
+        results.sort(
+            key=lambda doc, path=order.field: order_key(get_field_value(doc, path)),
+            reverse=order.descending,
+        )
+
+    if spec.start_after is not None:
+        results = [doc for doc in results if _is_after_cursor(doc, spec.order_by, spec.start_after)]
+    if spec.limit is not None:
+        results = results[: spec.limit]
+    if spec.select is not None:
+        results = [project_document(doc, spec.select) for doc in results]
+    return results
+
+
+def order_key(value: Any) -> Tuple[int, Any]:
+    """Sort key matching Firestore's ordering: null first, then by type, then by value."""
+    if value is None:
+        return (0, 0)
+    if isinstance(value, bool):
+        return (1, value)
+    if isinstance(value, (int, float)):
+        return (2, value)
+    if isinstance(value, datetime):
+        return (3, value)
+    if isinstance(value, str):
+        return (4, value)
+    # Arrays, maps and other values never raise; they sort after scalars by their text
+    return (5, str(value))
+
+
+def _is_after_cursor(
+    document: Dict[str, Any], order_by: List[OrderBy], cursor: Tuple[Any, ...]
+) -> bool:
+    """True when ``document`` sorts strictly after ``cursor`` under ``order_by``."""
+    for order, cursor_value in zip(order_by, cursor):
+        value = order_key(get_field_value(document, order.field))
+        bound = order_key(cursor_value)
+        if value == bound:
+            continue
+        try:
+            greater = value > bound
+        except TypeError:
+            return False
+        return greater != order.descending
+    return False
+
+
+# Cursor pagination
+
+
+def paginate(
+    spec: Optional[QuerySpec], page_size: int, cursor: Optional[Tuple[Any, ...]] = None
+) -> QuerySpec:
+    """
+    Copy ``spec`` as one page of a cursor walk.
+
+    The document ID is appended as a final sort key so cursors are unique
+    even when the ordering fields tie.
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be a positive integer")
+    paged = copy.deepcopy(spec) if spec is not None else QuerySpec()
+    if not any(order.field == DOCUMENT_ID_FIELD for order in paged.order_by):
+        paged.order(DOCUMENT_ID_FIELD)
+    if paged.select is not None:
+        # Cursor fields must come back with each document
+        missing = [o.field for o in paged.order_by if o.field != DOCUMENT_ID_FIELD]
+        paged.select = tuple(dict.fromkeys(paged.select + tuple(missing)))
+    return paged.take(page_size).after(cursor)
+
+
+def cursor_for(document: Dict[str, Any], spec: QuerySpec) -> Tuple[Any, ...]:
+    """Build the cursor that resumes after ``document``."""
+    values = []
+    for order in spec.order_by:
+        value = get_field_value(document, order.field)
+        values.append(None if value is _MISSING else value)
+    return tuple(values)
+
+
+async def fetch_page(
+    store: Any,
+    collection: str,
+    spec: Optional[QuerySpec] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[Tuple[Any, ...]] = None,
+) -> Page[Dict[str, Any]]:
+    """Fetch one page of documents from any store implementing ``run_query``."""
+    paged = paginate(spec, page_size, cursor)
+    documents = await store.run_query(collection, paged)
+    next_cursor = cursor_for(documents[-1], paged) if len(documents) == page_size else None
+    return Page(items=documents, next_cursor=next_cursor)
+
+
+async def iter_documents(
+    store: Any,
+    collection: str,
+    spec: Optional[QuerySpec] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    start_after: Optional[Tuple[Any, ...]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream every matching document, holding at most one page in memory.
+
+    ``spec.limit`` caps the total number of documents yielded. ``start_after``
+    resumes an earlier walk from a cursor (see ``cursor_for``).
+    """
+    remaining = spec.limit if spec is not None else None
+    cursor = start_after
+    while True:
+        size = min(page_size, remaining) if remaining is not None else page_size
+        page = await fetch_page(store, collection, spec, size, cursor)
+        for document in page.items:
+            yield document
+        if remaining is not None:
+            remaining -= len(page.items)
+            if remaining <= 0:
+                return
+        if not page.has_more:
+            return
+        cursor = page.next_cursor
+
+
+# Composite index generation
+
+_INDEX_REGISTRY: List[Tuple[str, QuerySpec]] = []
+
+
+def register_query_index(collection_template: str, spec: QuerySpec) -> QuerySpec:
+    """
+    Record a query shape that runs in production.
+
+    ``collection_template`` may contain ``{team_id}`` for team-scoped
+    collections. Only the fields, operators and ordering of ``spec`` matter;
+    values can be placeholders.
+    """
+    spec.validate()
+    _INDEX_REGISTRY.append((collection_template, spec))
+    return spec
+
+
+def get_registered_query_indexes() -> List[Tuple[str, QuerySpec]]:
+    return list(_INDEX_REGISTRY)
+
+
+def composite_index_fields(spec: QuerySpec) -> Optional[List[Tuple[str, str]]]:
+    """
+    Return the ``(field, direction)`` list of the composite index a spec needs.
+
+    Pure equality queries are served by Firestore's automatic single-field
+    indexes (merged as needed), so ``None`` is returned for them and for
+    queries that touch a single field only.
+    """
+    equality_fields: List[str] = []
+    for filter_item in spec.filters:
+        if not filter_item.is_range and filter_item.field not in equality_fields:
+            equality_fields.append(filter_item.field)
+
+    ordered: List[Tuple[str, str]] = [(name, ASCENDING) for name in equality_fields]
+    seen = set(equality_fields)
+
+    # The range field (if any) is the first sort key; explicit order_by follows
+    sort_keys = list(spec.order_by)
+    for range_field in spec.range_fields:
+        if not any(order.field == range_field for order in sort_keys):
+            sort_keys.insert(0, OrderBy(range_field))
+    sort_keys = [order for order in sort_keys if order.field != DOCUMENT_ID_FIELD]
+    for order in sort_keys:
+        if order.field not in seen:
+            ordered.append((order.field, order.direction))
+            seen.add(order.field)
+
+    needs_composite = len(ordered) > 1 and bool(sort_keys)
+    return ordered if needs_composite else None
+
+
+def generate_index_config(team_ids: Iterable[str]) -> Dict[str, Any]:
+    """Build a ``firestore.indexes.json`` document for every registered query shape."""
+    team_ids = list(team_ids)
+    indexes: List[Dict[str, Any]] = []
+    seen = set()
+    for collection_template, spec in _INDEX_REGISTRY:
+        fields = composite_index_fields(spec)
+        if not fields:
+            continue
+        if "{team_id}" in collection_template:
+            collections = [collection_template.format(team_id=team_id) for team_id in team_ids]
+        else:
+            collections = [collection_template]
+        for collection in collections:
+            key = (collection, tuple(fields))
+            if key in seen:
+                continue
+            seen.add(key)
+            indexes.append(
+                {
+                    "collectionGroup": collection,
+                    "queryScope": "COLLECTION",
+                    "fields": [
+                        {"fieldPath": name, "order": direction} for name, direction in fields
+                    ],
+                }
+            )
+    return {"indexes": indexes, "fieldOverrides": []}
@@ -0,0 +1,332 @@
+"""
+Live In-Memory Team Roster Replica
+
+Most bot traffic reads the same small per-team dataset: players, team members
+and matches. ``ReplicatedDataStore`` wraps a data store and, for opted-in
+teams, loads those collections once and keeps them current:
+
+- Firestore: ``on_snapshot`` listeners apply every change as it happens
+- other stores (MockDataStore): the collections are re-read on a poll interval
+
+Reads on a replicated collection are answered from memory while the replica
+is within its staleness bound, and fall through to the store otherwise.
+Writes always go to the store first and are then applied to the replica, so
+a caller reads its own writes immediately. Every other attribute is delegated
+to the wrapped store.
+
+Usage:
+    store = ReplicatedDataStore(get_firebase_client(), max_staleness_seconds=30)
+    await store.enable_team("KTI")
+    players = await store.run_query(get_team_players_collection("KTI"), spec)
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from kickai.core.firestore_constants import (
+    get_team_matches_collection,
+    get_team_members_collection,
+    get_team_players_collection,
+)
+from kickai.database.interfaces import DataStoreInterface
+from kickai.database.query_spec import QuerySpec, apply_query_spec
+
+DEFAULT_MAX_STALENESS_SECONDS = 30.0
+DEFAULT_POLL_INTERVAL_SECONDS = 10.0
+
+SYNC_MODE_LISTENER = "listener"
+SYNC_MODE_POLLING = "polling"
+
+
+def replicated_collections(team_id: str) -> List[str]:
+    """Collections held in a team's replica."""
+    return [
+        get_team_players_collection(team_id),
+        get_team_members_collection(team_id),
+        get_team_matches_collection(team_id),
+    ]
+
+
+class TeamReplica:
+    """In-memory copy of one team's replicated collections."""
+
+    def __init__(self, team_id: str, collections: List[str], max_staleness_seconds: float):
+        self.team_id = team_id
+        self.max_staleness_seconds = max_staleness_seconds
+        self.sync_mode: Optional[str] = None
+        self.synced_at = 0.0
+        self._documents: Dict[str, Dict[str, Dict[str, Any]]] = {name: {} for name in collections}
+        self._loaded: set[str] = set()
+        self._watches: List[Any] = []
+        self._poll_task: Optional[asyncio.Task] = None
+        # Snapshot callbacks run on Firestore's listener thread
+        self._lock = threading.RLock()
+
+    def is_fresh(self, collection: str) -> bool:
+        """Whether reads on a collection may be served from memory."""
+        if collection not in self._loaded:
+            return False
+        if self.sync_mode == SYNC_MODE_LISTENER:
+            return all(getattr(watch, "is_active", True) for watch in self._watches)
+        return time.monotonic() - self.synced_at <= self.max_staleness_seconds
+
+    # Replica contents
+    def replace(self, collection: str, documents: Dict[str, Dict[str, Any]]) -> None:
+        with self._lock:
+            self._documents[collection] = documents
+            self._loaded.add(collection)
+            self.synced_at = time.monotonic()
+
+    def put(self, collection: str, document_id: str, data: Dict[str, Any], merge: bool = False) -> None:
+        with self._lock:
+            documents = self._documents[collection]
+            data = {key: value for key, value in data.items() if key != "id"}
+            documents[document_id] = {**documents.get(document_id, {}), **data} if merge else data
+
+    def remove(self, collection: str, document_id: str) -> None:
+        with self._lock:
+            self._documents[collection].pop(document_id, None)
+
+    def get(self, collection: str, document_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            data = self._documents[collection].get(document_id)
+            return {**data, "id": document_id} if data is not None else None
+
+    def contains(self, collection: str, document_id: str) -> bool:
+        with self._lock:
+            return document_id in self._documents[collection]
+
+    def documents(self, collection: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [{**data, "id": doc_id} for doc_id, data in self._documents[collection].items()]
+
+    # Snapshot listener
+    def on_snapshot(self, collection: str):
+        """Build an ``on_snapshot`` callback applying changes to one collection."""
+
+        def callback(_snapshot: Any, changes: List[Any], _read_time: Any) -> None:
+            with self._lock:
+                for change in changes:
+                    document = change.document
+                    if change.type.name == "REMOVED":
+                        self.remove(collection, document.id)
+                    else:
+                        self.put(collection, document.id, document.to_dict() or {})
+                self._loaded.add(collection)
+                self.synced_at = time.monotonic()
+
+        return callback
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "sync_mode": self.sync_mode,
+                "age_seconds": round(time.monotonic() - self.synced_at, 3) if self.synced_at else None,
+                "documents": {name: len(docs) for name, docs in self._documents.items()},
+                "fresh": {name: self.is_fresh(name) for name in self._documents},
+            }
+
+
+class ReplicatedDataStore(DataStoreInterface):
+    """Data store wrapper serving opted-in teams' roster reads from live replicas."""
+
+    def __init__(
+        self,
+        store: Any,
+        max_staleness_seconds: float = DEFAULT_MAX_STALENESS_SECONDS,
+        poll_interval_seconds: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    ):
+        self.store = store
+        self.max_staleness_seconds = max_staleness_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self._replicas: Dict[str, TeamReplica] = {}
+        self._collection_replicas: Dict[str, TeamReplica] = {}
+        self.replica_reads = 0
+        self.store_reads = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Entity helpers, transactions and health checks go straight to the store
+        if name == "store":
+            raise AttributeError(name)
+        return getattr(self.store, name)
+
+    # Replica lifecycle
+    async def enable_team(self, team_id: str) -> TeamReplica:
+        """Load a team's replica and start keeping it current."""
+        if team_id in self._replicas:
+            return self._replicas[team_id]
+
+        collections = replicated_collections(team_id)
+        replica = TeamReplica(team_id, collections, self.max_staleness_seconds)
+        for collection in collections:
+            await self._load(replica, collection)
+
+        if self._supports_listeners():
+            replica.sync_mode = SYNC_MODE_LISTENER
+            for collection in collections:
+                reference = self.store._get_collection(collection)
+                replica._watches.append(reference.on_snapshot(replica.on_snapshot(collection)))
+        else:
+            replica.sync_mode = SYNC_MODE_POLLING
+            replica._poll_task = asyncio.create_task(self._poll(replica))
+
+        self._replicas[team_id] = replica
+        for collection in collections:
+            self._collection_replicas[collection] = replica
+        logger.info(f"📡 Roster replica for team {team_id} enabled ({replica.sync_mode}): {replica.stats()['documents']}")
+        return replica
+
+    async def disable_team(self, team_id: str) -> None:
+        """Stop syncing a team and serve its reads from the store again."""
+        replica = self._replicas.pop(team_id, None)
+        if replica is None:
+            return
+        for collection in list(self._collection_replicas):
+            if self._collection_replicas[collection] is replica:
+                del self._collection_replicas[collection]
+        for watch in replica._watches:
+            watch.unsubscribe()
+        if replica._poll_task is not None:
+            replica._poll_task.cancel()
+        logger.info(f"📡 Roster replica for team {team_id} disabled")
+
+    async def close(self) -> None:
+        for team_id in list(self._replicas):
+            await self.disable_team(team_id)
+
+    def _supports_listeners(self) -> bool:
+        get_collection = getattr(self.store, "_get_collection", None)
+        if get_collection is None or not hasattr(self.store, "client"):
+            return False
+        try:
+            return hasattr(get_collection("__replica_probe__"), "on_snapshot")
+        except Exception:
+            return False
+
+    async def _load(self, replica: TeamReplica, collection: str) -> None:
+        documents = {}
+        async for document in self.store.iter_documents(collection):
+            doc_id = document.pop("id")
+            documents[doc_id] = document
+        replica.replace(collection, documents)
+
+    async def _poll(self, replica: TeamReplica) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval_seconds)
+            for collection in replicated_collections(replica.team_id):
+                try:
+                    await self._load(replica, collection)
+                except Exception as e:
+                    # Keep serving the last copy until it exceeds the staleness bound
+                    logger.warning(f"⚠️ Roster replica poll failed for {collection}: {e}")
+
+    def _fresh_replica(self, collection: str) -> Optional[TeamReplica]:
+        replica = self._collection_replicas.get(collection)
+        if replica is None:
+            return None
+        if replica.is_fresh(collection):
+            self.replica_reads += 1
+            return replica
+        self.store_reads += 1
+        return None
+
+    def get_replica_stats(self) -> Dict[str, Any]:
+        return {
+            "replica_reads": self.replica_reads,
+            "store_reads": self.store_reads,
+            "teams": {team_id: replica.stats() for team_id, replica in self._replicas.items()},
+        }
+
+    # Reads
+    async def get_document(self, collection: str, document_id: str) -> Optional[Dict[str, Any]]:
+        replica = self._fresh_replica(collection)
+        if replica is not None:
+            return replica.get(collection, document_id)
+        return await self.store.get_document(collection, document_id)
+
+    async def query_documents(
+        self,
+        collection: str,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        legacy_filters = any("field" not in filter_item for filter_item in filters or [])
+        replica = None if legacy_filters else self._fresh_replica(collection)
+        if replica is None:
+            return await self.store.query_documents(collection, filters, order_by, limit)
+
+        spec = QuerySpec().take(limit)
+        for filter_item in filters or []:
+            spec.where(filter_item["field"], filter_item["operator"], filter_item["value"])
+        if order_by:
+            spec.order(order_by.lstrip("-"), descending=order_by.startswith("-"))
+        return apply_query_spec(replica.documents(collection), spec)
+
+    async def run_query(self, collection: str, spec: QuerySpec) -> List[Dict[str, Any]]:
+        replica = self._fresh_replica(collection)
+        if replica is None:
+            return await self.store.run_query(collection, spec)
+        spec.validate()
+        return apply_query_spec(replica.documents(collection), spec)
+
+    # Writes (store first, then the replica)
+    async def create_document(
+        self, collection: str, data: Dict[str, Any], document_id: Optional[str] = None
+    ) -> str:
+        document_id = await self.store.create_document(collection, data, document_id)
+        replica = self._collection_replicas.get(collection)
+        if replica is not None and document_id:
+            replica.put(collection, document_id, data)
+        return document_id
+
+    async def update_document(self, collection: str, document_id: str, data: Dict[str, Any]) -> bool:
+        updated = await self.store.update_document(collection, document_id, data)
+        replica = self._collection_replicas.get(collection)
+        if updated and replica is not None:
+            if replica.contains(collection, document_id):
+                replica.put(collection, document_id, data, merge=True)
+            else:
+                document = await self.store.get_document(collection, document_id)
+                if document is not None:
+                    replica.put(collection, document_id, document)
+        return updated
+
+    async def delete_document(self, collection: str, document_id: str) -> bool:
+        deleted = await self.store.delete_document(collection, document_id)
+        replica = self._collection_replicas.get(collection)
+        if deleted and replica is not None:
+            replica.remove(collection, document_id)
+        return deleted
+
+    async def execute_batch(self, operations: List[Dict[str, Any]]) -> List[Any]:
+        results = await self.store.execute_batch(operations)
+        self._apply_operations(operations)
+        return results
+
+    async def transact(
+        self,
+        reads: List[Tuple[str, str]],
+        build_operations: Callable[[List[Optional[Dict[str, Any]]]], List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        # Transactions always read the store: a replica read could be stale
+        operations = await self.store.transact(reads, build_operations)
+        self._apply_operations(operations)
+        return operations
+
+    def _apply_operations(self, operations: List[Dict[str, Any]]) -> None:
+        for operation in operations:
+            collection = operation["collection"]
+            replica = self._collection_replicas.get(collection)
+            document_id = operation.get("document_id")
+            if replica is None or not document_id:
+                continue
+            if operation["type"] == "delete":
+                replica.remove(collection, document_id)
+            else:
+                merge = operation["type"] == "update" or operation.get("merge", False)
+                replica.put(collection, document_id, operation.get("data", {}), merge=merge)
@@ -15,6 +15,11 @@ class AttendanceRepositoryInterface(ABC):
         """Create a new attendance record."""
         pass
 
+    @abstractmethod
+    async def create_many(self, attendances: list[Attendance]) -> list[Attendance]:
+        """Create several attendance records in batched writes."""
+        pass
+
     @abstractmethod
     async def get_by_id(self, attendance_id: str) -> Optional[Attendance]:
         """Get attendance record by ID."""
@@ -178,36 +178,40 @@ class AttendanceService:
                 logger.error(f"Match {match_id} not found")
                 return []
 
-            # Create attendance records for all active players
-            attendance_records = []
-            for player in players:
-                try:
-                    # Check if attendance record already exists
-                    existing = await self.get_player_attendance_for_match(
-                        player.player_id, match_id, team_id
-                    )
+            # One read for the whole match; missing players are found in memory
+            existing = {
+                attendance.player_id: attendance
+                for attendance in await self.attendance_repository.get_by_match(match_id, team_id)
+            }
+            missing = [
+                Attendance.create(
+                    player_id=player.player_id,
+                    match_id=match_id,
+                    team_id=team_id,
+                    status=AttendanceStatus.NOT_RESPONDED,
+                    response_method=AttendanceResponseMethod.AUTO_REMINDER,
+                    player_name=player.name,
+                    match_opponent=match.opponent,
+                    match_date=match.date,
+                )
+                for player in players
+                if player.player_id not in existing
+            ]
+            created = {}
+            if missing:
+                created = {
+                    attendance.player_id: attendance
+                    for attendance in await self.attendance_repository.create_many(missing)
+                }
 
-                    if not existing:
-                        attendance = Attendance.create(
-                            player_id=player.player_id,
-                            match_id=match_id,
-                            team_id=team_id,
-                            status=AttendanceStatus.NOT_RESPONDED,
-                            response_method=AttendanceResponseMethod.AUTO_REMINDER,
-                            player_name=player.name,
-                            match_opponent=match.opponent,
-                            match_date=match.date,
-                        )
-                        created_attendance = await self.attendance_repository.create(attendance)
-                        attendance_records.append(created_attendance)
-                    else:
-                        attendance_records.append(existing)
-
-                except (RuntimeError, ValueError, KeyError, AttributeError) as e:
-                    logger.error(f"Failed to create attendance for player {player.player_id}: {e}")
+            attendance_records = [
+                existing.get(player.player_id) or created[player.player_id]
+                for player in players
+            ]
 
             logger.info(
-                f"Initialized attendance for {len(attendance_records)} players for match {match_id}"
+                f"Initialized attendance for {len(attendance_records)} players for match {match_id} "
+                f"({len(missing)} new)"
             )
             return attendance_records
 
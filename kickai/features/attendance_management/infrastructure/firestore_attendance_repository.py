@@ -2,6 +2,7 @@ from typing import Optional
 import logging
 from datetime import datetime
 
+from kickai.database.bulk_writer import FIRESTORE_BATCH_LIMIT
 from kickai.database.firebase_client import get_firebase_client
 from kickai.features.attendance_management.domain.entities.attendance import (
     Attendance,
@@ -39,6 +40,27 @@ class FirestoreAttendanceRepository(AttendanceRepositoryInterface):
             logger.error(f"Failed to create attendance record: {e}")
             raise
 
+    async def create_many(self, attendances: list[Attendance]) -> list[Attendance]:
+        """Create several attendance records, one batch commit per FIRESTORE_BATCH_LIMIT records."""
+        try:
+            for start in range(0, len(attendances), FIRESTORE_BATCH_LIMIT):
+                chunk = attendances[start:start + FIRESTORE_BATCH_LIMIT]
+                await self.firebase_client.execute_batch([
+                    {
+                        "type": "create",
+                        "collection": self._get_collection_name(attendance.team_id),
+                        "document_id": attendance.id,
+                        "data": attendance.to_dict(),
+                    }
+                    for attendance in chunk
+                ])
+            logger.info(f"Created {len(attendances)} attendance records")
+            return attendances
+
+        except Exception as e:
+            logger.error(f"Failed to create attendance records: {e}")
+            raise
+
     async def get_by_id(self, attendance_id: str) -> Optional[Attendance]:
         """Get attendance record by ID."""
         try:
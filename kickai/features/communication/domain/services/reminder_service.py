@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import Any, Optional
 
 from kickai.core.config import Settings
+from kickai.core.crew_activity_store import ACTIVITY_REMINDER, record_team_activity
 from kickai.features.communication.domain.interfaces.reminder_service_interface import (
     IReminderService,
 )
@@ -52,14 +53,21 @@ class ReminderService(IReminderService):
     async def check_and_send_reminders(self) -> list[ReminderMessage]:
         """Check for players who need reminders and send them."""
         try:
-            players = await self.player_service.get_players_by_team(team_id=self.team_id)
+            # The pending/registered-before predicates run in the data store, so
+            # only players that actually need a reminder are loaded
+            players = await self.player_service.get_players_needing_reminders(
+                self.team_id,
+                self.reminder_config["max_reminders"],
+                self.reminder_config["first_reminder"],
+            )
+            # Reminder runs recur, so the crew pre-warmer learns to expect replies around them
+            record_team_activity(self.team_id, ACTIVITY_REMINDER)
             reminders_sent = []
 
             for player in players:
-                if player.needs_reminder():
-                    reminder_message = await self.send_automated_reminder(player)
-                    if reminder_message:
-                        reminders_sent.append(reminder_message)
+                reminder_message = await self.send_automated_reminder(player)
+                if reminder_message:
+                    reminders_sent.append(reminder_message)
 
             return reminders_sent
 
@@ -103,13 +111,8 @@ class ReminderService(IReminderService):
     async def send_manual_reminder(self, player_id: str, admin_id: str) -> tuple[bool, str]:
         """Send a manual reminder to a player (admin triggered)."""
         try:
-            # Find player by player_id
-            players = await self.player_service.get_players_by_team(team_id=self.team_id)
-            player = None
-            for p in players:
-                if p.player_id.upper() == player_id.upper():
-                    player = p
-                    break
+            # Player IDs are the document IDs, so this is a single point read
+            player = await self.player_service.get_player_by_id(player_id.upper(), self.team_id)
 
             if not player:
                 return False, f"❌ Player {player_id} not found"
@@ -302,8 +305,9 @@ Please complete your onboarding as soon as possible!"""
     async def get_players_needing_reminders(self) -> list[Player]:
         """Get list of players who need reminders."""
         try:
-            players = await self.player_service.get_players_by_team(team_id=self.team_id)
-            return [player for player in players if player.needs_reminder()]
+            return await self.player_service.get_players_needing_reminders(
+                self.team_id, self.reminder_config["max_reminders"]
+            )
         except Exception as e:
             logging.error(f"Error getting players needing reminders: {e}")
             return []
@@ -1,4 +1,4 @@
-from .attendance import AttendanceStatus, MatchAttendance
+from .attendance import AttendanceRecordResult, AttendanceStatus, MatchAttendance
 from .availability import Availability, AvailabilityStatus
 from .match import Match, MatchResult, MatchStatus
 
@@ -10,4 +10,5 @@ __all__ = [
     "AvailabilityStatus",
     "MatchAttendance",
     "AttendanceStatus",
+    "AttendanceRecordResult",
 ]
@@ -1,5 +1,5 @@
 from typing import Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, time
 from enum import Enum
 
@@ -76,6 +76,10 @@ class MatchAttendance:
     @classmethod
     def from_dict(cls, data: dict) -> "MatchAttendance":
         """Create attendance from dictionary."""
+        # Stores add the document "id" alongside the entity fields
+        field_names = {f.name for f in fields(cls)}
+        data = {key: value for key, value in data.items() if key in field_names}
+
         # Convert string dates back to datetime objects
         if "recorded_at" in data and isinstance(data["recorded_at"], str):
             data["recorded_at"] = datetime.fromisoformat(data["recorded_at"])
@@ -120,3 +124,22 @@ class MatchAttendance:
         if self.arrival_time:
             return self.arrival_time.strftime("%I:%M %p")
         return "Not recorded"
+
+
+@dataclass
+class AttendanceRecordResult:
+    """Outcome of one row of a bulk attendance recording."""
+
+    player_id: str
+    success: bool
+    attendance: Optional[MatchAttendance] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Convert result to dictionary."""
+        return {
+            "player_id": self.player_id,
+            "success": self.success,
+            "status": self.attendance.status.value if self.attendance else None,
+            "error": self.error,
+        }
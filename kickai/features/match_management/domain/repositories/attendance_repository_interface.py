@@ -45,6 +45,11 @@ class AttendanceRepositoryInterface(ABC):
         """Update an attendance record."""
         pass
 
+    @abstractmethod
+    async def save_batch(self, attendances: list[MatchAttendance]) -> None:
+        """Create or replace attendance records in one atomic batch."""
+        pass
+
     @abstractmethod
     async def delete(self, attendance_id: str) -> bool:
         """Delete an attendance record."""
@@ -3,7 +3,9 @@ import logging
 from datetime import time
 
 from kickai.core.exceptions import AttendanceError, create_error_context
+from kickai.database.bulk_writer import FIRESTORE_BATCH_LIMIT
 from kickai.features.match_management.domain.entities.attendance import (
+    AttendanceRecordResult,
     AttendanceStatus,
     MatchAttendance,
 )
@@ -197,36 +199,104 @@ class AttendanceService:
         match_id: str,
         attendance_records: list[dict],
         recorded_by: str = ""
-    ) -> list[MatchAttendance]:
-        """Record attendance for multiple players at once."""
+    ) -> list[AttendanceRecordResult]:
+        """
+        Record attendance for multiple players at once.
+
+        Every row is validated before anything is written: if any row is
+        invalid, nothing is recorded and each result says why. Existing records
+        are read with a single match query and the register is committed in
+        batches of up to FIRESTORE_BATCH_LIMIT records. Each batch is atomic,
+        so a register that fits in one batch (any real squad) is written
+        all-or-nothing; a larger one that fails part way keeps its earlier
+        batches. Returns one result per input row, in order.
+        """
         try:
-            recorded_attendances = []
+            rows, results = self._validate_attendance_rows(attendance_records)
+            if len(rows) != len(attendance_records):
+                logger.warning(
+                    f"Rejected bulk attendance for match {match_id}: "
+                    f"{len(attendance_records) - len(rows)} invalid rows, nothing recorded"
+                )
+                return results
 
-            for record in attendance_records:
-                player_id = record.get("player_id")
-                status = AttendanceStatus(record.get("status"))
-                reason = record.get("reason")
-                arrival_time_str = record.get("arrival_time")
+            existing = {
+                attendance.player_id: attendance
+                for attendance in await self.attendance_repository.get_by_match(match_id)
+            }
+            attendances = []
+            for player_id, status, reason, arrival_time in rows:
+                attendance = existing.get(player_id)
+                if attendance:
+                    attendance.update(status, reason, arrival_time)
+                else:
+                    attendance = MatchAttendance.create(
+                        match_id=match_id,
+                        player_id=player_id,
+                        status=status,
+                        reason=reason,
+                        recorded_by=recorded_by,
+                        arrival_time=arrival_time,
+                        attendance_id=self.id_generator.generate_attendance_id(match_id, player_id),
+                    )
+                attendances.append(attendance)
 
-                arrival_time = None
-                if arrival_time_str:
-                    arrival_time = time.fromisoformat(arrival_time_str)
+            results = []
+            for start in range(0, len(attendances), FIRESTORE_BATCH_LIMIT):
+                chunk = attendances[start:start + FIRESTORE_BATCH_LIMIT]
+                try:
+                    await self.attendance_repository.save_batch(chunk)
+                    results.extend(
+                        AttendanceRecordResult(player_id=a.player_id, success=True, attendance=a) for a in chunk
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to commit attendance batch for match {match_id}: {e}")
+                    results.extend(
+                        AttendanceRecordResult(player_id=a.player_id, success=False, error=str(e)) for a in chunk
+                    )
 
-                attendance = await self.record_attendance(
-                    match_id=match_id,
-                    player_id=player_id,
-                    status=status,
-                    reason=reason,
-                    recorded_by=recorded_by,
-                    arrival_time=arrival_time,
-                )
-                recorded_attendances.append(attendance)
-
-            logger.info(f"Bulk recorded attendance for {len(recorded_attendances)} players in match {match_id}")
-            return recorded_attendances
+            recorded = sum(1 for result in results if result.success)
+            logger.info(f"Bulk recorded attendance for {recorded}/{len(results)} players in match {match_id}")
+            return results
         except Exception as e:
             logger.error(f"Failed to bulk record attendance for match {match_id}: {e}")
             raise AttendanceError(
                 f"Failed to bulk record attendance: {e!s}",
                 create_error_context("bulk_record_attendance")
             )
+
+    @staticmethod
+    def _validate_attendance_rows(
+        attendance_records: list[dict],
+    ) -> tuple[list[tuple], list[AttendanceRecordResult]]:
+        """Parse bulk rows into (player_id, status, reason, arrival_time), with one result per row."""
+        rows = []
+        results = []
+        seen_players = set()
+        for record in attendance_records:
+            player_id = record.get("player_id")
+            try:
+                if not player_id:
+                    raise ValueError("Missing player_id")
+                if player_id in seen_players:
+                    raise ValueError(f"Duplicate row for player {player_id}")
+                seen_players.add(player_id)
+                status = AttendanceStatus(record.get("status"))
+                arrival_time_str = record.get("arrival_time")
+                arrival_time = time.fromisoformat(arrival_time_str) if arrival_time_str else None
+            except ValueError as e:
+                results.append(AttendanceRecordResult(player_id=player_id or "", success=False, error=str(e)))
+                continue
+            rows.append((player_id, status, record.get("reason"), arrival_time))
+            results.append(AttendanceRecordResult(player_id=player_id, success=True))
+
+        if len(rows) != len(attendance_records):
+            # All-or-nothing: valid rows are not recorded either
+            results = [
+                result if not result.success
+                else AttendanceRecordResult(
+                    player_id=result.player_id, success=False, error="Not recorded: other rows are invalid"
+                )
+                for result in results
+            ]
+        return rows, results
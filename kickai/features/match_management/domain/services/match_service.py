@@ -2,6 +2,7 @@ from typing import List, Optional
 import logging
 from datetime import datetime, time
 
+from kickai.core.crew_activity_store import DEMAND_MATCH, schedule_team_demand
 from kickai.core.exceptions import MatchError, MatchNotFoundError, create_error_context
 from kickai.features.match_management.domain.entities.match import Match, MatchResult, MatchStatus
 from kickai.features.match_management.domain.interfaces.match_service_interface import IMatchService
@@ -71,6 +72,10 @@ class MatchService(IMatchService):
 
             created_match = await self.match_repository.create(match)
             logger.info(f"Match created: {created_match.match_id}")
+
+            # Let the crew pre-warmer have the team's crew ready before kickoff
+            kickoff = datetime.combine(date.date(), match_time_obj)
+            schedule_team_demand(team_id, kickoff.timestamp(), DEMAND_MATCH)
             return created_match
         except MatchError:
             raise
@@ -267,11 +267,18 @@ async def bulk_record_attendance(
                 return create_json_response(ResponseStatus.ERROR, message=f"Invalid record format: Missing fields {missing_fields}")
 
         # Record attendance for all players
-        recorded_attendances = await attendance_service.bulk_record_attendance(
+        results = await attendance_service.bulk_record_attendance(
             match_id=match_id,
             attendance_records=attendance_records,
             recorded_by=recorded_by,
         )
+        failed = [result for result in results if not result.success]
+        if failed and len(failed) == len(results):
+            return create_json_response(
+                ResponseStatus.ERROR,
+                message="No attendance recorded: "
+                + "; ".join(f"{r.player_id or '?'}: {r.error}" for r in failed if r.error),
+            )
 
         # Get attendance summary
         summary = await attendance_service.get_attendance_summary(match_id)
@@ -280,8 +287,12 @@ async def bulk_record_attendance(
             "✅ Bulk Attendance Recorded",
             "",
             f"Match: {match_id}",
-            f"Players Recorded: {len(recorded_attendances)}",
+            f"Players Recorded: {len(results) - len(failed)}",
             f"Recorded by: {recorded_by or 'System'}",
+        ]
+        if failed:
+            result.append(f"⚠️ Not recorded: {', '.join(r.player_id for r in failed)}")
+        result += [
             "",
             "📊 Match Summary",
             f"• Attended: {summary['attended']} players",
@@ -292,8 +303,9 @@ async def bulk_record_attendance(
 
         bulk_data = {
             "match_id": match_id,
-            "players_recorded": len(recorded_attendances),
+            "players_recorded": len(results) - len(failed),
             "recorded_by": recorded_by or 'System',
+            "results": [r.to_dict() for r in results],
             "match_summary": summary,
             "formatted_message": "\n".join(result)
         }
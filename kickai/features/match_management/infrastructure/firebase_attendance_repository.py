@@ -1,6 +1,7 @@
 from typing import Optional
 import logging
 
+from kickai.core.firestore_constants import get_team_matches_collection
 from kickai.features.match_management.domain.entities.attendance import (
     AttendanceStatus,
     MatchAttendance,
@@ -17,11 +18,29 @@ class FirebaseAttendanceRepository(AttendanceRepositoryInterface):
 
     def __init__(self, firebase_client):
         self.firebase_client = firebase_client
+        # A match never changes team, so its lookup is done once
+        self._match_team_ids: dict[str, str] = {}
 
     def _get_collection_name(self, team_id: str) -> str:
         """Get the collection name for a team's attendance."""
         return f"kickai_{team_id}_match_attendance"
 
+    async def _get_match_team_id(self, match_id: str) -> str:
+        """Find the team whose matches collection holds the match."""
+        if match_id in self._match_team_ids:
+            return self._match_team_ids[match_id]
+
+        teams = await self.firebase_client.query_documents("teams")
+        for team in teams:
+            team_id = team.get("team_id")
+            if not team_id:
+                continue
+            if await self.firebase_client.get_document(get_team_matches_collection(team_id), match_id):
+                self._match_team_ids[match_id] = team_id
+                return team_id
+
+        raise ValueError(f"Match {match_id} not found in any team")
+
     async def create(self, attendance: MatchAttendance) -> MatchAttendance:
         """Create a new attendance record."""
         try:
@@ -74,7 +93,10 @@ class FirebaseAttendanceRepository(AttendanceRepositoryInterface):
                 collection_name = self._get_collection_name(team_id)
                 docs = await self.firebase_client.query_documents(
                     collection_name,
-                    filters={"match_id": match_id, "player_id": player_id}
+                    filters=[
+                        {"field": "match_id", "operator": "==", "value": match_id},
+                        {"field": "player_id", "operator": "==", "value": player_id},
+                    ]
                 )
                 if docs:
                     return MatchAttendance.from_dict(docs[0])
@@ -85,7 +107,7 @@ class FirebaseAttendanceRepository(AttendanceRepositoryInterface):
             return None
 
     async def get_by_match(self, match_id: str) -> list[MatchAttendance]:
-        """Get all attendance records for a match."""
+        """Get all attendance records for a match (read errors propagate)."""
         try:
             # Search across all team collections
             teams = await self.firebase_client.query_documents("teams")
@@ -99,7 +121,7 @@ class FirebaseAttendanceRepository(AttendanceRepositoryInterface):
                 collection_name = self._get_collection_name(team_id)
                 docs = await self.firebase_client.query_documents(
                     collection_name,
-                    filters={"match_id": match_id}
+                    filters=[{"field": "match_id", "operator": "==", "value": match_id}]
                 )
                 attendances = [MatchAttendance.from_dict(doc) for doc in docs]
                 all_attendances.extend(attendances)
@@ -108,7 +130,7 @@ class FirebaseAttendanceRepository(AttendanceRepositoryInterface):
             return all_attendances
         except Exception as e:
             logger.error(f"Failed to get attendance for match {match_id}: {e}")
-            return []
+            raise
 
     async def get_by_player(self, player_id: str, limit: int = 10) -> list[MatchAttendance]:
         """Get attendance history for a player."""
@@ -125,7 +147,7 @@ class FirebaseAttendanceRepository(AttendanceRepositoryInterface):
                 collection_name = self._get_collection_name(team_id)
                 docs = await self.firebase_client.query_documents(
                     collection_name,
-                    filters={"player_id": player_id}
+                    filters=[{"field": "player_id", "operator": "==", "value": player_id}]
                 )
                 attendances = [MatchAttendance.from_dict(doc) for doc in docs]
                 all_attendances.extend(attendances)
@@ -170,6 +192,28 @@ class FirebaseAttendanceRepository(AttendanceRepositoryInterface):
             logger.error(f"Failed to update attendance {attendance.attendance_id}: {e}")
             raise
 
+    async def save_batch(self, attendances: list[MatchAttendance]) -> None:
+        """Create or replace attendance records in one atomic batch, in each match's team."""
+        if not attendances:
+            return
+        try:
+            operations = []
+            for attendance in attendances:
+                team_id = await self._get_match_team_id(attendance.match_id)
+                operations.append(
+                    {
+                        "type": "set",
+                        "collection": self._get_collection_name(team_id),
+                        "document_id": attendance.attendance_id,
+                        "data": attendance.to_dict(),
+                    }
+                )
+            await self.firebase_client.execute_batch(operations)
+            logger.info(f"Saved {len(attendances)} attendance records in one batch")
+        except Exception as e:
+            logger.error(f"Failed to save batch of {len(attendances)} attendance records: {e}")
+            raise
+
     async def delete(self, attendance_id: str) -> bool:
         """Delete an attendance record."""
         try:
@@ -2,6 +2,7 @@ from typing import Optional
 import logging
 from datetime import datetime
 
+from kickai.database.query_spec import QuerySpec, register_query_index
 from kickai.features.match_management.domain.entities.match import Match, MatchStatus
 from kickai.features.match_management.domain.repositories.match_repository_interface import (
     MatchRepositoryInterface,
@@ -9,6 +10,43 @@ from kickai.features.match_management.domain.repositories.match_repository_inter
 
 logger = logging.getLogger(__name__)
 
+MATCHES_COLLECTION_TEMPLATE = "kickai_{team_id}_matches"
+UPCOMING_STATUSES = [
+    MatchStatus.SCHEDULED.value,
+    MatchStatus.AVAILABILITY_OPEN.value,
+    MatchStatus.SQUAD_SELECTION.value,
+]
+
+
+def _upcoming_matches_spec(now_iso: str, limit: int) -> QuerySpec:
+    return (
+        QuerySpec()
+        .where("status", "in", UPCOMING_STATUSES)
+        .where_range("date", lower=now_iso, include_lower=False)
+        .order("date")
+        .take(limit)
+    )
+
+
+def _past_matches_spec(now_iso: str, limit: int) -> QuerySpec:
+    return QuerySpec().where_range("date", upper=now_iso).order("date", descending=True).take(limit)
+
+
+def _future_completed_matches_spec(now_iso: str, limit: int) -> QuerySpec:
+    return (
+        QuerySpec()
+        .where("status", "==", MatchStatus.COMPLETED.value)
+        .where_range("date", lower=now_iso, include_lower=False)
+        .order("date", descending=True)
+        .take(limit)
+    )
+
+
+# Query shapes used below, recorded for composite index generation
+register_query_index(MATCHES_COLLECTION_TEMPLATE, _upcoming_matches_spec("", 1))
+register_query_index(MATCHES_COLLECTION_TEMPLATE, _past_matches_spec("", 1))
+register_query_index(MATCHES_COLLECTION_TEMPLATE, _future_completed_matches_spec("", 1))
+
 
 class FirebaseMatchRepository(MatchRepositoryInterface):
     """Firebase implementation of match repository."""
@@ -18,7 +56,7 @@ class FirebaseMatchRepository(MatchRepositoryInterface):
 
     def _get_collection_name(self, team_id: str) -> str:
         """Get the collection name for a team's matches."""
-        return f"kickai_{team_id}_matches"
+        return MATCHES_COLLECTION_TEMPLATE.format(team_id=team_id)
 
     async def create(self, match: Match) -> Match:
         """Create a new match."""
@@ -96,18 +134,14 @@ class FirebaseMatchRepository(MatchRepositoryInterface):
     async def get_upcoming_matches(self, team_id: str, limit: int = 10) -> list[Match]:
         """Get upcoming matches for a team."""
         try:
-            all_matches = await self.get_by_team(team_id)
-            now = datetime.utcnow()
-
-            upcoming_matches = [
-                match for match in all_matches
-                if match.match_date > now and match.is_upcoming
-            ]
-
-            # Sort by match date (earliest first)
-            upcoming_matches.sort(key=lambda m: m.match_date)
+            collection_name = self._get_collection_name(team_id)
+            now_iso = datetime.utcnow().isoformat()
 
-            return upcoming_matches[:limit]
+            # Status, date range, ordering and limit all run in the data store
+            docs = await self.firebase_client.run_query(
+                collection_name, _upcoming_matches_spec(now_iso, limit)
+            )
+            return [Match.from_dict(doc) for doc in docs]
         except Exception as e:
             logger.error(f"Failed to get upcoming matches for team {team_id}: {e}")
             return []
@@ -115,18 +149,22 @@ class FirebaseMatchRepository(MatchRepositoryInterface):
     async def get_past_matches(self, team_id: str, limit: int = 10) -> list[Match]:
         """Get past matches for a team."""
         try:
-            all_matches = await self.get_by_team(team_id)
-            now = datetime.utcnow()
-
-            past_matches = [
-                match for match in all_matches
-                if match.match_date <= now or match.is_completed
-            ]
+            collection_name = self._get_collection_name(team_id)
+            now_iso = datetime.utcnow().isoformat()
 
-            # Sort by match date (newest first)
-            past_matches.sort(key=lambda m: m.match_date, reverse=True)
+            # "Past" is date <= now OR completed; Firestore cannot OR across a
+            # range, so run both halves with the limit pushed down and merge.
+            past_docs = await self.firebase_client.run_query(
+                collection_name, _past_matches_spec(now_iso, limit)
+            )
+            completed_docs = await self.firebase_client.run_query(
+                collection_name, _future_completed_matches_spec(now_iso, limit)
+            )
 
-            return past_matches[:limit]
+            docs = sorted(
+                completed_docs + past_docs, key=lambda doc: doc.get("date") or "", reverse=True
+            )
+            return [Match.from_dict(doc) for doc in docs[:limit]]
         except Exception as e:
             logger.error(f"Failed to get past matches for team {team_id}: {e}")
             return []
@@ -266,18 +266,10 @@ async def get_all_players(telegram_id: int, team_id: str, username: str, chat_ty
         container = get_container()
         player_service = container.get_service(PlayerService)
         
-        # Execute domain operation
-        players = await player_service.get_all_players(team_id)
-        
-        if not players:
-            return create_json_response(
-                ResponseStatus.SUCCESS, 
-                data="No players found in the team."
-            )
-
-        # Format player list at application boundary
+        # Stream players page by page and format at the application boundary,
+        # so large squads are never held as a full list of entities
         formatted_players = []
-        for player in players:
+        async for player in player_service.iter_players(team_id):
             player_data = {
                 "name": player.name or "Unknown",
                 "position": player.position or "Not specified",
@@ -287,6 +279,12 @@ async def get_all_players(telegram_id: int, team_id: str, username: str, chat_ty
             }
             formatted_players.append(player_data)
 
+        if not formatted_players:
+            return create_json_response(
+                ResponseStatus.SUCCESS, 
+                data="No players found in the team."
+            )
+
         # Create formatted message
         message_lines = ["🏆 Team Players", ""]
         for i, player in enumerate(formatted_players, 1):
@@ -13,6 +13,7 @@ from datetime import datetime
 from enum import Enum
 
 from kickai.core.enums import PlayerPosition
+from kickai.utils.phone_validation import to_e164
 
 
 
@@ -166,6 +167,7 @@ class Player:
             "username": self.username,
             "position": self.position,
             "phone_number": self.phone_number,
+            "phone_e164": self.phone_e164,
             "email": self.email,
             "date_of_birth": self.date_of_birth,
             "emergency_contact_name": self.emergency_contact_name,
@@ -304,6 +306,11 @@ class Player:
         """Check if player is pending."""
         return self.status == "pending"
 
+    @property
+    def phone_e164(self) -> Optional[str]:
+        """Phone number canonicalised to E.164, stored alongside phone_number for lookups."""
+        return to_e164(self.phone_number)
+
     def get_display_name(self) -> str:
         """Get display name for the player."""
         if self.name:
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import AsyncIterator, Optional
 #!/usr/bin/env python3
 """
 Player Repository Interface
@@ -8,6 +8,7 @@ This module defines the interface for player data access operations.
 
 from abc import ABC, abstractmethod
 
+from kickai.features.shared.domain.pagination import Page
 from kickai.features.player_registration.domain.entities.player import Player
 
 
@@ -34,6 +35,18 @@ class PlayerRepositoryInterface(ABC):
         """Get all players in a team."""
         pass
 
+    @abstractmethod
+    async def list_players_page(
+        self, team_id: str, page_size: int, cursor: Optional[tuple] = None
+    ) -> Page[Player]:
+        """Get one page of a team's players, resuming after ``cursor``."""
+        pass
+
+    @abstractmethod
+    def iter_players(self, team_id: str, page_size: int) -> AsyncIterator[Player]:
+        """Stream a team's players page by page."""
+        pass
+
     @abstractmethod
     async def update_player(self, player: Player) -> Player:
         """Update a player."""
@@ -49,6 +62,13 @@ class PlayerRepositoryInterface(ABC):
         """Get players by status."""
         pass
 
+    @abstractmethod
+    async def get_players_due_for_reminder(
+        self, team_id: str, due_before: str, max_reminders: int
+    ) -> list[Player]:
+        """Get pending players registered before the given ISO timestamp."""
+        pass
+
     @abstractmethod
     async def get_player_by_telegram_id(self, telegram_id: int, team_id: str) -> Optional[Player]:
         """Get a player by Telegram ID."""
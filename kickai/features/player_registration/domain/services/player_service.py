@@ -8,10 +8,11 @@ This module provides player management functionality.
 # Standard library
 import logging
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Optional
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Optional
 
 # Local application
+from kickai.features.shared.domain.pagination import DEFAULT_PAGE_SIZE, Page
 from kickai.features.team_administration.domain.services.team_service import TeamService
 from kickai.utils.constants import (
     DEFAULT_CREATED_BY,
@@ -239,17 +240,34 @@ class PlayerService:
 
     async def get_players_by_team(self, *, team_id: str, status: str | None = None) -> list[Player]:
         """Get players for a team, optionally filtered by status."""
-        players = await self.player_repository.get_all_players(team_id)
-
         if status:
-            players = [player for player in players if player.status == status]
+            return await self.player_repository.get_players_by_status(team_id, status)
+        return await self.player_repository.get_all_players(team_id)
 
-        return players
+    async def get_players_needing_reminders(
+        self, team_id: str, max_reminders: int, first_reminder_hours: int = 24
+    ) -> list[Player]:
+        """Get pending players who registered at least ``first_reminder_hours`` ago."""
+        # created_at is written in UTC (Player.__post_init__)
+        registered_before = datetime.utcnow() - timedelta(hours=first_reminder_hours)
+        return await self.player_repository.get_players_due_for_reminder(
+            team_id, registered_before.isoformat(), max_reminders
+        )
 
     async def get_all_players(self, team_id: str) -> list[Player]:
         """Get all players for a team (alias for get_players_by_team)."""
         return await self.get_players_by_team(team_id=team_id)
 
+    async def get_players_page(
+        self, team_id: str, page_size: int = DEFAULT_PAGE_SIZE, cursor: Optional[tuple] = None
+    ) -> Page[Player]:
+        """Get one page of a team's players; pass ``next_cursor`` back to continue."""
+        return await self.player_repository.list_players_page(team_id, page_size, cursor)
+
+    def iter_players(self, team_id: str, page_size: int = DEFAULT_PAGE_SIZE) -> AsyncIterator[Player]:
+        """Stream a team's players without loading the whole roster."""
+        return self.player_repository.iter_players(team_id, page_size)
+
     async def get_active_players(self, team_id: str) -> list[Player]:
         """Get active players for a team."""
         return await self.get_players_by_team(team_id=team_id, status=ACTIVE_STATUS)
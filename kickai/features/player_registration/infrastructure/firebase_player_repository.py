@@ -7,14 +7,20 @@ This module provides the Firebase implementation of the player repository interf
 
 # Standard library
 import logging
+from dataclasses import fields
+from datetime import datetime
+from typing import AsyncIterator, Optional
 
 # Local application
 from kickai.core.firestore_constants import COLLECTION_PLAYERS, get_team_players_collection
 from kickai.database.interfaces import DataStoreInterface
+from kickai.database.query_spec import QuerySpec, register_query_index
 from kickai.features.player_registration.domain.entities.player import Player
 from kickai.features.player_registration.domain.repositories.player_repository_interface import (
     PlayerRepositoryInterface,
 )
+from kickai.features.shared.domain.pagination import DEFAULT_PAGE_SIZE, Page
+from kickai.utils.phone_validation import legacy_phone_forms, to_e164
 
 # Constants
 ERROR_MESSAGES = {
@@ -25,6 +31,7 @@ ERROR_MESSAGES = {
     "UPDATE_PLAYER_FAILED": "Failed to update player {} in team {}: {}",
     "DELETE_PLAYER_FAILED": "Failed to delete player {} from team {}: {}",
     "GET_PLAYERS_BY_STATUS_FAILED": "Failed to get players by status {} for team {}: {}",
+    "GET_PLAYERS_DUE_REMINDER_FAILED": "Failed to get players due a reminder for team {}: {}",
     "PLAYER_NOT_FOUND_DELETION": "Player {} not found in team {} for deletion",
     "PLAYER_MISSING_ID": "Player must have player_id",
 }
@@ -35,9 +42,30 @@ SUCCESS_MESSAGES = {
     "PLAYER_DELETED": "Successfully deleted player {} from team {}",
 }
 
+# Persisted Player attributes that partial updates may touch
+PLAYER_FIELDS = frozenset(f.name for f in fields(Player))
+
 logger = logging.getLogger(__name__)
 
 
+def _players_due_reminder_spec(team_id: str, registered_before: str) -> QuerySpec:
+    # Pending players are the ones still onboarding; created_at is the ISO
+    # timestamp written by Player.to_dict, so it compares as a string
+    return (
+        QuerySpec()
+        .where("team_id", "==", team_id)
+        .where("status", "==", "pending")
+        .where_range("created_at", upper=registered_before)
+        .order("created_at")
+    )
+
+
+# Query shape recorded for composite index generation
+register_query_index(
+    get_team_players_collection("{team_id}"), _players_due_reminder_spec("", "")
+)
+
+
 class FirebasePlayerRepository(PlayerRepositoryInterface):
     """Firebase implementation of the player repository."""
 
@@ -96,6 +124,7 @@ class FirebasePlayerRepository(PlayerRepositoryInterface):
             "username": player.username,
             "position": player.position,
             "phone_number": player.phone_number,
+            "phone_e164": player.phone_e164,
             "email": player.email,
             "date_of_birth": player.date_of_birth,
             "emergency_contact_name": player.emergency_contact_name,
@@ -137,18 +166,31 @@ class FirebasePlayerRepository(PlayerRepositoryInterface):
             return None
 
     async def get_player_by_phone(self, phone: str, team_id: str) -> Player | None:
-        """Get a player by phone number."""
+        """Get a player by phone number (any format), matched on the canonical E.164 field."""
         try:
+            phone_e164 = to_e164(phone)
+            if not phone_e164:
+                return None
+
             # Use team-specific collection naming
             collection_name = get_team_players_collection(team_id)
 
-            docs = await self.database.query_documents(
-                collection=collection_name,
-                filters=[
-                    {"field": "phone_number", "operator": "==", "value": phone},
-                    {"field": "team_id", "operator": "==", "value": team_id},
-                ],
+            docs = await self.database.run_query(
+                collection_name,
+                QuerySpec()
+                .where("phone_e164", "==", phone_e164)
+                .where("team_id", "==", team_id)
+                .take(1),
             )
+            if not docs:
+                # Not yet backfilled: match the stored phone_number in any format
+                docs = await self.database.run_query(
+                    collection_name,
+                    QuerySpec()
+                    .where("phone_number", "in", legacy_phone_forms(phone))
+                    .where("team_id", "==", team_id)
+                    .take(1),
+                )
 
             if docs:
                 return self._doc_to_player(docs[0])
@@ -175,6 +217,30 @@ class FirebasePlayerRepository(PlayerRepositoryInterface):
             logger.error(ERROR_MESSAGES["GET_ALL_PLAYERS_FAILED"].format(team_id, e))
             return []
 
+    async def list_players_page(
+        self, team_id: str, page_size: int = DEFAULT_PAGE_SIZE, cursor: Optional[tuple] = None
+    ) -> Page[Player]:
+        """Get one page of a team's players; pass ``next_cursor`` back to continue."""
+        collection_name = get_team_players_collection(team_id)
+        page = await self.database.query_page(
+            collection_name, self._team_spec(team_id), page_size, cursor
+        )
+        return Page(items=[self._doc_to_player(doc) for doc in page.items], next_cursor=page.next_cursor)
+
+    async def iter_players(
+        self, team_id: str, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[Player]:
+        """Stream a team's players page by page without loading the whole roster."""
+        collection_name = get_team_players_collection(team_id)
+        async for doc in self.database.iter_documents(
+            collection_name, self._team_spec(team_id), page_size
+        ):
+            yield self._doc_to_player(doc)
+
+    @staticmethod
+    def _team_spec(team_id: str) -> QuerySpec:
+        return QuerySpec().where("team_id", "==", team_id)
+
     async def update_player(self, player: Player) -> Player:
         """Update a player."""
         try:
@@ -242,6 +308,30 @@ class FirebasePlayerRepository(PlayerRepositoryInterface):
             logger.error(ERROR_MESSAGES["GET_PLAYERS_BY_STATUS_FAILED"].format(status, team_id, e))
             return []
 
+    async def get_players_due_for_reminder(
+        self, team_id: str, due_before: str, max_reminders: int
+    ) -> list[Player]:
+        """Get pending players registered before ``due_before``, oldest first."""
+        try:
+            collection_name = get_team_players_collection(team_id)
+
+            docs = await self.database.run_query(
+                collection_name, _players_due_reminder_spec(team_id, due_before)
+            )
+
+            # reminders_sent is a second inequality field, which Firestore cannot
+            # combine with the range on created_at, so it is checked here
+            # (documents without a count have had no reminder yet)
+            return [
+                self._doc_to_player(doc)
+                for doc in docs
+                if (doc.get("reminders_sent") or 0) < max_reminders
+            ]
+
+        except Exception as e:
+            logger.error(ERROR_MESSAGES["GET_PLAYERS_DUE_REMINDER_FAILED"].format(team_id, e))
+            return []
+
     async def get_player_by_telegram_id(self, telegram_id: int, team_id: str) -> Player | None:
         """Get a player by Telegram ID."""
         try:
@@ -284,32 +374,43 @@ class FirebasePlayerRepository(PlayerRepositoryInterface):
 
     async def update_player_field(self, telegram_id: int, team_id: str, field: str, value: str) -> bool:
         """Update a single field for a player."""
-        try:
-            player = await self.get_player_by_telegram_id(telegram_id, team_id)
-            if not player:
-                return False
-
-            # Update the field
-            setattr(player, field, value)
-            await self.update_player(player)
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to update player field {field} for telegram_id {telegram_id}: {e}")
-            return False
+        return await self.update_player_multiple_fields(telegram_id, team_id, {field: value})
 
     async def update_player_multiple_fields(self, telegram_id: int, team_id: str, updates: dict[str, str]) -> bool:
-        """Update multiple fields for a player."""
+        """
+        Update multiple fields for a player.
+
+        Resolves the document ID with a projected lookup and writes only the
+        changed fields in a single update, rather than re-writing the whole
+        player document.
+        """
         try:
-            player = await self.get_player_by_telegram_id(telegram_id, team_id)
-            if not player:
+            collection_name = get_team_players_collection(team_id)
+
+            docs = await self.database.run_query(
+                collection_name,
+                QuerySpec()
+                .where("telegram_id", "==", telegram_id)
+                .where("team_id", "==", team_id)
+                .project("player_id")
+                .take(1),
+            )
+            if not docs:
                 return False
 
-            # Update all fields
-            for field, value in updates.items():
-                setattr(player, field, value)
+            unknown_fields = [name for name in updates if name not in PLAYER_FIELDS]
+            if unknown_fields:
+                logger.warning(f"Ignoring unknown player fields {unknown_fields} for telegram_id {telegram_id}")
+            data = {name: value for name, value in updates.items() if name in PLAYER_FIELDS}
+            if not data:
+                return False
+            if "phone_number" in data:
+                data["phone_e164"] = to_e164(data["phone_number"])
+            data["updated_at"] = datetime.now().isoformat()
 
-            await self.update_player(player)
+            await self.database.update_document(
+                collection=collection_name, document_id=docs[0]["id"], data=data
+            )
             return True
 
         except Exception as e:
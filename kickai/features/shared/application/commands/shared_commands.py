@@ -208,6 +208,36 @@ async def handle_version_command(update, context, **kwargs):
     return None
 
 
+@command(
+    name="/usage",
+    description="Show the team's AI token and cost usage (Admin only)",
+    command_type=CommandType.SLASH_COMMAND,
+    permission_level=PermissionLevel.ADMIN,
+    feature="shared",
+    chat_type=ChatType.LEADERSHIP,
+    examples=["/usage"],
+    help_text="""
+📊 AI Usage Report (Admin Only)
+
+Show how much of the AI service your team has used.
+
+Usage:
+/usage
+
+What you'll see:
+• Tokens, calls and estimated cost for the last hour, day, week and month
+• Budget status, if your team has an AI budget
+• The agents, commands and models using the most tokens
+
+💡 Tip: Once a team's budget is used up, replies use a cheaper model or pause until the window frees up.
+    """,
+)
+async def handle_usage_command(update, context, **kwargs):
+    """Handle /usage command."""
+    # This will be handled by the agent system
+    return None
+
+
 @command(
     name="/update",
     description="Update your information (context-aware for players/team members)",
@@ -12,7 +12,7 @@ from .help_tools import (
     get_welcome_message,
     get_available_commands
 )
-from .system_tools import ping, version
+from .system_tools import get_llm_usage_report, ping, version
 from .user_tools import get_user_status
 from .permission_tools import permission_denied_message, command_not_available
 from .nlp_tools import (
@@ -34,6 +34,7 @@ __all__ = [
     "get_available_commands",
     "ping",
     "version",
+    "get_llm_usage_report",
     "get_user_status",
     "permission_denied_message",
     "command_not_available",
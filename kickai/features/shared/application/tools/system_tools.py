@@ -85,4 +85,34 @@ async def version(telegram_id: int, team_id: str, username: str, chat_type: str)
         
     except Exception as e:
         logger.error(f"❌ Error in version tool: {e}")
-        return create_tool_response(False, f"Version check failed: {str(e)}")
\ No newline at end of file
+        return create_tool_response(False, f"Version check failed: {str(e)}")
+
+@tool("get_llm_usage_report", result_as_answer=True)
+async def get_llm_usage_report(telegram_id: int, team_id: str, username: str, chat_type: str) -> str:
+    """
+    Get the team's LLM token and cost usage (admin only).
+
+    Reports usage over the last hour, day, week and month, the team's budget
+    status, and the agents, commands and models using the most tokens.
+
+    Args:
+        telegram_id: Telegram ID of the requesting user
+        team_id: Team ID
+        username: Username of the requesting user
+        chat_type: Chat type context
+
+    Returns:
+        JSON formatted usage report
+    """
+    try:
+        logger.info(f"📊 LLM usage report request from user {username} ({telegram_id}) in team {team_id}")
+
+        from kickai.core.token_accounting import get_token_accountant
+
+        report = get_token_accountant().format_team_usage(team_id)
+
+        return create_tool_response(True, f"LLM usage for {team_id}", {"usage_report": report})
+
+    except Exception as e:
+        logger.error(f"❌ Error in get_llm_usage_report tool: {e}")
+        return create_tool_response(False, f"LLM usage report failed: {str(e)}")
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Shared Pagination Types
+
+Page results returned by repositories and services that list large
+collections. Kept in the domain layer so repository interfaces and domain
+services can page without importing the database layer.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+
+DEFAULT_PAGE_SIZE = 200
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of results plus the cursor to request the next one (``None`` at the end)."""
+
+    items: List[T]
+    next_cursor: Optional[Tuple[Any, ...]] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
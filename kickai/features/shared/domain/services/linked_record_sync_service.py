@@ -10,11 +10,24 @@ any linked record (same telegram_id) is also updated with the same information
 for common fields like phone_number, email, and emergency contact details.
 """
 
-from typing import Dict, Optional, List, Set
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, List, Set, Tuple
 from loguru import logger
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from kickai.core.dependency_container import get_container
+from kickai.core.firestore_constants import get_team_members_collection, get_team_players_collection
+from kickai.database.bulk_writer import BulkWriter
+from kickai.database.query_spec import QuerySpec
+from kickai.utils.phone_validation import to_e164
+
+# Firestore caps "in" filters at 30 values; larger selections read the team's whole collection
+FIRESTORE_IN_LIMIT = 30
+
+# How a field set differently on both sides is resolved
+PREFER_PLAYER = 'player'
+PREFER_TEAM_MEMBER = 'team_member'
+PREFER_NEWEST = 'newest'
 
 
 @dataclass
@@ -26,6 +39,50 @@ class SyncResult:
     target_entity_updated: bool = False
 
 
+@dataclass
+class SyncConflict:
+    """A field set to different values on a linked player and team member."""
+    telegram_id: Any
+    field: str
+    player_value: Any
+    team_member_value: Any
+    # Side whose value was kept ('player' or 'team_member'), or 'unresolved'
+    resolution: str
+
+
+@dataclass
+class BatchSyncReport:
+    """Outcome of a batch sync over a team's linked records."""
+    team_id: str
+    dry_run: bool = False
+    pairs: int = 0
+    unpaired: int = 0
+    # Document ID -> fields written (or that would be written in a dry run)
+    player_updates: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    team_member_updates: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    conflicts: List[SyncConflict] = field(default_factory=list)
+    # As with BulkWriter, a dry run counts the batches it would have committed
+    batches_committed: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return not self.errors
+
+    @property
+    def unresolved_conflicts(self) -> List[SyncConflict]:
+        return [conflict for conflict in self.conflicts if conflict.resolution == 'unresolved']
+
+    def summary(self) -> str:
+        mode = "DRY RUN - " if self.dry_run else ""
+        return (
+            f"{mode}linked record sync for {self.team_id}: {self.pairs} linked pairs, "
+            f"{len(self.player_updates)} players and {len(self.team_member_updates)} team members to update, "
+            f"{len(self.conflicts)} conflicts ({len(self.unresolved_conflicts)} unresolved), "
+            f"{self.batches_committed} batches committed"
+        )
+
+
 class LinkedRecordSyncService:
     """Service for synchronizing common fields between Player and TeamMember records."""
 
@@ -185,6 +242,184 @@ class LinkedRecordSyncService:
                 error_message=str(e)
             )
 
+    async def sync_linked_records(self,
+                                  team_id: str,
+                                  telegram_ids: Optional[Iterable[Any]] = None,
+                                  prefer: str = PREFER_NEWEST,
+                                  dry_run: bool = False,
+                                  data_store: Any = None) -> BatchSyncReport:
+        """
+        Reconcile the syncable fields of every linked player/team member pair in a team.
+
+        Both collections are read with one query each and diffed in memory. A
+        field blank on one side is filled from the other; a field set
+        differently on both sides is a conflict, resolved by ``prefer`` and
+        listed in the report. Updates are committed in chunked batch writes.
+
+        Args:
+            team_id: Team whose players and team members are reconciled
+            telegram_ids: Only reconcile these links (default: every link in the team)
+            prefer: 'player' or 'team_member' to keep that side's value in a conflict,
+                or 'newest' for the most recently updated record (unresolved on a tie)
+            dry_run: Build the report without writing
+            data_store: Store to use (default: the container's database)
+
+        Returns:
+            BatchSyncReport with the planned or committed updates and the conflicts
+        """
+        if prefer not in (PREFER_PLAYER, PREFER_TEAM_MEMBER, PREFER_NEWEST):
+            raise ValueError(f"Unknown sync preference: {prefer}")
+
+        report = BatchSyncReport(team_id=team_id, dry_run=dry_run)
+        ids = None if telegram_ids is None else list(telegram_ids)
+        wanted = None if ids is None else {str(telegram_id) for telegram_id in ids}
+        if wanted is not None and not wanted:
+            return report
+
+        store = data_store or self.container.get_database()
+        players_collection = get_team_players_collection(team_id)
+        members_collection = get_team_members_collection(team_id)
+        players = self._group_by_telegram_id(
+            await self._load_linked(store, players_collection, ids, wanted)
+        )
+        members = self._group_by_telegram_id(
+            await self._load_linked(store, members_collection, ids, wanted)
+        )
+
+        report.unpaired = len(players.keys() ^ members.keys())
+        now = datetime.utcnow().isoformat()
+        for key in sorted(players.keys() & members.keys()):
+            if len(players[key]) > 1 or len(members[key]) > 1:
+                # Ambiguous link: leave it for a human rather than guess which record is current
+                report.conflicts.append(SyncConflict(
+                    telegram_id=players[key][0].get('telegram_id'),
+                    field='telegram_id',
+                    player_value=[doc['id'] for doc in players[key]],
+                    team_member_value=[doc['id'] for doc in members[key]],
+                    resolution='unresolved',
+                ))
+                continue
+
+            report.pairs += 1
+            player, member = players[key][0], members[key][0]
+            player_changes, member_changes = self._diff_pair(player, member, prefer, report)
+            self._derive_phone_e164(player, member, player_changes, member_changes, report)
+            if player_changes:
+                report.player_updates[player['id']] = {**player_changes, 'updated_at': now}
+            if member_changes:
+                report.team_member_updates[member['id']] = {**member_changes, 'updated_at': now}
+
+        writer = BulkWriter(store, job_name=f"linked_record_sync_{team_id}", dry_run=dry_run)
+        for document_id, data in report.player_updates.items():
+            await writer.update(players_collection, document_id, data)
+        for document_id, data in report.team_member_updates.items():
+            await writer.update(members_collection, document_id, data)
+        write_report = await writer.close()
+        report.batches_committed = write_report.batches_committed
+        report.errors.extend(write_report.errors)
+
+        logger.info(f"🔄 {report.summary()}")
+        return report
+
+    async def _load_linked(self,
+                           store: Any,
+                           collection: str,
+                           telegram_ids: Optional[List[Any]],
+                           wanted: Optional[Set[str]]) -> List[Dict[str, Any]]:
+        """Read the linked records of one collection with a single query."""
+        spec = QuerySpec().project('telegram_id', 'updated_at', *sorted(self.SYNCABLE_FIELDS))
+        if wanted is not None:
+            values = self._telegram_id_forms(telegram_ids)
+            if len(values) <= FIRESTORE_IN_LIMIT:
+                spec.where('telegram_id', 'in', values)
+        documents = await store.run_query(collection, spec)
+        return [
+            doc for doc in documents
+            if doc.get('telegram_id') is not None and (wanted is None or str(doc['telegram_id']) in wanted)
+        ]
+
+    @staticmethod
+    def _telegram_id_forms(telegram_ids: List[Any]) -> List[Any]:
+        # "in" matches on type, and older records store telegram_id as a string, so ask for both
+        values: List[Any] = []
+        for telegram_id in telegram_ids:
+            text = str(telegram_id)
+            forms = [text, int(text)] if text.lstrip('-').isdigit() else [text]
+            values.extend(form for form in forms if form not in values)
+        return values
+
+    @staticmethod
+    def _group_by_telegram_id(documents: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        # Older records store telegram_id as a string, so links are matched on its text
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for doc in documents:
+            grouped.setdefault(str(doc['telegram_id']), []).append(doc)
+        return grouped
+
+    def _diff_pair(self,
+                   player: Dict[str, Any],
+                   member: Dict[str, Any],
+                   prefer: str,
+                   report: BatchSyncReport) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Return the (player, team member) field changes that bring a pair into agreement."""
+        player_changes: Dict[str, Any] = {}
+        member_changes: Dict[str, Any] = {}
+        for field_name in sorted(self.SYNCABLE_FIELDS):
+            player_value = player.get(field_name) or None
+            member_value = member.get(field_name) or None
+            if player_value == member_value:
+                continue
+            if member_value is None:
+                member_changes[field_name] = player_value
+                continue
+            if player_value is None:
+                player_changes[field_name] = member_value
+                continue
+
+            winner = prefer
+            if prefer == PREFER_NEWEST:
+                player_updated = str(player.get('updated_at') or '')
+                member_updated = str(member.get('updated_at') or '')
+                if player_updated == member_updated:
+                    winner = 'unresolved'
+                else:
+                    winner = PREFER_PLAYER if player_updated > member_updated else PREFER_TEAM_MEMBER
+            report.conflicts.append(SyncConflict(
+                telegram_id=player.get('telegram_id'),
+                field=field_name,
+                player_value=player_value,
+                team_member_value=member_value,
+                resolution=winner,
+            ))
+            if winner == PREFER_PLAYER:
+                member_changes[field_name] = player_value
+            elif winner == PREFER_TEAM_MEMBER:
+                player_changes[field_name] = member_value
+        return player_changes, member_changes
+
+    @staticmethod
+    def _derive_phone_e164(player: Dict[str, Any],
+                           member: Dict[str, Any],
+                           player_changes: Dict[str, Any],
+                           member_changes: Dict[str, Any],
+                           report: BatchSyncReport) -> None:
+        """Keep the indexed phone_e164 lookup field in step with a synced phone_number."""
+        for changes in (player_changes, member_changes):
+            if 'phone_number' not in changes:
+                continue
+            phone_e164 = to_e164(changes['phone_number'])
+            if phone_e164:
+                changes['phone_e164'] = phone_e164
+                continue
+            # Never blank the lookup field: leave the stored value and flag the number for review
+            report.conflicts.append(SyncConflict(
+                telegram_id=player.get('telegram_id'),
+                field='phone_e164',
+                player_value=player.get('phone_number'),
+                team_member_value=member.get('phone_number'),
+                resolution='unresolved',
+            ))
+
     def get_syncable_fields(self) -> Set[str]:
         """
         Get set of fields that can be synchronized between entities.
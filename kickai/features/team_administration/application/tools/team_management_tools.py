@@ -97,13 +97,9 @@ async def list_team_members_and_players(
                 "Required services are not available"
             )
 
-        # Execute domain operations
-        players = await player_service.get_all_players(team_id)
-        team_members = await team_member_service.get_team_members(team_id)
-
-        # Format combined list at application boundary
+        # Stream both rosters page by page and format at the application boundary
         formatted_players = []
-        for player in players:
+        async for player in player_service.iter_players(team_id):
             player_data = {
                 "type": "Player",
                 "name": player.name or "Unknown",
@@ -115,7 +111,7 @@ async def list_team_members_and_players(
             formatted_players.append(player_data)
 
         formatted_members = []
-        for member in team_members:
+        async for member in team_member_service.iter_team_members(team_id):
             member_data = {
                 "type": "Team Member",
                 "name": member.name or "Unknown",
@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional, Set
 
 from kickai.core.enums import MemberStatus
+from kickai.utils.phone_validation import to_e164
 
 
 @dataclass
@@ -135,6 +136,7 @@ class TeamMember:
             "is_admin": self.is_admin,
             "status": self.status.value if isinstance(self.status, MemberStatus) else self.status,
             "phone_number": self.phone_number,
+            "phone_e164": self.phone_e164,
             "email": self.email,
             "emergency_contact_name": self.emergency_contact_name,
             "emergency_contact_phone": self.emergency_contact_phone,
@@ -282,6 +284,11 @@ class TeamMember:
         self.status = MemberStatus.SUSPENDED
         self.updated_at = datetime.utcnow()
 
+    @property
+    def phone_e164(self) -> Optional[str]:
+        """Phone number canonicalised to E.164, stored alongside phone_number for lookups."""
+        return to_e164(self.phone_number)
+
     @property
     def is_active(self) -> bool:
         """Check if the team member is active."""
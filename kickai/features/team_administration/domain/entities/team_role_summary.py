@@ -0,0 +1,105 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class TeamRoleSummary:
+    """
+    Per-team summary of the roster used for role decisions.
+
+    Holds each team member's join date, admin flag and status, ordered by join
+    date, so "is this the first member", "how many admins are left" and "who
+    has been here longest" are answered from one document instead of the full
+    roster. The team member repository rewrites it in the same transaction as
+    every member create, update and delete.
+    """
+
+    team_id: str
+    # {"member_doc_id", "telegram_id", "joined_at", "is_admin", "active"}, oldest first
+    members: List[Dict[str, Any]] = field(default_factory=list)
+    updated_at: Optional[str] = None
+
+    @property
+    def member_count(self) -> int:
+        return len(self.members)
+
+    @property
+    def admin_count(self) -> int:
+        return sum(1 for entry in self.members if entry["is_admin"] and entry["active"])
+
+    @property
+    def first_member(self) -> Optional[Dict[str, Any]]:
+        return self.members[0] if self.members else None
+
+    def admins(self, exclude_telegram_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Active admins, oldest first."""
+        return [
+            entry
+            for entry in self.members
+            if entry["is_admin"] and entry["active"] and not _same_user(entry, exclude_telegram_id)
+        ]
+
+    def longest_tenured(self, exclude_telegram_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """The active member who joined first, optionally ignoring one user."""
+        for entry in self.members:
+            if entry["active"] and not _same_user(entry, exclude_telegram_id):
+                return entry
+        return None
+
+    def upsert(self, member_doc_id: str, member_data: Dict[str, Any]) -> None:
+        """Add or refresh a member from its stored document data, keeping join order."""
+        existing = self._find(member_doc_id)
+        joined_at = existing["joined_at"] if existing else _iso(member_data.get("created_at"))
+        self.remove(member_doc_id)
+        self.members.append(
+            {
+                "member_doc_id": member_doc_id,
+                "telegram_id": member_data.get("telegram_id"),
+                "joined_at": joined_at or datetime.utcnow().isoformat(),
+                "is_admin": bool(member_data.get("is_admin", False)),
+                "active": member_data.get("status", "active") == "active",
+            }
+        )
+        self.members.sort(key=lambda entry: (entry["joined_at"], entry["member_doc_id"]))
+
+    def remove(self, member_doc_id: str) -> None:
+        self.members = [entry for entry in self.members if entry["member_doc_id"] != member_doc_id]
+
+    def _find(self, member_doc_id: str) -> Optional[Dict[str, Any]]:
+        for entry in self.members:
+            if entry["member_doc_id"] == member_doc_id:
+                return entry
+        return None
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for storage."""
+        first = self.first_member
+        return {
+            "team_id": self.team_id,
+            "member_count": self.member_count,
+            "admin_count": self.admin_count,
+            "first_member_id": first["member_doc_id"] if first else None,
+            "members": [dict(entry) for entry in self.members],
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict], team_id: str = "") -> "TeamRoleSummary":
+        """Create from dictionary; a missing document is an empty team."""
+        data = data or {}
+        return cls(
+            team_id=data.get("team_id") or team_id,
+            members=[dict(entry) for entry in data.get("members", [])],
+            updated_at=data.get("updated_at"),
+        )
+
+
+def _iso(value: Any) -> Optional[str]:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value or None
+
+
+def _same_user(entry: Dict[str, Any], telegram_id: Optional[int]) -> bool:
+    return telegram_id is not None and str(entry.get("telegram_id")) == str(telegram_id)
@@ -6,16 +6,24 @@ This module defines the interface for team member data access operations.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
+
+from kickai.features.shared.domain.pagination import Page
 from kickai.features.team_administration.domain.entities.team_member import TeamMember
+from kickai.features.team_administration.domain.entities.team_role_summary import TeamRoleSummary
 
 
 class TeamMemberRepositoryInterface(ABC):
     """Interface for team member data access operations."""
 
     @abstractmethod
-    async def create_team_member(self, team_member: TeamMember) -> TeamMember:
-        """Create a new team member."""
+    async def create_team_member(self, team_member: TeamMember, admin_if_first: bool = False) -> TeamMember:
+        """Create a new team member; with ``admin_if_first`` the team's first member becomes admin."""
+        pass
+
+    @abstractmethod
+    async def get_role_summary(self, team_id: str) -> TeamRoleSummary:
+        """Get the team's role summary (admin count, first member, members by join date)."""
         pass
 
     @abstractmethod
@@ -38,6 +46,18 @@ class TeamMemberRepositoryInterface(ABC):
         """Get all team members for a team."""
         pass
 
+    @abstractmethod
+    async def list_team_members_page(
+        self, team_id: str, page_size: int, cursor: Optional[tuple] = None
+    ) -> Page[TeamMember]:
+        """Get one page of a team's members, resuming after ``cursor``."""
+        pass
+
+    @abstractmethod
+    def iter_team_members(self, team_id: str, page_size: int) -> AsyncIterator[TeamMember]:
+        """Stream a team's members page by page."""
+        pass
+
     @abstractmethod
     async def get_team_members_by_status(self, team_id: str, status: str) -> List[TeamMember]:
         """Get team members by status."""
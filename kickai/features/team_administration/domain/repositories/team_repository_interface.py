@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 #!/usr/bin/env python3
 """
 Team Repository Interface
@@ -51,6 +51,11 @@ class TeamRepositoryInterface(ABC):
         """Get all teams."""
         pass
 
+    @abstractmethod
+    def iter_teams(self, page_size: int) -> AsyncIterator[Team]:
+        """Stream all teams page by page."""
+        pass
+
     @abstractmethod
     async def get_by_status(self, status: str) -> List[Team]:
         """Get teams by status (alias used in tests)."""
@@ -8,6 +8,9 @@ This service handles automatic role assignment based on chat membership:
 - Users in both chats are both players and team members
 - First user automatically becomes admin
 - Auto-promote longest-tenured leadership member when last admin leaves
+
+First-user, admin-count and tenure decisions read the team's role summary
+(one document kept in step with the roster) rather than the full roster.
 """
 
 import logging
@@ -26,33 +29,45 @@ logger = logging.getLogger(__name__)
 class ChatRoleAssignmentService:
     """Service for managing chat-based role assignment."""
 
-    def __init__(self, firebase_client: FirebaseClient):
+    def __init__(
+        self,
+        firebase_client: FirebaseClient,
+        team_member_service: Optional[Any] = None,
+        player_service: Optional[Any] = None,
+    ):
         self.firebase_client = firebase_client
 
-        # Get PlayerService from dependency container instead of creating it directly
-        try:
-            from kickai.core.dependency_container import get_service
-            from kickai.features.player_registration.domain.services.player_service import (
-                PlayerService,
-            )
-
-            self.player_service = get_service(PlayerService)
-        except Exception as e:
-            logger.warning(f"⚠️ Could not get PlayerService from dependency container: {e}")
-            # Fallback to mock service
-            self.player_service = self._create_mock_player_service()
+        if player_service is not None:
+            self.player_service = player_service
+        else:
+            # Get PlayerService from dependency container instead of creating it directly
+            try:
+                from kickai.core.dependency_container import get_service
+                from kickai.features.player_registration.domain.services.player_service import (
+                    PlayerService,
+                )
 
-        # Get real TeamMemberService from container
-        try:
-            from kickai.features.team_administration.domain.services.team_member_service import TeamMemberService
-            self.team_member_service = container.get_service(TeamMemberService)
-            if not self.team_member_service:
-                logger.warning("⚠️ TeamMemberService not available, using mock service")
+                self.player_service = get_service(PlayerService)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not get PlayerService from dependency container: {e}")
+                # Fallback to mock service
+                self.player_service = self._create_mock_player_service()
+
+        if team_member_service is not None:
+            self.team_member_service = team_member_service
+        else:
+            # Get real TeamMemberService from container
+            try:
+                from kickai.core.dependency_container import get_service
+                from kickai.features.team_administration.domain.services.team_member_service import TeamMemberService
+                self.team_member_service = get_service(TeamMemberService)
+                if not self.team_member_service:
+                    logger.warning("⚠️ TeamMemberService not available, using mock service")
+                    self.team_member_service = self._create_mock_team_member_service()
+            except Exception as e:
+                logger.warning(f"⚠️ Could not get TeamMemberService from dependency container: {e}")
+                # Fallback to mock service
                 self.team_member_service = self._create_mock_team_member_service()
-        except Exception as e:
-            logger.warning(f"⚠️ Could not get TeamMemberService from dependency container: {e}")
-            # Fallback to mock service
-            self.team_member_service = self._create_mock_team_member_service()
 
         logger.info("✅ ChatRoleAssignmentService initialized")
 
@@ -75,10 +90,20 @@ class ChatRoleAssignmentService:
             async def get_team_members_by_team(self, team_id: str):
                 return []
 
+            async def get_role_summary(self, team_id: str):
+                from kickai.features.team_administration.domain.entities.team_role_summary import (
+                    TeamRoleSummary,
+                )
+
+                return TeamRoleSummary(team_id=team_id)
+
+            async def get_team_member_by_id(self, member_id: str, team_id: str = None):
+                return None
+
             async def get_team_member_by_telegram_id(self, telegram_id: str, team_id: str):
                 return None
 
-            async def create_team_member(self, team_member):
+            async def create_team_member(self, team_member, admin_if_first: bool = False):
                 return "mock_member_id"
 
             async def update_team_member(self, team_member):
@@ -104,14 +129,11 @@ class ChatRoleAssignmentService:
         try:
             logger.info(f"Adding user {user_id} to {chat_type} for team {team_id}")
 
-            # Check if this is the first user (no team members exist)
-            existing_members = await self.team_member_service.get_team_members_by_team(team_id)
-            is_first_user = len(existing_members) == 0
-
             # Get or create team member
             team_member = await self.team_member_service.get_team_member_by_telegram_id(
-                user_id, team_id
+                int(user_id), team_id
             )
+            is_first_user = False
 
             if not team_member:
                 # Create new team member
@@ -120,7 +142,6 @@ class ChatRoleAssignmentService:
                 )
                 from kickai.core.enums import MemberStatus
 
-                roles = self._determine_initial_roles(chat_type, is_first_user)
                 team_member = TeamMember(
                     team_id=team_id,
                     telegram_id=int(user_id),
@@ -128,13 +149,17 @@ class ChatRoleAssignmentService:
                     username=username,
                     role="Team Member",  # Default role
                     status=MemberStatus.ACTIVE,  # Automatically activate when joining chat
-                    is_admin=is_first_user,  # First user becomes admin
+                    is_admin=False,
                     created_at=datetime.now(),
                     updated_at=datetime.now(),
                     source="chat_join"
                 )
 
-                member_id = await self.team_member_service.create_team_member(team_member)
+                # The first user becomes admin; decided in the same transaction as the
+                # create, so two users joining at once cannot both be first
+                await self.team_member_service.create_team_member(team_member, admin_if_first=True)
+                is_first_user = team_member.is_admin
+                roles = self._determine_initial_roles(chat_type, is_first_user)
                 logger.info(f"✅ Created and activated new team member {user_id} with roles: {roles}")
             else:
                 # Update existing team member and activate if pending
@@ -153,18 +178,14 @@ class ChatRoleAssignmentService:
             if chat_type == ChatType.MAIN.value:
                 await self._ensure_player_role(team_id, user_id, username)
 
-            # Handle first user admin assignment
-            if is_first_user:
-                await self._assign_first_user_admin(team_id, user_id)
-
             return {
                 "success": True,
                 "user_id": user_id,
                 "team_id": team_id,
                 "chat_type": chat_type,
-                "roles": team_member.roles,
+                "roles": self._determine_initial_roles(chat_type, team_member.is_admin),
                 "is_first_user": is_first_user,
-                "is_admin": "admin" in team_member.roles,
+                "is_admin": team_member.is_admin,
             }
 
         except Exception as e:
@@ -199,7 +220,7 @@ class ChatRoleAssignmentService:
             await self.team_member_service.update_team_member(team_member)
 
             # Handle admin leaving leadership chat
-            if chat_type == ChatType.LEADERSHIP.value and "admin" in team_member.roles:
+            if chat_type == ChatType.LEADERSHIP.value and team_member.is_admin:
                 await self._handle_admin_leaving_leadership(team_id, user_id)
 
             # Remove player role if leaving main chat
@@ -320,35 +341,16 @@ class ChatRoleAssignmentService:
         except Exception as e:
             logger.warning(f"Failed to create/activate player record for user {user_id}: {e}")
 
-    async def _assign_first_user_admin(self, team_id: str, user_id: str) -> None:
-        """Assign admin role to the first user of a team."""
-        try:
-            team_member = await self.team_member_service.get_team_member_by_telegram_id(
-                user_id, team_id
-            )
-            if team_member and "admin" not in team_member.roles:
-                team_member.roles.append("admin")
-                await self.team_member_service.update_team_member(team_member)
-                logger.info(f"Assigned admin role to first user {user_id} for team {team_id}")
-        except Exception as e:
-            logger.error(f"Failed to assign admin role to first user {user_id}: {e}")
-
     async def _handle_admin_leaving_leadership(self, team_id: str, user_id: str) -> None:
         """Handle when an admin leaves the leadership chat."""
         try:
             # Check if this was the last admin
-            admin_members = await self.team_member_service.get_team_members_by_role(
-                team_id, "admin"
-            )
-            remaining_admins = [
-                m
-                for m in admin_members
-                if m.telegram_id != user_id and m.can_access_chat("leadership_chat")
-            ]
+            summary = await self.team_member_service.get_role_summary(team_id)
+            remaining_admins = summary.admins(exclude_telegram_id=user_id)
 
             if not remaining_admins:
                 # No admins left in leadership chat, promote longest-tenured member
-                await self._promote_longest_tenured_to_admin(team_id)
+                await self._promote_longest_tenured_to_admin(team_id, exclude_telegram_id=user_id)
             else:
                 logger.info(
                     f"Admin {user_id} left leadership chat, but {len(remaining_admins)} admins remain"
@@ -357,40 +359,41 @@ class ChatRoleAssignmentService:
         except Exception as e:
             logger.error(f"Failed to handle admin leaving leadership: {e}")
 
-    async def _promote_longest_tenured_to_admin(self, team_id: str) -> Optional[str]:
+    async def _promote_longest_tenured_to_admin(
+        self, team_id: str, exclude_telegram_id: Optional[str] = None
+    ) -> Optional[str]:
         """
-        Promote the longest-tenured leadership member to admin.
+        Promote the longest-tenured active member to admin.
+
+        Args:
+            team_id: The team ID
+            exclude_telegram_id: A member not to promote (e.g. the admin who just left)
 
         Returns:
             The user_id of the promoted member, or None if no suitable candidate
         """
         try:
-            # Get all leadership members (excluding the one who just left)
-            leadership_members = await self.team_member_service.get_leadership_members(team_id)
-
-            # Filter to only those with leadership chat access
-            eligible_members = [
-                m for m in leadership_members if m.can_access_chat("leadership_chat")
-            ]
-
-            if not eligible_members:
+            summary = await self.team_member_service.get_role_summary(team_id)
+            candidate = summary.longest_tenured(exclude_telegram_id=exclude_telegram_id)
+            if not candidate:
                 logger.warning(f"No eligible members to promote to admin in team {team_id}")
                 return None
 
-            # Sort by join date (oldest first)
-            eligible_members.sort(key=lambda m: m.joined_at)
+            user_id = str(candidate["telegram_id"])
+            if candidate["is_admin"]:
+                return user_id  # Already admin
 
-            # Promote the longest-tenured member
-            longest_tenured = eligible_members[0]
-            if "admin" not in longest_tenured.roles:
-                longest_tenured.roles.append("admin")
-                await self.team_member_service.update_team_member(longest_tenured)
-                logger.info(
-                    f"Promoted longest-tenured member {longest_tenured.user_id} to admin in team {team_id}"
-                )
-                return longest_tenured.user_id
+            longest_tenured = await self.team_member_service.get_team_member_by_id(
+                candidate["member_doc_id"], team_id
+            )
+            if not longest_tenured:
+                logger.warning(f"Member {candidate['member_doc_id']} in role summary not found in team {team_id}")
+                return None
 
-            return longest_tenured.user_id  # Already admin
+            longest_tenured.is_admin = True
+            await self.team_member_service.update_team_member(longest_tenured)
+            logger.info(f"Promoted longest-tenured member {user_id} to admin in team {team_id}")
+            return user_id
 
         except Exception as e:
             logger.error(f"Failed to promote longest-tenured member to admin: {e}")
@@ -8,6 +8,9 @@ from kickai.agents.crew_lifecycle_manager import (
     initialize_crew_lifecycle_manager,
     shutdown_crew_lifecycle_manager,
 )
+from kickai.core.config import get_settings
+from kickai.core.monitoring import start_metrics_server, stop_metrics_server
+from kickai.core.team_config_cache import TeamConfigDiff, get_team_config_cache
 from kickai.features.communication.infrastructure import TelegramBotService
 
 
@@ -36,6 +39,7 @@ class MultiBotManager:
 
             # Initialize the crew lifecycle manager
             await initialize_crew_lifecycle_manager()
+            start_metrics_server()
 
             # Load bot configurations
             await self.load_bot_configurations()
@@ -103,6 +107,8 @@ class MultiBotManager:
 
         # Initialize the crew lifecycle manager
         await initialize_crew_lifecycle_manager()
+        # Serve runtime metrics (no-op unless METRICS_PORT is set)
+        start_metrics_server()
 
         if not self.bot_configs:
             logger.info("🔍 Loading bot configurations...")
@@ -110,103 +116,170 @@ class MultiBotManager:
         logger.info("🚀 Starting all bots...")
 
         for team in self.bot_configs:
-            team_id = getattr(team, "team_id", None) or getattr(team, "id", None)
-            settings = getattr(team, "settings", {})
-
-            # Read bot configuration ONLY from team explicit fields (single source of truth)
-            bot_token = getattr(team, "bot_token", None)
-            main_chat_id = getattr(team, "main_chat_id", None)
-            leadership_chat_id = getattr(team, "leadership_chat_id", None)
-
-            # Log the configuration being used
-            logger.info(f"🔧 Bot configuration for team: {team_id}")
-            logger.info(f"  - bot_token: {bot_token[:10]}..." if bot_token else "None")
-            logger.info(f"  - main_chat_id: {main_chat_id}")
-            logger.info(f"  - leadership_chat_id: {leadership_chat_id}")
-            logger.info("  - source: team_explicit_fields_from_firestore")
+            await self.start_team_bot(team)
 
-            name = getattr(team, "name", team_id)
+        self._running = True
+        logger.info(f"🎉 Started {len(self.bots)} bots successfully")
+        logger.info(f"🤖 CrewAI agents initialized for {len(self.crewai_systems)} teams")
 
-            # Check if team has complete bot configuration
-            if not bot_token or not main_chat_id or not leadership_chat_id:
-                logger.warning(f"⚠️ Skipping team {name} ({team_id}) - incomplete bot configuration")
-                logger.warning(f"  - bot_token: {'✓' if bot_token else '✗'}")
-                logger.warning(f"  - main_chat_id: {'✓' if main_chat_id else '✗'}")
-                logger.warning(f"  - leadership_chat_id: {'✓' if leadership_chat_id else '✗'}")
-                continue
+        self._enable_config_hot_reload()
+
+    def _enable_config_hot_reload(self) -> None:
+        """Follow team config changes, restarting only the affected teams."""
+        cache = get_team_config_cache()
+        if not cache.is_initialized():
+            logger.info("ℹ️ Team config cache not initialized - config hot reload disabled")
+            return
+
+        cache.subscribe(self.apply_team_config_diff)
+        interval = get_settings().team_config_refresh_interval_seconds
+        if interval > 0:
+            cache.start_auto_refresh(interval)
+
+    async def apply_team_config_diff(self, diff: TeamConfigDiff) -> None:
+        """
+        Apply a team config cache change to the running bots.
+
+        Removed teams are stopped, added teams are started, and changed teams
+        are restarted only when a bot or crew setting changed. Other teams keep
+        running untouched.
+        """
+        cache = get_team_config_cache()
+
+        for team_id in diff.removed:
+            logger.info(f"➖ Team {team_id} removed - stopping its bot")
+            await self.stop_team_bot(team_id)
+
+        for team_id, fields in diff.changed.items():
+            if diff.needs_restart(team_id):
+                logger.info(f"🔁 Team {team_id} config changed ({', '.join(fields)}) - restarting its bot")
+                await self.stop_team_bot(team_id)
+                await self.start_team_bot(cache.get_team(team_id))
+
+        for team_id in diff.added:
+            logger.info(f"➕ Team {team_id} added - starting its bot")
+            await self.start_team_bot(cache.get_team(team_id))
+
+        self.bot_configs = [
+            team
+            for team in (cache.get_team(team_id) for team_id in cache.get_all_team_ids())
+            if team is not None and getattr(team, "bot_token", None)
+        ]
+        logger.info(f"✅ Applied team config v{diff.version}: {len(self.bots)} bots running")
+
+    async def stop_team_bot(self, team_id: str) -> None:
+        """Stop one team's Telegram bot and discard its crew."""
+        bot = self.bots.pop(team_id, None)
+        if bot is not None:
+            try:
+                await bot.stop()
+                logger.info(f"✅ Bot stopped for team: {team_id}")
+            except Exception as e:
+                logger.error(f"❌ Error stopping bot for team {team_id}: {e}")
+
+        self.crewai_systems.pop(team_id, None)
+        await self.crew_lifecycle_manager.shutdown_crew(team_id)
+
+    async def start_team_bot(self, team: Any) -> bool:
+        """Start the CrewAI system and Telegram bot for one team; returns True if started."""
+        team_id = getattr(team, "team_id", None) or getattr(team, "id", None)
+        settings = getattr(team, "settings", {})
+
+        # Read bot configuration ONLY from team explicit fields (single source of truth)
+        bot_token = getattr(team, "bot_token", None)
+        main_chat_id = getattr(team, "main_chat_id", None)
+        leadership_chat_id = getattr(team, "leadership_chat_id", None)
+
+        # Log the configuration being used
+        logger.info(f"🔧 Bot configuration for team: {team_id}")
+        logger.info(f"  - bot_token: {bot_token[:10]}..." if bot_token else "None")
+        logger.info(f"  - main_chat_id: {main_chat_id}")
+        logger.info(f"  - leadership_chat_id: {leadership_chat_id}")
+        logger.info("  - source: team_explicit_fields_from_firestore")
+
+        name = getattr(team, "name", team_id)
+
+        # Check if team has complete bot configuration
+        if not bot_token or not main_chat_id or not leadership_chat_id:
+            logger.warning(f"⚠️ Skipping team {name} ({team_id}) - incomplete bot configuration")
+            logger.warning(f"  - bot_token: {'✓' if bot_token else '✗'}")
+            logger.warning(f"  - main_chat_id: {'✓' if main_chat_id else '✗'}")
+            logger.warning(f"  - leadership_chat_id: {'✓' if leadership_chat_id else '✗'}")
+            return False
+
+        # Team has complete bot configuration, proceed with bot creation
+        try:
+            # Initialize CrewAI agents first
+            logger.info(f"🤖 Starting CrewAI agents for team: {name}")
+            crewai_system = await self.initialize_crewai_agents(team_id, team)
+            self.crewai_systems[team_id] = crewai_system
+
+            # Then initialize Telegram bot service
+            bot_service = TelegramBotService(
+                token=bot_token,
+                main_chat_id=main_chat_id,
+                leadership_chat_id=leadership_chat_id,
+                team_id=team_id,
+                crewai_system=crewai_system,  # Pass the CrewAI system
+            )
+            self.bots[team_id] = bot_service
 
-            # Team has complete bot configuration, proceed with bot creation
+            # Update InviteLinkService with bot token
             try:
-                # Initialize CrewAI agents first
-                logger.info(f"🤖 Starting CrewAI agents for team: {name}")
-                crewai_system = await self.initialize_crewai_agents(team_id, team)
-                self.crewai_systems[team_id] = crewai_system
-
-                # Then initialize Telegram bot service
-                bot_service = TelegramBotService(
-                    token=bot_token,
-                    main_chat_id=main_chat_id,
-                    leadership_chat_id=leadership_chat_id,
-                    team_id=team_id,
-                    crewai_system=crewai_system,  # Pass the CrewAI system
+                from kickai.core.dependency_container import get_service
+                from kickai.features.communication.domain.services.invite_link_service import (
+                    InviteLinkService,
                 )
-                self.bots[team_id] = bot_service
 
-                # Update InviteLinkService with bot token
-                try:
-                    from kickai.core.dependency_container import get_service
-                    from kickai.features.communication.domain.services.invite_link_service import (
-                        InviteLinkService,
-                    )
-
-                    invite_service = get_service(InviteLinkService)
-                    if invite_service:
-                        invite_service.set_bot_token(bot_token)
-                        logger.info(
-                            f"✅ Updated InviteLinkService with bot token for team: {team_id}"
-                        )
-                except Exception as e:
-                    logger.warning(
-                        f"⚠️ Failed to update InviteLinkService with bot token for team {team_id}: {e}"
+                invite_service = get_service(InviteLinkService)
+                if invite_service:
+                    invite_service.set_bot_token(bot_token)
+                    logger.info(
+                        f"✅ Updated InviteLinkService with bot token for team: {team_id}"
                     )
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ Failed to update InviteLinkService with bot token for team {team_id}: {e}"
+                )
 
-                # Update CommunicationService with TelegramBotService
-                try:
-                    from kickai.features.communication.domain.services.communication_service import (
-                        CommunicationService,
-                    )
+            # Update CommunicationService with TelegramBotService
+            try:
+                from kickai.features.communication.domain.services.communication_service import (
+                    CommunicationService,
+                )
 
-                    communication_service = get_service(CommunicationService)
-                    if communication_service:
-                        communication_service.set_telegram_bot_service(bot_service)
-                        logger.info(
-                            f"✅ Updated CommunicationService with TelegramBotService for team: {team_id}"
-                        )
-                except Exception as e:
-                    logger.warning(
-                        f"⚠️ Failed to update CommunicationService with TelegramBotService for team {team_id}: {e}"
+                communication_service = get_service(CommunicationService)
+                if communication_service:
+                    communication_service.set_telegram_bot_service(bot_service)
+                    logger.info(
+                        f"✅ Updated CommunicationService with TelegramBotService for team: {team_id}"
                     )
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ Failed to update CommunicationService with TelegramBotService for team {team_id}: {e}"
+                )
 
-                # Start the bot polling
-                logger.info(f"🚀 Starting Telegram bot polling for team: {name}")
-                await bot_service.start_polling()
-
-                logger.info(f"✅ Created TelegramBotService for team: {name}")
-                logger.info(f"✅ CrewAI system ready for team: {name}")
-                logger.info(f"✅ Telegram bot polling started for team: {name}")
+            # Start the bot polling
+            logger.info(f"🚀 Starting Telegram bot polling for team: {name}")
+            await bot_service.start_polling()
 
-            except Exception as e:
-                logger.error(f"❌ Failed to start bot for team {name}: {e}")
-                continue
+            logger.info(f"✅ Created TelegramBotService for team: {name}")
+            logger.info(f"✅ CrewAI system ready for team: {name}")
+            logger.info(f"✅ Telegram bot polling started for team: {name}")
+            return True
 
-        self._running = True
-        logger.info(f"🎉 Started {len(self.bots)} bots successfully")
-        logger.info(f"🤖 CrewAI agents initialized for {len(self.crewai_systems)} teams")
+        except Exception as e:
+            logger.error(f"❌ Failed to start bot for team {name}: {e}")
+            return False
 
     async def stop_all_bots(self) -> None:
         """Stop all running bots."""
         self.logger.info("🛑 Stopping all bots...")
 
+        cache = get_team_config_cache()
+        cache.unsubscribe(self.apply_team_config_diff)
+        await cache.stop_auto_refresh()
+
         # Stop CrewAI systems
         for team_id, crewai_system in self.crewai_systems.items():
             try:
@@ -230,6 +303,12 @@ class MultiBotManager:
 
         # Shutdown the crew lifecycle manager
         await shutdown_crew_lifecycle_manager()
+        stop_metrics_server()
+
+        # Write any buffered conversation summaries
+        from kickai.agents.utils.memory_manager import shutdown_conversation_persistence
+
+        await shutdown_conversation_persistence()
 
         self.logger.info("🎉 All bots and CrewAI systems stopped successfully")
 
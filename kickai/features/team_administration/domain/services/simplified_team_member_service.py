@@ -113,51 +113,14 @@ class SimplifiedTeamMemberService:
         return success, message
 
     async def get_team_member_by_phone(self, phone: str, team_id: str) -> Optional[TeamMember]:
-        """Get team member by phone number using phonenumbers library for flexible matching."""
+        """Get team member by phone number in any format via the indexed E.164 field."""
         try:
-            # Use phonenumbers library for proper phone matching
-            from kickai.utils.phone_utils import get_phone_variants, normalize_phone
-
-            # Normalize the search phone number
-            normalized_search_phone = normalize_phone(phone)
-            if not normalized_search_phone:
-                logger.warning(f"Could not normalize phone number: {phone}")
-                return None
-
-            # Get all possible variants of the search phone number
-            search_variants = get_phone_variants(phone)
-
-            members = await self.team_member_repository.get_team_members(team_id)
-
-            for member in members:
-                if not member.phone_number:
-                    continue
-
-                # Normalize the member's phone number
-                normalized_member_phone = normalize_phone(member.phone_number)
-                if not normalized_member_phone:
-                    continue
-
-                # Check for exact match with normalized numbers
-                if normalized_member_phone == normalized_search_phone:
-                    logger.info(
-                        f"Found team member by phone: {member.name} ({normalized_member_phone})"
-                    )
-                    return member
-
-                # Check for match with any variant
-                member_variants = get_phone_variants(member.phone_number)
-                for search_variant in search_variants:
-                    if search_variant in member_variants:
-                        logger.info(
-                            f"Found team member by phone variant: {member.name} ({normalized_member_phone})"
-                        )
-                        return member
-
-            logger.info(
-                f"No team member found for phone: {phone} (normalized: {normalized_search_phone})"
-            )
-            return None
+            member = await self.team_member_repository.get_team_member_by_phone(phone, team_id)
+            if member:
+                logger.info(f"Found team member by phone: {member.name} ({member.phone_e164})")
+            else:
+                logger.info(f"No team member found for phone: {phone}")
+            return member
 
         except Exception as e:
             logger.error(f"Error getting team member by phone {phone}: {e}")
@@ -1,4 +1,4 @@
-from typing import Optional, Set, List
+from typing import AsyncIterator, Optional, Set, List
 #!/usr/bin/env python3
 """
 Team Member Service
@@ -12,7 +12,10 @@ from datetime import datetime
 
 from loguru import logger
 
+from kickai.features.shared.domain.pagination import DEFAULT_PAGE_SIZE, Page
+
 from ..entities.team_member import TeamMember
+from ..entities.team_role_summary import TeamRoleSummary
 from ..repositories.team_member_repository_interface import TeamMemberRepositoryInterface
 
 
@@ -23,18 +26,18 @@ class TeamMemberService:
         self.team_member_repository = team_member_repository
         self.logger = logger
 
-    async def create_team_member(self, team_member: TeamMember) -> str:
-        """Create a new team member."""
+    async def create_team_member(self, team_member: TeamMember, admin_if_first: bool = False) -> str:
+        """Create a new team member; with ``admin_if_first`` the team's first member becomes admin."""
         try:
-            # Validate team member data
-            self._validate_team_member(team_member)
-
+            # TeamMember validates itself on construction
             # Set timestamps
             team_member.created_at = datetime.utcnow()
             team_member.updated_at = datetime.utcnow()
 
             # Save to repository
-            created_member = await self.team_member_repository.create_team_member(team_member)
+            created_member = await self.team_member_repository.create_team_member(
+                team_member, admin_if_first=admin_if_first
+            )
             member_id = created_member.member_id
             self.logger.info(f"✅ Created team member: {team_member.name} ({member_id})")
             return member_id
@@ -59,7 +62,7 @@ class TeamMemberService:
     async def get_team_member_by_telegram_id(self, telegram_id: int, team_id: str) -> Optional[TeamMember]:
         """Get a team member by Telegram ID and team."""
         try:
-            return await self.team_member_repository.get_team_member_by_telegram_id(team_id, telegram_id)
+            return await self.team_member_repository.get_team_member_by_telegram_id(telegram_id, team_id)
         except Exception as e:
             self.logger.error(f"❌ Failed to get team member by Telegram ID {telegram_id}: {e}")
             return None
@@ -86,6 +89,22 @@ class TeamMemberService:
         """Get all team members for a team (alias for get_team_members_by_team)."""
         return await self.get_team_members_by_team(team_id)
 
+    async def get_team_members_page(
+        self, team_id: str, page_size: int = DEFAULT_PAGE_SIZE, cursor: Optional[tuple] = None
+    ) -> Page[TeamMember]:
+        """Get one page of a team's members; pass ``next_cursor`` back to continue."""
+        return await self.team_member_repository.list_team_members_page(team_id, page_size, cursor)
+
+    def iter_team_members(
+        self, team_id: str, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[TeamMember]:
+        """Stream a team's members without loading them all at once."""
+        return self.team_member_repository.iter_team_members(team_id, page_size)
+
+    async def get_role_summary(self, team_id: str) -> TeamRoleSummary:
+        """Get the team's role summary: admin count, first member and members by join date."""
+        return await self.team_member_repository.get_role_summary(team_id)
+
     async def get_team_members_by_role(self, team_id: str, role: str) -> List[TeamMember]:
         """Get team members by specific role."""
         try:
@@ -108,10 +127,10 @@ class TeamMemberService:
             self.logger.error(f"❌ Failed to update team member: {e}")
             return False
 
-    async def delete_team_member(self, member_id: str) -> bool:
+    async def delete_team_member(self, member_id: str, team_id: str = "") -> bool:
         """Delete a team member."""
         try:
-            success = await self.team_member_repository.delete_team_member(member_id, "")  # team_id will be inferred from member_id
+            success = await self.team_member_repository.delete_team_member(member_id, team_id)
             if success:
                 self.logger.info(f"✅ Deleted team member: {member_id}")
             return success
@@ -166,8 +166,8 @@ class TeamService:
         # Get team member first
         team_members = await self.get_team_members(team_id)
         for member in team_members:
-            if member.user_id == user_id:
-                return await self.team_repository.delete_team_member(member.user_id)
+            if str(member.telegram_id) == str(user_id):
+                return await self.team_repository.delete_team_member(member.member_id, team_id)
         return False
 
     async def get_team_members(self, team_id: str) -> List[TeamMember]:
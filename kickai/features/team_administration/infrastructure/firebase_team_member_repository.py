@@ -6,14 +6,22 @@ This module provides the Firebase implementation of the team member repository i
 """
 
 import logging
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 
-from kickai.core.firestore_constants import get_team_members_collection
+from kickai.core.firestore_constants import (
+    COLLECTION_TEAM_ROLE_SUMMARIES,
+    get_collection_name,
+    get_team_members_collection,
+)
 from kickai.database.interfaces import DataStoreInterface
+from kickai.database.query_spec import QuerySpec
+from kickai.features.shared.domain.pagination import DEFAULT_PAGE_SIZE, Page
 from kickai.features.team_administration.domain.entities.team_member import TeamMember
+from kickai.features.team_administration.domain.entities.team_role_summary import TeamRoleSummary
 from kickai.features.team_administration.domain.repositories.team_member_repository_interface import (
     TeamMemberRepositoryInterface,
 )
+from kickai.utils.phone_validation import legacy_phone_forms, to_e164
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +31,17 @@ class FirebaseTeamMemberRepository(TeamMemberRepositoryInterface):
 
     def __init__(self, database: DataStoreInterface):
         self.database = database
+        self.role_summaries_collection = get_collection_name(COLLECTION_TEAM_ROLE_SUMMARIES)
+        # Teams whose role summary is known to exist, so writes skip the existence check
+        self._summarised_teams = set()
+
+    async def create_team_member(self, team_member: TeamMember, admin_if_first: bool = False) -> TeamMember:
+        """
+        Create a new team member, updating the team's role summary in the same transaction.
 
-    async def create_team_member(self, team_member: TeamMember) -> TeamMember:
-        """Create a new team member."""
+        With ``admin_if_first`` the member is made admin if, at commit time, the
+        team has no other members; ``team_member.is_admin`` reflects the outcome.
+        """
         try:
             # Generate document ID from member_id
             document_id = team_member.member_id or f"member_{team_member.telegram_id}"
@@ -35,10 +51,16 @@ class FirebaseTeamMemberRepository(TeamMemberRepositoryInterface):
             
             # Use team-specific collection naming
             collection_name = get_team_members_collection(team_member.team_id)
-            
-            await self.database.create_document(
-                collection=collection_name, document_id=document_id, data=member_data
-            )
+
+            def build_operations(summary: TeamRoleSummary) -> list:
+                data = dict(member_data)
+                if admin_if_first and summary.member_count == 0:
+                    data["is_admin"] = True
+                summary.upsert(document_id, data)
+                return [{"type": "create", "collection": collection_name, "document_id": document_id, "data": data}]
+
+            operations = await self._write_with_role_summary(team_member.team_id, build_operations)
+            team_member.is_admin = operations[0]["data"]["is_admin"]
             
             logger.info(f"Successfully created team member {document_id} in team {team_member.team_id}")
             return team_member
@@ -47,23 +69,76 @@ class FirebaseTeamMemberRepository(TeamMemberRepositoryInterface):
             logger.error(f"Failed to create team member in team {team_member.team_id}: {e}")
             raise
 
-    def _prepare_team_member_data(self, team_member: TeamMember) -> dict:
-        """Prepare team member data for database operations."""
+    async def get_role_summary(self, team_id: str) -> TeamRoleSummary:
+        """Get the team's role summary (one document read; built from the roster the first time)."""
+        doc = await self.database.get_document(
+            collection=self.role_summaries_collection, document_id=team_id
+        )
+        if doc is None:
+            return await self.rebuild_role_summary(team_id)
+        self._summarised_teams.add(team_id)
+        return TeamRoleSummary.from_dict(doc, team_id)
+
+    async def rebuild_role_summary(self, team_id: str, force: bool = False) -> TeamRoleSummary:
+        """
+        Build the role summary from the full roster.
+
+        Only needed once for teams created before summaries existed (or with
+        ``force`` to repair one); an existing summary is otherwise kept.
+        """
+        docs = await self.database.query_documents(
+            collection=get_team_members_collection(team_id),
+            filters=[{"field": "team_id", "operator": "==", "value": team_id}],
+        )
+        summary = TeamRoleSummary(team_id=team_id)
+        for doc in docs:
+            summary.upsert(doc["id"], doc)
+
+        def build_operations(documents: list) -> list:
+            if documents[0] is not None and not force:
+                return []
+            return [self._role_summary_operation(summary)]
+
+        operations = await self.database.transact(
+            [(self.role_summaries_collection, team_id)], build_operations
+        )
+        self._summarised_teams.add(team_id)
+        if not operations:
+            return await self.get_role_summary(team_id)
+        logger.info(f"Built role summary for team {team_id} from {summary.member_count} members")
+        return summary
+
+    async def _write_with_role_summary(self, team_id: str, build_member_operations) -> list:
+        """
+        Commit member operations and the updated role summary in one transaction.
+
+        ``build_member_operations`` gets the current summary, updates it in place
+        and returns the member operations; it may run more than once on contention.
+        """
+        if team_id not in self._summarised_teams:
+            await self.get_role_summary(team_id)
+
+        def build_operations(documents: list) -> list:
+            summary = TeamRoleSummary.from_dict(documents[0], team_id)
+            member_operations = build_member_operations(summary)
+            return member_operations + [self._role_summary_operation(summary)]
+
+        return await self.database.transact(
+            [(self.role_summaries_collection, team_id)], build_operations
+        )
+
+    def _role_summary_operation(self, summary: TeamRoleSummary) -> dict:
         return {
-            "team_id": team_member.team_id,
-            "telegram_id": team_member.telegram_id,
-            "member_id": team_member.member_id,
-            "name": team_member.name,
-            "username": team_member.username,
-            "phone_number": team_member.phone_number,
-            "email": getattr(team_member, 'email', None),
-            "role": getattr(team_member, 'role', 'Member'),
-            "status": team_member.status.value if hasattr(team_member.status, 'value') else str(team_member.status),
-            "is_admin": getattr(team_member, 'is_admin', False),
-            "created_at": team_member.created_at.isoformat() if team_member.created_at else None,
-            "updated_at": team_member.updated_at.isoformat() if team_member.updated_at else None,
+            "type": "set",
+            "collection": self.role_summaries_collection,
+            "document_id": summary.team_id,
+            "data": summary.to_dict(),
         }
 
+    def _prepare_team_member_data(self, team_member: TeamMember) -> dict:
+        """Prepare team member data for database operations (every stored field)."""
+        return team_member.to_dict()
+
     async def get_team_member_by_id(self, member_id: str, team_id: str) -> Optional[TeamMember]:
         """Get a team member by ID."""
         try:
@@ -103,17 +178,30 @@ class FirebaseTeamMemberRepository(TeamMemberRepositoryInterface):
             return None
 
     async def get_team_member_by_phone(self, phone_number: str, team_id: str) -> Optional[TeamMember]:
-        """Get a team member by phone number."""
+        """Get a team member by phone number (any format), matched on the canonical E.164 field."""
         try:
+            phone_e164 = to_e164(phone_number)
+            if not phone_e164:
+                return None
+
             collection_name = get_team_members_collection(team_id)
             
-            docs = await self.database.query_documents(
-                collection=collection_name,
-                filters=[
-                    {"field": "phone_number", "operator": "==", "value": phone_number},
-                    {"field": "team_id", "operator": "==", "value": team_id},
-                ],
+            docs = await self.database.run_query(
+                collection_name,
+                QuerySpec()
+                .where("phone_e164", "==", phone_e164)
+                .where("team_id", "==", team_id)
+                .take(1),
             )
+            if not docs:
+                # Not yet backfilled: match the stored phone_number in any format
+                docs = await self.database.run_query(
+                    collection_name,
+                    QuerySpec()
+                    .where("phone_number", "in", legacy_phone_forms(phone_number))
+                    .where("team_id", "==", team_id)
+                    .take(1),
+                )
             
             if docs:
                 return self._doc_to_team_member(docs[0])
@@ -139,6 +227,29 @@ class FirebaseTeamMemberRepository(TeamMemberRepositoryInterface):
             logger.error(f"Failed to get team members for team {team_id}: {e}")
             return []
 
+    async def list_team_members_page(
+        self, team_id: str, page_size: int = DEFAULT_PAGE_SIZE, cursor: Optional[tuple] = None
+    ) -> Page[TeamMember]:
+        """Get one page of a team's members; pass ``next_cursor`` back to continue."""
+        collection_name = get_team_members_collection(team_id)
+        page = await self.database.query_page(
+            collection_name, QuerySpec().where("team_id", "==", team_id), page_size, cursor
+        )
+        return Page(
+            items=[self._doc_to_team_member(doc) for doc in page.items],
+            next_cursor=page.next_cursor,
+        )
+
+    async def iter_team_members(
+        self, team_id: str, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[TeamMember]:
+        """Stream a team's members page by page."""
+        collection_name = get_team_members_collection(team_id)
+        async for doc in self.database.iter_documents(
+            collection_name, QuerySpec().where("team_id", "==", team_id), page_size
+        ):
+            yield self._doc_to_team_member(doc)
+
     async def get_team_members_by_status(self, team_id: str, status: str) -> List[TeamMember]:
         """Get team members by status."""
         try:
@@ -164,10 +275,12 @@ class FirebaseTeamMemberRepository(TeamMemberRepositoryInterface):
             document_id = team_member.member_id or f"member_{team_member.telegram_id}"
             member_data = self._prepare_team_member_data(team_member)
             collection_name = get_team_members_collection(team_member.team_id)
-            
-            await self.database.update_document(
-                collection=collection_name, document_id=document_id, data=member_data
-            )
+
+            def build_operations(summary: TeamRoleSummary) -> list:
+                summary.upsert(document_id, member_data)
+                return [{"type": "update", "collection": collection_name, "document_id": document_id, "data": member_data}]
+
+            await self._write_with_role_summary(team_member.team_id, build_operations)
             
             logger.info(f"Successfully updated team member {document_id} in team {team_member.team_id}")
             return team_member
@@ -186,7 +299,12 @@ class FirebaseTeamMemberRepository(TeamMemberRepositoryInterface):
                 return False
 
             collection_name = get_team_members_collection(team_id)
-            await self.database.delete_document(collection=collection_name, document_id=member_id)
+
+            def build_operations(summary: TeamRoleSummary) -> list:
+                summary.remove(member_id)
+                return [{"type": "delete", "collection": collection_name, "document_id": member_id}]
+
+            await self._write_with_role_summary(team_id, build_operations)
             
             logger.info(f"Successfully deleted team member {member_id} from team {team_id}")
             return True
@@ -6,7 +6,7 @@ This module provides the Firebase implementation of the team repository interfac
 """
 
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import AsyncIterator, List, Optional, Union
 
 from loguru import logger
 
@@ -15,11 +15,16 @@ from kickai.core.firestore_constants import (
     get_team_members_collection,
 )
 from kickai.database.interfaces import DataStoreInterface
+from kickai.features.shared.domain.pagination import DEFAULT_PAGE_SIZE
 from kickai.features.team_administration.domain.entities.team import Team
 from kickai.features.team_administration.domain.entities.team_member import TeamMember
 from kickai.features.team_administration.domain.repositories.team_repository_interface import (
     TeamRepositoryInterface,
 )
+from kickai.features.team_administration.infrastructure.firebase_team_member_repository import (
+    FirebaseTeamMemberRepository,
+)
+from kickai.utils.phone_validation import legacy_phone_forms, to_e164
 
 
 class FirebaseTeamRepository(TeamRepositoryInterface):
@@ -28,6 +33,8 @@ class FirebaseTeamRepository(TeamRepositoryInterface):
     def __init__(self, database: DataStoreInterface):
         self.database = database
         self.collection_name = COLLECTION_TEAMS
+        # Member writes go through the member repository so the team's role summary stays in step
+        self._member_repository = FirebaseTeamMemberRepository(database)
 
     async def create_team(self, team: Team) -> Team:
         """Create a new team."""
@@ -90,6 +97,11 @@ class FirebaseTeamRepository(TeamRepositoryInterface):
         except Exception:
             return []
 
+    async def iter_teams(self, page_size: int = DEFAULT_PAGE_SIZE) -> AsyncIterator[Team]:
+        """Stream all teams page by page."""
+        async for doc in self.database.iter_documents(self.collection_name, page_size=page_size):
+            yield self._doc_to_team(doc)
+
     async def get_by_status(self, status: str) -> List[Team]:
         try:
             docs = await self.database.query_documents(
@@ -171,16 +183,8 @@ class FirebaseTeamRepository(TeamRepositoryInterface):
             existing_ids = {member.member_id for member in existing_members if member.member_id}
             team_member.member_id = generate_simple_team_member_id(team_member.name or f"User{team_member.telegram_id}", team_member.team_id, existing_ids)
 
-        team_member_data = team_member.to_dict()
-
-        # Create document in team_members collection using member_id as document ID
-        doc_id = await self.database.create_document(
-            collection=get_team_members_collection(team_member.team_id),
-            document_id=team_member.member_id,
-            data=team_member_data,
-        )
-
-        return team_member
+        # Document ID is the member_id; the role summary is updated in the same transaction
+        return await self._member_repository.create_team_member(team_member)
 
     async def get_team_members(self, team_id: str) -> List[TeamMember]:
         """Get all members of a team."""
@@ -230,15 +234,31 @@ class FirebaseTeamRepository(TeamRepositoryInterface):
     async def get_team_member_by_phone(
         self, phone: str, team_id: str
     ) -> Optional[TeamMember]:
-        """Get a team member by phone number."""
+        """Get a team member by phone number (any format), matched on the canonical E.164 field."""
         try:
+            phone_e164 = to_e164(phone)
+            if not phone_e164:
+                return None
+
+            collection_name = get_team_members_collection(team_id)
             docs = await self.database.query_documents(
-                collection=get_team_members_collection(team_id),
+                collection=collection_name,
                 filters=[
                     {"field": "team_id", "operator": "==", "value": team_id},
-                    {"field": "phone_number", "operator": "==", "value": phone},
+                    {"field": "phone_e164", "operator": "==", "value": phone_e164},
                 ],
+                limit=1,
             )
+            if not docs:
+                # Not yet backfilled: match the stored phone_number in any format
+                docs = await self.database.query_documents(
+                    collection=collection_name,
+                    filters=[
+                        {"field": "team_id", "operator": "==", "value": team_id},
+                        {"field": "phone_number", "operator": "in", "value": legacy_phone_forms(phone)},
+                    ],
+                    limit=1,
+                )
 
             if docs:
                 return self._doc_to_team_member(docs[0])
@@ -307,29 +327,14 @@ class FirebaseTeamRepository(TeamRepositoryInterface):
             return []
 
     async def update_team_member(self, team_member: TeamMember) -> TeamMember:
-        """Update a team member."""
-        team_member_data = team_member.to_dict()
-
-        await self.database.update_document(
-            collection=get_team_members_collection(team_member.team_id),
-            document_id=team_member.member_id,
-            data=team_member_data,
-        )
-
-        return team_member
-
-    async def delete_team_member(self, team_member_id: str) -> bool:
-        """Delete a team member."""
-        try:
-            await self.database.delete_document(
-                collection=get_team_members_collection(team_member_id.split("_")[0]),
-                document_id=team_member_id,
-            )
-
-            return True
-        except Exception as e:
-            logger.error(f"❌ [REPO] Error deleting team member: {e}")
-            return False
+        """Update a team member (and the team's role summary, in one transaction)."""
+        return await self._member_repository.update_team_member(team_member)
+
+    async def delete_team_member(self, team_member_id: str, team_id: Optional[str] = None) -> bool:
+        """Delete a team member (and remove it from the team's role summary, in one transaction)."""
+        # Callers that pass only the ID fall back to deriving the team from its prefix, as before
+        team_id = team_id or team_member_id.split("_")[0]
+        return await self._member_repository.delete_team_member(team_member_id, team_id)
 
     def _doc_to_team(self, doc: dict) -> Team:
         """Convert a Firestore document to a Team entity."""
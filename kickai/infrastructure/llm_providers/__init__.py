@@ -18,6 +18,7 @@ from .factory import (
     create_llm_provider_from_settings,
     get_provider_health_status,
 )
+from .router import LLMEndpoint, LLMRouter, LLMRouterError, RoutedLLM
 
 __all__ = [
     "LLMProviderFactory",
@@ -30,4 +31,8 @@ __all__ = [
     "create_llm_provider",
     "create_llm_provider_from_settings",
     "get_provider_health_status",
+    "LLMEndpoint",
+    "LLMRouter",
+    "LLMRouterError",
+    "RoutedLLM",
 ]
@@ -23,6 +23,10 @@ class LLMConfig:
     api_key: Optional[str] = None
     temperature: float = 0.7
     timeout: int = 30
+    timeout_seconds: Optional[int] = None
+    max_retries: int = 3
+    api_base: Optional[str] = None
+    additional_params: Optional[Dict[str, Any]] = None
 
 class LLMFactory:
     """Legacy LLM factory for compatibility."""
@@ -227,21 +231,23 @@ class MockProvider(BaseLLMProvider):
         pass
 
     def create_llm(self) -> Any:
-        """Create mock LLM instance."""
+        """
+        Create mock LLM instance.
+
+        Returns a ``MockLLM`` with deterministic token counts. ``additional_params``
+        may set ``mock_response``, ``agent_name``, ``accountant`` and ``downgrade_llm``.
+        """
         try:
-            # Convert to LLMConfig format for compatibility
-            llm_config = LLMConfig(
-                provider=self.config.provider,
-                model_name=self.config.model_name,
+            from kickai.infrastructure.llm_providers.mock_llm import MockLLM
+
+            return MockLLM(
+                model=self.config.model_name,
                 api_key="mock-key",
                 temperature=self.config.temperature,
-                timeout_seconds=self.config.timeout_seconds,
-                max_retries=self.config.max_retries,
-                additional_params=self.config.additional_params,
+                timeout=self.config.timeout_seconds,
+                **(self.config.additional_params or {}),
             )
 
-            return LLMFactory.create_llm(llm_config)
-
         except Exception as e:
             logger.error(f"Failed to create Mock LLM: {e}")
             raise LLMProviderError(f"Mock LLM creation failed: {e}")
@@ -266,6 +272,9 @@ class LLMProviderFactory:
         AIProvider.MOCK: MockProvider,
     }
 
+    # Health (latency stats + circuit breaker) per routed endpoint name
+    _endpoint_health: Dict[str, Any] = {}
+
     @classmethod
     def register_provider(cls, provider: AIProvider, provider_class: type[BaseLLMProvider]) -> None:
         """Register a new LLM provider."""
@@ -431,6 +440,51 @@ class LLMProviderFactory:
 
         return health_status
 
+    @classmethod
+    def get_endpoint_health(
+        cls, name: str, failure_threshold: int = 3, reset_seconds: int = 60
+    ) -> Any:
+        """Shared EndpointHealth for a routed endpoint, created on first use."""
+        from kickai.core.service_discovery.registry import CircuitBreaker
+        from kickai.infrastructure.llm_providers.router import EndpointHealth
+
+        if name not in cls._endpoint_health:
+            cls._endpoint_health[name] = EndpointHealth(
+                name=name, breaker=CircuitBreaker(failure_threshold, reset_seconds)
+            )
+        return cls._endpoint_health[name]
+
+    @classmethod
+    def create_endpoint(
+        cls, name: str, llm: Any, failure_threshold: int = 3, reset_seconds: int = 60
+    ) -> Any:
+        """
+        Wrap an LLM as a routable endpoint.
+
+        Args:
+            name: Endpoint name, e.g. "groq/llama3-8b-8192"; endpoints with the
+                same name share latency statistics and circuit breaker
+            llm: Object with ``call(messages, **kwargs)`` (a CrewAI LLM or a stub)
+        """
+        from kickai.infrastructure.llm_providers.router import LLMEndpoint
+
+        return LLMEndpoint(
+            name=name, llm=llm, health=cls.get_endpoint_health(name, failure_threshold, reset_seconds)
+        )
+
+    @classmethod
+    def create_router(cls, endpoints: List[Any], hedge: bool = False) -> Any:
+        """Create an LLMRouter over endpoints in preference order."""
+        from kickai.infrastructure.llm_providers.router import LLMRouter
+
+        logger.info(f"Creating LLM router: {[endpoint.name for endpoint in endpoints]}, hedge={hedge}")
+        return LLMRouter(endpoints, hedge=hedge)
+
+    @classmethod
+    def get_endpoint_health_status(cls) -> Dict[str, Dict[str, Any]]:
+        """Latency, error rate and breaker state of every routed endpoint."""
+        return {name: health.to_dict() for name, health in cls._endpoint_health.items()}
+
 
 # Convenience functions for easy access
 def create_llm_provider(config: ProviderConfig) -> BaseLLMProvider:
@@ -0,0 +1,38 @@
+"""
+Mock LLM
+
+Offline CrewAI LLM for tests and local runs: it returns a canned response
+without any network call and counts tokens with the character estimate
+(``len(text) // CHARS_PER_TOKEN``), so token usage and cost are deterministic.
+Token accounting and team budgets apply as for any ``AccountedLLM``.
+"""
+
+from typing import Any, Tuple
+
+from kickai.core.token_accounting import CHARS_PER_TOKEN, AccountedLLM, _message_text
+
+# ReAct final-answer form, so a CrewAI agent finishes in one iteration
+DEFAULT_MOCK_RESPONSE = "Thought: I now know the final answer\nFinal Answer: Mock response"
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN
+
+
+class MockLLM(AccountedLLM):
+    """AccountedLLM whose completion is a fixed response."""
+
+    def __init__(self, *args: Any, mock_response: str = DEFAULT_MOCK_RESPONSE, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.mock_response = mock_response
+
+    def count_prompt_tokens(self, messages: Any) -> int:
+        if isinstance(messages, str):
+            return _estimate_tokens(messages)
+        return sum(_estimate_tokens(_message_text(message)) for message in messages)
+
+    def count_completion_tokens(self, response: Any) -> int:
+        return _estimate_tokens(response if isinstance(response, str) else str(response))
+
+    def _complete(self, messages: Any, *args: Any, **kwargs: Any) -> Tuple[Any, str]:
+        return self.mock_response, self.model
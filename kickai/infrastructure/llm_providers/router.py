@@ -0,0 +1,274 @@
+"""
+LLM Router
+
+Routes LLM calls across several provider endpoints (e.g. Groq primary, OpenAI
+and Ollama fallbacks) so one degraded provider does not stall every agent:
+
+- rolling latency and error statistics per provider/model endpoint
+- each call goes to the healthiest endpoint whose circuit breaker is closed,
+  failing over to the next on error
+- optional hedging: when a call runs past the endpoint's p95 latency a second
+  request is fired at the next endpoint and the first success wins
+
+Endpoints are anything with ``call(messages, **kwargs)`` (CrewAI ``LLM``
+instances in production, local stubs in tests). Health is shared per endpoint
+name, so every agent's LLM sees the same statistics and breaker state.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from kickai.agents.config.message_router_config import ADMISSION_MAX_CONCURRENT
+from kickai.core.service_discovery.registry import CircuitBreaker
+from kickai.core.token_accounting import AccountedLLM
+
+logger = logging.getLogger(__name__)
+
+# Rolling window of calls kept per endpoint
+STATS_WINDOW = 100
+
+# Calls needed before an endpoint's latency is trusted for ranking or hedging
+MIN_SAMPLES_FOR_RANKING = 5
+MIN_SAMPLES_FOR_HEDGING = 20
+
+# Each error counts as this many times the endpoint's median latency when ranking
+ERROR_RATE_PENALTY = 4.0
+
+DEFAULT_BREAKER_FAILURES = 3
+DEFAULT_BREAKER_RESET_SECONDS = 60
+
+# Threads running primary and hedge requests: every admitted request has at most
+# a primary and a hedge in flight, so a hedge is never queued behind other calls
+HEDGE_MAX_WORKERS = 2 * ADMISSION_MAX_CONCURRENT
+_hedge_executor = ThreadPoolExecutor(max_workers=HEDGE_MAX_WORKERS, thread_name_prefix="llm-hedge")
+
+
+class LLMRouterError(Exception):
+    """Every endpoint failed or was unavailable."""
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class EndpointStats:
+    """Rolling latency and error statistics for one endpoint."""
+
+    def __init__(self, window: int = STATS_WINDOW):
+        self._calls: Deque[Tuple[float, bool]] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.total_calls = 0
+        self.total_errors = 0
+
+    def record(self, latency_seconds: float, ok: bool) -> None:
+        with self._lock:
+            self._calls.append((latency_seconds, ok))
+            self.total_calls += 1
+            if not ok:
+                self.total_errors += 1
+
+    def _latencies(self) -> List[float]:
+        with self._lock:
+            return sorted(latency for latency, ok in self._calls if ok)
+
+    @property
+    def samples(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    @property
+    def error_rate(self) -> float:
+        with self._lock:
+            if not self._calls:
+                return 0.0
+            return sum(1 for _, ok in self._calls if not ok) / len(self._calls)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        latencies = self._latencies()
+        return _percentile(latencies, fraction) if latencies else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        p50 = self.percentile(0.5)
+        p95 = self.percentile(0.95)
+        return {
+            "samples": self.samples,
+            "total_calls": self.total_calls,
+            "total_errors": self.total_errors,
+            "error_rate": round(self.error_rate, 3),
+            "p50_seconds": round(p50, 3) if p50 is not None else None,
+            "p95_seconds": round(p95, 3) if p95 is not None else None,
+        }
+
+
+@dataclass
+class EndpointHealth:
+    """Statistics and circuit breaker shared by every LLM using one endpoint."""
+
+    name: str
+    stats: EndpointStats = field(default_factory=EndpointStats)
+    breaker: CircuitBreaker = field(
+        default_factory=lambda: CircuitBreaker(DEFAULT_BREAKER_FAILURES, DEFAULT_BREAKER_RESET_SECONDS)
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "breaker": self.breaker.state, **self.stats.to_dict()}
+
+
+@dataclass
+class LLMEndpoint:
+    """One provider/model an LLM call can be sent to."""
+
+    name: str
+    llm: Any
+    health: EndpointHealth
+
+    @property
+    def model(self) -> str:
+        """Model this endpoint serves, for attributing usage (the endpoint name for stubs)."""
+        return getattr(self.llm, "model", None) or self.name
+
+    def score(self) -> Optional[float]:
+        """Ranking score (lower is better), or None until enough calls are recorded."""
+        stats = self.health.stats
+        p50 = stats.percentile(0.5)
+        if stats.samples < MIN_SAMPLES_FOR_RANKING or p50 is None:
+            return None
+        return p50 * (1 + ERROR_RATE_PENALTY * stats.error_rate)
+
+    def call(self, messages: Any, *args: Any, **kwargs: Any) -> Any:
+        """Call the endpoint, recording latency, errors and breaker state."""
+        started = time.perf_counter()
+        try:
+            response = self.llm.call(messages, *args, **kwargs)
+        except Exception:
+            self.health.stats.record(time.perf_counter() - started, ok=False)
+            self.health.breaker.record_failure()
+            raise
+        self.health.stats.record(time.perf_counter() - started, ok=True)
+        self.health.breaker.record_success()
+        return response
+
+
+class LLMRouter:
+    """Routes calls to the healthiest endpoint, with failover and optional hedging."""
+
+    def __init__(self, endpoints: List[LLMEndpoint], hedge: bool = False):
+        if not endpoints:
+            raise ValueError("LLMRouter needs at least one endpoint")
+        self.endpoints = endpoints
+        self.hedge = hedge
+        self.hedged_calls = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+
+    def ranked_endpoints(self) -> List[LLMEndpoint]:
+        """
+        Endpoints whose breakers allow a call, healthiest first.
+
+        Endpoints without enough history rank level with the best measured
+        one, so configured order decides until latencies are known.
+        """
+        # Ranking must not move breakers to HALF_OPEN; only the call outcome changes their state
+        available = [
+            endpoint for endpoint in self.endpoints if endpoint.health.breaker.is_available()
+        ]
+        scores = {endpoint.name: endpoint.score() for endpoint in available}
+        known = [score for score in scores.values() if score is not None]
+        default = min(known) if known else 0.0
+        return sorted(
+            available,
+            key=lambda endpoint: default if scores[endpoint.name] is None else scores[endpoint.name],
+        )
+
+    def call(self, messages: Any, *args: Any, **kwargs: Any) -> Any:
+        """Send one call, failing over through the ranked endpoints."""
+        return self.call_with_endpoint(messages, *args, **kwargs)[0]
+
+    def call_with_endpoint(self, messages: Any, *args: Any, **kwargs: Any) -> Tuple[Any, LLMEndpoint]:
+        """Send one call like ``call``; also return the endpoint whose response was used."""
+        candidates = self.ranked_endpoints()
+        if not candidates:
+            raise LLMRouterError("All LLM endpoints have open circuit breakers")
+
+        errors = []
+        index = 0
+        while index < len(candidates):
+            primary = candidates[index]
+            backup = candidates[index + 1] if index + 1 < len(candidates) else None
+            try:
+                if self.hedge:
+                    return self._hedged_call(primary, backup, messages, args, kwargs)
+                return primary.call(messages, *args, **kwargs), primary
+            except Exception as e:
+                errors.append(f"{primary.name}: {e}")
+                logger.warning(f"LLM endpoint {primary.name} failed, failing over: {e}")
+                self.failovers += 1
+                index += 1
+
+        raise LLMRouterError(f"All LLM endpoints failed: {'; '.join(errors)}")
+
+    def _hedged_call(
+        self,
+        primary: LLMEndpoint,
+        backup: Optional[LLMEndpoint],
+        messages: Any,
+        args: tuple,
+        kwargs: dict,
+    ) -> Tuple[Any, LLMEndpoint]:
+        """Call ``primary``; past its p95 latency also call ``backup`` (or primary again)."""
+        stats = primary.health.stats
+        threshold = stats.percentile(0.95)
+        if threshold is None or stats.samples < MIN_SAMPLES_FOR_HEDGING:
+            return primary.call(messages, *args, **kwargs), primary
+
+        first = _hedge_executor.submit(primary.call, messages, *args, **kwargs)
+        done, _ = wait([first], timeout=threshold)
+        if done:
+            return first.result(), primary
+
+        hedge_endpoint = backup or primary
+        self.hedged_calls += 1
+        logger.info(f"LLM call on {primary.name} exceeded p95 {threshold:.2f}s, hedging to {hedge_endpoint.name}")
+        second = _hedge_executor.submit(hedge_endpoint.call, messages, *args, **kwargs)
+        endpoints = {first: primary, second: hedge_endpoint}
+
+        pending = {first, second}
+        last_error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    if future is second:
+                        self.hedge_wins += 1
+                    return future.result(), endpoints[future]
+                last_error = error
+        raise last_error
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "endpoints": [endpoint.health.to_dict() for endpoint in self.endpoints],
+            "hedge": self.hedge,
+            "hedged_calls": self.hedged_calls,
+            "hedge_wins": self.hedge_wins,
+            "failovers": self.failovers,
+        }
+
+
+class RoutedLLM(AccountedLLM):
+    """CrewAI LLM whose completions go through an ``LLMRouter`` (token accounting still applies)."""
+
+    def __init__(self, *args: Any, router: LLMRouter, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.router = router
+
+    def _complete(self, messages: Any, *args: Any, **kwargs: Any) -> Tuple[Any, str]:
+        # Usage is recorded against the endpoint that answered, not the configured primary
+        response, endpoint = self.router.call_with_endpoint(messages, *args, **kwargs)
+        return response, endpoint.model
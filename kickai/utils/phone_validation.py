@@ -8,6 +8,7 @@ using the phonenumbers library for robust international phone number handling.
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 try:
@@ -24,6 +25,11 @@ except ImportError:
 
 from loguru import logger
 
+# Distinct (phone, region) inputs kept by the canonicalisation/variant caches
+PHONE_PARSE_CACHE_SIZE = 4096
+# Firestore caps the values of an ``in`` filter
+LEGACY_PHONE_FORMS_LIMIT = 10
+
 
 @dataclass
 class PhoneValidationResult:
@@ -215,6 +221,39 @@ class PhoneValidator:
 
         return list(set(variants))  # Remove duplicates
 
+    def to_e164(self, phone: str, region: Optional[str] = None) -> Optional[str]:
+        """
+        Canonicalise a phone number to E.164 (e.g. "+447871521581").
+
+        This is the form stored in the indexed ``phone_e164`` field, so lookups
+        by phone are a single equality query.
+
+        Args:
+            phone: Phone number in any format
+            region: Region code for parsing
+
+        Returns:
+            E.164 string, or None if the number is not valid
+        """
+        if not phone or not phone.strip():
+            return None
+
+        if not PHONENUMBERS_AVAILABLE:
+            result = self._fallback_validation(self._clean_phone_number(phone))
+            if not result.is_valid:
+                return None
+            return "+" + re.sub(r"[^\d]", "", result.normalized_number)
+
+        try:
+            # phonenumbers resolves national formats ("07...") against the region itself
+            parsed_number = phonenumbers.parse(phone, region or self.default_region)
+        except NumberParseException:
+            return None
+
+        if not phonenumbers.is_valid_number(parsed_number):
+            return None
+        return phonenumbers.format_number(parsed_number, PhoneNumberFormat.E164)
+
     def is_mobile_number(self, phone: str, region: Optional[str] = None) -> bool:
         """
         Check if a phone number is a mobile number.
@@ -434,8 +473,65 @@ def get_phone_variants(phone: str, region: Optional[str] = None) -> List[str]:
     Returns:
         List of phone number variants
     """
-    validator = get_phone_validator()
-    return validator.get_phone_variants(phone, region)
+    return list(_cached_phone_variants(phone, region))
+
+
+def to_e164(phone: Optional[str], region: Optional[str] = None) -> Optional[str]:
+    """
+    Canonicalise a phone number to E.164 using the global validator.
+
+    Results are memoised per (phone, region), so repeated lookups and bulk
+    writes only parse each distinct number once.
+
+    Args:
+        phone: Phone number in any format
+        region: Region code for parsing
+
+    Returns:
+        E.164 string, or None if the number is missing or invalid
+    """
+    if not phone:
+        return None
+    return _cached_to_e164(phone, region)
+
+
+def legacy_phone_forms(phone: Optional[str], region: Optional[str] = None) -> List[str]:
+    """
+    Formats a number may be stored in on documents written before ``phone_e164``.
+
+    Lookups fall back to an ``in`` query on ``phone_number`` with these values
+    until ``scripts/backfill_phone_e164.py`` has run on every team.
+
+    Args:
+        phone: Phone number in any format
+        region: Region code for parsing
+
+    Returns:
+        The number as given plus its variants, at most LEGACY_PHONE_FORMS_LIMIT
+    """
+    if not phone or not phone.strip():
+        return []
+    forms = [phone.strip()]
+    for variant in get_phone_variants(phone, region):
+        if variant and variant not in forms:
+            forms.append(variant)
+    return forms[:LEGACY_PHONE_FORMS_LIMIT]
+
+
+def clear_phone_cache() -> None:
+    """Drop memoised parse results (e.g. after changing the default region)."""
+    _cached_to_e164.cache_clear()
+    _cached_phone_variants.cache_clear()
+
+
+@lru_cache(maxsize=PHONE_PARSE_CACHE_SIZE)
+def _cached_to_e164(phone: str, region: Optional[str]) -> Optional[str]:
+    return get_phone_validator().to_e164(phone, region)
+
+
+@lru_cache(maxsize=PHONE_PARSE_CACHE_SIZE)
+def _cached_phone_variants(phone: str, region: Optional[str]) -> tuple:
+    return tuple(get_phone_validator().get_phone_variants(phone, region))
 
 
 def is_mobile_number(phone: str, region: Optional[str] = None) -> bool:
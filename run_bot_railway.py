@@ -5,6 +5,7 @@ KICKAI Bot Startup Script - Railway Deployment
 A clean, robust bot startup script for Railway deployment with health check server.
 """
 
+import argparse
 import asyncio
 import os
 import signal
@@ -123,7 +124,7 @@ def setup_environment():
         raise
 
 
-async def run_system_validation():
+async def run_system_validation(force_validate: bool = False):
     """Run comprehensive system validation before starting bots."""
     try:
         logger.info("🔍 Running system validation...")
@@ -132,7 +133,7 @@ async def run_system_validation():
         team_id = await get_team_id_from_firestore()
         
         # Create validator and run checks
-        validator = StartupValidator()
+        validator = StartupValidator(force_validate=force_validate)
         context = {"team_id": team_id}  # Use the team ID from Firestore
         
         report = await validator.validate(context)
@@ -238,7 +239,7 @@ def flush_and_close_loggers():
     # Loguru handles cleanup automatically
     logger.info("📝 Logging cleanup completed")
 
-async def main():
+async def main(force_validate: bool = False):
     """Main async entry point with clean shutdown."""
     global multi_bot_manager
     shutdown_event = asyncio.Event()
@@ -257,7 +258,7 @@ async def main():
         start_health_check_server()
         
         # Run system validation
-        validation_passed = await run_system_validation()
+        validation_passed = await run_system_validation(force_validate=force_validate)
         if not validation_passed:
             logger.error("❌ System validation failed. Exiting.")
             return
@@ -307,8 +308,15 @@ async def main():
 
 def main_sync():
     """Synchronous entry point."""
+    parser = argparse.ArgumentParser(description="Run the KICKAI multi-bot manager (Railway)")
+    parser.add_argument(
+        "--force-validate",
+        action="store_true",
+        help="Run every startup check, ignoring cached results of static checks",
+    )
+    args = parser.parse_args()
     try:
-        asyncio.run(main())
+        asyncio.run(main(force_validate=args.force_validate))
     except KeyboardInterrupt:
         logger.info("🛑 Keyboard interrupt received")
     except Exception as e:
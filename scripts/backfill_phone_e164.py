@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Phone E.164 Backfill Script
+
+Players and team members now carry a ``phone_e164`` field (the phone number
+canonicalised to E.164) written alongside ``phone_number``; phone lookups are
+a single equality query on it. This script fills the field in for documents
+written before it existed, and corrects any that are stale.
+
+Usage:
+    python scripts/backfill_phone_e164.py --dry-run           # Preview changes
+    python scripts/backfill_phone_e164.py                     # All teams
+    python scripts/backfill_phone_e164.py --team-id KTI       # One team
+
+Each collection is streamed in document-ID order and updated in batches; an
+interrupted run resumes after the last committed document.
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import List
+
+from loguru import logger
+
+# Add project root to path
+sys.path.insert(0, '.')
+
+from kickai.core.firestore_constants import (
+    COLLECTION_TEAMS,
+    get_collection_name,
+    get_team_members_collection,
+    get_team_players_collection,
+)
+from kickai.core.config import get_settings
+from kickai.database.bulk_writer import BulkWriteReport, add_bulk_write_arguments, bulk_writer_from_args
+from kickai.database.firebase_client import FirebaseClient
+from kickai.database.query_spec import QuerySpec
+from kickai.utils.phone_validation import to_e164
+
+
+async def backfill_collection(
+    client: FirebaseClient, collection: str, args: argparse.Namespace
+) -> BulkWriteReport:
+    """Set phone_e164 on every document in a collection whose value is missing or stale."""
+    writer = bulk_writer_from_args(client, f"backfill_phone_e164_{collection}", args)
+    spec = QuerySpec().project("phone_number", "phone_e164")
+    invalid = 0
+
+    async with writer:
+        async for doc in client.iter_documents(collection, spec, start_after=writer.resume_after):
+            position = (doc["id"],)
+            phone_e164 = to_e164(doc.get("phone_number"))
+            if doc.get("phone_number") and not phone_e164:
+                invalid += 1
+                logger.warning(f"⚠️ {collection}/{doc['id']}: unparseable phone number {doc['phone_number']!r}")
+            if doc.get("phone_e164") == phone_e164:
+                writer.mark_position(position)
+                continue
+            await writer.update(collection, doc["id"], {"phone_e164": phone_e164}, position=position)
+
+    logger.info(f"📦 {collection}: {writer.report.summary()} ({invalid} unparseable)")
+    return writer.report
+
+
+async def get_team_ids(client: FirebaseClient, args: argparse.Namespace) -> List[str]:
+    """Teams named on the command line, or every team in Firestore."""
+    if args.team_id:
+        return args.team_id
+    spec = QuerySpec().project("team_id")
+    return [doc["id"] async for doc in client.iter_documents(get_collection_name(COLLECTION_TEAMS), spec)]
+
+
+async def backfill(client: FirebaseClient, args: argparse.Namespace) -> int:
+    """Backfill every selected team against a data store; returns the exit code."""
+    reports = []
+    for team_id in await get_team_ids(client, args):
+        logger.info(f"🔄 Backfilling phone_e164 for team {team_id}")
+        for collection in (get_team_players_collection(team_id), get_team_members_collection(team_id)):
+            reports.append(await backfill_collection(client, collection, args))
+
+    failed = [report for report in reports if not report.success]
+    updated = sum(report.operations for report in reports)
+    logger.info(f"🎉 Backfill complete: {updated} documents {'to update' if args.dry_run else 'updated'}")
+    if failed:
+        logger.error(f"❌ {len(failed)} collections had failed batches; re-run to resume")
+        return 1
+    return 0
+
+
+async def main(args: argparse.Namespace) -> int:
+    return await backfill(FirebaseClient(get_settings()), args)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Backfill the canonical phone_e164 field")
+    parser.add_argument(
+        "--team-id", action="append", default=[], help="Team ID to backfill (repeatable; default: all teams)"
+    )
+    add_bulk_write_arguments(parser)
+    return parser
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(build_parser().parse_args())))
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Firestore Composite Index Generator
+
+Imports the repositories that push queries down through QuerySpec, collects
+the query shapes they register and writes the composite index definitions
+Firestore needs for them as a firestore.indexes.json file:
+
+    python scripts/generate_firestore_indexes.py --team-id KTI --team-id KAI
+    firebase deploy --only firestore:indexes
+
+Team-scoped collections (kickai_<team>_players, ...) are separate collection
+groups in Firestore, so indexes are emitted for every team ID given.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.insert(0, project_root)
+
+from kickai.database.query_spec import generate_index_config, get_registered_query_indexes
+
+# Modules that register query shapes on import
+QUERY_MODULES = [
+    "kickai.database.firebase_client",
+    "kickai.features.match_management.infrastructure.firebase_match_repository",
+    "kickai.features.player_registration.infrastructure.firebase_player_repository",
+]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate Firestore composite indexes")
+    parser.add_argument(
+        "--team-id", action="append", default=[], help="Team ID to emit indexes for (repeatable)"
+    )
+    parser.add_argument(
+        "--output",
+        default=os.path.join(project_root, "firestore.indexes.json"),
+        help="Output file (use - for stdout)",
+    )
+    args = parser.parse_args()
+
+    if not args.team_id:
+        parser.error("at least one --team-id is required")
+
+    for module_name in QUERY_MODULES:
+        importlib.import_module(module_name)
+
+    config = generate_index_config(args.team_id)
+    output = json.dumps(config, indent=2) + "\n"
+
+    if args.output == "-":
+        sys.stdout.write(output)
+    else:
+        with open(args.output, "w") as f:
+            f.write(output)
+        print(
+            f"Wrote {len(config['indexes'])} composite indexes "
+            f"({len(get_registered_query_indexes())} registered query shapes) to {args.output}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
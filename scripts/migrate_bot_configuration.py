@@ -22,8 +22,13 @@ New Format:
   "leadership_chat_id": "...",
   "bot_id": "..."  // renamed from bot_username
 }
+
+Teams are streamed in document-ID order and updates are committed in batches;
+an interrupted run resumes after the last committed team. Use --dry-run to
+preview.
 """
 
+import argparse
 import asyncio
 import sys
 from typing import Dict, Any, List
@@ -33,8 +38,9 @@ from loguru import logger
 # Add project root to path
 sys.path.insert(0, '.')
 
-from kickai.core.dependency_container import initialize_container, get_service
-from kickai.core.settings import initialize_settings, get_settings
+from kickai.core.config import get_settings
+from kickai.core.dependency_container import initialize_container
+from kickai.database.bulk_writer import BulkWriter, add_bulk_write_arguments, bulk_writer_from_args
 from kickai.database.firebase_client import FirebaseClient
 from kickai.features.team_administration.domain.entities.team import Team, TeamStatus
 
@@ -42,7 +48,8 @@ from kickai.features.team_administration.domain.entities.team import Team, TeamS
 class BotConfigurationMigrator:
     """Handles migration of bot configuration from settings to explicit fields."""
     
-    def __init__(self):
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
         self.firebase_client = None
         self.migration_stats = {
             'total_teams': 0,
@@ -57,9 +64,8 @@ class BotConfigurationMigrator:
         """Initialize the migrator with Firebase client."""
         try:
             # Initialize settings and dependency container
-            initialize_settings()
             config = get_settings()
-            initialize_container()
+            await initialize_container()
             
             # Get Firebase client
             self.firebase_client = FirebaseClient(config)
@@ -70,18 +76,6 @@ class BotConfigurationMigrator:
             logger.error(f"❌ Failed to initialize migrator: {e}")
             raise
     
-    async def get_all_teams(self) -> List[Dict[str, Any]]:
-        """Get all teams from Firestore."""
-        try:
-            teams = await self.firebase_client.query_documents(
-                collection='kickai_teams'
-            )
-            logger.info(f"📋 Found {len(teams)} teams in Firestore")
-            return teams
-        except Exception as e:
-            logger.error(f"❌ Failed to get teams: {e}")
-            raise
-    
     def needs_migration(self, team_data: Dict[str, Any]) -> bool:
         """Check if a team needs migration."""
         settings = team_data.get('settings', {})
@@ -128,8 +122,8 @@ class BotConfigurationMigrator:
         
         return cleaned_settings
     
-    async def migrate_team(self, team_data: Dict[str, Any]) -> bool:
-        """Migrate a single team's bot configuration."""
+    async def migrate_team(self, writer: BulkWriter, team_data: Dict[str, Any]) -> bool:
+        """Queue a single team's bot configuration migration."""
         team_id = team_data.get('id')
         team_name = team_data.get('name', 'Unknown')
         
@@ -152,14 +146,10 @@ class BotConfigurationMigrator:
                 'settings': cleaned_settings
             }
             
-            # Update the team document
-            await self.firebase_client.update_document(
-                collection='kickai_teams',
-                document_id=team_id,
-                data=update_data
-            )
+            # Queue the team document update
+            await writer.update('kickai_teams', team_id, update_data, position=(team_id,))
             
-            logger.info(f"✅ Successfully migrated team: {team_name}")
+            logger.info(f"✅ Queued migration for team: {team_name}")
             logger.info(f"   Bot Token: {bot_config['bot_token'][:20]}..." if bot_config['bot_token'] else "None")
             logger.info(f"   Main Chat ID: {bot_config['main_chat_id']}")
             logger.info(f"   Leadership Chat ID: {bot_config['leadership_chat_id']}")
@@ -179,48 +169,15 @@ class BotConfigurationMigrator:
         logger.info("=" * 60)
         
         try:
-            # Get all teams
-            teams = await self.get_all_teams()
-            self.migration_stats['total_teams'] = len(teams)
+            writer = bulk_writer_from_args(self.firebase_client, 'migrate_bot_configuration', self.args)
+            async with writer:
+                await self._migrate_teams(writer)
             
-            for team_data in teams:
-                team_id = team_data.get('id')
-                team_name = team_data.get('name', 'Unknown')
-                
-                if self.needs_migration(team_data):
-                    self.migration_stats['teams_with_bot_config'] += 1
-                    
-                    # Check if bot config exists in settings
-                    settings = team_data.get('settings', {})
-                    has_bot_config = any([
-                        'bot_token' in settings,
-                        'main_chat_id' in settings,
-                        'leadership_chat_id' in settings,
-                        'bot_username' in settings
-                    ])
-                    
-                    if has_bot_config:
-                        success = await self.migrate_team(team_data)
-                        if success:
-                            self.migration_stats['teams_migrated'] += 1
-                    else:
-                        logger.info(f"ℹ️ Team {team_name} ({team_id}) has no bot configuration to migrate")
-                        self.migration_stats['teams_without_bot_config'] += 1
-                else:
-                    # Check if already migrated
-                    has_explicit_fields = any([
-                        team_data.get('bot_token'),
-                        team_data.get('main_chat_id'),
-                        team_data.get('leadership_chat_id'),
-                        team_data.get('bot_id')
-                    ])
-                    
-                    if has_explicit_fields:
-                        logger.info(f"✅ Team {team_name} ({team_id}) already migrated")
-                        self.migration_stats['teams_already_migrated'] += 1
-                    else:
-                        logger.info(f"ℹ️ Team {team_name} ({team_id}) has no bot configuration")
-                        self.migration_stats['teams_without_bot_config'] += 1
+            report = writer.report
+            if not report.success:
+                self.migration_stats['teams_migrated'] = report.committed_operations
+                self.migration_stats['errors'].extend(report.errors)
+            logger.info(f"📦 {report.summary()}")
             
             # Print migration summary
             self._print_migration_summary()
@@ -232,6 +189,51 @@ class BotConfigurationMigrator:
             self.migration_stats['errors'].append(f"Migration failed: {e}")
             return self.migration_stats
     
+    async def _migrate_teams(self, writer: BulkWriter) -> None:
+        """Stream teams and queue updates for the ones still on the old format."""
+        async for team_data in self.firebase_client.iter_documents(
+            'kickai_teams', start_after=writer.resume_after
+        ):
+            self.migration_stats['total_teams'] += 1
+            team_id = team_data.get('id')
+            team_name = team_data.get('name', 'Unknown')
+            
+            if self.needs_migration(team_data):
+                self.migration_stats['teams_with_bot_config'] += 1
+                
+                # Check if bot config exists in settings
+                settings = team_data.get('settings', {})
+                has_bot_config = any([
+                    'bot_token' in settings,
+                    'main_chat_id' in settings,
+                    'leadership_chat_id' in settings,
+                    'bot_username' in settings
+                ])
+                
+                if has_bot_config:
+                    success = await self.migrate_team(writer, team_data)
+                    if success:
+                        self.migration_stats['teams_migrated'] += 1
+                else:
+                    logger.info(f"ℹ️ Team {team_name} ({team_id}) has no bot configuration to migrate")
+                    self.migration_stats['teams_without_bot_config'] += 1
+            else:
+                # Check if already migrated
+                has_explicit_fields = any([
+                    team_data.get('bot_token'),
+                    team_data.get('main_chat_id'),
+                    team_data.get('leadership_chat_id'),
+                    team_data.get('bot_id')
+                ])
+                
+                if has_explicit_fields:
+                    logger.info(f"✅ Team {team_name} ({team_id}) already migrated")
+                    self.migration_stats['teams_already_migrated'] += 1
+                else:
+                    logger.info(f"ℹ️ Team {team_name} ({team_id}) has no bot configuration")
+                    self.migration_stats['teams_without_bot_config'] += 1
+            writer.mark_position((team_id,))
+    
     def _print_migration_summary(self):
         """Print a summary of the migration results."""
         logger.info("=" * 60)
@@ -255,14 +257,14 @@ class BotConfigurationMigrator:
             logger.info("ℹ️ No teams needed migration")
 
 
-async def main():
+async def main(args: argparse.Namespace):
     """Main function to run the migration."""
     logger.info("🤖 Bot Configuration Migration Script")
     logger.info("=" * 60)
     
     try:
         # Create and run migrator
-        migrator = BotConfigurationMigrator()
+        migrator = BotConfigurationMigrator(args)
         await migrator.initialize()
         
         # Run migration
@@ -281,6 +283,12 @@ async def main():
         sys.exit(1)
 
 
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Migrate bot configuration to explicit team fields")
+    add_bulk_write_arguments(parser)
+    return parser
+
+
 if __name__ == "__main__":
     # Configure logging
     logger.remove()
@@ -291,4 +299,4 @@ if __name__ == "__main__":
     )
     
     # Run migration
-    asyncio.run(main()) 
\ No newline at end of file
+    asyncio.run(main(build_parser().parse_args())) 
\ No newline at end of file
@@ -8,6 +8,9 @@ to the new simplified format (e.g., 01MH, 02MH).
 Usage:
     python scripts/migrate_to_simplified_ids.py --dry-run  # Preview changes
     python scripts/migrate_to_simplified_ids.py --execute  # Apply changes
+
+Documents are streamed page by page and the ID updates are committed through
+BulkWriter in batches of up to --batch-size writes.
 """
 
 import argparse
@@ -22,6 +25,7 @@ from loguru import logger
 sys.path.insert(0, "kickai")
 
 from kickai.core.dependency_container import get_container
+from kickai.database.bulk_writer import FIRESTORE_BATCH_LIMIT, BulkWriter, BulkWriteReport
 from kickai.database.firebase_client import FirebaseClient
 from kickai.utils.simple_id_generator import SimpleIDGenerator
 from kickai.features.player_registration.domain.entities.player import Player
@@ -31,17 +35,20 @@ from kickai.features.team_administration.domain.entities.team_member import Team
 class SimplifiedIDMigration:
     """Handles migration of existing IDs to simplified format."""
     
-    def __init__(self):
+    def __init__(self, batch_size: int = FIRESTORE_BATCH_LIMIT):
         self.container = get_container()
         self.firebase_client = self.container.get(FirebaseClient)
         self.id_generator = SimpleIDGenerator()
         self.migration_log = []
+        self.batch_size = batch_size
         
     async def get_all_players(self) -> List[Player]:
         """Retrieve all players from Firestore."""
         try:
-            players = await self.firebase_client.get_all_documents("kickai_players")
-            return [Player(**player) for player in players]
+            return [
+                Player.from_dict(player)
+                async for player in self.firebase_client.iter_documents("kickai_players")
+            ]
         except Exception as e:
             logger.error(f"Failed to retrieve players: {e}")
             return []
@@ -49,8 +56,10 @@ class SimplifiedIDMigration:
     async def get_all_team_members(self) -> List[TeamMember]:
         """Retrieve all team members from Firestore."""
         try:
-            members = await self.firebase_client.get_all_documents("kickai_team_members")
-            return [TeamMember(**member) for member in members]
+            return [
+                TeamMember.from_dict(member)
+                async for member in self.firebase_client.iter_documents("kickai_team_members")
+            ]
         except Exception as e:
             logger.error(f"Failed to retrieve team members: {e}")
             return []
@@ -86,6 +95,9 @@ class SimplifiedIDMigration:
             players_by_team[player.team_id].append(player)
         
         migration_results = []
+        writer = BulkWriter(
+            self.firebase_client, job_name="migrate_player_ids", batch_size=self.batch_size, dry_run=dry_run
+        )
         
         for team_id, team_players in players_by_team.items():
             logger.info(f"Processing team {team_id} with {len(team_players)} players")
@@ -109,21 +121,12 @@ class SimplifiedIDMigration:
                 
                 migration_results.append(migration_result)
                 
-                if not dry_run:
-                    # Update the player document
-                    try:
-                        await self.firebase_client.update_document(
-                            collection="kickai_players",
-                            document_id=old_id,
-                            data={"player_id": new_id}
-                        )
-                        logger.info(f"✅ Updated player {player.name}: {old_id} → {new_id}")
-                    except Exception as e:
-                        logger.error(f"❌ Failed to update player {player.name}: {e}")
-                        migration_result["error"] = str(e)
-                else:
-                    logger.info(f"📝 Would update player {player.name}: {old_id} → {new_id}")
+                await writer.update("kickai_players", old_id, {"player_id": new_id})
+                logger.info(f"📝 Queued player {player.name}: {old_id} → {new_id}")
         
+        report = await writer.close()
+        self._record_batch_errors(migration_results, report)
+        logger.info(f"Player ID migration: {report.summary()}")
         return migration_results
     
     async def migrate_team_members(self, dry_run: bool = True) -> List[Dict]:
@@ -141,6 +144,9 @@ class SimplifiedIDMigration:
             members_by_team[member.team_id].append(member)
         
         migration_results = []
+        writer = BulkWriter(
+            self.firebase_client, job_name="migrate_member_ids", batch_size=self.batch_size, dry_run=dry_run
+        )
         
         for team_id, team_members in members_by_team.items():
             logger.info(f"Processing team {team_id} with {len(team_members)} members")
@@ -164,22 +170,21 @@ class SimplifiedIDMigration:
                 
                 migration_results.append(migration_result)
                 
-                if not dry_run:
-                    # Update the team member document
-                    try:
-                        await self.firebase_client.update_document(
-                            collection="kickai_team_members",
-                            document_id=old_id,
-                            data={"member_id": new_id}
-                        )
-                        logger.info(f"✅ Updated team member {member.name}: {old_id} → {new_id}")
-                    except Exception as e:
-                        logger.error(f"❌ Failed to update team member {member.name}: {e}")
-                        migration_result["error"] = str(e)
-                else:
-                    logger.info(f"📝 Would update team member {member.name}: {old_id} → {new_id}")
+                await writer.update("kickai_team_members", old_id, {"member_id": new_id})
+                logger.info(f"📝 Queued team member {member.name}: {old_id} → {new_id}")
         
+        report = await writer.close()
+        self._record_batch_errors(migration_results, report)
+        logger.info(f"Team member ID migration: {report.summary()}")
         return migration_results
+
+    def _record_batch_errors(self, migration_results: List[Dict], report: BulkWriteReport) -> None:
+        """Mark results as failed when any of the batches carrying them failed."""
+        if report.success:
+            return
+        error = "; ".join(report.errors)
+        for result in migration_results:
+            result["error"] = error
     
     def generate_migration_report(self, player_results: List[Dict], member_results: List[Dict]) -> str:
         """Generate a comprehensive migration report."""
@@ -262,6 +267,9 @@ async def main():
     parser = argparse.ArgumentParser(description="Migrate to simplified IDs")
     parser.add_argument("--dry-run", action="store_true", help="Preview changes without applying them")
     parser.add_argument("--execute", action="store_true", help="Execute the migration")
+    parser.add_argument(
+        "--batch-size", type=int, default=FIRESTORE_BATCH_LIMIT, help="Updates per batch commit"
+    )
     
     args = parser.parse_args()
     
@@ -273,7 +281,7 @@ async def main():
         logger.error("Cannot specify both --dry-run and --execute")
         sys.exit(1)
     
-    migration = SimplifiedIDMigration()
+    migration = SimplifiedIDMigration(batch_size=args.batch_size)
     
     try:
         await migration.run_migration(dry_run=args.dry_run)
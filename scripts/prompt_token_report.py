@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Prompt Token Report
+
+Measures the static prompt components every LLM call carries, so prompt
+changes can be compared on token cost before they ship:
+
+- agents.yaml role/goal/backstory per agent (after template processing)
+- tool schemas bound to each agent (--with-tools)
+- tasks.yaml templates
+- the manager backstory and per-message manager task in TeamManagementSystem
+
+Runtime usage (per agent, team and message type, including completion tokens,
+trimming and latency) is recorded by kickai.core.token_accounting.
+
+Usage:
+    python scripts/prompt_token_report.py
+    python scripts/prompt_token_report.py --model groq/llama3-8b-8192 --with-tools --json
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List
+
+import yaml
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.insert(0, project_root)
+
+from kickai.agents.crew_agents import MANAGER_AGENT_BACKSTORY, MANAGER_TASK_TEMPLATE
+from kickai.config.agents import get_enabled_agent_configs
+from kickai.core.token_accounting import count_text_tokens
+
+TASKS_YAML = os.path.join(project_root, "kickai", "config", "tasks.yaml")
+
+SAMPLE_CONTEXT = {
+    "team_name": "KICKAI",
+    "team_id": "KTI",
+    "chat_type": "main",
+    "user_role": "public",
+    "username": "user",
+}
+
+
+def agent_rows(model: str, with_tools: bool) -> List[Dict[str, Any]]:
+    """Token cost of each enabled agent's static prompt."""
+    tool_registry = None
+    if with_tools:
+        from kickai.agents.tool_registry import get_tool_registry, initialize_tool_registry
+
+        initialize_tool_registry("kickai")
+        tool_registry = get_tool_registry()
+
+    rows = []
+    for role, config in get_enabled_agent_configs(SAMPLE_CONTEXT).items():
+        row = {
+            "component": f"agent:{role.value}",
+            "tokens": count_text_tokens(f"{config.role}\n{config.goal}\n{config.backstory}", model),
+        }
+        if tool_registry is not None:
+            from kickai.agents.tool_selection import estimate_tool_schema_tokens
+
+            tools = [tool_registry.get_tool_function(name) for name in config.tools]
+            row["tool_schema_tokens"] = sum(estimate_tool_schema_tokens(t) for t in tools if t)
+        rows.append(row)
+    return rows
+
+
+def task_rows(model: str) -> List[Dict[str, Any]]:
+    """Token cost of the tasks.yaml templates."""
+    with open(TASKS_YAML) as f:
+        data = yaml.safe_load(f) or {}
+
+    rows = [
+        {"component": f"task_template:{name}", "tokens": count_text_tokens(str(text), model)}
+        for name, text in (data.get("task_templates") or {}).items()
+    ]
+    rows.extend(
+        {"component": f"task:{task.get('name')}", "tokens": count_text_tokens(str(task.get("description", "")), model)}
+        for task in data.get("tasks") or []
+    )
+    return rows
+
+
+def manager_rows(model: str) -> List[Dict[str, Any]]:
+    """Token cost of the manager agent prompt and its per-message task."""
+    sample_task = MANAGER_TASK_TEMPLATE.format(
+        user="user", chat_type="main", task_description="/list", telegram_id=123456789, team_id="KTI"
+    )
+    return [
+        {"component": "manager:backstory", "tokens": count_text_tokens(MANAGER_AGENT_BACKSTORY, model)},
+        {"component": "manager:task (per message)", "tokens": count_text_tokens(sample_task, model)},
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Report token cost of static prompt components")
+    parser.add_argument("--model", default=None, help="Model whose tokenizer to use (default: character estimate)")
+    parser.add_argument("--with-tools", action="store_true", help="Include bound tool schema estimates")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    args = parser.parse_args()
+
+    rows = agent_rows(args.model, args.with_tools) + manager_rows(args.model) + task_rows(args.model)
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+
+    width = max(len(row["component"]) for row in rows)
+    for row in rows:
+        extra = f"  (+{row['tool_schema_tokens']} tool schema)" if "tool_schema_tokens" in row else ""
+        print(f"{row['component']:<{width}}  {row['tokens']:>6}{extra}")
+    print(f"{'total':<{width}}  {sum(row['tokens'] for row in rows):>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
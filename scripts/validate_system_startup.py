@@ -10,7 +10,7 @@ It can be used for:
 4. Ensuring all components are ready
 
 Usage:
-    python scripts/validate_system_startup.py [--team-id TEAM_ID] [--exit-on-failure] [--verbose]
+    python scripts/validate_system_startup.py [--team-id TEAM_ID] [--exit-on-failure] [--force-validate] [--verbose]
 """
 
 import argparse
@@ -27,7 +27,7 @@ sys.path.insert(0, str(project_root))
 # Set PYTHONPATH for proper imports
 os.environ["PYTHONPATH"] = str(project_root)
 
-from kickai.core.startup_validation.validator import run_critical_startup_validation
+from kickai.core.startup_validation.validator import run_startup_validation
 
 
 def setup_logging(level: int = logging.INFO) -> None:
@@ -71,6 +71,9 @@ Examples:
     # Validation that exits on failure
     python scripts/validate_system_startup.py --exit-on-failure
     
+    # Ignore cached results of static checks
+    python scripts/validate_system_startup.py --force-validate
+    
     # Verbose validation with detailed output
     python scripts/validate_system_startup.py --verbose
         """
@@ -88,6 +91,12 @@ Examples:
         help="Exit with error code 1 if validation fails"
     )
     
+    parser.add_argument(
+        "--force-validate",
+        action="store_true",
+        help="Run every check, ignoring cached results of static checks"
+    )
+    
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -115,11 +124,12 @@ Examples:
     logger.info("=" * 50)
     
     try:
-        # Run critical validation
-        success = await run_critical_startup_validation(
+        # Run startup validation
+        report = await run_startup_validation(
             team_id=args.team_id,
-            exit_on_failure=args.exit_on_failure
+            force_validate=args.force_validate
         )
+        success = report.is_healthy()
         
         if success:
             logger.info("✅ System validation completed successfully!")
@@ -9,11 +9,19 @@ This script:
 4. Provides a clean dataset for end-to-end testing
 """
 
+import argparse
+import asyncio
 import os
 import firebase_admin
 from firebase_admin import credentials, firestore
 import logging
 
+from kickai.database.bulk_writer import (
+    FirestoreBatchStore,
+    add_bulk_write_arguments,
+    bulk_writer_from_args,
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -24,6 +32,7 @@ cred = credentials.Certificate(cred_file)
 if not firebase_admin._apps:
     firebase_admin.initialize_app(cred)
 db = firestore.client()
+store = FirestoreBatchStore(db)
 
 # Define the collections that should exist with kickai_ prefix
 EXPECTED_COLLECTIONS = {
@@ -47,43 +56,26 @@ def list_current_collections():
     
     return collection_names
 
-def delete_all_documents_in_collection(collection_name: str):
-    """Delete all documents in a collection."""
+async def delete_all_documents_in_collection(collection_name: str, args) -> int:
+    """Delete all documents in a collection, streaming IDs into batched deletes."""
     try:
-        collection_ref = db.collection(collection_name)
-        docs = collection_ref.stream()
-        
-        # Get all document IDs
-        doc_ids = [doc.id for doc in docs]
-        
-        if not doc_ids:
+        writer = bulk_writer_from_args(store, f"clean_{collection_name}", args)
+        async with writer:
+            async for doc in store.stream_documents(collection_name, start_after=writer.resume_after):
+                await writer.delete(collection_name, doc.id, position=(doc.id,))
+
+        report = writer.report
+        if report.operations == 0:
             logger.info(f"  📭 Collection '{collection_name}' is already empty")
-            return 0
-        
-        # Delete documents in batches (Firestore limit is 500 per batch)
-        batch_size = 500
-        deleted_count = 0
-        
-        for i in range(0, len(doc_ids), batch_size):
-            batch = db.batch()
-            batch_doc_ids = doc_ids[i:i + batch_size]
-            
-            for doc_id in batch_doc_ids:
-                doc_ref = collection_ref.document(doc_id)
-                batch.delete(doc_ref)
-            
-            batch.commit()
-            deleted_count += len(batch_doc_ids)
-            logger.info(f"  🗑️  Deleted batch {i//batch_size + 1}: {len(batch_doc_ids)} documents")
-        
-        logger.info(f"  ✅ Deleted {deleted_count} documents from '{collection_name}'")
-        return deleted_count
+        else:
+            logger.info(f"  ✅ {report.summary()}")
+        return report.operations if args.dry_run else report.committed_operations
         
     except Exception as e:
         logger.error(f"  ❌ Error deleting documents from '{collection_name}': {e}")
         return 0
 
-def clean_e2e_collections():
+async def clean_e2e_collections(args):
     """Clean all collections used for E2E testing."""
     logger.info("🧹 Cleaning collections for E2E testing...")
     
@@ -92,7 +84,7 @@ def clean_e2e_collections():
     # Clean expected collections
     for collection_name, description in EXPECTED_COLLECTIONS.items():
         logger.info(f"Cleaning {collection_name}: {description}")
-        deleted = delete_all_documents_in_collection(collection_name)
+        deleted = await delete_all_documents_in_collection(collection_name, args)
         total_deleted += deleted
     
     # Also clean any collections without kickai_ prefix that might exist
@@ -105,7 +97,7 @@ def clean_e2e_collections():
     for legacy_name in legacy_collections:
         if legacy_name in current_collections:
             logger.info(f"Cleaning legacy collection '{legacy_name}' (should be 'kickai_{legacy_name}')")
-            deleted = delete_all_documents_in_collection(legacy_name)
+            deleted = await delete_all_documents_in_collection(legacy_name, args)
             total_deleted += deleted
     
     logger.info(f"🎯 Total documents deleted: {total_deleted}")
@@ -164,7 +156,7 @@ def create_empty_collections_if_missing():
         except Exception as e:
             logger.error(f"  ❌ Error ensuring collection '{collection_name}': {e}")
 
-def main():
+async def main(args):
     """Main function to clean and standardize Firestore collections."""
     logger.info("🚀 Starting Firestore collection cleanup and standardization...")
     
@@ -175,10 +167,11 @@ def main():
     issues = validate_collection_consistency()
     
     # Step 3: Clean E2E collections
-    total_deleted = clean_e2e_collections()
+    total_deleted = await clean_e2e_collections(args)
     
     # Step 4: Create missing collections
-    create_empty_collections_if_missing()
+    if not args.dry_run:
+        create_empty_collections_if_missing()
     
     # Step 5: Final validation
     logger.info("🔍 Final collection validation...")
@@ -205,4 +198,6 @@ def main():
     logger.info("=" * 60)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Clean and standardize Firestore collections")
+    add_bulk_write_arguments(parser)
+    asyncio.run(main(parser.parse_args())) 
\ No newline at end of file
@@ -1,14 +1,23 @@
+import argparse
+import asyncio
 import os
 import firebase_admin
 from firebase_admin import credentials, firestore
 from loguru import logger
 
+from kickai.database.bulk_writer import (
+    FirestoreBatchStore,
+    add_bulk_write_arguments,
+    bulk_writer_from_args,
+)
+
 # Load credentials and initialize Firebase app
 cred_file = os.getenv('FIREBASE_CREDENTIALS_FILE', './credentials/firebase_credentials_testing.json')
 cred = credentials.Certificate(cred_file)
 if not firebase_admin._apps:
     firebase_admin.initialize_app(cred)
 db = firestore.client()
+store = FirestoreBatchStore(db)
 
 # Set your player collection name here
 PLAYER_COLLECTION = os.getenv('FIRESTORE_PLAYER_COLLECTION', 'players')
@@ -20,31 +29,35 @@ LEGACY_TEAM_IDS = [
 ]
 NEW_TEAM_ID = 'KAI'
 
-def correct_legacy_team_ids():
+async def correct_legacy_team_ids(args):
     logger.info('🔄 Checking for legacy team IDs...')
-    players_ref = db.collection(PLAYER_COLLECTION)
-    docs = players_ref.stream()
-    count = 0
-    for doc in docs:
-        data = doc.to_dict()
-        if TEAM_ID_FIELD in data and data[TEAM_ID_FIELD] in LEGACY_TEAM_IDS:
-            players_ref.document(doc.id).update({TEAM_ID_FIELD: NEW_TEAM_ID})
-            logger.info(f'✅ Updated team_id for player {doc.id} to {NEW_TEAM_ID}')
-            count += 1
-    logger.info(f'🔍 Legacy team ID correction complete. {count} player(s) updated.')
-
-def delete_all_players():
+    writer = bulk_writer_from_args(store, 'correct_legacy_team_ids', args)
+    async with writer:
+        async for doc in store.stream_documents(PLAYER_COLLECTION, start_after=writer.resume_after):
+            data = doc.to_dict()
+            if TEAM_ID_FIELD in data and data[TEAM_ID_FIELD] in LEGACY_TEAM_IDS:
+                await writer.update(
+                    PLAYER_COLLECTION, doc.id, {TEAM_ID_FIELD: NEW_TEAM_ID}, position=(doc.id,)
+                )
+                logger.debug(f'Queued team_id update for player {doc.id} to {NEW_TEAM_ID}')
+            else:
+                writer.mark_position((doc.id,))
+    logger.info(f'🔍 Legacy team ID correction complete. {writer.report.summary()}')
+
+async def delete_all_players(args):
     logger.warning('⚠️  Deleting all player documents in Firestore collection: {}', PLAYER_COLLECTION)
-    players_ref = db.collection(PLAYER_COLLECTION)
-    docs = players_ref.stream()
-    count = 0
-    for doc in docs:
-        players_ref.document(doc.id).delete()
-        logger.info(f'🗑️  Deleted player document: {doc.id}')
-        count += 1
-    logger.info(f'✅ All player documents deleted. Total: {count}')
+    writer = bulk_writer_from_args(store, 'delete_all_players', args)
+    async with writer:
+        async for doc in store.stream_documents(PLAYER_COLLECTION, start_after=writer.resume_after):
+            await writer.delete(PLAYER_COLLECTION, doc.id, position=(doc.id,))
+    logger.info(f'✅ All player documents deleted. {writer.report.summary()}')
+
+async def main(args):
+    await correct_legacy_team_ids(args)
+    await delete_all_players(args)
+    logger.info('🎉 Firestore player data cleanup complete.')
 
 if __name__ == '__main__':
-    correct_legacy_team_ids()
-    delete_all_players()
-    logger.info('🎉 Firestore player data cleanup complete.') 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Correct legacy team IDs and delete player documents')
+    add_bulk_write_arguments(parser)
+    asyncio.run(main(parser.parse_args()))
@@ -6,23 +6,35 @@ This script fixes invalid enum values in the Firestore database by converting th
 to valid enum values for PlayerPosition and OnboardingStatus.
 """
 
+import argparse
 import asyncio
 import logging
 from typing import Dict, Any, List
 import firebase_admin
 from firebase_admin import credentials, firestore
-from features.player_registration.domain.entities.player import Player, PlayerPosition, OnboardingStatus
+from kickai.database.bulk_writer import (
+    FirestoreBatchStore,
+    add_bulk_write_arguments,
+    bulk_writer_from_args,
+)
+from kickai.core.enums import PlayerPosition
+from kickai.features.player_registration.domain.entities.player import OnboardingStatus
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+VALID_POSITIONS = {pos.value for pos in PlayerPosition}
+VALID_STATUSES = {status.value for status in OnboardingStatus}
+
 class DatabaseEnumCleaner:
     """Clean up invalid enum values in the database."""
     
-    def __init__(self):
+    def __init__(self, args):
         """Initialize the database cleaner."""
         self.db = firestore.client()
+        self.store = FirestoreBatchStore(self.db)
+        self.args = args
         
     async def cleanup_player_positions(self) -> Dict[str, int]:
         """Clean up invalid player positions."""
@@ -54,47 +66,44 @@ class DatabaseEnumCleaner:
         
         stats = {'updated': 0, 'skipped': 0, 'errors': 0}
         
+        writer = bulk_writer_from_args(self.store, "cleanup_player_positions", self.args)
         try:
-            # Get all players
-            players_ref = self.db.collection('players')
-            players = players_ref.stream()
-            
-            for player_doc in players:
-                try:
-                    player_data = player_doc.to_dict()
-                    current_position = player_data.get('position')
-                    
-                    # Skip if position is already valid
-                    if current_position in [pos.value for pos in PlayerPosition]:
-                        stats['skipped'] += 1
-                        continue
-                    
-                    # Check if we have a mapping for this position
-                    if current_position in position_mapping:
-                        new_position = position_mapping[current_position]
-                        logger.info(f"🔄 Updating player {player_doc.id}: {current_position} → {new_position}")
+            # Stream players and queue updates; commits happen in batches of up to 500
+            async with writer:
+                async for player_doc in self.store.stream_documents('players', start_after=writer.resume_after):
+                    try:
+                        player_data = player_doc.to_dict()
+                        current_position = player_data.get('position')
                         
-                        # Update the document
-                        player_doc.reference.update({
-                            'position': new_position
-                        })
-                        stats['updated'] += 1
-                    else:
-                        # Default to 'utility' for unknown positions
-                        logger.warning(f"⚠️ Unknown position '{current_position}' for player {player_doc.id}, defaulting to 'utility'")
-                        player_doc.reference.update({
-                            'position': 'utility'
-                        })
-                        stats['updated'] += 1
+                        # Skip if position is already valid
+                        if current_position in VALID_POSITIONS:
+                            stats['skipped'] += 1
+                            writer.mark_position((player_doc.id,))
+                            continue
                         
-                except Exception as e:
-                    logger.error(f"❌ Error processing player {player_doc.id}: {e}")
-                    stats['errors'] += 1
+                        # Check if we have a mapping for this position, defaulting to 'utility'
+                        if current_position in position_mapping:
+                            new_position = position_mapping[current_position]
+                            logger.info(f"🔄 Updating player {player_doc.id}: {current_position} → {new_position}")
+                        else:
+                            new_position = 'utility'
+                            logger.warning(f"⚠️ Unknown position '{current_position}' for player {player_doc.id}, defaulting to 'utility'")
+                        
+                        await writer.update(
+                            'players', player_doc.id, {'position': new_position}, position=(player_doc.id,)
+                        )
+                        stats['updated'] += 1
+                            
+                    except Exception as e:
+                        logger.error(f"❌ Error processing player {player_doc.id}: {e}")
+                        stats['errors'] += 1
                     
         except Exception as e:
             logger.error(f"❌ Error during position cleanup: {e}")
             stats['errors'] += 1
-            
+        
+        stats['errors'] += writer.report.batches_failed
+        logger.info(f"📦 {writer.report.summary()}")
         logger.info(f"✅ Position cleanup completed: {stats}")
         return stats
     
@@ -132,47 +141,44 @@ class DatabaseEnumCleaner:
         
         stats = {'updated': 0, 'skipped': 0, 'errors': 0}
         
+        writer = bulk_writer_from_args(self.store, "cleanup_onboarding_status", self.args)
         try:
-            # Get all players
-            players_ref = self.db.collection('players')
-            players = players_ref.stream()
-            
-            for player_doc in players:
-                try:
-                    player_data = player_doc.to_dict()
-                    current_status = player_data.get('onboarding_status')
-                    
-                    # Skip if status is already valid
-                    if current_status in [status.value for status in OnboardingStatus]:
-                        stats['skipped'] += 1
-                        continue
-                    
-                    # Check if we have a mapping for this status
-                    if current_status in status_mapping:
-                        new_status = status_mapping[current_status]
-                        logger.info(f"🔄 Updating player {player_doc.id}: {current_status} → {new_status}")
+            # Stream players and queue updates; commits happen in batches of up to 500
+            async with writer:
+                async for player_doc in self.store.stream_documents('players', start_after=writer.resume_after):
+                    try:
+                        player_data = player_doc.to_dict()
+                        current_status = player_data.get('onboarding_status')
                         
-                        # Update the document
-                        player_doc.reference.update({
-                            'onboarding_status': new_status
-                        })
-                        stats['updated'] += 1
-                    else:
-                        # Default to 'pending' for unknown statuses
-                        logger.warning(f"⚠️ Unknown status '{current_status}' for player {player_doc.id}, defaulting to 'pending'")
-                        player_doc.reference.update({
-                            'onboarding_status': 'pending'
-                        })
-                        stats['updated'] += 1
+                        # Skip if status is already valid
+                        if current_status in VALID_STATUSES:
+                            stats['skipped'] += 1
+                            writer.mark_position((player_doc.id,))
+                            continue
                         
-                except Exception as e:
-                    logger.error(f"❌ Error processing player {player_doc.id}: {e}")
-                    stats['errors'] += 1
+                        # Check if we have a mapping for this status, defaulting to 'pending'
+                        if current_status in status_mapping:
+                            new_status = status_mapping[current_status]
+                            logger.info(f"🔄 Updating player {player_doc.id}: {current_status} → {new_status}")
+                        else:
+                            new_status = 'pending'
+                            logger.warning(f"⚠️ Unknown status '{current_status}' for player {player_doc.id}, defaulting to 'pending'")
+                        
+                        await writer.update(
+                            'players', player_doc.id, {'onboarding_status': new_status}, position=(player_doc.id,)
+                        )
+                        stats['updated'] += 1
+                            
+                    except Exception as e:
+                        logger.error(f"❌ Error processing player {player_doc.id}: {e}")
+                        stats['errors'] += 1
                     
         except Exception as e:
             logger.error(f"❌ Error during status cleanup: {e}")
             stats['errors'] += 1
-            
+        
+        stats['errors'] += writer.report.batches_failed
+        logger.info(f"📦 {writer.report.summary()}")
         logger.info(f"✅ Status cleanup completed: {stats}")
         return stats
     
@@ -224,7 +230,7 @@ class DatabaseEnumCleaner:
             logger.error(f"❌ Error during verification: {e}")
             return {'error': str(e)}
 
-async def main():
+async def main(args):
     """Main cleanup function."""
     logger.info("🚀 Starting database enum cleanup...")
     
@@ -268,7 +274,7 @@ async def main():
         except Exception as e:
             raise RuntimeError(f"Failed to initialize Firebase app: {e}")
     
-    cleaner = DatabaseEnumCleaner()
+    cleaner = DatabaseEnumCleaner(args)
     
     # Run cleanup
     position_stats = await cleaner.cleanup_player_positions()
@@ -290,4 +296,6 @@ async def main():
         logger.warning("⚠️ Some issues remain. Check the logs above.")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Fix invalid position/onboarding status values")
+    add_bulk_write_arguments(parser)
+    asyncio.run(main(parser.parse_args())) 
\ No newline at end of file
@@ -7,6 +7,7 @@ a clean slate for end-to-end testing. It preserves the collection structure
 but removes all test documents.
 """
 
+import argparse
 import os
 import sys
 import asyncio
@@ -15,6 +16,12 @@ from firebase_admin import credentials, firestore
 import logging
 from typing import List, Dict, Any
 
+from kickai.database.bulk_writer import (
+    FirestoreBatchStore,
+    add_bulk_write_arguments,
+    bulk_writer_from_args,
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -25,6 +32,7 @@ cred = credentials.Certificate(cred_file)
 if not firebase_admin._apps:
     firebase_admin.initialize_app(cred)
 db = firestore.client()
+store = FirestoreBatchStore(db)
 
 # Collections to clean
 COLLECTIONS_TO_CLEAN = [
@@ -49,62 +57,36 @@ TEST_TEAM_MEMBER_IDS = [
     'TM_LEADER_admin_user', 'TM_LEADER_team_secretary'
 ]
 
-async def clean_collection(collection_name: str, specific_ids: List[str] = None) -> int:
+async def clean_collection(collection_name: str, args, specific_ids: List[str] = None) -> int:
     """Clean a specific collection, optionally removing specific document IDs."""
     logger.info(f"🧹 Cleaning collection: {collection_name}")
     
     try:
-        collection_ref = db.collection(collection_name)
-        deleted_count = 0
-        
-        if specific_ids:
-            # Delete specific documents
-            for doc_id in specific_ids:
-                try:
-                    doc_ref = collection_ref.document(doc_id)
-                    doc = doc_ref.get()
-                    if doc.exists:
-                        doc_ref.delete()
-                        deleted_count += 1
-                        logger.debug(f"    ✅ Deleted document: {doc_id}")
-                    else:
-                        logger.debug(f"    ⚠️  Document not found: {doc_id}")
-                except Exception as e:
-                    logger.warning(f"    ⚠️  Error deleting document {doc_id}: {e}")
-        else:
-            # Delete all documents in collection
-            docs = collection_ref.stream()
-            batch = db.batch()
-            batch_count = 0
-            
-            for doc in docs:
-                # Skip initialization documents
-                if doc.id == '_initialization':
-                    continue
-                    
-                batch.delete(doc.reference)
-                batch_count += 1
-                
-                # Commit batch when it gets large
-                if batch_count >= 500:
-                    batch.commit()
-                    deleted_count += batch_count
-                    batch_count = 0
-                    batch = db.batch()
-            
-            # Commit remaining documents
-            if batch_count > 0:
-                batch.commit()
-                deleted_count += batch_count
+        writer = bulk_writer_from_args(store, f"cleanup_e2e_{collection_name}", args)
+        async with writer:
+            if specific_ids:
+                # Deleting a missing document is a no-op, so no existence reads are needed
+                for doc_id in specific_ids:
+                    await writer.delete(collection_name, doc_id)
+            else:
+                # Stream the collection and delete in batches of up to 500
+                async for doc in store.stream_documents(collection_name, start_after=writer.resume_after):
+                    # Skip initialization documents
+                    if doc.id == '_initialization':
+                        writer.mark_position((doc.id,))
+                        continue
+                    await writer.delete(collection_name, doc.id, position=(doc.id,))
         
-        logger.info(f"  ✅ Cleaned {collection_name}: {deleted_count} documents deleted")
+        report = writer.report
+        deleted_count = report.operations if args.dry_run else report.committed_operations
+        logger.info(f"  ✅ Cleaned {collection_name}: {report.summary()}")
         return deleted_count
         
     except Exception as e:
         logger.error(f"  ❌ Error cleaning collection {collection_name}: {e}")
         return 0
 
-async def clean_all_test_data():
+async def clean_all_test_data(args):
     """Clean all test data from Firestore."""
     logger.info("🚀 Starting E2E test data cleanup...")
     
@@ -121,7 +103,7 @@ async def clean_all_test_data():
         ]
         
         for collection_name, specific_ids in specific_cleanups:
-            deleted = await clean_collection(collection_name, specific_ids)
+            deleted = await clean_collection(collection_name, args, specific_ids)
             total_deleted += deleted
         
         # Clean other collections completely
@@ -133,7 +115,7 @@ async def clean_all_test_data():
         ]
         
         for collection_name in other_collections:
-            deleted = await clean_collection(collection_name)
+            deleted = await clean_collection(collection_name, args)
             total_deleted += deleted
         
         logger.info("🎉 E2E test data cleanup completed successfully!")
@@ -194,6 +176,10 @@ def list_current_collections():
 
 def main():
     """Main function to clean test data."""
+    parser = argparse.ArgumentParser(description="Remove E2E test data from Firestore")
+    add_bulk_write_arguments(parser)
+    args = parser.parse_args()
+
     logger.info("🎯 Starting E2E test data cleanup...")
     
     # Show current state
@@ -201,7 +187,7 @@ def main():
     list_current_collections()
     
     # Run the cleanup
-    asyncio.run(clean_all_test_data())
+    asyncio.run(clean_all_test_data(args))
     
     # Verify cleanup
     asyncio.run(verify_cleanup())
@@ -5,6 +5,7 @@ Cleanup script for test data in Firestore.
 This script removes test data created during E2E testing to keep the database clean.
 """
 
+import argparse
 import asyncio
 import os
 import sys
@@ -13,12 +14,13 @@ from dotenv import load_dotenv
 # Load test environment
 load_dotenv('.env.test')
 
-# Add src to path
-sys.path.insert(0, 'src')
+# Add project root to path
+sys.path.insert(0, '.')
 
-from database.firebase_client import get_firebase_client
+from kickai.database.bulk_writer import add_bulk_write_arguments, bulk_writer_from_args
+from kickai.database.firebase_client import get_firebase_client
 
-async def cleanup_test_data():
+async def cleanup_test_data(args):
     """Clean up test data from Firestore."""
     print("🧹 Starting test data cleanup...")
     
@@ -47,26 +49,26 @@ async def cleanup_test_data():
             ]
         }
         
-        # Clean up each collection
-        for collection, document_ids in test_data.items():
-            print(f"📁 Cleaning up {collection} collection...")
-            
-            for doc_id in document_ids:
-                try:
-                    # Check if document exists
-                    doc = await firebase_client.get_document(collection, doc_id)
-                    if doc:
-                        await firebase_client.delete_document(collection, doc_id)
-                        print(f"  ✅ Deleted {collection}/{doc_id}")
-                    else:
-                        print(f"  ℹ️  {collection}/{doc_id} not found")
-                except Exception as e:
-                    print(f"  ❌ Error deleting {collection}/{doc_id}: {e}")
+        # Deletes of missing documents are no-ops in Firestore, so every known
+        # test document is deleted in one batched pass without existence checks
+        writer = bulk_writer_from_args(firebase_client, "cleanup_test_data", args)
+        async with writer:
+            for collection, document_ids in test_data.items():
+                print(f"📁 Cleaning up {collection} collection...")
+                for doc_id in document_ids:
+                    await writer.delete(collection, doc_id)
         
-        print("✅ Test data cleanup completed!")
+        print(f"📊 {writer.report.summary()}")
+        if writer.report.success:
+            print("✅ Test data cleanup completed!")
+        else:
+            for error in writer.report.errors:
+                print(f"  ❌ {error}")
         
     except Exception as e:
         print(f"❌ Error during cleanup: {e}")
 
 if __name__ == "__main__":
-    asyncio.run(cleanup_test_data()) 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Remove known E2E test documents")
+    add_bulk_write_arguments(parser)
+    asyncio.run(cleanup_test_data(parser.parse_args())) 
\ No newline at end of file
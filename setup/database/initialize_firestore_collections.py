@@ -6,11 +6,19 @@ This script creates the expected collections with kickai_ prefix
 for end-to-end testing.
 """
 
+import argparse
+import asyncio
 import os
 import firebase_admin
 from firebase_admin import credentials, firestore
 import logging
 
+from kickai.database.bulk_writer import (
+    FirestoreBatchStore,
+    add_bulk_write_arguments,
+    bulk_writer_from_args,
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -32,27 +40,27 @@ EXPECTED_COLLECTIONS = {
     'kickai_daily_status': 'Daily status documents for E2E testing'
 }
 
-def initialize_collections():
-    """Initialize all expected collections."""
+async def initialize_collections(args):
+    """Initialize all expected collections in a single batch."""
     logger.info("🚀 Initializing Firestore collections...")
     
-    for collection_name, description in EXPECTED_COLLECTIONS.items():
-        try:
+    writer = bulk_writer_from_args(FirestoreBatchStore(db), "initialize_firestore_collections", args)
+    async with writer:
+        for collection_name, description in EXPECTED_COLLECTIONS.items():
             # Create collection by adding an initialization document
-            collection_ref = db.collection(collection_name)
-            init_doc = collection_ref.document('_initialization')
-            init_doc.set({
+            await writer.set(collection_name, '_initialization', {
                 'type': 'initialization',
                 'description': description,
                 'created_at': firestore.SERVER_TIMESTAMP,
                 'version': '1.0.0',
                 'note': 'This document keeps the collection alive. Safe to ignore in queries.'
             })
-            
-            logger.info(f"  ✅ Created collection: {collection_name}")
-            
-        except Exception as e:
-            logger.error(f"  ❌ Error creating collection '{collection_name}': {e}")
+    
+    if writer.report.success:
+        logger.info(f"  ✅ Initialized {len(EXPECTED_COLLECTIONS)} collections: {writer.report.summary()}")
+    else:
+        for error in writer.report.errors:
+            logger.error(f"  ❌ Error creating collections: {error}")
 
 def verify_collections():
     """Verify that all expected collections exist."""
@@ -80,10 +88,16 @@ def verify_collections():
 
 def main():
     """Main function to initialize Firestore collections."""
+    parser = argparse.ArgumentParser(description="Initialize KICKAI Firestore collections")
+    add_bulk_write_arguments(parser)
+    args = parser.parse_args()
+
     logger.info("🎯 Starting Firestore collection initialization...")
     
     # Initialize collections
-    initialize_collections()
+    asyncio.run(initialize_collections(args))
+    if args.dry_run:
+        return
     
     # Verify collections
     success = verify_collections()
@@ -22,6 +22,9 @@ TEAM_LIMIT = 1
 
 logger = logging.getLogger(__name__)
 
+# Routers are reused per team; building one per message re-runs its setup on the hot path
+_routers: Dict[str, Any] = {}
+
 # Import real bot integration components
 try:
     # Local imports
@@ -163,21 +166,26 @@ async def _ensure_dependencies_initialized() -> None:
 
 async def _create_router(team_id: str) -> AgenticMessageRouter:
     """
-    Create and configure AgenticMessageRouter.
+    Get or create the AgenticMessageRouter for a team.
     
     Args:
         team_id: Team ID for the router
         
     Returns:
-        Configured AgenticMessageRouter instance
+        Configured AgenticMessageRouter instance (cached per team)
         
     Raises:
         Exception: When router creation fails
     """
+    router = _routers.get(team_id)
+    if router is not None:
+        return router
+
     logger.info(f"🔧 Creating AgenticMessageRouter with team_id={team_id}")
     
     router = AgenticMessageRouter(team_id)
     router.set_chat_ids(main_chat_id=MOCK_MAIN_CHAT_ID, leadership_chat_id=MOCK_LEADERSHIP_CHAT_ID)
+    _routers[team_id] = router
     logger.info("✅ AgenticMessageRouter created successfully")
     
     return router
@@ -0,0 +1,170 @@
+"""
+Indexed Message Store for the Mock Telegram Service
+
+Keeps messages in per-chat ring buffers so that appends and evictions are
+O(1) and chat/user history reads only touch the messages they return,
+instead of scanning the whole history on every request. Memory is bounded
+twice: each chat keeps at most ``max_messages_per_chat`` messages, and the
+store as a whole at most ``max_messages`` (the oldest message of any chat is
+evicted first), however many chats there are.
+"""
+
+import heapq
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional
+
+DEFAULT_MAX_MESSAGES = 1000
+DEFAULT_MAX_MESSAGES_PER_CHAT = 200
+
+
+class IndexedMessageStore:
+    """
+    Per-chat ring buffers with a global recency index.
+
+    Messages must expose ``message_id`` (monotonically increasing) and
+    ``chat.id``. Reads accept a ``since_message_id`` cursor so clients can
+    page forward incrementally rather than re-fetching the full history.
+    """
+
+    def __init__(
+        self,
+        max_messages: int = DEFAULT_MAX_MESSAGES,
+        max_messages_per_chat: Optional[int] = None,
+    ):
+        self.max_messages = max_messages
+        self.max_messages_per_chat = min(
+            max_messages_per_chat or DEFAULT_MAX_MESSAGES_PER_CHAT, max_messages
+        )
+        self._lock = threading.RLock()
+        self._by_chat: Dict[int, Deque[Any]] = {}
+        # Every retained message in append order, keyed by object identity for O(1) removal
+        self._recent: "OrderedDict[int, Any]" = OrderedDict()
+        self._total_appended = 0
+        self._evicted = 0
+
+    # List-like API kept for existing callers (len(), iteration, append, clear)
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._recent)
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            return iter(list(self._recent.values()))
+
+    def append(self, message: Any) -> None:
+        """Append a message, evicting the chat's oldest message or, when the store is full, the oldest overall."""
+        with self._lock:
+            chat_id = message.chat.id
+            buffer = self._by_chat.get(chat_id)
+            if buffer is None:
+                buffer = deque()
+                self._by_chat[chat_id] = buffer
+            if len(buffer) >= self.max_messages_per_chat:
+                self._recent.pop(id(buffer.popleft()))
+                self._evicted += 1
+            buffer.append(message)
+            self._recent[id(message)] = message
+            self._total_appended += 1
+
+            while len(self._recent) > self.max_messages:
+                _, oldest = self._recent.popitem(last=False)
+                # Chats are appended in the same order, so the overall oldest heads its chat
+                oldest_chat = self._by_chat[oldest.chat.id]
+                oldest_chat.popleft()
+                if not oldest_chat:
+                    del self._by_chat[oldest.chat.id]
+                self._evicted += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_chat.clear()
+            self._recent.clear()
+
+    def remove_where(self, predicate: Callable[[Any], bool]) -> int:
+        """Remove all messages matching ``predicate``. Returns the number removed."""
+        with self._lock:
+            before = len(self._recent)
+            self._recent = OrderedDict(
+                (key, msg) for key, msg in self._recent.items() if not predicate(msg)
+            )
+            for chat_id, buffer in list(self._by_chat.items()):
+                kept = deque(msg for msg in buffer if not predicate(msg))
+                if kept:
+                    self._by_chat[chat_id] = kept
+                else:
+                    del self._by_chat[chat_id]
+            return before - len(self._recent)
+
+    # Indexed reads
+    def get_chat_messages(
+        self, chat_id: int, limit: int = 50, since_message_id: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Get the most recent messages of one chat in chronological order.
+
+        Args:
+            chat_id: Chat to read
+            limit: Maximum number of messages to return
+            since_message_id: Only return messages newer than this cursor
+
+        Returns:
+            Up to ``limit`` messages, oldest first (the newest page without a cursor,
+            the next page after the cursor otherwise)
+        """
+        with self._lock:
+            buffer = self._by_chat.get(chat_id)
+            if not buffer:
+                return []
+            return self._tail(buffer, limit, since_message_id)
+
+    def get_messages_for_chats(
+        self, chat_ids: Iterable[int], limit: int = 50, since_message_id: Optional[int] = None
+    ) -> List[Any]:
+        """Get the most recent messages across several chats, merged by message ID."""
+        with self._lock:
+            tails = [
+                self._tail(self._by_chat[chat_id], limit, since_message_id)
+                for chat_id in chat_ids
+                if chat_id in self._by_chat
+            ]
+        merged = list(heapq.merge(*tails, key=lambda msg: msg.message_id))
+        if not limit:
+            return merged
+        return merged[:limit] if since_message_id is not None else merged[-limit:]
+
+    def get_recent(self, limit: int = 100, since_message_id: Optional[int] = None) -> List[Any]:
+        """Get the most recent messages across all chats."""
+        with self._lock:
+            return self._tail(self._recent.values(), limit, since_message_id)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "chats": len(self._by_chat),
+                "retained_messages": len(self._recent),
+                "total_appended": self._total_appended,
+                "evicted": self._evicted,
+            }
+
+    @staticmethod
+    def _tail(buffer: Any, limit: int, since_message_id: Optional[int]) -> List[Any]:
+        """
+        Walk a buffer (any reversible sequence of messages) from the newest end.
+
+        Without a cursor this returns the newest ``limit`` messages. With a cursor
+        it returns the oldest ``limit`` messages after it, so a client can advance
+        the cursor to the last returned ID and fetch the next page.
+        """
+        result = []
+        for message in reversed(buffer):
+            if since_message_id is not None:
+                if message.message_id <= since_message_id:
+                    break
+            elif limit and len(result) >= limit:
+                break
+            result.append(message)
+        result.reverse()
+        if since_message_id is not None and limit:
+            return result[:limit]
+        return result
@@ -21,6 +21,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field, validator
 import uvicorn
 
+from .message_store import IndexedMessageStore
+
 # Set required environment variable for bot integration
 os.environ.setdefault("KICKAI_INVITE_SECRET_KEY", "test_secret_key_for_debugging_only_32_chars_long")
 
@@ -36,6 +38,9 @@ except ImportError as e:
     logger.warning(f"Bot integration not available - running in standalone mode: {e}")
 
 
+WEBSOCKET_SEND_TIMEOUT_SECONDS = 5.0
+
+
 class MessageType(str, Enum):
     """Types of messages that can be sent/received"""
     TEXT = "text"
@@ -200,8 +205,12 @@ class MockTelegramService:
         self._lock = threading.RLock()  # Thread safety
         self.users: Dict[int, MockUser] = {}
         self.chats: Dict[int, MockChat] = {}
-        self.messages: List[MockMessage] = []
+        # Per-chat ring buffers: O(1) append/eviction, reads only touch returned messages
+        self.messages = IndexedMessageStore(max_messages=max_messages)
         self.websocket_connections: Set[WebSocket] = set()  # Use set for O(1) operations
+        # user_id -> (membership version, accessible chat IDs); rebuilt after any chat/member change
+        self._chat_access_index: Dict[int, tuple] = {}
+        self._membership_version = 0
         self.message_counter = 1
         self.max_messages = max_messages
         self.max_users = max_users
@@ -262,7 +271,7 @@ class MockTelegramService:
         
         # Add users to the service
         for user in test_users:
-            self.users[user.id] = user
+            self._add_user(user)
             
             # Create private chat for each user
             chat = MockChat(
@@ -270,7 +279,7 @@ class MockTelegramService:
                 type=ChatType.PRIVATE,
                 first_name=user.first_name
             )
-            self.chats[chat.id] = chat
+            self._add_chat(chat)
             
             logger.info(f"✅ Created test user: {user.first_name} (ID: {user.id}, Role: {user.role.value})")
         
@@ -305,7 +314,7 @@ class MockTelegramService:
                                     phone_number=player_data.get('phone'),  # Fixed: use 'phone' instead of 'phone_number'
                                     status=player_data.get('status', 'pending')  # Include status from Firestore
                                 )
-                                self.users[user.id] = user
+                                self._add_user(user)
                                 
                                 # Create private chat
                                 chat = MockChat(
@@ -313,7 +322,7 @@ class MockTelegramService:
                                     type=ChatType.PRIVATE,
                                     first_name=user.first_name
                                 )
-                                self.chats[chat.id] = chat
+                                self._add_chat(chat)
                                 users_loaded += 1
                                 logger.info(f"✅ Loaded player: {user.first_name} (ID: {telegram_id})")
                                 
@@ -353,7 +362,7 @@ class MockTelegramService:
                                         phone_number=member_data.get('phone'),  # Fixed: use 'phone' instead of 'phone_number'
                                         status=member_data.get('status', 'active')  # Include status from Firestore
                                     )
-                                    self.users[user.id] = user
+                                    self._add_user(user)
                                     
                                     # Create private chat
                                     chat = MockChat(
@@ -361,7 +370,7 @@ class MockTelegramService:
                                         type=ChatType.PRIVATE,
                                         first_name=user.first_name
                                     )
-                                    self.chats[chat.id] = chat
+                                    self._add_chat(chat)
                                     users_loaded += 1
                                     logger.info(f"✅ Loaded team member: {user.first_name} (ID: {telegram_id}, Role: {role.value})")
                                 
@@ -391,7 +400,7 @@ class MockTelegramService:
                 title=team_name,
                 is_main_chat=True
             )
-            self.chats[main_chat.id] = main_chat
+            self._add_chat(main_chat)
             
             # Leadership chat (only team members, admins, and leadership can access)
             leadership_chat = MockChat(
@@ -400,7 +409,7 @@ class MockTelegramService:
                 title=f"{team_name} - Leadership",
                 is_leadership_chat=True
             )
-            self.chats[leadership_chat.id] = leadership_chat
+            self._add_chat(leadership_chat)
             
             logger.info(f"Created group chats: Main ({main_chat.id}), Leadership ({leadership_chat.id}) for team: {team_name}")
     
@@ -463,7 +472,7 @@ class MockTelegramService:
                                         phone_number=player_data.get('phone_number') or player_data.get('phone'),
                                         status=player_data.get('status', 'pending')  # Include status from Firestore
                                     )
-                                    self.users[user.id] = user
+                                    self._add_user(user)
                                     
                                     # Create private chat
                                     chat = MockChat(
@@ -471,7 +480,7 @@ class MockTelegramService:
                                         type=ChatType.PRIVATE,
                                         first_name=user.first_name
                                     )
-                                    self.chats[chat.id] = chat
+                                    self._add_chat(chat)
                                     new_users += 1
                                     logger.info(f"🆕 Added new player: {user.first_name} (ID: {telegram_id}, Status: {player_data.get('status', 'unknown')})")
                                 
@@ -513,7 +522,7 @@ class MockTelegramService:
                                         phone_number=member_data.get('phone_number') or member_data.get('phone'),
                                         status=member_data.get('status', 'active')  # Include status from Firestore
                                     )
-                                    self.users[user.id] = user
+                                    self._add_user(user)
                                     
                                     # Create private chat
                                     chat = MockChat(
@@ -521,7 +530,7 @@ class MockTelegramService:
                                         type=ChatType.PRIVATE,
                                         first_name=user.first_name
                                     )
-                                    self.chats[chat.id] = chat
+                                    self._add_chat(chat)
                                     new_users += 1
                                     logger.info(f"🆕 Added new team member: {user.first_name} (ID: {telegram_id}, Role: {role.value})")
                                 
@@ -541,6 +550,35 @@ class MockTelegramService:
         except Exception as e:
             logger.warning(f"⚠️ Failed to refresh users from Firestore: {e}")
     
+    def _add_chat(self, chat: MockChat) -> None:
+        """Add or replace a chat, invalidating the access index"""
+        with self._lock:
+            self.chats[chat.id] = chat
+            self._bump_membership_version()
+
+    def _add_user(self, user: MockUser) -> None:
+        """Add or replace a user, invalidating the access index"""
+        with self._lock:
+            self.users[user.id] = user
+            self._bump_membership_version()
+
+    def _bump_membership_version(self) -> None:
+        """Record a chat or membership change; cached access entries from before it are stale"""
+        with self._lock:
+            self._membership_version += 1
+
+    def get_accessible_chat_ids(self, user_id: int) -> Set[int]:
+        """Get the IDs of chats accessible to a user from the access index"""
+        with self._lock:
+            if user_id not in self.users:
+                return set()
+            cached = self._chat_access_index.get(user_id)
+            if cached is not None and cached[0] == self._membership_version:
+                return cached[1]
+            chat_ids = {chat.id for chat in self.get_accessible_chats_for_user(user_id)}
+            self._chat_access_index[user_id] = (self._membership_version, chat_ids)
+            return chat_ids
+
     def get_accessible_chats_for_user(self, user_id: int) -> List[MockChat]:
         """Get all chats accessible to a specific user"""
         if user_id not in self.users:
@@ -607,29 +645,47 @@ class MockTelegramService:
             return
             
         message_json = json.dumps(message)
-        disconnected = set()
         
         # Create a copy to avoid modification during iteration
         connections = list(self.websocket_connections)
         
-        for websocket in connections:
-            try:
-                await websocket.send_text(message_json)
-            except (WebSocketDisconnect, ConnectionResetError, Exception) as e:
-                logger.warning(f"WebSocket error during broadcast: {e}")
-                disconnected.add(websocket)
+        # Fan out concurrently so one slow client doesn't delay the others
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(websocket.send_text(message_json), WEBSOCKET_SEND_TIMEOUT_SECONDS)
+                for websocket in connections
+            ),
+            return_exceptions=True,
+        )
         
         # Clean up disconnected websockets
-        for websocket in disconnected:
-            await self.disconnect_websocket(websocket)
+        for websocket, result in zip(connections, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"WebSocket error during broadcast: {result}")
+                await self.disconnect_websocket(websocket)
     
-    def _cleanup_old_messages(self):
-        """Remove old messages to prevent memory leaks"""
-        with self._lock:
-            if len(self.messages) > self.max_messages:
-                # Keep only the most recent messages
-                self.messages = self.messages[-self.max_messages:]
-                logger.info(f"Cleaned up messages. Current count: {len(self.messages)}")
+    async def send_history(
+        self,
+        websocket: WebSocket,
+        since_message_id: int,
+        user_id: Optional[int] = None,
+        chat_id: Optional[int] = None,
+        limit: int = 100,
+    ):
+        """Send a client only the messages it missed since its cursor"""
+        if chat_id is not None:
+            messages = self.get_chat_messages(chat_id, limit, since_message_id)
+        elif user_id is not None:
+            messages = self.get_user_messages(user_id, limit, since_message_id)
+        else:
+            messages = self.get_all_messages(limit, since_message_id)
+        
+        await websocket.send_text(json.dumps({
+            "type": "history",
+            "since_message_id": since_message_id,
+            "messages": [msg.to_dict() for msg in messages],
+            "next_cursor": messages[-1].message_id if messages else since_message_id,
+        }))
     
     def create_user(self, request: CreateUserRequest) -> MockUser:
         """Create a new test user"""
@@ -653,7 +709,7 @@ class MockTelegramService:
                     phone_number=request.phone_number
                 )
                 
-                self.users[user_id] = user
+                self._add_user(user)
                 
                 # Create private chat for the user
                 chat = MockChat(
@@ -662,7 +718,7 @@ class MockTelegramService:
                     first_name=user.first_name,
                     last_name=user.last_name
                 )
-                self.chats[chat.id] = chat
+                self._add_chat(chat)
                 
                 logger.info(f"Created new user: {user.first_name} (@{user.username})")
                 return user
@@ -775,7 +831,7 @@ class MockTelegramService:
                     status='pending'
                 )
                 
-                self.users[new_telegram_id] = user
+                self._add_user(user)
                 logger.info(f"🔗 [INVITE PROCESSING] Added user to mock service")
                 
                 # Create private chat for the user
@@ -786,7 +842,7 @@ class MockTelegramService:
                     first_name=user.first_name,
                     last_name=user.last_name
                 )
-                self.chats[chat.id] = chat
+                self._add_chat(chat)
                 logger.info(f"🔗 [INVITE PROCESSING] Added private chat to mock service")
                 
                 logger.info(f"✅ [INVITE PROCESSING] SUCCESS: Created user from invite: {user.first_name} (@{user.username}, ID: {new_telegram_id})")
@@ -879,6 +935,7 @@ class MockTelegramService:
             
             user = self.users[user_id]
             chat = self.chats[chat_id]
+            self._bump_membership_version()
             
             # Create new_chat_members event data
             event_data = {
@@ -972,12 +1029,10 @@ class MockTelegramService:
                 message_type=request.message_type
             )
             
+            # Ring buffers evict the oldest messages on append
             self.messages.append(message)
             self.message_counter += 1
             
-            # Cleanup old messages
-            self._cleanup_old_messages()
-            
             chat_context = chat.get_chat_context()
             logger.info(f"Message sent: {user.first_name} -> {chat_context} chat -> {request.text[:50]}...")
             
@@ -1027,34 +1082,24 @@ class MockTelegramService:
             
             return message
     
-    def get_user_messages(self, user_id: int, limit: int = 50) -> List[MockMessage]:
+    def get_user_messages(
+        self, user_id: int, limit: int = 50, since_message_id: Optional[int] = None
+    ) -> List[MockMessage]:
         """Get messages for a specific user (from all accessible chats)"""
-        with self._lock:
-            if user_id not in self.users:
-                raise HTTPException(status_code=404, detail="User not found")
-            
-            # Get all chats accessible to the user
-            accessible_chat_ids = [chat.id for chat in self.get_accessible_chats_for_user(user_id)]
-            
-            user_messages = [
-                msg for msg in self.messages 
-                if msg.chat.id in accessible_chat_ids
-            ]
-            
-            return user_messages[-limit:]
+        if user_id not in self.users:
+            raise HTTPException(status_code=404, detail="User not found")
+        
+        accessible_chat_ids = self.get_accessible_chat_ids(user_id)
+        return self.messages.get_messages_for_chats(accessible_chat_ids, limit, since_message_id)
     
-    def get_chat_messages(self, chat_id: int, limit: int = 50) -> List[MockMessage]:
+    def get_chat_messages(
+        self, chat_id: int, limit: int = 50, since_message_id: Optional[int] = None
+    ) -> List[MockMessage]:
         """Get messages for a specific chat"""
-        with self._lock:
-            if chat_id not in self.chats:
-                raise HTTPException(status_code=404, detail="Chat not found")
-            
-            chat_messages = [
-                msg for msg in self.messages 
-                if msg.chat.id == chat_id
-            ]
-            
-            return chat_messages[-limit:]
+        if chat_id not in self.chats:
+            raise HTTPException(status_code=404, detail="Chat not found")
+        
+        return self.messages.get_chat_messages(chat_id, limit, since_message_id)
     
     def get_all_users(self) -> List[MockUser]:
         """Get all test users (includes fresh data from Firestore)"""
@@ -1077,10 +1122,11 @@ class MockTelegramService:
                 if chat.is_main_chat or chat.is_leadership_chat
             ]
     
-    def get_all_messages(self, limit: int = 100) -> List[MockMessage]:
+    def get_all_messages(
+        self, limit: int = 100, since_message_id: Optional[int] = None
+    ) -> List[MockMessage]:
         """Get all messages"""
-        with self._lock:
-            return self.messages[-limit:]
+        return self.messages.get_recent(limit, since_message_id)
     
     def get_service_stats(self) -> Dict[str, Any]:
         """Get service statistics"""
@@ -1090,6 +1136,7 @@ class MockTelegramService:
                 "total_chats": len(self.chats),
                 "group_chats": len([c for c in self.chats.values() if c.is_main_chat or c.is_leadership_chat]),
                 "total_messages": len(self.messages),
+                "message_store": self.messages.stats(),
                 "active_websockets": len(self.websocket_connections),
                 "message_counter": self.message_counter,
                 "bot_integration_available": BOT_INTEGRATION_AVAILABLE,
@@ -1389,23 +1436,23 @@ async def bot_response(response_data: dict):
 
 
 @app.get("/messages/{user_id}")
-async def get_user_messages(user_id: int, limit: int = 50):
+async def get_user_messages(user_id: int, limit: int = 50, since_message_id: Optional[int] = None):
     """Get messages for a specific user (from all accessible chats)"""
-    messages = mock_service.get_user_messages(user_id, limit)
+    messages = mock_service.get_user_messages(user_id, limit, since_message_id)
     return [msg.to_dict() for msg in messages]
 
 
 @app.get("/chats/{chat_id}/messages")
-async def get_chat_messages(chat_id: int, limit: int = 50):
+async def get_chat_messages(chat_id: int, limit: int = 50, since_message_id: Optional[int] = None):
     """Get messages for a specific chat"""
-    messages = mock_service.get_chat_messages(chat_id, limit)
+    messages = mock_service.get_chat_messages(chat_id, limit, since_message_id)
     return [msg.to_dict() for msg in messages]
 
 
 @app.get("/messages")
-async def get_all_messages(limit: int = 100):
+async def get_all_messages(limit: int = 100, since_message_id: Optional[int] = None):
     """Get all messages"""
-    messages = mock_service.get_all_messages(limit)
+    messages = mock_service.get_all_messages(limit, since_message_id)
     return [msg.to_dict() for msg in messages]
 
 
@@ -1415,8 +1462,20 @@ async def websocket_endpoint(websocket: WebSocket):
     await mock_service.connect_websocket(websocket)
     try:
         while True:
-            # Keep connection alive
-            await websocket.receive_text()
+            # Keep connection alive; a {"since_message_id": N} frame requests missed messages
+            data = await websocket.receive_text()
+            try:
+                request = json.loads(data)
+            except ValueError:
+                continue
+            if isinstance(request, dict) and "since_message_id" in request:
+                await mock_service.send_history(
+                    websocket,
+                    since_message_id=int(request["since_message_id"]),
+                    user_id=request.get("user_id"),
+                    chat_id=request.get("chat_id"),
+                    limit=int(request.get("limit", 100)),
+                )
     except WebSocketDisconnect:
         await mock_service.disconnect_websocket(websocket)
     except Exception as e:
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Crew Cold vs. Warm First-Message Benchmark
+
+Builds real ``TeamManagementSystem`` crews (agents, tool bindings, memory and
+the hierarchical manager) over ``MockDataStore`` with ``AI_PROVIDER=mock``, so
+no model is called, and times the first message a team sends when its crew is:
+
+- cold: never built, so the whole crew is built on the message
+- rehydrated: hibernated, then rebuilt from its blueprint on the message
+- pre-warmed: hibernated, then rebuilt by ``CrewPreWarmer`` ahead of a match
+- warm: an already active crew (a follow-up message)
+
+Usage:
+    python -m tests.mock_telegram.crew_warmup_benchmark --teams 5
+    python -m tests.mock_telegram.crew_warmup_benchmark --json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Must be set before settings and the dependency container are imported
+os.environ.setdefault("USE_MOCK_DATASTORE", "true")
+os.environ.setdefault("KICKAI_INVITE_SECRET_KEY", "load_harness_secret_key_32_chars_long!!")
+# Settings requires Firebase credentials; MockDataStore never opens them
+os.environ.setdefault("FIREBASE_PROJECT_ID", "kickai-benchmark")
+os.environ.setdefault("FIREBASE_CREDENTIALS_FILE", "mock-credentials.json")
+os.environ["AI_PROVIDER"] = "mock"
+os.environ.setdefault("AI_MODEL_SIMPLE", "mock-model")
+os.environ.setdefault("AI_MODEL_ADVANCED", "mock-model")
+
+from kickai.agents.crew_hibernation import CrewPreWarmer
+from kickai.agents.crew_lifecycle_manager import CrewLifecycleManager
+from kickai.core.crew_activity_store import CrewActivityStore
+from tests.mock_telegram.load_harness import _latency_summary
+
+SCENARIOS = ("cold", "rehydrated", "prewarmed", "warm")
+FIRST_MESSAGE = "/help"
+# Lead window the pre-warmer looks ahead; the benchmark match is inside it
+PREWARM_LEAD_SECONDS = 3600
+
+
+def _context(team_id: str) -> Dict[str, Any]:
+    return {
+        "team_id": team_id,
+        "telegram_id": 1001,
+        "username": "benchmark_user",
+        "chat_type": "main",
+        "message_text": FIRST_MESSAGE,
+    }
+
+
+async def _timed_message(manager: CrewLifecycleManager, team_id: str) -> Tuple[float, bool]:
+    """Time one message; execute_task answers failures with an apology, so check the metrics."""
+    before = await manager.get_crew_metrics(team_id)
+    succeeded_before = before.successful_requests if before else 0
+    started = time.perf_counter()
+    await manager.execute_task(team_id, FIRST_MESSAGE, _context(team_id))
+    elapsed = time.perf_counter() - started
+
+    after = await manager.get_crew_metrics(team_id)
+    if after is None:
+        return elapsed, False
+    # Every crew build starts fresh metrics
+    return elapsed, after.successful_requests > (succeeded_before if after is before else 0)
+
+
+async def run_benchmark(teams: int) -> Dict[str, Any]:
+    """Time first messages for each crew state over ``teams`` distinct teams."""
+    store = CrewActivityStore()
+    manager = CrewLifecycleManager(activity_store=store)
+    prewarmer = CrewPreWarmer(manager, store, lead_seconds=PREWARM_LEAD_SECONDS, min_events=1)
+    samples: Dict[str, List[float]] = {scenario: [] for scenario in SCENARIOS}
+    prewarm_build_seconds: List[float] = []
+    errors: List[str] = []
+
+    async def measure(scenario: str, team_id: str) -> None:
+        seconds, succeeded = await _timed_message(manager, team_id)
+        samples[scenario].append(seconds)
+        if not succeeded:
+            errors.append(f"{team_id} {scenario}")
+
+    for index in range(teams):
+        team_id = f"BW{index + 1}"
+
+        await measure("cold", team_id)
+        await measure("warm", team_id)
+
+        await manager.hibernate_crew(team_id)
+        await measure("rehydrated", team_id)
+
+        await manager.hibernate_crew(team_id)
+        store.schedule(team_id, time.time() + PREWARM_LEAD_SECONDS / 2)
+        started = time.perf_counter()
+        await prewarmer.run_once()
+        prewarm_build_seconds.append(time.perf_counter() - started)
+        await measure("prewarmed", team_id)
+
+    await manager.shutdown_all_crews()
+    return {
+        "teams": teams,
+        "first_message_ms": {scenario: _latency_summary(samples[scenario]) for scenario in SCENARIOS},
+        "prewarm_build_ms": _latency_summary(prewarm_build_seconds),
+        "lifecycle": manager.get_lifecycle_stats(),
+        "errors": errors,
+    }
+
+
+def report_problems(report: Dict[str, Any]) -> List[str]:
+    """Reasons the measurements do not describe working crews (empty when they do)."""
+    problems = []
+    if report["errors"]:
+        problems.append(f"{len(report['errors'])} messages failed: {', '.join(report['errors'])}")
+    for counter in ("hibernations", "rehydrations"):
+        if not report["lifecycle"].get(counter):
+            problems.append(f"no crew {counter} recorded")
+    return problems
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [f"🧊 Crew first-message latency over {report['teams']} teams (mock LLM)", ""]
+    lines.append(f"{'crew state':<12} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10}")
+    for scenario, summary in report["first_message_ms"].items():
+        lines.append(f"{scenario:<12} {summary['p50']:>10.1f} {summary['p95']:>10.1f} {summary['max']:>10.1f}")
+    cold = report["first_message_ms"]["cold"]["p50"]
+    for scenario in ("rehydrated", "prewarmed"):
+        value = report["first_message_ms"][scenario]["p50"]
+        if value:
+            lines.append(f"\n{scenario}: {cold / value:.1f}x faster than cold (p50)")
+    lines.append(f"\npre-warm build p50: {report['prewarm_build_ms']['p50']:.1f} ms (off the message path)")
+    lines.append(f"lifecycle: {report['lifecycle']}")
+    return "\n".join(lines)
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Cold vs. warm crew first-message benchmark")
+    parser.add_argument("--teams", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--verbose", action="store_true", help="Keep application logging")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+
+    if not args.verbose:
+        from loguru import logger
+
+        logger.remove()
+        logger.add(sys.stderr, level="WARNING")
+
+    report = asyncio.run(run_benchmark(args.teams))
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+    problems = report_problems(report)
+    for problem in problems:
+        print(f"❌ {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Agent Iteration Budget Benchmark
+
+Counts LLM calls per message with fixed iteration limits and with the
+adaptive ``IterationController``, for simple commands, lookups, actions and
+natural language. The LLM is scripted to behave like a chatty model: after a
+tool answers, the specialist re-checks the result a few times before writing
+its final answer.
+
+The crew is a manager delegating to one specialist that has every command
+tool. Tool selection, budgets, final-answer tools and step counting are the
+real ``tool_selection`` and ``iteration_control`` code; the agent loop is a
+minimal stand-in for CrewAI's executor with the same semantics for
+``max_iter`` (one forced final-answer call once it is reached),
+``result_as_answer`` and ``step_callback``, so no model or CrewAI prompt
+format is involved.
+
+Usage:
+    python -m tests.mock_telegram.iteration_benchmark --rounds 30
+    python -m tests.mock_telegram.iteration_benchmark --json
+"""
+
+import argparse
+import functools
+import json
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from kickai.agents.config.tool_binding_config import ALWAYS_BOUND_TOOLS, COMMAND_INTENT_TOOLS
+from kickai.agents.iteration_control import IterationController, iteration_scope, record_agent_step
+from kickai.agents.tool_selection import binding_key, select_tools, tool_name
+
+MESSAGES = (
+    "/help",
+    "/myinfo",
+    "/ping",
+    "/list",
+    "/matches",
+    "/update phone 07700900123",
+    "Who is available for Saturday's match?",
+)
+MANAGER = "team_manager"
+SPECIALIST = "specialist"
+# Iteration limits the agents are configured with (agents.yaml default, CrewAI manager default)
+SPECIALIST_MAX_ITERATIONS = 10
+MANAGER_MAX_ITERATIONS = 20
+MODES = ("fixed", "adaptive")
+
+
+@dataclass
+class StandInTool:
+    """Tool with a canned reply; copied (not mutated) when bound as a final answer."""
+
+    name: str
+    result_as_answer: bool = False
+    description: str = ""
+
+    def run(self) -> str:
+        return f"{self.name} result"
+
+
+ALL_TOOLS = [
+    StandInTool(name, description=f"{name} tool")
+    for name in sorted(set().union(*COMMAND_INTENT_TOOLS.values()) | ALWAYS_BOUND_TOOLS)
+]
+
+
+class ScriptedLLM:
+    """Chatty scripted model: the specialist calls a tool, re-checks it, then answers.
+
+    The manager delegates once and then answers.
+    """
+
+    def __init__(self, rechecks: int = 2):
+        self.rechecks = rechecks
+        self.calls = 0
+
+    def next_action(self, agent_name: str, tools: List[Any], steps_taken: int) -> Optional[Any]:
+        """One LLM call; returns the tool to use next, or None for the final answer."""
+        self.calls += 1
+        usable = [tool for tool in tools if tool_name(tool) not in ALWAYS_BOUND_TOOLS]
+        planned = 1 if agent_name == MANAGER else 1 + self.rechecks
+        if not usable or steps_taken >= planned:
+            return None
+        return usable[0]
+
+    def force_final_answer(self) -> str:
+        self.calls += 1
+        return "Final answer (iteration limit reached)"
+
+
+def run_agent(
+    agent_name: str,
+    llm: ScriptedLLM,
+    tools: List[Any],
+    max_iter: int,
+    run_tool: Callable[[Any], str],
+) -> str:
+    """ReAct loop with CrewAI's max_iter, result_as_answer and step_callback semantics."""
+    step_callback = functools.partial(record_agent_step, agent_name)
+    iterations = 0
+    while True:
+        if iterations >= max_iter:
+            # CrewAI asks once more for a final answer; that call is not a step
+            return llm.force_final_answer()
+        tool = llm.next_action(agent_name, tools, iterations)
+        iterations += 1
+        if tool is None:
+            step_callback()
+            return "Final answer"
+        result = run_tool(tool)
+        step_callback()
+        if tool.result_as_answer:
+            return result
+
+
+def handle_message(controller: IterationController, llm: ScriptedLLM, text: str) -> int:
+    """Run one message through manager and specialist; returns the LLM calls it took."""
+    context = {"chat_type": "leadership", "is_registered": True, "message_text": text}
+    calls_before = llm.calls
+    with iteration_scope(text, controller) as run:
+        binding = select_tools(SPECIALIST, ALL_TOOLS, binding_key(context))
+        tools = binding.tools
+        if run.stop_on_tool_answer and binding.answer_tools:
+            tools = binding.answer_tools
+        specialist_max_iter = run.cap(SPECIALIST, SPECIALIST_MAX_ITERATIONS)
+        manager_max_iter = run.cap(MANAGER, MANAGER_MAX_ITERATIONS)
+
+        def delegate(_: Any) -> str:
+            return run_agent(SPECIALIST, llm, tools, specialist_max_iter, lambda tool: tool.run())
+
+        run_agent(MANAGER, llm, [StandInTool("delegate_work_to_coworker")], manager_max_iter, delegate)
+    return llm.calls - calls_before
+
+
+def run_benchmark(rounds: int) -> Dict[str, Any]:
+    """LLM calls per message for each mode; ``rounds`` passes let the adaptive budgets tune."""
+    report: Dict[str, Any] = {"rounds": rounds, "llm_calls": {}, "iterations": {}}
+    for mode in MODES:
+        controller = IterationController(adaptive=mode == "adaptive")
+        llm = ScriptedLLM()
+        first_round: Dict[str, int] = {}
+        last_round: Dict[str, int] = {}
+        for round_index in range(rounds):
+            for text in MESSAGES:
+                calls = handle_message(controller, llm, text)
+                if round_index == 0:
+                    first_round[text] = calls
+                last_round[text] = calls
+        report["llm_calls"][mode] = {
+            "first_round": first_round,
+            "last_round": last_round,
+            "total": llm.calls,
+        }
+        report["iterations"][mode] = controller.report()
+    return report
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    fixed = report["llm_calls"]["fixed"]["last_round"]
+    adaptive = report["llm_calls"]["adaptive"]
+    lines = [f"🔁 LLM calls per message over {report['rounds']} rounds (scripted LLM)", ""]
+    lines.append(f"{'message':<42} {'fixed':>6} {'adaptive':>9} {'tuned':>6}")
+    for text in MESSAGES:
+        lines.append(
+            f"{text[:42]:<42} {fixed[text]:>6} {adaptive['first_round'][text]:>9} {adaptive['last_round'][text]:>6}"
+        )
+    total_fixed = report["llm_calls"]["fixed"]["total"]
+    lines.append(f"\ntotal LLM calls: {total_fixed} fixed, {adaptive['total']} adaptive")
+    lines.append("\nbudgets:")
+    for intent, stats in report["iterations"]["adaptive"].items():
+        lines.append(
+            f"  {intent:<18} class {stats['task_class']:<7} budget {stats['class_budget']}, "
+            f"tuned {stats['tuned_budget']}, mean {stats['mean_iterations']} iterations"
+        )
+    return "\n".join(lines)
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Fixed vs. adaptive agent iteration budget benchmark")
+    parser.add_argument("--rounds", type=int, default=30)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--verbose", action="store_true", help="Keep application logging")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+
+    if not args.verbose:
+        from loguru import logger
+
+        logger.remove()
+        logger.add(sys.stderr, level="WARNING")
+
+    report = run_benchmark(args.rounds)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
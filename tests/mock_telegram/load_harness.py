@@ -0,0 +1,603 @@
+#!/usr/bin/env python3
+"""
+In-Process Load Harness for the KICKAI Message Pipeline
+
+Drives ``AgenticMessageRouter.route_message`` directly with synthetic
+multi-user, multi-team traffic over ``MockDataStore`` and a stub LLM crew.
+Unlike ``performance_test_suite.py`` this needs no running mock server,
+websockets, matplotlib or psutil, and it measures the bot rather than HTTP.
+
+Reports:
+- Throughput (messages/second)
+- Latency percentiles (p50/p90/p95/p99/max)
+- Memory growth (tracemalloc current/peak)
+- Per-stage latency breakdown (admission, registration check, context, crew)
+
+Usage:
+    python -m tests.mock_telegram.load_harness --messages 2000 --concurrency 50
+    python -m tests.mock_telegram.load_harness --save-baseline baseline.json
+    python -m tests.mock_telegram.load_harness --baseline baseline.json --fail-on-regression
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Must be set before the dependency container is imported
+os.environ.setdefault("USE_MOCK_DATASTORE", "true")
+os.environ.setdefault("KICKAI_INVITE_SECRET_KEY", "load_harness_secret_key_32_chars_long!!")
+# Settings requires Firebase and model configuration; MockDataStore and the stub crew never use them
+os.environ.setdefault("FIREBASE_PROJECT_ID", "kickai-load-harness")
+os.environ.setdefault("FIREBASE_CREDENTIALS_FILE", "mock-credentials.json")
+os.environ.setdefault("AI_PROVIDER", "mock")
+os.environ.setdefault("AI_MODEL_SIMPLE", "mock-model")
+os.environ.setdefault("AI_MODEL_ADVANCED", "mock-model")
+
+from kickai.core.enums import ChatType
+from kickai.core.firestore_constants import (
+    get_team_members_collection,
+    get_team_players_collection,
+)
+from kickai.core.types import AgentResponse, TelegramMessage
+
+# Message kinds
+KIND_COMMAND = "command"
+KIND_NATURAL_LANGUAGE = "natural_language"
+KIND_CONTACT_SHARE = "contact_share"
+KIND_NEW_MEMBER = "new_member"
+
+COMMAND_SAMPLES = ["/help", "/myinfo", "/list", "/status", "/info", "/ping", "/version"]
+LEADERSHIP_COMMAND_SAMPLES = ["/list", "/addplayer John Smith +447700900123 Forward", "/help"]
+NATURAL_LANGUAGE_SAMPLES = [
+    "who is playing on saturday?",
+    "what's my status?",
+    "can you show me the squad for the next match",
+    "I can't make it this weekend",
+    "what commands can I use?",
+    "update my position to midfielder",
+]
+
+# Stage names used in the breakdown
+STAGE_ADMISSION = "admission"
+STAGE_REGISTRATION = "registration_check"
+STAGE_CONTEXT = "context_build"
+STAGE_CREW = "crew_execution"
+
+# Regression tolerance for baseline comparison (fractional change)
+DEFAULT_REGRESSION_TOLERANCE = 0.15
+
+
+@dataclass
+class TrafficMix:
+    """Relative weights of synthetic message kinds."""
+
+    command: float = 0.55
+    natural_language: float = 0.30
+    contact_share: float = 0.10
+    new_member: float = 0.05
+
+    def choose(self, rng: random.Random) -> str:
+        kinds = [KIND_COMMAND, KIND_NATURAL_LANGUAGE, KIND_CONTACT_SHARE, KIND_NEW_MEMBER]
+        weights = [self.command, self.natural_language, self.contact_share, self.new_member]
+        return rng.choices(kinds, weights=weights, k=1)[0]
+
+
+@dataclass
+class LoadProfile:
+    """Shape of the synthetic load."""
+
+    teams: int = 3
+    users_per_team: int = 40
+    registered_ratio: float = 0.8
+    leadership_ratio: float = 0.2
+    messages: int = 1000
+    concurrency: int = 25
+    llm_latency_ms: float = 5.0
+    llm_jitter_ms: float = 2.0
+    requests_per_minute: int = 10_000
+    max_concurrent: int = 1_000
+    seed: int = 1234
+    mix: TrafficMix = field(default_factory=TrafficMix)
+
+
+@dataclass
+class SyntheticUser:
+    """A simulated Telegram user."""
+
+    telegram_id: int
+    username: str
+    team_id: str
+    phone_number: str
+    registered: bool
+    leadership: bool
+
+
+class StubLLMCrew:
+    """
+    Crew stand-in that simulates LLM latency without any model calls.
+
+    Implements the ``CrewProtocol`` used by ``CrewLifecycleManager`` and performs
+    a roster read for listing commands so the data-store path is exercised.
+    """
+
+    def __init__(self, team_id: str, database: Any, profile: LoadProfile):
+        self.team_id = team_id
+        self.database = database
+        self.profile = profile
+        self.calls = 0
+        self._rng = random.Random(f"{profile.seed}:{team_id}")
+
+    async def execute_task(self, task_description: str, execution_context: Dict[str, Any]) -> str:
+        self.calls += 1
+        latency_ms = max(
+            0.0, self._rng.gauss(self.profile.llm_latency_ms, self.profile.llm_jitter_ms)
+        )
+        await asyncio.sleep(latency_ms / 1000)
+
+        text = (task_description or "").lower()
+        if text.startswith("/list") or "squad" in text:
+            players = await self.database.query_documents(
+                get_team_players_collection(self.team_id),
+                filters=[{"field": "team_id", "operator": "==", "value": self.team_id}],
+            )
+            return f"📋 {len(players)} players in {self.team_id}"
+        return f"🤖 [stub] handled: {task_description[:40]}"
+
+    def health_check(self) -> Dict[str, Any]:
+        return {"system": "healthy", "agents": {"stub": True}}
+
+
+class StageProfiler:
+    """Times selected pipeline stages by temporarily wrapping their callables."""
+
+    def __init__(self) -> None:
+        self.timings: Dict[str, List[float]] = defaultdict(list)
+        self._patches: List[Tuple[Any, str, Any]] = []
+
+    def wrap(self, owner: Any, attribute: str, stage: str) -> None:
+        original = owner.__dict__[attribute]
+        descriptor = type(original) if isinstance(original, (staticmethod, classmethod)) else None
+        func = original.__func__ if descriptor else original
+        timings = self.timings[stage]
+
+        if asyncio.iscoroutinefunction(func):
+
+            async def timed(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    timings.append(time.perf_counter() - start)
+
+        else:
+
+            def timed(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    timings.append(time.perf_counter() - start)
+
+        setattr(owner, attribute, descriptor(timed) if descriptor else timed)
+        self._patches.append((owner, attribute, original))
+
+    def restore(self) -> None:
+        for owner, attribute, original in reversed(self._patches):
+            setattr(owner, attribute, original)
+        self._patches.clear()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {stage: _latency_summary(samples) for stage, samples in self.timings.items()}
+
+
+@dataclass
+class LoadReport:
+    """Result of one harness run."""
+
+    messages: int
+    succeeded: int
+    failed: int
+    duration_seconds: float
+    throughput_per_second: float
+    latency_ms: Dict[str, float]
+    stages_ms: Dict[str, Dict[str, float]]
+    by_kind_ms: Dict[str, Dict[str, float]]
+    failures_by_reason: Dict[str, int]
+    memory: Dict[str, float]
+    profile: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _percentile(sorted_samples: List[float], pct: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, max(0, int(round(pct / 100 * len(sorted_samples))) - 1))
+    return sorted_samples[index]
+
+
+def _latency_summary(samples_seconds: List[float]) -> Dict[str, float]:
+    samples = sorted(s * 1000 for s in samples_seconds)
+    if not samples:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p90": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "count": len(samples),
+        "mean": round(statistics.fmean(samples), 3),
+        "p50": round(_percentile(samples, 50), 3),
+        "p90": round(_percentile(samples, 90), 3),
+        "p95": round(_percentile(samples, 95), 3),
+        "p99": round(_percentile(samples, 99), 3),
+        "max": round(samples[-1], 3),
+    }
+
+
+class LoadHarness:
+    """Builds the in-process pipeline, generates traffic and measures it."""
+
+    def __init__(self, profile: LoadProfile):
+        self.profile = profile
+        self.rng = random.Random(profile.seed)
+        self.team_ids = [f"LT{i}" for i in range(1, profile.teams + 1)]
+        self.users: List[SyntheticUser] = []
+        self.routers: Dict[str, Any] = {}
+        self.database: Any = None
+        self.crews: Dict[str, StubLLMCrew] = {}
+        self._next_new_member_id = 9_000_000
+
+    async def setup(self) -> None:
+        """Initialise the container over MockDataStore, seed data and build routers."""
+        from kickai.agents.agentic_message_router import AgenticMessageRouter
+        from kickai.agents.crew_lifecycle_manager import CrewLifecycleManager
+        from kickai.agents.utils.admission_scheduler import AdmissionScheduler
+        from kickai.agents.utils.resource_manager import ResourceManager
+        from kickai.core.dependency_container import get_container, initialize_container
+
+        await initialize_container()
+        self.database = get_container().get_database()
+        await self._seed_data()
+
+        lifecycle_manager = CrewLifecycleManager(crew_factory=self._build_crew)
+        # One scheduler for all teams, as in production
+        scheduler = AdmissionScheduler(max_concurrent=self.profile.max_concurrent)
+        for index, team_id in enumerate(self.team_ids):
+            router = AgenticMessageRouter(
+                team_id,
+                resource_manager=ResourceManager(
+                    scheduler=scheduler,
+                    max_requests_per_minute=self.profile.requests_per_minute,
+                ),
+                crew_lifecycle_manager=lifecycle_manager,
+            )
+            router.set_chat_ids(
+                main_chat_id=f"-100{index}1", leadership_chat_id=f"-100{index}2"
+            )
+            self.routers[team_id] = router
+
+    def _build_crew(self, team_id: str) -> StubLLMCrew:
+        crew = StubLLMCrew(team_id, self.database, self.profile)
+        self.crews[team_id] = crew
+        return crew
+
+    async def _seed_data(self) -> None:
+        telegram_id = 1_000_000
+        for team_id in self.team_ids:
+            for n in range(self.profile.users_per_team):
+                telegram_id += 1
+                user = SyntheticUser(
+                    telegram_id=telegram_id,
+                    username=f"{team_id.lower()}_user{n}",
+                    team_id=team_id,
+                    phone_number=f"+4477009{telegram_id % 100000:05d}",
+                    registered=self.rng.random() < self.profile.registered_ratio,
+                    leadership=self.rng.random() < self.profile.leadership_ratio,
+                )
+                self.users.append(user)
+                if not user.registered:
+                    continue
+                player_id = f"{n:02d}{team_id}"
+                await self.database.create_document(
+                    get_team_players_collection(team_id),
+                    {
+                        "team_id": team_id,
+                        "telegram_id": user.telegram_id,
+                        "player_id": player_id,
+                        "name": user.username,
+                        "username": user.username,
+                        "phone_number": user.phone_number,
+                        "status": "active",
+                    },
+                    document_id=player_id,
+                )
+                if user.leadership:
+                    await self.database.create_document(
+                        get_team_members_collection(team_id),
+                        {
+                            "team_id": team_id,
+                            "telegram_id": user.telegram_id,
+                            "member_id": f"M{player_id}",
+                            "name": user.username,
+                            "role": "Team Manager",
+                            "is_admin": n == 0,
+                            "status": "active",
+                            "phone_number": user.phone_number,
+                        },
+                        document_id=f"M{player_id}",
+                    )
+
+    def generate_message(self) -> Tuple[str, TelegramMessage]:
+        """Build one synthetic message according to the traffic mix."""
+        user = self.rng.choice(self.users)
+        kind = self.profile.mix.choose(self.rng)
+        router = self.routers[user.team_id]
+        in_leadership = user.leadership and self.rng.random() < 0.5
+        chat_type = ChatType.LEADERSHIP if in_leadership else ChatType.MAIN
+        chat_id = router.leadership_chat_id if in_leadership else router.main_chat_id
+
+        message = TelegramMessage(
+            telegram_id=user.telegram_id,
+            text="",
+            chat_id=chat_id,
+            chat_type=chat_type,
+            team_id=user.team_id,
+            username=user.username,
+            name=user.username,
+        )
+        if kind == KIND_COMMAND:
+            samples = LEADERSHIP_COMMAND_SAMPLES if in_leadership else COMMAND_SAMPLES
+            message.text = self.rng.choice(samples)
+        elif kind == KIND_NATURAL_LANGUAGE:
+            message.text = self.rng.choice(NATURAL_LANGUAGE_SAMPLES)
+        elif kind == KIND_CONTACT_SHARE:
+            message.chat_type = ChatType.PRIVATE
+            message.chat_id = str(user.telegram_id)
+            message.text = "📱 Shared contact"
+            message.contact_phone = user.phone_number
+            message.contact_user_id = user.telegram_id
+        else:
+            self._next_new_member_id += 1
+            member = {
+                "id": self._next_new_member_id,
+                "username": f"newbie{self._next_new_member_id}",
+                "first_name": "New",
+                "last_name": "Member",
+                "is_bot": False,
+            }
+            message.telegram_id = self._next_new_member_id
+            message.username = member["username"]
+            message.chat_type = ChatType.MAIN
+            message.chat_id = router.main_chat_id
+            message.text = f"{member['username']} joined the chat"
+            message.new_chat_members = [member]
+        return kind, message
+
+    async def _dispatch(self, kind: str, message: TelegramMessage) -> AgentResponse:
+        router = self.routers[message.team_id]
+        if kind == KIND_CONTACT_SHARE:
+            return await router.route_contact_share(message)
+        return await router.route_message(message)
+
+    def _install_profiler(self) -> StageProfiler:
+        from kickai.agents.utils.context_optimizer import ContextOptimizer
+        from kickai.agents.utils.resource_manager import ResourceManager
+        from kickai.agents.utils.user_registration_checker import UserRegistrationChecker
+
+        profiler = StageProfiler()
+        profiler.wrap(ResourceManager, "acquire_semaphore", STAGE_ADMISSION)
+        profiler.wrap(
+            UserRegistrationChecker, "check_user_registration_status", STAGE_REGISTRATION
+        )
+        profiler.wrap(ContextOptimizer, "create_minimal_context", STAGE_CONTEXT)
+        profiler.wrap(StubLLMCrew, "execute_task", STAGE_CREW)
+        return profiler
+
+    async def run(self) -> LoadReport:
+        """Drive the configured number of messages and return the report."""
+        messages = [self.generate_message() for _ in range(self.profile.messages)]
+        latencies: List[float] = []
+        by_kind: Dict[str, List[float]] = defaultdict(list)
+        failures: Counter = Counter()
+        semaphore = asyncio.Semaphore(self.profile.concurrency)
+
+        async def drive(kind: str, message: TelegramMessage) -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    response = await self._dispatch(kind, message)
+                    succeeded = response.success
+                    reason = response.error or "unknown"
+                except Exception as e:
+                    succeeded = False
+                    reason = type(e).__name__
+                elapsed = time.perf_counter() - start
+                latencies.append(elapsed)
+                by_kind[kind].append(elapsed)
+                if not succeeded:
+                    failures[reason] += 1
+
+        # Warm up once per team so crew creation doesn't skew the percentiles
+        for team_id in self.team_ids:
+            await self.routers[team_id].crew_lifecycle_manager.get_or_create_crew(team_id)
+
+        profiler = self._install_profiler()
+        tracemalloc.start()
+        baseline_memory, _ = tracemalloc.get_traced_memory()
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(*(drive(kind, message) for kind, message in messages))
+        finally:
+            duration = time.perf_counter() - started
+            current_memory, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            profiler.restore()
+
+        total = len(messages)
+        failed = sum(failures.values())
+        return LoadReport(
+            messages=total,
+            succeeded=total - failed,
+            failed=failed,
+            duration_seconds=round(duration, 4),
+            throughput_per_second=round(total / duration, 2) if duration else 0.0,
+            latency_ms=_latency_summary(latencies),
+            stages_ms=profiler.summary(),
+            by_kind_ms={kind: _latency_summary(samples) for kind, samples in by_kind.items()},
+            failures_by_reason=dict(failures),
+            memory={
+                "growth_kb": round((current_memory - baseline_memory) / 1024, 1),
+                "peak_kb": round(peak_memory / 1024, 1),
+                "per_message_bytes": round((current_memory - baseline_memory) / total, 1)
+                if total
+                else 0.0,
+            },
+            profile={**asdict(self.profile), "teams": self.team_ids},
+        )
+
+
+def compare_to_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_REGRESSION_TOLERANCE,
+) -> List[str]:
+    """
+    Compare a report against a saved baseline.
+
+    Returns:
+        Human-readable regression descriptions (empty when within tolerance)
+    """
+    regressions = []
+    checks: List[Tuple[str, Callable[[Dict[str, Any]], float], bool]] = [
+        ("throughput_per_second", lambda r: r["throughput_per_second"], True),
+        ("latency p50", lambda r: r["latency_ms"]["p50"], False),
+        ("latency p95", lambda r: r["latency_ms"]["p95"], False),
+        ("latency p99", lambda r: r["latency_ms"]["p99"], False),
+        ("memory growth", lambda r: r["memory"]["growth_kb"], False),
+    ]
+    for name, extract, higher_is_better in checks:
+        try:
+            current, previous = extract(report), extract(baseline)
+        except (KeyError, TypeError):
+            continue
+        if not previous:
+            continue
+        change = (current - previous) / abs(previous)
+        regressed = change < -tolerance if higher_is_better else change > tolerance
+        if regressed:
+            regressions.append(f"{name}: {previous} -> {current} ({change:+.1%})")
+
+    if report.get("failed", 0) > baseline.get("failed", 0):
+        regressions.append(f"failures: {baseline.get('failed', 0)} -> {report['failed']}")
+    return regressions
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render a report as plain text."""
+    lat = report["latency_ms"]
+    lines = [
+        "KICKAI in-process load harness",
+        "=" * 40,
+        f"Messages:    {report['messages']} ({report['succeeded']} ok, {report['failed']} failed)",
+        f"Duration:    {report['duration_seconds']}s",
+        f"Throughput:  {report['throughput_per_second']} msg/s",
+        f"Latency ms:  p50={lat['p50']} p90={lat['p90']} p95={lat['p95']} "
+        f"p99={lat['p99']} max={lat['max']}",
+        f"Memory:      growth={report['memory']['growth_kb']}KB "
+        f"peak={report['memory']['peak_kb']}KB",
+        "",
+        "Per-stage breakdown (ms):",
+    ]
+    for stage, summary in report["stages_ms"].items():
+        lines.append(
+            f"  {stage:<20} n={summary['count']:<6} mean={summary['mean']:<8} "
+            f"p95={summary['p95']:<8} p99={summary['p99']}"
+        )
+    lines.append("")
+    lines.append("Per message kind (ms):")
+    for kind, summary in report["by_kind_ms"].items():
+        lines.append(f"  {kind:<20} n={summary['count']:<6} p50={summary['p50']:<8} p95={summary['p95']}")
+    if report["failures_by_reason"]:
+        lines.append("")
+        lines.append("Failures:")
+        for reason, count in report["failures_by_reason"].items():
+            lines.append(f"  {count:>6}  {reason}")
+    return "\n".join(lines)
+
+
+async def run_load(profile: LoadProfile) -> LoadReport:
+    """Convenience entry point: set up a harness and run it once."""
+    harness = LoadHarness(profile)
+    await harness.setup()
+    return await harness.run()
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="In-process load harness for the message pipeline")
+    parser.add_argument("--teams", type=int, default=3)
+    parser.add_argument("--users-per-team", type=int, default=40)
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=25)
+    parser.add_argument("--llm-latency-ms", type=float, default=5.0)
+    parser.add_argument("--llm-jitter-ms", type=float, default=2.0)
+    parser.add_argument("--requests-per-minute", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Write the report to PATH")
+    parser.add_argument("--baseline", metavar="PATH", help="Compare against a saved report")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_REGRESSION_TOLERANCE)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--verbose", action="store_true", help="Keep application logging")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+
+    if not args.verbose:
+        from loguru import logger
+
+        logger.remove()
+        logger.add(sys.stderr, level="WARNING")
+
+    profile = LoadProfile(
+        teams=args.teams,
+        users_per_team=args.users_per_team,
+        messages=args.messages,
+        concurrency=args.concurrency,
+        llm_latency_ms=args.llm_latency_ms,
+        llm_jitter_ms=args.llm_jitter_ms,
+        requests_per_minute=args.requests_per_minute,
+        seed=args.seed,
+    )
+    report = asyncio.run(run_load(profile)).to_dict()
+
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Baseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.tolerance)
+        if regressions:
+            print("\n❌ Regressions vs baseline:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1 if args.fail_on_regression else 0
+        print("\n✅ Within tolerance of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
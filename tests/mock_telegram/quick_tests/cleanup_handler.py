@@ -543,12 +543,9 @@ class CleanupHandler:
                     logger.debug(f"Cleared all {message_count} messages")
                 else:
                     # Remove only test-related messages (basic heuristic)
-                    original_count = len(self.mock_service.messages)
-                    self.mock_service.messages = [
-                        msg for msg in self.mock_service.messages
-                        if not (hasattr(msg.from_user, 'is_test_user') and msg.from_user.is_test_user)
-                    ]
-                    removed_count = original_count - len(self.mock_service.messages)
+                    removed_count = self.mock_service.messages.remove_where(
+                        lambda msg: getattr(msg.from_user, 'is_test_user', False)
+                    )
                     logger.debug(f"Removed {removed_count} test messages")
             
             logger.success("✅ Cleaned up test messages")
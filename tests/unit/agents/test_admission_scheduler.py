@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the process-wide admission scheduler and bounded rate limiter.
+"""
+
+import asyncio
+
+import pytest
+
+from kickai.agents.utils.admission_scheduler import (
+    AdmissionPriority,
+    AdmissionScheduler,
+    SlidingWindowRateLimiter,
+    classify_priority,
+)
+from kickai.core.enums import ChatType
+
+
+def _scheduler(**kwargs):
+    return AdmissionScheduler(
+        max_concurrent=kwargs.pop("max_concurrent", 1),
+        queue_timeouts=kwargs.pop("queue_timeouts", {"leadership": 1.0, "interactive": 1.0, "bulk": 1.0}),
+        **kwargs,
+    )
+
+
+async def _admitted_order(scheduler, requests):
+    """Queue requests behind a held slot, release it, and return the admission order."""
+    order = []
+
+    async def request(label, team_id, priority):
+        assert await scheduler.acquire(team_id, priority)
+        order.append(label)
+        await asyncio.sleep(0)
+        scheduler.release()
+
+    assert await scheduler.acquire("holder")
+    tasks = [asyncio.create_task(request(*item)) for item in requests]
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.gather(*tasks)
+    return order
+
+
+class TestClassification:
+    """Test cases for priority classification."""
+
+    def test_leadership_chat_is_leadership(self):
+        assert classify_priority(ChatType.LEADERSHIP, "who is available?") == AdmissionPriority.LEADERSHIP
+
+    def test_admin_command_in_main_chat_is_leadership(self):
+        assert classify_priority(ChatType.MAIN, "/addplayer John 07123456789") == AdmissionPriority.LEADERSHIP
+
+    def test_bulk_command(self):
+        assert classify_priority(ChatType.LEADERSHIP, "/announce Training moved") == AdmissionPriority.BULK
+
+    def test_default_is_interactive(self):
+        assert classify_priority("main", "/myinfo") == AdmissionPriority.INTERACTIVE
+
+
+class TestAdmissionScheduler:
+    """Test cases for admission ordering, bounds and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_priority_classes_served_in_order(self):
+        scheduler = _scheduler()
+        order = await _admitted_order(scheduler, [
+            ("bulk", "KTI", AdmissionPriority.BULK),
+            ("interactive", "KTI", AdmissionPriority.INTERACTIVE),
+            ("leadership", "KTI", AdmissionPriority.LEADERSHIP),
+        ])
+
+        assert order == ["leadership", "interactive", "bulk"]
+
+    @pytest.mark.asyncio
+    async def test_busy_team_does_not_starve_quiet_team(self):
+        scheduler = _scheduler()
+        requests = [(f"busy{i}", "BUSY", AdmissionPriority.INTERACTIVE) for i in range(5)]
+        requests.append(("quiet", "QUIET", AdmissionPriority.INTERACTIVE))
+
+        order = await _admitted_order(scheduler, requests)
+
+        assert order.index("quiet") <= 1
+
+    @pytest.mark.asyncio
+    async def test_weighted_team_gets_larger_share(self):
+        scheduler = _scheduler()
+        scheduler.set_team_weight("BIG", 3.0)
+        requests = [(f"big{i}", "BIG", AdmissionPriority.INTERACTIVE) for i in range(6)]
+        requests += [(f"small{i}", "SMALL", AdmissionPriority.INTERACTIVE) for i in range(6)]
+
+        order = await _admitted_order(scheduler, requests)
+
+        assert sum(label.startswith("big") for label in order[:8]) == 6
+
+    @pytest.mark.asyncio
+    async def test_wait_is_bounded(self):
+        scheduler = _scheduler(queue_timeouts={"interactive": 0.05})
+        assert await scheduler.acquire("KTI")
+
+        assert await scheduler.acquire("KTI") is False
+        stats = scheduler.get_metrics()["priorities"]["interactive"]["KTI"]
+        assert stats["dropped_timeout"] == 1
+        assert stats["max_wait_seconds"] >= 0.05
+        assert scheduler.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_immediately(self):
+        scheduler = _scheduler(max_queue_depth=1)
+        assert await scheduler.acquire("KTI")
+        waiting = asyncio.create_task(scheduler.acquire("KTI"))
+        await asyncio.sleep(0)
+
+        assert await scheduler.acquire("KTI") is False
+        assert scheduler.get_metrics()["priorities"]["interactive"]["KTI"]["dropped_queue_full"] == 1
+
+        scheduler.release()
+        assert await waiting
+        scheduler.release()
+        assert scheduler.in_use == 0
+
+
+class TestRateLimiter:
+    """Test cases for the bounded sliding-window rate limiter."""
+
+    def test_limit_per_window(self):
+        limiter = SlidingWindowRateLimiter(max_requests=2, window_seconds=60)
+
+        assert [limiter.is_limited(1, now=t) for t in (0, 1, 2)] == [False, False, True]
+        assert limiter.is_limited(1, now=61.5) is False
+
+    def test_state_is_bounded(self):
+        limiter = SlidingWindowRateLimiter(max_requests=5, max_tracked_keys=100)
+        for user in range(1_000):
+            limiter.is_limited(user, now=0)
+
+        assert limiter.tracked_keys == 100
+        assert limiter.evicted_keys == 900
+
+    def test_prune_sheds_idle_users(self):
+        limiter = SlidingWindowRateLimiter(max_requests=5, window_seconds=60)
+        limiter.is_limited("idle", now=0)
+        limiter.is_limited("active", now=100)
+
+        assert limiter.prune(now=120) == 1
+        assert limiter.tracked_keys == 1
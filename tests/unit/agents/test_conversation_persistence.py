@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Unit tests for persisted conversation summaries (write-behind and lazy reload).
+"""
+
+import asyncio
+
+import pytest
+
+from kickai.agents.utils.conversation_store import ConversationPersistence, SQLiteConversationStore
+from kickai.agents.utils.memory_manager import PERSISTED_COMMAND_LENGTH, OptimizedMemoryManager
+
+
+class CountingStore(SQLiteConversationStore):
+    """SQLite store recording which users were loaded and how many batches were written."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.batches = 0
+        self.loaded_users = []
+
+    async def append_batch(self, records):
+        self.batches += 1
+        await super().append_batch(records)
+
+    async def load_user(self, team_id, telegram_id, limit):
+        self.loaded_users.append(telegram_id)
+        return await super().load_user(team_id, telegram_id, limit)
+
+
+def _manager(path, **kwargs):
+    store = CountingStore(str(path))
+    persistence = ConversationPersistence(store, **kwargs)
+    return OptimizedMemoryManager("KTI", persistence=persistence), store
+
+
+class TestConversationPersistence:
+    """Test cases for summary persistence across restarts."""
+
+    @pytest.mark.asyncio
+    async def test_message_path_does_not_write(self, tmp_path):
+        manager, store = _manager(tmp_path / "summaries.db", flush_interval_seconds=60, batch_size=100)
+
+        for i in range(10):
+            manager.add_conversation_summary(1, f"/list {i}", "response")
+
+        assert store.batches == 0
+        assert manager.persistence.pending == 10
+
+        await manager.persistence.close()
+        assert store.batches == 1
+        assert manager.persistence.written == 10
+
+    @pytest.mark.asyncio
+    async def test_writer_flushes_in_background(self, tmp_path):
+        manager, store = _manager(tmp_path / "summaries.db", flush_interval_seconds=0.01)
+
+        manager.add_conversation_summary(1, "/myinfo", "response")
+        await asyncio.sleep(0.1)
+
+        assert manager.persistence.pending == 0
+        assert store.batches == 1
+        await manager.persistence.close()
+
+    @pytest.mark.asyncio
+    async def test_history_survives_restart(self, tmp_path):
+        path = tmp_path / "summaries.db"
+        before, _ = _manager(path)
+        before.add_conversation_summary(42, "/myinfo", "Your details ...")
+        before.add_conversation_summary(42, "what about saturday?", "You are available")
+        await before.persistence.close()
+
+        after, _ = _manager(path)
+        assert after.get_conversation_reference(42)["has_history"] is False
+
+        await after.ensure_user_loaded(42)
+
+        reference = after.get_conversation_reference(42)
+        assert reference["conversation_count"] == 2
+        assert reference["last_command"] == "what about saturday?"[:20]
+        await after.persistence.close()
+
+    @pytest.mark.asyncio
+    async def test_reload_is_lazy_and_once_per_user(self, tmp_path):
+        path = tmp_path / "summaries.db"
+        before, _ = _manager(path)
+        for telegram_id in (1, 2, 3):
+            before.add_conversation_summary(telegram_id, "/list", "response")
+        await before.persistence.close()
+
+        after, store = _manager(path)
+        await after.ensure_user_loaded(2)
+        await after.ensure_user_loaded(2)
+
+        assert store.loaded_users == [2]
+        assert after.get_conversation_reference(1)["has_history"] is False
+        await after.persistence.close()
+
+    @pytest.mark.asyncio
+    async def test_reload_merges_with_new_summaries(self, tmp_path):
+        path = tmp_path / "summaries.db"
+        before, _ = _manager(path)
+        before.add_conversation_summary(7, "/status", "response")
+        await before.persistence.close()
+
+        after, _ = _manager(path)
+        after.add_conversation_summary(7, "/list", "response")
+        await after.ensure_user_loaded(7)
+
+        history = after.export_user_history(7)
+        assert [entry["command"] for entry in history] == ["/status", "/list"]
+        await after.persistence.close()
+
+    @pytest.mark.asyncio
+    async def test_only_the_command_prefix_is_persisted(self, tmp_path):
+        path = tmp_path / "summaries.db"
+        manager, store = _manager(path)
+        message = "please update my phone number to 07700 900123"
+        manager.add_conversation_summary(9, message, "Updated")
+        await manager.persistence.flush()
+
+        records = await store.load_user("KTI", 9, 10)
+        assert [record["command"] for record in records] == [message[:PERSISTED_COMMAND_LENGTH]]
+
+        # The written summary is recognised as the one already in memory
+        await manager.ensure_user_loaded(9)
+        assert manager.get_conversation_reference(9)["conversation_count"] == 1
+        await manager.persistence.close()
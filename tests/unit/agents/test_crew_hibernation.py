@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Unit tests for crew hibernation, rehydration and pre-warming.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from kickai.agents.crew_hibernation import CrewBlueprint, CrewPreWarmer
+from kickai.agents.crew_lifecycle_manager import CrewLifecycleManager, CrewStatus
+from kickai.core.crew_activity_store import WEEK_SECONDS, CrewActivityStore
+from kickai.core.enums import PermissionLevel
+
+CONTEXT = {"team_id": "KTI", "telegram_id": 1, "username": "u", "chat_type": "main"}
+
+
+class StubCrew:
+    """Crew stand-in recording the blueprint it was built from."""
+
+    def __init__(self, team_id, blueprint=None):
+        self.team_id = team_id
+        self.blueprint = blueprint
+
+    async def execute_task(self, task_description, execution_context):
+        return "ok"
+
+    def health_check(self):
+        return {"system": "healthy"}
+
+    def to_blueprint(self):
+        return CrewBlueprint(
+            team_id=self.team_id,
+            fingerprint="test",
+            agents={"help_assistant": {"role": "help_assistant", "goal": "help", "backstory": "b"}},
+            binding_keys=[["main", PermissionLevel.PLAYER.value, "/help"]],
+        )
+
+
+def _manager(store=None):
+    builds = []
+
+    def factory(team_id, blueprint=None):
+        builds.append((team_id, blueprint))
+        return StubCrew(team_id, blueprint)
+
+    return CrewLifecycleManager(crew_factory=factory, activity_store=store), builds
+
+
+async def _go_idle(manager, team_id):
+    manager._crew_metrics[team_id].last_activity = datetime.now() - timedelta(hours=1)
+    await manager._check_idle_crews()
+
+
+class TestHibernation:
+    """Test cases for hibernating and rehydrating idle crews."""
+
+    @pytest.mark.asyncio
+    async def test_idle_crew_hibernates_and_rehydrates_from_blueprint(self):
+        manager, builds = _manager()
+        await manager.execute_task("KTI", "/help", CONTEXT)
+
+        await _go_idle(manager, "KTI")
+        assert await manager.get_crew_status("KTI") == CrewStatus.HIBERNATED
+
+        crew = await manager.get_or_create_crew("KTI")
+        assert crew.blueprint is not None
+        assert crew.blueprint.tool_binding_keys() == [("main", PermissionLevel.PLAYER, "/help")]
+        assert [blueprint is None for _, blueprint in builds] == [True, False]
+        assert manager.get_lifecycle_stats()["rehydrations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_blueprint_survives_restart_through_store(self):
+        store = CrewActivityStore()
+        manager, _ = _manager(store)
+        await manager.execute_task("KTI", "/help", CONTEXT)
+        await _go_idle(manager, "KTI")
+
+        restarted, builds = _manager(store)
+        await restarted.get_or_create_crew("KTI")
+
+        blueprint = builds[0][1]
+        assert blueprint is not None
+        assert "help_assistant" in blueprint.agents
+        assert CrewBlueprint.from_json(blueprint.to_json()) == blueprint
+
+
+class TestPreWarming:
+    """Test cases for predicting demand and pre-warming crews."""
+
+    def test_expected_teams_from_schedule_and_recurring_activity(self):
+        store = CrewActivityStore()
+        now = time.time()
+        store.schedule("MATCHDAY", now + 1800)
+        store.schedule("LATER", now + 5 * 3600)
+        for week in range(1, 5):
+            for minute in (5, 10):
+                store.record_activity("BUSY", ts=now - week * WEEK_SECONDS + minute * 60)
+        store.record_activity("QUIET", ts=now - WEEK_SECONDS + 300)
+
+        expected = store.expected_teams(now, lead_seconds=3600, min_events=2)
+
+        assert set(expected) == {"MATCHDAY", "BUSY"}
+
+    @pytest.mark.asyncio
+    async def test_prewarmed_crew_serves_first_message_and_is_kept_warm(self):
+        store = CrewActivityStore()
+        manager, builds = _manager(store)
+        store.schedule("KTI", time.time() + 600)
+        prewarmer = CrewPreWarmer(manager, store, lead_seconds=3600, min_events=2)
+
+        assert await prewarmer.run_once() == ["KTI"]
+        assert await prewarmer.run_once() == []
+
+        await manager.execute_task("KTI", "/help", CONTEXT)
+        assert len(builds) == 1
+        assert manager.get_lifecycle_stats()["prewarms"] == 1
+
+        # Idle, but inside the pre-warm window: not hibernated
+        await _go_idle(manager, "KTI")
+        assert await manager.get_crew_status("KTI") == CrewStatus.ACTIVE
+
+
+class TestExclusiveExecution:
+    """Test cases for running one task at a time on a team's shared crew."""
+
+    @pytest.mark.asyncio
+    async def test_tasks_for_one_team_do_not_overlap(self):
+        running = []
+        overlaps = []
+
+        class SlowCrew(StubCrew):
+            async def execute_task(self, task_description, execution_context):
+                running.append(task_description)
+                overlaps.append(len(running))
+                await asyncio.sleep(0.01)
+                running.remove(task_description)
+                return task_description
+
+        manager = CrewLifecycleManager(crew_factory=lambda team_id, blueprint=None: SlowCrew(team_id))
+
+        results = await asyncio.gather(
+            *(manager.execute_task("KTI", f"/help {i}", CONTEXT) for i in range(3))
+        )
+
+        assert results == ["/help 0", "/help 1", "/help 2"]
+        assert max(overlaps) == 1
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Unit tests for adaptive agent iteration budgets.
+"""
+
+from types import SimpleNamespace
+
+from kickai.agents.config.iteration_config import COMMAND_TASK_CLASSES
+from kickai.agents.config.tool_binding_config import COMMAND_INTENT_TOOLS
+from kickai.agents.iteration_control import (
+    IterationController,
+    current_iteration_run,
+    iteration_scope,
+    record_agent_step,
+)
+from kickai.agents.tool_selection import binding_key, select_tools
+
+PLAYER_TOOLS = [
+    SimpleNamespace(name=name, description=f"{name} tool", result_as_answer=False)
+    for name in [
+        "get_my_status",
+        "get_player_current_info",
+        "update_player_field",
+        "get_player_update_help",
+    ]
+]
+
+
+def _context(message_text):
+    return {"chat_type": "main", "is_registered": True, "message_text": message_text}
+
+
+def _run(controller, message_text, steps):
+    with iteration_scope(message_text, controller) as run:
+        run.cap("specialist", 10)
+        for _ in range(steps):
+            record_agent_step("specialist")
+    return run
+
+
+class TestIterationBudgets:
+    """Test cases for budgets chosen from the classified intent."""
+
+    def test_every_command_intent_has_a_task_class(self):
+        assert set(COMMAND_INTENT_TOOLS) <= set(COMMAND_TASK_CLASSES)
+
+    def test_simple_command_gets_a_small_budget_and_tool_answers(self):
+        controller = IterationController()
+
+        with iteration_scope("/myinfo", controller) as run:
+            assert current_iteration_run() is run
+            assert run.cap("player_coordinator", 10) == 2
+            assert run.stop_on_tool_answer
+
+        assert current_iteration_run() is None
+
+    def test_natural_language_keeps_the_configured_limit(self):
+        controller = IterationController()
+
+        with iteration_scope("who is playing on saturday?", controller) as run:
+            assert run.intent == "natural_language"
+            assert run.cap("player_coordinator", 10) == 10
+            assert not run.stop_on_tool_answer
+
+    def test_fixed_mode_keeps_limits_but_records(self):
+        controller = IterationController(adaptive=False)
+
+        run = _run(controller, "/myinfo", steps=4)
+
+        assert run.agent_budgets == {"specialist": 10}
+        assert controller.report()["/myinfo"]["total_iterations"] == 4
+
+
+class TestFinalAnswerTools:
+    """Test cases for tools that end the agent's turn with their output."""
+
+    def test_simple_intent_binds_answering_copies(self):
+        binding = select_tools("player_coordinator", PLAYER_TOOLS, binding_key(_context("/myinfo")))
+
+        assert [tool.name for tool in binding.answer_tools] == binding.tool_names
+        assert all(tool.result_as_answer for tool in binding.answer_tools)
+        # The registry's tools are shared across teams and left untouched
+        assert not any(tool.result_as_answer for tool in PLAYER_TOOLS)
+
+    def test_action_intent_has_no_answering_tools(self):
+        key = binding_key(_context("/update phone 07700900123"))
+        binding = select_tools("player_coordinator", PLAYER_TOOLS, key)
+
+        assert binding.answer_tools == []
+
+
+class TestObservedIterations:
+    """Test cases for recording iterations and tuning budgets from them."""
+
+    def test_budget_is_tuned_from_observed_runs(self):
+        controller = IterationController(min_samples=5)
+        for _ in range(4):
+            _run(controller, "/update phone 07700900123", steps=2)
+        assert controller.tuned_budget("/update") is None
+
+        _run(controller, "/update phone 07700900123", steps=2)
+
+        assert controller.tuned_budget("/update") == 3
+        with iteration_scope("/update position striker", controller) as run:
+            assert run.cap("specialist", 10) == 3
+
+    def test_natural_language_is_never_tuned_down(self):
+        controller = IterationController(min_samples=5)
+        for _ in range(5):
+            _run(controller, "what's the weather for training?", steps=3)
+
+        assert controller.tuned_budget("natural_language") is None
+        with iteration_scope("anything else?", controller) as run:
+            assert run.cap("specialist", 10) == 10
+
+    def test_nested_scopes_share_one_run(self):
+        controller = IterationController()
+
+        with iteration_scope("/ping", controller) as outer:
+            record_agent_step("team_manager")
+            with iteration_scope("/ping", controller) as inner:
+                record_agent_step("help_assistant")
+
+        assert inner is outer
+        report = controller.report()["/ping"]
+        assert report["runs"] == 1
+        assert report["total_iterations"] == 2
+        assert report["task_class"] == "simple"
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for run-scoped tool memoization.
+"""
+
+import asyncio
+
+from kickai.agents.tool_memo import current_tool_memo, memoize_tool_function, tool_memo_scope
+
+
+class FakeStore:
+    """Counts store reads and writes made by the fake tools."""
+
+    def __init__(self):
+        self.reads = 0
+        self.writes = 0
+        self.players = ["Alice"]
+
+
+def _tools(store: FakeStore):
+    async def get_all_players(team_id: str) -> str:
+        store.reads += 1
+        return ",".join(store.players)
+
+    async def add_player(team_id: str, name: str) -> str:
+        store.writes += 1
+        store.players.append(name)
+        return "added"
+
+    return (
+        memoize_tool_function("get_all_players", get_all_players),
+        memoize_tool_function("add_player", add_player),
+    )
+
+
+class TestToolMemo:
+    """Test cases for tool_memo_scope and memoized tool functions."""
+
+    def test_repeated_reads_hit_the_memo(self):
+        store = FakeStore()
+        get_all_players, _ = _tools(store)
+
+        async def run():
+            with tool_memo_scope("KTI:/list") as memo:
+                results = [await get_all_players("KTI") for _ in range(3)]
+                await get_all_players("OTHER")
+            return memo, results
+
+        memo, results = asyncio.run(run())
+
+        assert results == ["Alice"] * 3
+        assert store.reads == 2
+        assert memo.stats.hits == 2
+        assert memo.stats.misses == 2
+        assert memo.stats.avoided_db_calls == 2
+        assert memo.stats.hits_by_tool == {"get_all_players": 2}
+
+    def test_write_invalidates_memo(self):
+        store = FakeStore()
+        get_all_players, add_player = _tools(store)
+
+        async def run():
+            with tool_memo_scope() as memo:
+                before = await get_all_players("KTI")
+                await add_player("KTI", "Bob")
+                after = await get_all_players("KTI")
+            return memo, before, after
+
+        memo, before, after = asyncio.run(run())
+
+        assert before == "Alice"
+        assert after == "Alice,Bob"
+        assert store.reads == 2
+        assert memo.stats.hits == 0
+        assert memo.stats.invalidations == 1
+
+    def test_no_memo_outside_a_run(self):
+        store = FakeStore()
+        get_all_players, _ = _tools(store)
+
+        async def run():
+            for _ in range(2):
+                await get_all_players("KTI")
+
+        asyncio.run(run())
+
+        assert store.reads == 2
+        assert current_tool_memo() is None
+
+    def test_nested_scopes_share_the_outer_memo(self):
+        with tool_memo_scope("outer") as outer:
+            with tool_memo_scope("inner") as inner:
+                assert inner is outer
+        assert current_tool_memo() is None
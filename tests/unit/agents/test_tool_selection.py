@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Unit tests for per-request tool selection.
+"""
+
+from types import SimpleNamespace
+
+from kickai.agents.tool_selection import binding_key, resolve_intent, select_tools
+from kickai.core.enums import PermissionLevel
+
+TEAM_ADMIN_TOOLS = [
+    SimpleNamespace(name=name, description=f"{name} tool " * 20)
+    for name in [
+        "get_team_members",
+        "get_my_team_member_status",
+        "add_player",
+        "add_team_member_simplified",
+        "approve_user",
+        "get_pending_users",
+        "update_team_member_field",
+        "get_llm_usage_report",
+    ]
+]
+
+
+def _context(**overrides):
+    context = {"chat_type": "main", "is_registered": True, "message_text": "hello there"}
+    context.update(overrides)
+    return context
+
+
+class TestToolSelection:
+    """Test cases for tool selection by chat type, permission and intent."""
+
+    def test_main_chat_player_gets_no_leadership_tools(self):
+        binding = select_tools("team_administrator", TEAM_ADMIN_TOOLS, binding_key(_context()))
+
+        assert binding.permission_level == PermissionLevel.PLAYER
+        assert "add_player" not in binding.tool_names
+        assert "get_team_members" in binding.tool_names
+        assert binding.schema_tokens < binding.full_schema_tokens
+
+    def test_unregistered_user_gets_public_tools_only(self):
+        binding = select_tools(
+            "team_administrator", TEAM_ADMIN_TOOLS, binding_key(_context(is_registered=False))
+        )
+
+        assert binding.permission_level == PermissionLevel.PUBLIC
+        assert binding.tools == []
+
+    def test_leadership_command_narrows_to_intent(self):
+        key = binding_key(_context(chat_type="leadership", message_text="/addplayer John +447700900123"))
+        binding = select_tools("team_administrator", TEAM_ADMIN_TOOLS, key)
+
+        assert binding.intent == "/addplayer"
+        assert binding.tool_names == ["add_player"]
+
+    def test_leadership_chat_binds_admin_tools(self):
+        binding = select_tools(
+            "team_administrator", TEAM_ADMIN_TOOLS, binding_key(_context(chat_type="leadership"))
+        )
+
+        assert "get_llm_usage_report" in binding.tool_names
+
+    def test_context_without_registration_flags_binds_every_tool(self):
+        context = {"chat_type": "main", "message_text": "hello there"}
+        binding = select_tools("team_administrator", TEAM_ADMIN_TOOLS, binding_key(context))
+
+        assert len(binding.tools) == len(TEAM_ADMIN_TOOLS)
+
+    def test_intent_for_other_agent_keeps_permitted_tools(self):
+        key = binding_key(_context(chat_type="leadership", message_text="/help"))
+        binding = select_tools("team_administrator", TEAM_ADMIN_TOOLS, key)
+
+        assert len(binding.tools) == len(TEAM_ADMIN_TOOLS)
+
+    def test_natural_language_has_no_intent(self):
+        assert resolve_intent("who is playing saturday?") is None
+        assert resolve_intent("/LIST") == "/list"
+        assert resolve_intent("/unknowncommand") is None
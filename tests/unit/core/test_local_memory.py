@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the local SQLite agent memory backend.
+"""
+
+import pytest
+
+from kickai.core.local_memory import LocalMemory, LocalMemoryStore
+
+
+@pytest.fixture(params=[True, False], ids=["fts5", "token_scan"])
+def store(request):
+    store = LocalMemoryStore(max_entries_per_namespace=50)
+    if not request.param:
+        store.use_fts = False
+    elif not store.use_fts:
+        pytest.skip("SQLite built without FTS5")
+    return store
+
+
+class TestLocalMemory:
+    """Test cases for recall, namespaces and bounds."""
+
+    def test_search_recalls_relevant_entries(self, store):
+        memory = LocalMemory(store, "player")
+        memory.save("John Smith prefers playing left back", metadata={"entity_id": "JS1"})
+        memory.save("Training moved to Thursday", metadata={"entity_id": "team"})
+
+        results = memory.search("which position does John play left")
+
+        assert [result["entity_id"] for result in results] == ["JS1"]
+        assert results[0]["context"] == "John Smith prefers playing left back"
+
+    def test_namespaces_are_isolated(self, store):
+        LocalMemory(store, "player").save("availability for Saturday")
+        team_memory = LocalMemory(store, "team")
+
+        assert team_memory.search("Saturday availability") == []
+
+    def test_search_scoped_to_entity(self, store):
+        memory = LocalMemory(store, "player")
+        memory.save("injured ankle", metadata={"entity_id": "P1"})
+        memory.save("injured knee", metadata={"entity_id": "P2"})
+
+        results = memory.search("injured", entity_id="P2")
+
+        assert [result["context"] for result in results] == ["injured knee"]
+
+    def test_key_value_round_trip_replaces(self, store):
+        memory = LocalMemory(store, "team_member")
+        memory.store("M1", "preferences", {"notify": True})
+        memory.store("M1", "preferences", {"notify": False})
+
+        assert memory.retrieve("M1", "preferences") == {"notify": False}
+        assert store.count("team_member") == 1
+
+    def test_namespace_size_is_bounded(self, store):
+        memory = LocalMemory(store, "short_term")
+        for i in range(120):
+            memory.save(f"message number {i}")
+
+        assert store.count("short_term") == 50
+        contexts = [result["context"] for result in memory.search("message number", limit=50)]
+        assert "message number 0" not in contexts
+        assert memory.search("119")[0]["context"] == "message number 119"
+
+    def test_reset_clears_only_namespace(self, store):
+        LocalMemory(store, "player").save("keep me")
+        memory = LocalMemory(store, "short_term")
+        memory.save("drop me")
+
+        memory.reset()
+
+        assert store.get_stats()["namespaces"] == {"player": 1}
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the runtime metrics registry and its OpenMetrics endpoint.
+"""
+
+import asyncio
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from kickai.agents.utils.admission_scheduler import AdmissionPriority, AdmissionScheduler
+from kickai.core.monitoring import MetricsRegistry, MetricsServer, get_metrics_registry, runtime_metrics
+from kickai.core.resilience import DependencyGuard
+
+
+def _sample(text, series):
+    """Value of one series in a scrape (0 when absent)."""
+    for line in text.splitlines():
+        if line.startswith(series + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+def _scrape(server, accept="application/openmetrics-text"):
+    request = urllib.request.Request(server.url, headers={"Accept": accept})
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return response.headers["Content-Type"], response.read().decode("utf-8")
+
+
+@pytest.fixture
+def server():
+    registry = get_metrics_registry()
+    metrics_server = MetricsServer(registry, port=0)
+    metrics_server.start()
+    yield metrics_server
+    metrics_server.stop()
+    registry.unregister_collector("test_scheduler")
+
+
+class TestMetricsRegistry:
+    """Test cases for recording into per-thread shards."""
+
+    def test_concurrent_threads_are_all_counted(self):
+        registry = MetricsRegistry()
+        messages = registry.counter("messages", "Messages", ("team_id",))
+        latency = registry.histogram("latency_seconds", "Latency", ("team_id",), buckets=(0.1, 1.0))
+
+        def record():
+            for _ in range(1000):
+                messages.inc("KTI")
+                latency.observe(0.5, "KTI")
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert registry.counter_value("messages", "KTI") == 8000
+        text = registry.render()
+        assert 'latency_seconds_bucket{team_id="KTI",le="0.1"} 0' in text
+        assert 'latency_seconds_bucket{team_id="KTI",le="1.0"} 8000' in text
+        assert 'latency_seconds_count{team_id="KTI"} 8000' in text
+        assert 'latency_seconds_sum{team_id="KTI"} 4000' in text
+
+    def test_redeclaring_with_other_labels_fails(self):
+        registry = MetricsRegistry()
+        assert registry.counter("messages", "Messages", ("team_id",)) is registry.counter(
+            "messages", "Messages", ("team_id",)
+        )
+        with pytest.raises(ValueError):
+            registry.counter("messages", "Messages", ("chat_type",))
+
+
+class TestMetricsEndpoint:
+    """Test cases for scraping the endpoint after synthetic traffic."""
+
+    @pytest.mark.asyncio
+    async def test_scrape_after_synthetic_traffic(self, server):
+        team_id = "METRICS_TEAM"
+        wait_bucket = 'kickai_admission_wait_seconds_bucket{priority="bulk",outcome="success",le="%s"}'
+        _, before = await asyncio.to_thread(_scrape, server)
+        for chat_type in ("main", "main", "leadership"):
+            runtime_metrics.MESSAGES_RECEIVED.inc(team_id, chat_type)
+        runtime_metrics.ROUTING_PATHS.inc(team_id, runtime_metrics.PATH_NLP)
+        runtime_metrics.CREW_EXECUTION_SECONDS.observe(3.0, team_id, runtime_metrics.OUTCOME_SUCCESS)
+
+        # One slot: the second request queues until the first is released
+        scheduler = AdmissionScheduler(max_concurrent=1)
+        get_metrics_registry().register_collector("test_scheduler", scheduler.collect_metrics)
+        assert await scheduler.acquire(team_id, AdmissionPriority.BULK)
+        waiter = asyncio.create_task(scheduler.acquire(team_id, AdmissionPriority.BULK))
+        await asyncio.sleep(0.05)
+        scheduler.release()
+        assert await waiter
+
+        guard = DependencyGuard("metrics_test_store")
+
+        async def ok():
+            return "ok"
+
+        async def broken():
+            raise ConnectionError("unavailable")
+
+        await guard.run(ok)
+        with pytest.raises(ConnectionError):
+            await guard.run(broken)
+
+        content_type, text = await asyncio.to_thread(_scrape, server)
+
+        assert content_type.startswith("application/openmetrics-text")
+        assert text.endswith("# EOF\n")
+        assert "# TYPE kickai_messages_received counter" in text
+        assert f'kickai_messages_received_total{{team_id="{team_id}",chat_type="main"}} 2' in text
+        assert f'kickai_routing_path_total{{team_id="{team_id}",path="nlp"}} 1' in text
+        assert f'kickai_crew_execution_seconds_bucket{{team_id="{team_id}",outcome="success",le="2.5"}} 0' in text
+        assert f'kickai_crew_execution_seconds_bucket{{team_id="{team_id}",outcome="success",le="5.0"}} 1' in text
+        assert 'kickai_dependency_calls_total{dependency="metrics_test_store",outcome="success"} 1' in text
+        assert 'kickai_dependency_calls_total{dependency="metrics_test_store",outcome="error"} 1' in text
+        assert 'kickai_dependency_call_seconds_count{dependency="metrics_test_store"} 2' in text
+        assert 'kickai_admission_slots_in_use 1' in text
+        assert 'kickai_admission_queue_depth 0' in text
+        # Admitted at once, then after waiting ~0.05s for the release
+        waits = {
+            le: _sample(text, wait_bucket % le) - _sample(before, wait_bucket % le) for le in ("0.0", "0.01", "0.1")
+        }
+        assert waits == {"0.0": 1, "0.01": 1, "0.1": 2}
+
+    def test_prometheus_text_and_unknown_paths(self, server):
+        content_type, text = _scrape(server, accept="text/plain")
+
+        assert content_type.startswith("text/plain; version=0.0.4")
+        assert "# EOF" not in text
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(server.url.replace("/metrics", "/other"), timeout=5)
+        assert error.value.code == 404
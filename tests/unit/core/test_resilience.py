@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Unit tests for request deadlines, circuit breakers and bulkheads.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from kickai.agents.tool_guard import guard_tool_function
+from kickai.core.config import Settings
+from kickai.core.constants.agent_constants import AgentConstants
+from kickai.core.exceptions import DeadlineExceededError, DependencyUnavailableError
+from kickai.core.resilience import (
+    DependencyGuard,
+    remaining_seconds,
+    request_deadline,
+    reset_dependency_guards,
+)
+from kickai.database.firebase_client import FirebaseClient
+
+
+class SlowDocument:
+    """Firestore document reference whose calls block like a degraded backend."""
+
+    def __init__(self, store: "SlowFirestore"):
+        self.store = store
+        self.id = "doc1"
+
+    def get(self):
+        self.store.calls += 1
+        time.sleep(self.store.delay)
+        return SimpleNamespace(exists=True, id=self.id, to_dict=lambda: {"name": "slow"})
+
+    def set(self, data):
+        self.store.calls += 1
+        time.sleep(self.store.delay)
+
+
+class SlowFirestore:
+    """Fake Firestore client; every document read or write takes ``delay`` seconds."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+
+    def collection(self, name):
+        return SimpleNamespace(document=lambda document_id=None: SlowDocument(self))
+
+
+def _slow_client(delay: float, **config) -> FirebaseClient:
+    settings = SimpleNamespace(
+        firebase_project_id="test_project",
+        firebase_timeout=30,
+        firestore_breaker_failure_threshold=config.get("failure_threshold", 5),
+        firestore_breaker_reset_seconds=60,
+        firestore_max_concurrent_operations=config.get("max_concurrent", 8),
+    )
+    client = FirebaseClient(settings)
+    client._client = SlowFirestore(delay)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def fresh_guards():
+    reset_dependency_guards()
+    yield
+    reset_dependency_guards()
+
+
+class TestRequestDeadline:
+    """Test cases for deadline scopes."""
+
+    def test_nested_scope_never_extends_deadline(self):
+        assert remaining_seconds() is None
+        with request_deadline(1.0):
+            with request_deadline(30.0):
+                assert remaining_seconds() <= 1.0
+            with request_deadline(0.5):
+                assert remaining_seconds() <= 0.5
+        assert remaining_seconds() is None
+
+    def test_default_deadline_outlasts_a_crew_run(self):
+        default = Settings.model_fields["request_deadline_seconds"].default
+
+        assert default > AgentConstants.CREW_MAX_EXECUTION_TIME
+
+
+class TestFirestoreResilience:
+    """Test cases for Firestore calls against a slow fake store."""
+
+    @pytest.mark.asyncio
+    async def test_slow_store_latency_bounded_by_deadline(self):
+        client = _slow_client(delay=2.0)
+
+        started = time.monotonic()
+        with request_deadline(0.2):
+            with pytest.raises(DeadlineExceededError):
+                await client.get_document("players", "doc1")
+
+        assert time.monotonic() - started < 0.6
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_fails_fast(self):
+        client = _slow_client(delay=0.5, failure_threshold=2)
+        for _ in range(2):
+            with request_deadline(0.05):
+                with pytest.raises(DeadlineExceededError):
+                    await client.get_document("players", "doc1")
+        calls_before = client._client.calls
+
+        started = time.monotonic()
+        with pytest.raises(DependencyUnavailableError):
+            await client.create_document("players", {"name": "x"}, "doc1")
+
+        assert time.monotonic() - started < 0.05
+        assert client._client.calls == calls_before
+        assert client._guard.get_stats()["breaker"] == "OPEN"
+
+    @pytest.mark.asyncio
+    async def test_fast_store_unaffected(self):
+        client = _slow_client(delay=0.0)
+
+        with request_deadline(1.0):
+            document = await client.get_document("players", "doc1")
+
+        assert document == {"name": "slow", "id": "doc1"}
+        assert client._guard.get_stats()["breaker"] == "CLOSED"
+
+
+class TestBulkhead:
+    """Test cases for the concurrency cap."""
+
+    @pytest.mark.asyncio
+    async def test_bulkhead_caps_concurrent_operations(self):
+        guard = DependencyGuard("store", max_concurrent=3)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def blocking_call():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+        await asyncio.gather(*(guard.run_blocking(blocking_call) for _ in range(12)))
+
+        assert peak == 3
+        assert guard.bulkhead.get_stats()["peak_in_flight"] == 3
+
+    @pytest.mark.asyncio
+    async def test_full_bulkhead_refuses_within_deadline(self):
+        guard = DependencyGuard("store", max_concurrent=1)
+        holder = asyncio.ensure_future(guard.run_blocking(time.sleep, 0.5))
+        await asyncio.sleep(0.01)
+
+        started = time.monotonic()
+        with request_deadline(0.1):
+            with pytest.raises(DependencyUnavailableError):
+                await guard.run_blocking(time.sleep, 0)
+
+        assert time.monotonic() - started < 0.3
+        await holder
+
+
+class TestToolGuard:
+    """Test cases for deadline-bounded tools."""
+
+    @pytest.mark.asyncio
+    async def test_slow_tool_returns_error_within_deadline(self):
+        async def slow_tool(team_id: str) -> str:
+            await asyncio.sleep(2)
+            return "done"
+
+        guarded = guard_tool_function("slow_tool", slow_tool)
+
+        started = time.monotonic()
+        with request_deadline(0.1):
+            result = await guarded("KTI")
+
+        assert time.monotonic() - started < 0.5
+        assert json.loads(result)["status"] == "error"
+        assert guard_tool_function("slow_tool", guarded) is guarded
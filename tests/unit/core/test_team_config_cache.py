@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Unit tests for TeamConfigCache hot reload.
+"""
+
+import pytest
+
+from kickai.core.team_config_cache import TeamConfigCache, diff_team_configs
+from kickai.features.team_administration.domain.entities.team import Team
+
+
+def _team(team_id: str, **overrides) -> Team:
+    values = {
+        "name": f"Team {team_id}",
+        "id": team_id,
+        "bot_token": f"token-{team_id}",
+        "main_chat_id": f"-100{team_id}",
+        "leadership_chat_id": f"-200{team_id}",
+    }
+    values.update(overrides)
+    return Team(**values)
+
+
+@pytest.fixture
+def cache():
+    TeamConfigCache._instance = None
+    cache = TeamConfigCache()
+    cache._configs = {}
+    cache._listeners = []
+    cache._version = 0
+    cache._reload_lock = None
+    cache._refresh_task = None
+    cache._initialized = False
+    yield cache
+    TeamConfigCache._instance = None
+
+
+def _serve(cache: TeamConfigCache, *teams: Team) -> None:
+    async def load():
+        return {team.id: team for team in teams}
+
+    cache._load_configs = load
+
+
+class TestDiffTeamConfigs:
+    """Test cases for diff_team_configs."""
+
+    def test_added_removed_and_changed_fields(self):
+        old = {"A": _team("A"), "B": _team("B"), "C": _team("C")}
+        new = {"A": _team("A"), "B": _team("B", bot_token="rotated", name="Renamed"), "D": _team("D")}
+
+        diff = diff_team_configs(old, new, version=2)
+
+        assert diff.added == ["D"]
+        assert diff.removed == ["C"]
+        assert sorted(diff.changed["B"]) == ["bot_token", "name"]
+        assert "A" not in diff.changed
+        assert diff.needs_restart("B")
+
+    def test_cosmetic_change_needs_no_restart(self):
+        diff = diff_team_configs({"A": _team("A")}, {"A": _team("A", description="New")}, version=2)
+
+        assert diff.changed == {"A": ["description"]}
+        assert not diff.needs_restart("A")
+
+
+class TestTeamConfigCacheReload:
+    """Test cases for versioned reload and listeners."""
+
+    @pytest.mark.asyncio
+    async def test_reload_swaps_configs_and_notifies(self, cache):
+        _serve(cache, _team("A"), _team("B"))
+        await cache.initialize()
+        diffs = []
+
+        async def listener(diff):
+            diffs.append(diff)
+
+        cache.subscribe(listener)
+        _serve(cache, _team("A", main_chat_id="-999"), _team("C"))
+        diff = await cache.reload()
+
+        assert diffs == [diff]
+        assert diff.version == 2
+        assert cache.get_stats()["version"] == 2
+        assert cache.get_main_chat_id("A") == "-999"
+        assert cache.get_team("B") is None
+        assert cache.get_team("C") is not None
+
+    @pytest.mark.asyncio
+    async def test_unchanged_reload_keeps_version(self, cache):
+        _serve(cache, _team("A"))
+        await cache.initialize()
+        diff = await cache.reload()
+
+        assert not diff.has_changes
+        assert cache.get_stats()["version"] == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_reload_keeps_cached_teams(self, cache):
+        _serve(cache, _team("A"))
+        await cache.initialize()
+        _serve(cache)
+
+        assert await cache.reload() is None
+        assert cache.get_team("A") is not None
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Unit tests for prompt token accounting and budgets.
+"""
+
+import time
+
+import pytest
+
+from kickai.core.enums import AIProvider
+from kickai.core.exceptions import TokenBudgetExceededError
+from kickai.core.token_accounting import (
+    TRIM_MARKER,
+    TeamTokenBudget,
+    TokenAccountant,
+    count_message_tokens,
+    message_type_for,
+    token_accounting_scope,
+    trim_messages_to_budget,
+)
+from kickai.infrastructure.llm_providers.factory import MockProvider, ProviderConfig
+
+
+def _messages(history: int = 10):
+    messages = [{"role": "system", "content": "system prompt " * 20}]
+    for i in range(history):
+        messages.append({"role": "user" if i % 2 else "assistant", "content": f"turn {i} " + "x" * 400})
+    messages.append({"role": "user", "content": "final question"})
+    return messages
+
+
+class TestTrimming:
+    """Test cases for prompt budget trimming."""
+
+    def test_under_budget_is_untouched(self):
+        messages = _messages(history=1)
+        trimmed, removed = trim_messages_to_budget(messages, 10_000, count_message_tokens)
+
+        assert trimmed is messages
+        assert removed == 0
+
+    def test_history_dropped_before_system_and_final_message(self):
+        messages = _messages()
+        trimmed, removed = trim_messages_to_budget(messages, 400, count_message_tokens)
+
+        assert count_message_tokens(trimmed) <= 400
+        assert removed > 0
+        assert trimmed[0] == messages[0]
+        assert trimmed[-1] == messages[-1]
+        # Newest history survives, oldest goes first
+        assert "turn 0 " not in "".join(m["content"] for m in trimmed)
+
+    def test_task_and_system_prompt_survive_trimming(self):
+        messages = [
+            {"role": "system", "content": "system prompt " * 200},
+            {"role": "user", "content": "task: list the squad"},
+            *_messages(history=10)[1:-1],
+            {"role": "user", "content": "final question"},
+        ]
+        trimmed, _ = trim_messages_to_budget(messages, 300, count_message_tokens)
+
+        assert trimmed[0] == messages[0]
+        assert trimmed[1] == messages[1]
+        assert trimmed[-1] == messages[-1]
+
+    def test_oversized_context_is_cut(self):
+        messages = [{"role": "system", "content": "s"}, {"role": "user", "content": "y" * 8000}]
+        trimmed, _ = trim_messages_to_budget(messages, 500, count_message_tokens)
+
+        assert count_message_tokens(trimmed) <= 500
+        assert TRIM_MARKER in trimmed[-1]["content"]
+
+
+class TestTokenAccountant:
+    """Test cases for usage recording and reports."""
+
+    def test_calls_attributed_to_scope(self):
+        accountant = TokenAccountant()
+        with token_accounting_scope("KTI", message_type_for("/list all")):
+            accountant.record("player_coordinator", 100, 20, 0.5)
+            accountant.record("player_coordinator", 300, 40, 1.5, trimmed_tokens=50)
+        accountant.record("help_assistant", 10, 5, 0.1)
+
+        rows = accountant.report(team_id="KTI")
+        assert len(rows) == 1
+        row = rows[0]
+        assert (row["agent"], row["team_id"], row["message_type"]) == ("player_coordinator", "KTI", "/list")
+        assert row["calls"] == 2
+        assert row["prompt_tokens"] == 400
+        assert row["max_prompt_tokens"] == 300
+        assert row["trimmed_calls"] == 1
+        assert row["avg_latency_seconds"] == 1.0
+
+        by_agent = {row["agent"]: row for row in accountant.report(("agent",))}
+        assert by_agent["help_assistant"]["calls"] == 1
+
+
+PRICES = {"mock-model": (1000.0, 2000.0), "mock-small": (100.0, 200.0)}
+PROMPT = [{"role": "user", "content": "x" * 400}]  # 100 tokens
+
+
+def _mock_llm(accountant, model="mock-model", response="y" * 40, **params):
+    config = ProviderConfig(
+        provider=AIProvider.MOCK,
+        model_name=model,
+        additional_params={"mock_response": response, "accountant": accountant, **params},
+    )
+    return MockProvider(config).create_llm()
+
+
+class TestUsageLedger:
+    """Test cases for per-call usage, cost and rolling windows with the mock provider."""
+
+    def test_mock_calls_recorded_with_deterministic_tokens_and_cost(self):
+        accountant = TokenAccountant(prices=PRICES)
+        llm = _mock_llm(accountant, agent_name="player_coordinator")
+
+        with token_accounting_scope("KTI", message_type_for("/list")):
+            assert llm.call(PROMPT) == "y" * 40
+            llm.call(PROMPT)
+
+        rows = accountant.window_report("1h", ("team_id", "agent", "message_type", "model"))
+        assert len(rows) == 1
+        row = rows[0]
+        assert (row["team_id"], row["agent"], row["message_type"], row["model"]) == (
+            "KTI", "player_coordinator", "/list", "mock-model"
+        )
+        assert (row["calls"], row["prompt_tokens"], row["completion_tokens"]) == (2, 200, 20)
+        # (100 * 1000 + 10 * 2000) / 1M per call
+        assert row["cost_usd"] == 0.24
+        assert accountant.report(("team_id",))[0]["cost_usd"] == 0.24
+
+    def test_rolling_window_excludes_older_calls(self):
+        accountant = TokenAccountant(prices=PRICES)
+        now = time.time()
+        accountant.store.append("KTI", "help_assistant", "/help", "mock-model", 100, 10, 0.1, 0.1, ts=now - 2 * 3600)
+        accountant.store.append("KTI", "help_assistant", "/help", "mock-model", 50, 5, 0.1, 0.05, ts=now)
+
+        assert accountant.window_report("1h", ("team_id",))[0]["total_tokens"] == 55
+        assert accountant.window_report("24h", ("team_id",))[0]["total_tokens"] == 165
+
+        report = accountant.format_team_usage("KTI")
+        assert "Last 1h: 55 tokens in 1 calls" in report
+        assert "help_assistant" in report
+
+
+class TestTeamBudgets:
+    """Test cases for per-team budgets."""
+
+    def test_exceeded_budget_downgrades_model(self):
+        accountant = TokenAccountant(prices=PRICES)
+        accountant.set_team_budget("KTI", TeamTokenBudget(tokens=100, action="downgrade"))
+        small = _mock_llm(accountant, model="mock-small", response="small")
+        llm = _mock_llm(accountant, downgrade_llm=small)
+
+        with token_accounting_scope("KTI", "natural_language"):
+            assert llm.call(PROMPT) == "y" * 40
+            assert llm.call(PROMPT) == "small"
+
+        models = {row["model"]: row["calls"] for row in accountant.window_report("1h", ("model",))}
+        assert models == {"mock-model": 1, "mock-small": 1}
+
+        # Other teams are unaffected
+        with token_accounting_scope("OTHER", "natural_language"):
+            assert llm.call(PROMPT) == "y" * 40
+
+    def test_exceeded_cost_budget_throttles(self):
+        accountant = TokenAccountant(prices=PRICES)
+        accountant.set_team_budget("KTI", TeamTokenBudget(cost_usd=0.1, action="throttle"))
+        llm = _mock_llm(accountant)
+
+        with token_accounting_scope("KTI", "natural_language"):
+            llm.call(PROMPT)
+            with pytest.raises(TokenBudgetExceededError):
+                llm.call(PROMPT)
+
+        assert accountant.window_report("1h", ("team_id",))[0]["calls"] == 1
+        assert "exceeded, calls throttled" in accountant.format_team_usage("KTI")
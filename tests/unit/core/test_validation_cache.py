@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the startup validation cache.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from kickai.core.enums import CheckCategory, CheckStatus
+from kickai.core.startup_validation import validator as validator_module
+from kickai.core.startup_validation.checks.base_check import BaseCheck
+from kickai.core.startup_validation.reporting import CheckResult
+from kickai.core.startup_validation.validation_cache import ValidationCache, compute_validation_fingerprint
+from kickai.core.startup_validation.validator import StartupValidator
+
+
+class FakeCheck(BaseCheck):
+    """Check recording how often it really ran."""
+
+    category = CheckCategory.SYSTEM
+    description = "fake"
+
+    def __init__(self, name, cacheable, status=CheckStatus.PASSED):
+        self.name = name
+        self.cacheable = cacheable
+        self.status = status
+        self.runs = 0
+
+    async def execute(self, context=None):
+        self.runs += 1
+        return CheckResult(name=self.name, category=self.category, status=self.status, message="ok")
+
+
+@pytest.fixture
+def fingerprint(monkeypatch):
+    state = {"value": "fp-1"}
+    monkeypatch.setattr(validator_module, "compute_validation_fingerprint", lambda: state["value"])
+    return state
+
+
+def _validator(tmp_path, checks, force_validate=False):
+    validator = StartupValidator(force_validate=force_validate, cache=ValidationCache(str(tmp_path / "cache.json")))
+    validator.checks = checks
+
+    async def no_bot_configuration(context):
+        context["bot_config"] = None
+
+    async def registries_ok():
+        return SimpleNamespace(success=True)
+
+    validator._load_bot_configuration = no_bot_configuration
+    validator._validate_registries = registries_ok
+    return validator
+
+
+class TestValidationCache:
+    """Test cases for serving static checks from cache."""
+
+    @pytest.mark.asyncio
+    async def test_static_checks_served_from_cache_on_hit(self, tmp_path, fingerprint):
+        static, live = FakeCheck("tools", cacheable=True), FakeCheck("llm", cacheable=False)
+        await _validator(tmp_path, [static, live]).validate()
+
+        report = await _validator(tmp_path, [static, live]).validate()
+
+        assert (static.runs, live.runs) == (1, 2)
+        assert [check.name for check in report.checks] == ["tools", "llm"]
+        assert [row["name"] for row in report.get_timing_report() if row["cached"]] == ["tools"]
+        assert report.is_healthy()
+
+    @pytest.mark.asyncio
+    async def test_fingerprint_change_reruns_everything(self, tmp_path, fingerprint):
+        static = FakeCheck("tools", cacheable=True)
+        await _validator(tmp_path, [static]).validate()
+
+        fingerprint["value"] = "fp-2"
+        report = await _validator(tmp_path, [static]).validate()
+
+        assert static.runs == 2
+        assert report.get_cached_checks() == []
+
+    @pytest.mark.asyncio
+    async def test_force_validate_ignores_cache(self, tmp_path, fingerprint):
+        static = FakeCheck("tools", cacheable=True)
+        await _validator(tmp_path, [static]).validate()
+
+        await _validator(tmp_path, [static], force_validate=True).validate()
+
+        assert static.runs == 2
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_run_is_not_cached(self, tmp_path, fingerprint):
+        static = FakeCheck("tools", cacheable=True)
+        failing = FakeCheck("commands", cacheable=True, status=CheckStatus.FAILED)
+        await _validator(tmp_path, [static, failing]).validate()
+
+        await _validator(tmp_path, [static]).validate()
+
+        assert static.runs == 2
+
+    def test_fingerprint_tracks_source_and_environment(self, tmp_path, monkeypatch):
+        (tmp_path / "module.py").write_text("VALUE = 1\n")
+        (tmp_path / "agents.yaml").write_text("agents: []\n")
+        monkeypatch.setenv("AI_PROVIDER", "groq")
+        baseline = compute_validation_fingerprint(tmp_path, ["AI_PROVIDER"])
+
+        assert compute_validation_fingerprint(tmp_path, ["AI_PROVIDER"]) == baseline
+        (tmp_path / "agents.yaml").write_text("agents: [help]\n")
+        changed_config = compute_validation_fingerprint(tmp_path, ["AI_PROVIDER"])
+        monkeypatch.setenv("AI_PROVIDER", "ollama")
+
+        assert changed_config != baseline
+        assert compute_validation_fingerprint(tmp_path, ["AI_PROVIDER"]) != changed_config
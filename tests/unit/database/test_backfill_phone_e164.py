@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Smoke tests for scripts/backfill_phone_e164.py against MockDataStore.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from kickai.core.firestore_constants import (
+    COLLECTION_TEAMS,
+    get_collection_name,
+    get_team_members_collection,
+    get_team_players_collection,
+)
+from kickai.database.mock_data_store import MockDataStore
+
+TEAM_ID = "KTI"
+PLAYERS = get_team_players_collection(TEAM_ID)
+MEMBERS = get_team_members_collection(TEAM_ID)
+SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "backfill_phone_e164.py"
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location("backfill_phone_e164", SCRIPT)
+    script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(script)
+    return script
+
+
+async def _store():
+    store = MockDataStore()
+    await store.create_document(get_collection_name(COLLECTION_TEAMS), {"name": "Tigers"}, TEAM_ID)
+    await store.create_document(PLAYERS, {"phone_number": "07871 521581"}, "P001")
+    await store.create_document(
+        PLAYERS, {"phone_number": "+447871521582", "phone_e164": "+447871521582"}, "P002"
+    )
+    await store.create_document(MEMBERS, {"phone_number": "+44 7871 521583"}, "M001")
+    return store
+
+
+class TestBackfillScript:
+    """Test cases for running the backfill end to end."""
+
+    @pytest.mark.asyncio
+    async def test_dry_run_reports_without_writing(self, tmp_path):
+        script = _load_script()
+        store = await _store()
+        args = script.build_parser().parse_args(
+            ["--dry-run", "--checkpoint-dir", str(tmp_path)]
+        )
+
+        assert await script.backfill(store, args) == 0
+
+        assert "phone_e164" not in await store.get_document(PLAYERS, "P001")
+        assert "phone_e164" not in await store.get_document(MEMBERS, "M001")
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_backfill_sets_missing_values(self, tmp_path):
+        script = _load_script()
+        store = await _store()
+        args = script.build_parser().parse_args(
+            ["--team-id", TEAM_ID, "--checkpoint-dir", str(tmp_path)]
+        )
+
+        assert await script.backfill(store, args) == 0
+
+        assert (await store.get_document(PLAYERS, "P001"))["phone_e164"] == "+447871521581"
+        assert (await store.get_document(MEMBERS, "M001"))["phone_e164"] == "+447871521583"
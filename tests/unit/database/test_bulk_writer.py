@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Unit tests for BulkWriter against MockDataStore.
+"""
+
+import json
+
+import pytest
+
+from kickai.database.bulk_writer import FIRESTORE_BATCH_LIMIT, BulkWriter
+from kickai.database.mock_data_store import MockDataStore
+
+COLLECTION = "kickai_KTI_players"
+
+
+class Interrupted(Exception):
+    """Stands in for a script being stopped part way through."""
+
+
+class RecordingStore(MockDataStore):
+    """MockDataStore recording batch sizes and rejecting batches that start at given documents."""
+
+    def __init__(self, reject_from=(), rejections=1):
+        super().__init__()
+        self.batch_sizes = []
+        self.reject_from = set(reject_from)
+        self.rejections = rejections
+        self._rejected = {}
+
+    async def execute_batch(self, operations):
+        first_id = operations[0]["document_id"]
+        if first_id in self.reject_from and self._rejected.get(first_id, 0) < self.rejections:
+            self._rejected[first_id] = self._rejected.get(first_id, 0) + 1
+            raise RuntimeError(f"commit at {first_id} rejected")
+        self.batch_sizes.append(len(operations))
+        return await super().execute_batch(operations)
+
+
+async def _write_players(writer, player_ids):
+    for player_id in player_ids:
+        await writer.set(COLLECTION, player_id, {"name": player_id}, position=(player_id,))
+
+
+def _player_ids(count):
+    return [f"P{i:04d}" for i in range(count)]
+
+
+class TestChunking:
+    """Test cases for splitting operations into batches."""
+
+    @pytest.mark.asyncio
+    async def test_operations_are_committed_in_chunks(self):
+        store = RecordingStore()
+
+        async with BulkWriter(store, batch_size=4, max_concurrent_commits=2) as writer:
+            await _write_players(writer, _player_ids(10))
+
+        assert sorted(store.batch_sizes) == [2, 4, 4]
+        assert writer.report.committed_operations == 10
+        assert writer.report.batches_committed == 3
+        assert writer.report.operations_by_type == {"set": 10}
+        assert await store.get_document(COLLECTION, "P0009") == {"name": "P0009"}
+
+    def test_batch_size_is_capped_at_the_firestore_limit(self):
+        with pytest.raises(ValueError):
+            BulkWriter(MockDataStore(), batch_size=FIRESTORE_BATCH_LIMIT + 1)
+
+    @pytest.mark.asyncio
+    async def test_invalid_operations_are_rejected_before_buffering(self):
+        writer = BulkWriter(MockDataStore())
+
+        with pytest.raises(ValueError):
+            await writer.add({"type": "upsert", "collection": COLLECTION, "document_id": "P1"})
+        with pytest.raises(ValueError):
+            await writer.add({"type": "delete", "collection": COLLECTION})
+
+        assert writer.report.operations == 0
+
+
+class TestDryRun:
+    """Test cases for dry-run mode."""
+
+    @pytest.mark.asyncio
+    async def test_dry_run_counts_without_writing(self, tmp_path):
+        store = RecordingStore()
+        checkpoint = tmp_path / "dry.json"
+
+        async with BulkWriter(
+            store, batch_size=3, dry_run=True, checkpoint_path=str(checkpoint)
+        ) as writer:
+            await _write_players(writer, _player_ids(7))
+            await writer.delete(COLLECTION, "P0000")
+
+        assert store.batch_sizes == []
+        assert await store.get_document(COLLECTION, "P0001") is None
+        assert writer.report.operations == 8
+        assert writer.report.batches_committed == 3
+        assert writer.report.committed_operations == 0
+        assert not checkpoint.exists()
+
+
+class TestCheckpoints:
+    """Test cases for resumable runs."""
+
+    @pytest.mark.asyncio
+    async def test_aborted_run_resumes_after_last_committed_batch(self, tmp_path):
+        checkpoint = tmp_path / "import.json"
+        store = RecordingStore()
+        player_ids = _player_ids(10)
+
+        with pytest.raises(Interrupted):
+            async with BulkWriter(
+                store,
+                job_name="import",
+                batch_size=3,
+                max_concurrent_commits=1,
+                checkpoint_path=str(checkpoint),
+            ) as writer:
+                await _write_players(writer, player_ids[:7])
+                raise Interrupted
+
+        # Two full batches committed; the buffered seventh write was not
+        assert json.loads(checkpoint.read_text())["resume_after"] == ["P0005"]
+        assert await store.get_document(COLLECTION, "P0006") is None
+
+        async with BulkWriter(
+            store, job_name="import", batch_size=3, checkpoint_path=str(checkpoint)
+        ) as resumed:
+            assert resumed.resume_after == ("P0005",)
+            remaining = [pid for pid in player_ids if (pid,) > resumed.resume_after]
+            await _write_players(resumed, remaining)
+
+        assert resumed.report.committed_operations == 4
+        assert len(await store.query_documents(COLLECTION)) == 10
+        assert not checkpoint.exists()
+
+    def test_checkpoint_of_another_job_is_refused(self, tmp_path):
+        checkpoint = tmp_path / "shared.json"
+        checkpoint.write_text(json.dumps({"job_name": "cleanup", "resume_after": ["P0001"]}))
+
+        with pytest.raises(ValueError):
+            BulkWriter(MockDataStore(), job_name="import", checkpoint_path=str(checkpoint))
+
+
+class TestErrors:
+    """Test cases for retrying and reporting failed batches."""
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_retried(self):
+        store = RecordingStore(reject_from={"P0000"}, rejections=1)
+
+        async with BulkWriter(store, batch_size=5, retry_delay=0) as writer:
+            await _write_players(writer, _player_ids(5))
+
+        assert writer.report.success
+        assert writer.report.committed_operations == 5
+        assert writer.report.errors == []
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_reported_and_checkpoint_kept(self, tmp_path):
+        checkpoint = tmp_path / "import.json"
+        store = RecordingStore(reject_from={"P0002"}, rejections=10)
+
+        async with BulkWriter(
+            store,
+            job_name="import",
+            batch_size=2,
+            max_concurrent_commits=1,
+            checkpoint_path=str(checkpoint),
+            max_retries=1,
+            retry_delay=0,
+        ) as writer:
+            await _write_players(writer, _player_ids(6))
+
+        assert not writer.report.success
+        assert writer.report.batches_failed == 1
+        assert writer.report.committed_operations == 4
+        assert writer.report.errors == ["batch 1: commit at P0002 rejected"]
+        # The checkpoint never moves past the failed batch, so a re-run replays it
+        assert json.loads(checkpoint.read_text())["resume_after"] == ["P0001"]
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Smoke tests for scripts/migrate_bot_configuration.py against MockDataStore.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from kickai.database.mock_data_store import MockDataStore
+
+TEAMS = "kickai_teams"
+SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "migrate_bot_configuration.py"
+
+
+def _migrator(store, argv):
+    spec = importlib.util.spec_from_file_location("migrate_bot_configuration", SCRIPT)
+    script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(script)
+    migrator = script.BotConfigurationMigrator(script.build_parser().parse_args(argv))
+    migrator.firebase_client = store
+    return migrator
+
+
+async def _store():
+    store = MockDataStore()
+    old_format = {"bot_token": "123:abc", "main_chat_id": "-100", "bot_username": "tigers_bot"}
+    await store.create_document(TEAMS, {"name": "Tigers", "settings": old_format}, "KTI")
+    await store.create_document(TEAMS, {"name": "Ants", "bot_token": "456:def"}, "KAI")
+    await store.create_document(TEAMS, {"name": "Owls", "settings": {}}, "KOW")
+    return store
+
+
+class TestMigrationScript:
+    """Test cases for running the migration end to end."""
+
+    @pytest.mark.asyncio
+    async def test_dry_run_reports_without_writing(self, tmp_path):
+        store = await _store()
+        migrator = _migrator(store, ["--dry-run", "--checkpoint-dir", str(tmp_path)])
+
+        stats = await migrator.run_migration()
+
+        assert stats["errors"] == []
+        assert stats["total_teams"] == 3
+        assert stats["teams_migrated"] == 1
+        assert stats["teams_already_migrated"] == 1
+        assert "bot_id" not in await store.get_document(TEAMS, "KTI")
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_migration_moves_bot_fields_out_of_settings(self, tmp_path):
+        store = await _store()
+        migrator = _migrator(store, ["--checkpoint-dir", str(tmp_path)])
+
+        stats = await migrator.run_migration()
+
+        team = await store.get_document(TEAMS, "KTI")
+        assert stats["errors"] == []
+        assert team["bot_id"] == "tigers_bot"
+        assert team["bot_token"] == "123:abc"
+        assert team["settings"] == {}
+        # A completed run leaves no checkpoint behind
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Unit tests for MockDataStore's generic document and query operations.
+"""
+
+import pytest
+
+from kickai.core.firestore_constants import get_team_players_collection
+from kickai.database.mock_data_store import MockDataStore
+from kickai.database.query_spec import QuerySpec
+
+TEAM_ID = "KTI"
+PLAYERS = get_team_players_collection(TEAM_ID)
+
+
+async def _store_with_players():
+    store = MockDataStore()
+    players = [
+        ("P001", {"name": "Ann", "status": "active", "position": "defender", "joined": 3}),
+        ("P002", {"name": "Ben", "status": "pending", "position": None, "joined": 1}),
+        ("P003", {"name": "Cat", "status": "active", "position": "forward", "joined": 2}),
+        ("P004", {"name": "Dan", "status": "inactive", "joined": 4}),
+    ]
+    for player_id, data in players:
+        await store.create_document(PLAYERS, data, player_id)
+    return store
+
+
+class TestDocuments:
+    """Test cases for generic document reads and writes."""
+
+    @pytest.mark.asyncio
+    async def test_get_document_returns_stored_fields_only(self):
+        store = await _store_with_players()
+
+        document = await store.get_document(PLAYERS, "P001")
+        document["name"] = "changed"
+
+        assert "id" not in document
+        assert (await store.get_document(PLAYERS, "P001"))["name"] == "Ann"
+        assert await store.get_document(PLAYERS, "missing") is None
+
+    @pytest.mark.asyncio
+    async def test_transact_reads_documents_as_stored(self):
+        store = await _store_with_players()
+        seen = []
+
+        def build_operations(documents):
+            seen.extend(documents)
+            return [{"type": "update", "collection": PLAYERS, "document_id": "P001", "data": {"status": "left"}}]
+
+        await store.transact([(PLAYERS, "P001"), (PLAYERS, "missing")], build_operations)
+
+        assert seen == [{"name": "Ann", "status": "active", "position": "defender", "joined": 3}, None]
+        assert (await store.get_document(PLAYERS, "P001"))["status"] == "left"
+
+
+class TestQueries:
+    """Test cases for query_documents and run_query."""
+
+    @pytest.mark.asyncio
+    async def test_operator_filters_and_order_by(self):
+        store = await _store_with_players()
+
+        docs = await store.query_documents(
+            PLAYERS,
+            filters=[{"field": "status", "operator": "in", "value": ["active", "pending"]}],
+            order_by="-joined",
+        )
+
+        assert [doc["id"] for doc in docs] == ["P001", "P003", "P002"]
+
+    @pytest.mark.asyncio
+    async def test_order_by_tolerates_missing_and_mixed_values(self):
+        store = await _store_with_players()
+        await store.create_document(PLAYERS, {"name": "Eve", "position": 7}, "P005")
+
+        docs = await store.query_documents(PLAYERS, order_by="position")
+
+        # Nulls (and missing fields) first, numbers before strings
+        assert [doc["id"] for doc in docs] == ["P002", "P004", "P005", "P001", "P003"]
+
+    @pytest.mark.asyncio
+    async def test_run_query_filters_orders_limits_and_projects(self):
+        store = await _store_with_players()
+        spec = QuerySpec().where("status", "==", "active").order("joined").take(1).project("name")
+
+        docs = await store.run_query(PLAYERS, spec)
+
+        assert docs == [{"id": "P003", "name": "Cat"}]
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_every_document_once(self):
+        store = await _store_with_players()
+        spec = QuerySpec().order("joined")
+
+        first = await store.query_page(PLAYERS, spec, page_size=3)
+        second = await store.query_page(PLAYERS, spec, page_size=3, cursor=first.next_cursor)
+
+        assert [doc["name"] for doc in first.items + second.items] == ["Ben", "Cat", "Ann", "Dan"]
+        assert not second.has_more
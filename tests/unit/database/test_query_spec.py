@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Unit tests for QuerySpec, in-memory query evaluation and composite index generation.
+"""
+
+import importlib.util
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from kickai.core.firestore_constants import get_team_players_collection
+from kickai.database.mock_data_store import MockDataStore
+from kickai.database.query_spec import (
+    ASCENDING,
+    DESCENDING,
+    QuerySpec,
+    apply_query_spec,
+    composite_index_fields,
+    generate_index_config,
+)
+from kickai.features.player_registration.infrastructure.firebase_player_repository import (
+    FirebasePlayerRepository,
+    _players_due_reminder_spec,
+)
+
+TEAM_ID = "KTI"
+PLAYERS = get_team_players_collection(TEAM_ID)
+SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "generate_firestore_indexes.py"
+
+DOCUMENTS = [
+    {"id": "M1", "status": "scheduled", "date": "2026-03-01", "venue": {"name": "Park"}},
+    {"id": "M2", "status": "completed", "date": "2026-01-10", "venue": {"name": "Hall"}},
+    {"id": "M3", "status": "scheduled", "date": "2026-02-14", "venue": {"name": "Park"}},
+    {"id": "M4", "status": "scheduled"},
+]
+
+
+class TestQuerySpec:
+    """Test cases for building and validating specs."""
+
+    def test_where_range_adds_one_filter_per_bound(self):
+        spec = QuerySpec().where_range(
+            "date", lower="2026-01-01", upper="2026-02-01", include_upper=False
+        )
+
+        assert spec.filter_dicts() == [
+            {"field": "date", "operator": ">=", "value": "2026-01-01"},
+            {"field": "date", "operator": "<", "value": "2026-02-01"},
+        ]
+        assert spec.range_fields == ["date"]
+
+    def test_unsupported_operator_is_rejected(self):
+        with pytest.raises(ValueError):
+            QuerySpec().where("status", "like", "sched%")
+
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            QuerySpec().where_range("date", lower="a").where_range("kickoff", upper="b"),
+            QuerySpec().where_range("date", lower="a").order("status"),
+            QuerySpec().take(0),
+            QuerySpec().order("date").after(("a", "b")),
+        ],
+    )
+    def test_specs_firestore_cannot_run_are_rejected(self, spec):
+        with pytest.raises(ValueError):
+            spec.validate()
+
+
+class TestApplyQuerySpec:
+    """Test cases for evaluating specs in memory."""
+
+    def test_filters_order_and_nested_projection(self):
+        spec = (
+            QuerySpec()
+            .where("status", "==", "scheduled")
+            .where_range("date", lower="2026-02-01")
+            .order("date", descending=True)
+            .project("venue.name")
+        )
+
+        results = apply_query_spec(DOCUMENTS, spec)
+
+        assert results == [
+            {"id": "M1", "venue": {"name": "Park"}},
+            {"id": "M3", "venue": {"name": "Park"}},
+        ]
+
+    def test_documents_missing_the_order_field_are_excluded(self):
+        results = apply_query_spec(DOCUMENTS, QuerySpec().order("date"))
+
+        assert [doc["id"] for doc in results] == ["M2", "M3", "M1"]
+
+    def test_start_after_resumes_past_the_cursor(self):
+        spec = QuerySpec().order("date").after(("2026-01-10",)).take(1)
+
+        assert [doc["id"] for doc in apply_query_spec(DOCUMENTS, spec)] == ["M3"]
+
+
+class TestRunQuery:
+    """Test cases for pushing a repository query down to the data store."""
+
+    @pytest.mark.asyncio
+    async def test_players_due_reminder_uses_persisted_fields(self):
+        store = MockDataStore()
+        now = datetime.utcnow()
+        players = [
+            ("P001", "pending", now - timedelta(hours=30), 0),
+            ("P002", "pending", now - timedelta(hours=2), 0),
+            ("P003", "active", now - timedelta(hours=50), 0),
+            ("P004", "pending", now - timedelta(hours=72), None),
+            ("P005", "pending", now - timedelta(hours=90), 3),
+        ]
+        for player_id, status, created_at, reminders_sent in players:
+            data = {
+                "player_id": player_id,
+                "team_id": TEAM_ID,
+                "name": player_id,
+                "status": status,
+                "created_at": created_at.isoformat(),
+            }
+            if reminders_sent is not None:
+                data["reminders_sent"] = reminders_sent
+            await store.create_document(PLAYERS, data, player_id)
+        repository = FirebasePlayerRepository(store)
+
+        due = await repository.get_players_due_for_reminder(
+            TEAM_ID, (now - timedelta(hours=24)).isoformat(), max_reminders=3
+        )
+
+        assert [player.player_id for player in due] == ["P004", "P001"]
+
+
+class TestCompositeIndexes:
+    """Test cases for deriving composite indexes from registered query shapes."""
+
+    def test_equality_filters_precede_the_range_field(self):
+        fields = composite_index_fields(_players_due_reminder_spec("", ""))
+
+        assert fields == [("team_id", ASCENDING), ("status", ASCENDING), ("created_at", ASCENDING)]
+
+    def test_single_field_queries_need_no_composite_index(self):
+        assert composite_index_fields(QuerySpec().where("status", "==", "active")) is None
+        assert composite_index_fields(QuerySpec().order("date", descending=True)) is None
+        assert composite_index_fields(
+            QuerySpec().where("status", "==", "scheduled").order("date", descending=True)
+        ) == [("status", ASCENDING), ("date", DESCENDING)]
+
+    def test_generated_config_covers_every_team(self):
+        config = generate_index_config(["KTI", "KAI"])
+
+        reminder_indexes = [
+            index
+            for index in config["indexes"]
+            if [field["fieldPath"] for field in index["fields"]]
+            == ["team_id", "status", "created_at"]
+        ]
+        assert {index["collectionGroup"] for index in reminder_indexes} == {
+            get_team_players_collection("KTI"),
+            get_team_players_collection("KAI"),
+        }
+        assert config["fieldOverrides"] == []
+
+    def test_script_writes_index_file(self, tmp_path, monkeypatch):
+        spec = importlib.util.spec_from_file_location("generate_firestore_indexes", SCRIPT)
+        script = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(script)
+        monkeypatch.setattr(
+            script,
+            "QUERY_MODULES",
+            ["kickai.features.player_registration.infrastructure.firebase_player_repository"],
+        )
+        output = tmp_path / "firestore.indexes.json"
+        argv = ["generate", "--team-id", TEAM_ID, "--output", str(output)]
+        monkeypatch.setattr(sys, "argv", argv)
+
+        assert script.main() == 0
+
+        written = json.loads(output.read_text())
+        assert {
+            "collectionGroup": PLAYERS,
+            "queryScope": "COLLECTION",
+            "fields": [
+                {"fieldPath": "team_id", "order": ASCENDING},
+                {"fieldPath": "status", "order": ASCENDING},
+                {"fieldPath": "created_at", "order": ASCENDING},
+            ],
+        } in written["indexes"]
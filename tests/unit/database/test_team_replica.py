@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the live team roster replica.
+"""
+
+import pytest
+
+from kickai.core.firestore_constants import get_team_players_collection
+from kickai.database.mock_data_store import MockDataStore
+from kickai.database.query_spec import QuerySpec
+from kickai.database.team_replica import SYNC_MODE_POLLING, ReplicatedDataStore
+
+TEAM_ID = "KTI"
+PLAYERS = get_team_players_collection(TEAM_ID)
+
+
+class CountingStore(MockDataStore):
+    """MockDataStore counting the reads that reach it."""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    async def run_query(self, collection, spec):
+        self.reads += 1
+        return await super().run_query(collection, spec)
+
+    async def get_document(self, collection, document_id=None, doc_id=None):
+        self.reads += 1
+        return await super().get_document(collection, document_id, doc_id)
+
+
+async def _replicated_store(player_count: int = 20):
+    base = CountingStore()
+    for i in range(player_count):
+        await base.create_document(
+            PLAYERS, {"name": f"Player {i}", "status": "active" if i % 2 else "pending"}, f"P{i:03d}"
+        )
+    store = ReplicatedDataStore(base, max_staleness_seconds=60, poll_interval_seconds=3600)
+    replica = await store.enable_team(TEAM_ID)
+    base.reads = 0
+    return base, store, replica
+
+
+class TestReplicatedDataStore:
+    """Test cases for ReplicatedDataStore over MockDataStore."""
+
+    @pytest.mark.asyncio
+    async def test_reads_served_from_replica(self):
+        base, store, replica = await _replicated_store()
+
+        for _ in range(5):
+            active = await store.run_query(PLAYERS, QuerySpec().where("status", "==", "active"))
+        player = await store.get_document(PLAYERS, "P003")
+
+        assert replica.sync_mode == SYNC_MODE_POLLING
+        assert len(active) == 10
+        assert player["name"] == "Player 3"
+        assert base.reads == 0
+        assert store.replica_reads == 6
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_writes_go_through_and_are_read_back(self):
+        base, store, _ = await _replicated_store()
+
+        await store.create_document(PLAYERS, {"name": "New", "status": "active"}, "P999")
+        await store.update_document(PLAYERS, "P000", {"status": "active"})
+        await store.delete_document(PLAYERS, "P001")
+
+        active = await store.query_documents(
+            PLAYERS, [{"field": "status", "operator": "==", "value": "active"}]
+        )
+        ids = {doc["id"] for doc in active}
+        assert {"P999", "P000"} <= ids
+        assert "P001" not in ids
+        assert (await base.get_document(PLAYERS, "P000"))["status"] == "active"
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_replica_falls_through_to_store(self):
+        base, store, replica = await _replicated_store()
+        replica.synced_at -= 120
+
+        await store.run_query(PLAYERS, QuerySpec())
+
+        assert base.reads == 1
+        assert store.store_reads == 1
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_other_collections_use_the_store(self):
+        base, store, _ = await _replicated_store()
+
+        await store.get_document("kickai_teams", TEAM_ID)
+
+        assert base.reads == 1
+        await store.close()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Unit tests for set-based match attendance initialization.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from kickai.features.attendance_management.domain.entities.attendance import Attendance, AttendanceStatus
+from kickai.features.attendance_management.domain.services.attendance_service import AttendanceService
+from kickai.features.match_management.domain.interfaces.match_service_interface import IMatchService
+from kickai.features.player_registration.domain.interfaces.player_service_interface import IPlayerService
+
+TEAM_ID = "KTI"
+MATCH_ID = "MATCH_001"
+TEAM_SIZE = 40
+
+
+class CountingRepository:
+    """In-memory attendance repository recording every call."""
+
+    def __init__(self, records=None):
+        self.records = {record.id: record for record in records or []}
+        self.calls = []
+
+    async def get_by_match(self, match_id, team_id):
+        self.calls.append("get_by_match")
+        return [r for r in self.records.values() if r.match_id == match_id and r.team_id == team_id]
+
+    async def get_by_player_and_match(self, player_id, match_id, team_id):
+        self.calls.append("get_by_player_and_match")
+        return self.records.get(f"{team_id}_{match_id}_{player_id}")
+
+    async def create(self, attendance):
+        self.calls.append("create")
+        self.records[attendance.id] = attendance
+        return attendance
+
+    async def create_many(self, attendances):
+        self.calls.append("create_many")
+        self.records.update((attendance.id, attendance) for attendance in attendances)
+        return attendances
+
+
+def _players(count=TEAM_SIZE):
+    return [SimpleNamespace(player_id=f"P{i:02d}", name=f"Player {i}") for i in range(count)]
+
+
+def _container(players):
+    player_service = MagicMock()
+    player_service.get_active_players = AsyncMock(return_value=players)
+    match_service = MagicMock()
+    match_service.get_match = AsyncMock(return_value=SimpleNamespace(opponent="Arsenal", date="2025-03-01"))
+    container = MagicMock()
+    container.get_service.side_effect = {IPlayerService: player_service, IMatchService: match_service}.get
+    return container
+
+
+async def _initialize(repository, players):
+    with patch(
+        "kickai.features.attendance_management.domain.services.attendance_service.get_container",
+        return_value=_container(players),
+    ):
+        return await AttendanceService(repository).initialize_match_attendance(MATCH_ID, TEAM_ID)
+
+
+class TestInitializeMatchAttendance:
+    """Test cases for roster initialization cost and results."""
+
+    @pytest.mark.asyncio
+    async def test_forty_players_take_two_repository_calls(self):
+        repository = CountingRepository()
+
+        records = await _initialize(repository, _players())
+
+        assert repository.calls == ["get_by_match", "create_many"]
+        assert [record.player_id for record in records] == [f"P{i:02d}" for i in range(TEAM_SIZE)]
+        assert all(record.status == AttendanceStatus.NOT_RESPONDED for record in records)
+        assert len(repository.records) == TEAM_SIZE
+
+    @pytest.mark.asyncio
+    async def test_existing_records_are_kept(self):
+        answered = Attendance.create("P03", MATCH_ID, TEAM_ID, AttendanceStatus.PRESENT)
+        repository = CountingRepository([answered])
+
+        records = await _initialize(repository, _players())
+
+        assert repository.calls == ["get_by_match", "create_many"]
+        assert records[3] is answered
+        assert len(repository.records) == TEAM_SIZE
+
+    @pytest.mark.asyncio
+    async def test_fully_initialized_match_writes_nothing(self):
+        repository = CountingRepository()
+        await _initialize(repository, _players())
+        repository.calls.clear()
+
+        records = await _initialize(repository, _players())
+
+        assert repository.calls == ["get_by_match"]
+        assert len(records) == TEAM_SIZE
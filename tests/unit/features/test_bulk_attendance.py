@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Unit tests for batched bulk attendance recording.
+"""
+
+import pytest
+
+from kickai.core.exceptions import AttendanceError
+from kickai.core.firestore_constants import get_team_matches_collection
+from kickai.database.mock_data_store import MockDataStore
+from kickai.features.match_management.domain.entities.attendance import AttendanceStatus
+from kickai.features.match_management.domain.services.attendance_service import AttendanceService
+from kickai.features.match_management.infrastructure.firebase_attendance_repository import (
+    FirebaseAttendanceRepository,
+)
+
+MATCH_ID = "MATCH_2025-03-01_KAI_ARSENAL"
+SQUAD_SIZE = 30
+
+
+class CountingStore(MockDataStore):
+    """MockDataStore counting the calls that reach it."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    async def query_documents(self, collection, filters=None, order_by=None, limit=None):
+        self.calls.append("query_documents")
+        return await super().query_documents(collection, filters, order_by, limit)
+
+    async def create_document(self, collection, data, document_id=None, doc_id=None):
+        self.calls.append("create_document")
+        return await super().create_document(collection, data, document_id, doc_id)
+
+    async def update_document(self, collection, document_id=None, data=None, doc_id=None):
+        self.calls.append("update_document")
+        return await super().update_document(collection, document_id, data, doc_id)
+
+    async def execute_batch(self, operations):
+        self.calls.append("execute_batch")
+        return await super().execute_batch(operations)
+
+
+async def _service():
+    store = CountingStore()
+    for team_id in ("KTI", "KAI"):
+        await store.create_document("teams", {"team_id": team_id}, team_id)
+    await store.create_document(get_team_matches_collection("KAI"), {"team_id": "KAI"}, MATCH_ID)
+    store.calls.clear()
+    return AttendanceService(FirebaseAttendanceRepository(store)), store
+
+
+def _register(size=SQUAD_SIZE):
+    statuses = [AttendanceStatus.ATTENDED, AttendanceStatus.ABSENT, AttendanceStatus.LATE]
+    return [
+        {"player_id": f"P{i:02d}", "status": statuses[i % 3].value, "arrival_time": "14:05" if i % 3 == 2 else None}
+        for i in range(size)
+    ]
+
+
+class TestBulkRecordAttendance:
+    """Test cases for the batched register."""
+
+    @pytest.mark.asyncio
+    async def test_register_uses_fixed_number_of_store_calls(self):
+        service, store = await _service()
+
+        results = await service.bulk_record_attendance(MATCH_ID, _register(), recorded_by="M01")
+
+        assert [result.player_id for result in results] == [f"P{i:02d}" for i in range(SQUAD_SIZE)]
+        assert all(result.success for result in results)
+        # Teams lookup, existing-records queries, the match's team lookup, one batch commit
+        assert store.calls == ["query_documents"] * 4 + ["execute_batch"]
+        assert len(await service.get_match_attendance(MATCH_ID)) == SQUAD_SIZE
+
+    @pytest.mark.asyncio
+    async def test_register_is_written_to_the_match_team(self):
+        service, store = await _service()
+
+        await service.bulk_record_attendance(MATCH_ID, _register(3))
+
+        assert len(await store.query_documents("kickai_KAI_match_attendance")) == 3
+        assert await store.query_documents("kickai_KTI_match_attendance") == []
+
+    @pytest.mark.asyncio
+    async def test_rerecording_updates_existing_rows(self):
+        service, store = await _service()
+        await service.bulk_record_attendance(MATCH_ID, _register())
+        store.calls.clear()
+
+        results = await service.bulk_record_attendance(
+            MATCH_ID, [{"player_id": "P01", "status": "attended"}, {"player_id": "P30", "status": "late"}]
+        )
+
+        assert all(result.success for result in results)
+        # The match's team is known from the first register
+        assert store.calls == ["query_documents"] * 3 + ["execute_batch"]
+        summary = await service.get_attendance_summary(MATCH_ID)
+        assert summary["total_players"] == SQUAD_SIZE + 1
+        assert summary["absent"] == SQUAD_SIZE // 3 - 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_row_writes_nothing(self):
+        service, store = await _service()
+        register = _register()
+        register[17]["status"] = "maybe"
+        register[21]["player_id"] = register[20]["player_id"]
+
+        results = await service.bulk_record_attendance(MATCH_ID, register)
+
+        assert not any(result.success for result in results)
+        assert "maybe" in results[17].error
+        assert "Duplicate" in results[21].error
+        assert results[0].error == "Not recorded: other rows are invalid"
+        assert store.calls == []
+
+    @pytest.mark.asyncio
+    async def test_failed_existing_records_read_writes_nothing(self):
+        service, store = await _service()
+        await service.bulk_record_attendance(MATCH_ID, _register(2))
+
+        async def failing_query(collection, filters=None, order_by=None, limit=None):
+            if collection.endswith("_match_attendance"):
+                raise RuntimeError("firestore unavailable")
+            return await MockDataStore.query_documents(store, collection, filters, order_by, limit)
+
+        store.query_documents = failing_query
+        store.calls.clear()
+
+        # Re-recording on an unreadable register would otherwise recreate rows as new
+        with pytest.raises(AttendanceError):
+            await service.bulk_record_attendance(MATCH_ID, [{"player_id": "P00", "status": "late"}])
+        assert store.calls == []
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Unit tests for batched linked-record synchronisation.
+"""
+
+import pytest
+
+from kickai.core.firestore_constants import get_team_members_collection, get_team_players_collection
+from kickai.database.mock_data_store import MockDataStore
+from kickai.features.shared.domain.services.linked_record_sync_service import LinkedRecordSyncService
+
+TEAM_ID = "KTI"
+PAIRS = 40
+
+
+class CountingStore(MockDataStore):
+    """MockDataStore counting the calls that reach it."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    async def run_query(self, collection, spec):
+        self.calls.append("run_query")
+        return await super().run_query(collection, spec)
+
+    async def execute_batch(self, operations):
+        self.calls.append("execute_batch")
+        return await super().execute_batch(operations)
+
+
+async def _store(pairs=PAIRS):
+    """Linked pairs where the player has the phone number and the team member has the email."""
+    store = CountingStore()
+    for i in range(pairs):
+        await store.create_document(
+            get_team_players_collection(TEAM_ID),
+            {"telegram_id": 1000 + i, "phone_number": f"+4478715215{i:02d}", "updated_at": "2025-01-01T00:00:00"},
+            f"P{i:03d}",
+        )
+        await store.create_document(
+            get_team_members_collection(TEAM_ID),
+            {"telegram_id": 1000 + i, "email": f"member{i}@example.com", "updated_at": "2025-01-01T00:00:00"},
+            f"M{i:03d}",
+        )
+    store.calls.clear()
+    return store
+
+
+class TestBatchSync:
+    """Test cases for reconciling linked pairs in bulk."""
+
+    @pytest.mark.asyncio
+    async def test_team_sync_reads_each_side_once_and_writes_in_one_batch(self):
+        store = await _store()
+
+        report = await LinkedRecordSyncService().sync_linked_records(TEAM_ID, data_store=store)
+
+        assert store.calls == ["run_query", "run_query", "execute_batch"]
+        assert report.pairs == PAIRS
+        assert len(report.player_updates) == len(report.team_member_updates) == PAIRS
+        assert report.batches_committed == 1
+        member = await store.get_document(get_team_members_collection(TEAM_ID), "M007")
+        player = await store.get_document(get_team_players_collection(TEAM_ID), "P007")
+        assert member["phone_number"] == player["phone_number"] == "+447871521507"
+        assert member["phone_e164"] == "+447871521507"
+        assert player["email"] == member["email"] == "member7@example.com"
+
+    @pytest.mark.asyncio
+    async def test_dry_run_reports_without_writing(self):
+        store = await _store()
+
+        report = await LinkedRecordSyncService().sync_linked_records(
+            TEAM_ID, telegram_ids=[1000, 1001], dry_run=True, data_store=store
+        )
+
+        assert store.calls == ["run_query", "run_query"]
+        assert set(report.player_updates) == {"P000", "P001"}
+        player = await store.get_document(get_team_players_collection(TEAM_ID), "P000")
+        assert "email" not in player
+
+    @pytest.mark.asyncio
+    async def test_selected_links_match_telegram_ids_stored_as_strings(self):
+        store = await _store(pairs=3)
+        members = get_team_members_collection(TEAM_ID)
+        await store.update_document(members, "M001", {"telegram_id": "1001"})
+        store.calls.clear()
+
+        report = await LinkedRecordSyncService().sync_linked_records(
+            TEAM_ID, telegram_ids=[1001, "1002"], data_store=store
+        )
+
+        assert report.pairs == 2
+        assert set(report.team_member_updates) == {"M001", "M002"}
+        assert (await store.get_document(members, "M001"))["phone_e164"] == "+447871521501"
+
+    @pytest.mark.asyncio
+    async def test_invalid_number_keeps_the_stored_phone_e164(self):
+        store = await _store(pairs=1)
+        players = get_team_players_collection(TEAM_ID)
+        members = get_team_members_collection(TEAM_ID)
+        # Ofcom drama-range number: stored as typed, but it has no E.164 form
+        await store.update_document(players, "P000", {"phone_number": "07700 900123"})
+        await store.update_document(members, "M000", {"phone_e164": "+447871521500"})
+        store.calls.clear()
+
+        report = await LinkedRecordSyncService().sync_linked_records(TEAM_ID, data_store=store)
+
+        member = await store.get_document(members, "M000")
+        assert member["phone_number"] == "07700 900123"
+        assert member["phone_e164"] == "+447871521500"
+        assert [(c.field, c.resolution) for c in report.unresolved_conflicts] == [
+            ("phone_e164", "unresolved")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_conflicts_are_reported_and_resolved_by_preference(self):
+        store = await _store(pairs=2)
+        members = get_team_members_collection(TEAM_ID)
+        await store.update_document(
+            members, "M000", {"phone_number": "+447871999111", "updated_at": "2025-02-01T00:00:00"}
+        )
+        await store.update_document(members, "M001", {"phone_number": "+447871999222"})
+        store.calls.clear()
+
+        report = await LinkedRecordSyncService().sync_linked_records(TEAM_ID, data_store=store)
+
+        by_id = {conflict.telegram_id: conflict for conflict in report.conflicts}
+        assert by_id[1000].field == "phone_number"
+        assert by_id[1000].resolution == "team_member"  # Newer record wins
+        assert by_id[1001].resolution == "unresolved"  # Same updated_at: left alone
+        player = await store.get_document(get_team_players_collection(TEAM_ID), "P000")
+        assert player["phone_number"] == "+447871999111"
+        assert (await store.get_document(members, "M001"))["phone_number"] == "+447871999222"
+
+        report = await LinkedRecordSyncService().sync_linked_records(
+            TEAM_ID, prefer="player", dry_run=True, data_store=store
+        )
+        assert report.unresolved_conflicts == []
+        assert report.team_member_updates["M001"]["phone_number"] == "+447871521501"
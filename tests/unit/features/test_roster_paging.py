@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Unit tests for paging team rosters through the player and team member services.
+"""
+
+import pytest
+
+from kickai.core.firestore_constants import get_team_members_collection, get_team_players_collection
+from kickai.database.mock_data_store import MockDataStore
+from kickai.features.player_registration.domain.services.player_service import PlayerService
+from kickai.features.player_registration.infrastructure.firebase_player_repository import (
+    FirebasePlayerRepository,
+)
+from kickai.features.shared.domain.pagination import Page
+from kickai.features.team_administration.domain.services.team_member_service import (
+    TeamMemberService,
+)
+from kickai.features.team_administration.infrastructure.firebase_team_member_repository import (
+    FirebaseTeamMemberRepository,
+)
+
+TEAM_ID = "KTI"
+
+
+async def _player_service(player_count: int):
+    store = MockDataStore()
+    for i in range(player_count):
+        await store.create_document(
+            get_team_players_collection(TEAM_ID),
+            {"player_id": f"P{i:03d}", "team_id": TEAM_ID, "name": f"Player {i}"},
+            f"P{i:03d}",
+        )
+    # Another team's player in the same store must never appear in KTI's pages
+    await store.create_document(
+        get_team_players_collection(TEAM_ID),
+        {"player_id": "X001", "team_id": "KAI", "name": "Visitor"},
+        "X001",
+    )
+    return PlayerService(FirebasePlayerRepository(store), team_service=None)
+
+
+class TestPlayerPages:
+    """Test cases for PlayerService paging."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_walk_returns_each_player_once(self):
+        service = await _player_service(7)
+
+        seen, cursor, pages = [], None, 0
+        while True:
+            page = await service.get_players_page(TEAM_ID, page_size=3, cursor=cursor)
+            assert isinstance(page, Page)
+            pages += 1
+            seen.extend(player.player_id for player in page.items)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        assert pages == 3
+        assert seen == [f"P{i:03d}" for i in range(7)]
+
+    @pytest.mark.asyncio
+    async def test_exact_multiple_ends_with_an_empty_page(self):
+        service = await _player_service(4)
+
+        first = await service.get_players_page(TEAM_ID, page_size=4)
+        second = await service.get_players_page(TEAM_ID, page_size=4, cursor=first.next_cursor)
+
+        assert len(first.items) == 4 and first.has_more
+        assert second.items == [] and not second.has_more
+
+    @pytest.mark.asyncio
+    async def test_iter_players_streams_the_whole_roster(self):
+        service = await _player_service(5)
+
+        names = [player.name async for player in service.iter_players(TEAM_ID, page_size=2)]
+
+        assert names == [f"Player {i}" for i in range(5)]
+
+
+class TestTeamMemberPages:
+    """Test cases for TeamMemberService paging."""
+
+    @pytest.mark.asyncio
+    async def test_member_pages_and_stream_agree(self):
+        store = MockDataStore()
+        for i in range(5):
+            await store.create_document(
+                get_team_members_collection(TEAM_ID),
+                {"member_id": f"M{i:03d}", "team_id": TEAM_ID, "name": f"Member {i}"},
+                f"M{i:03d}",
+            )
+        service = TeamMemberService(FirebaseTeamMemberRepository(store))
+
+        first = await service.get_team_members_page(TEAM_ID, page_size=2)
+        rest = await service.get_team_members_page(TEAM_ID, page_size=10, cursor=first.next_cursor)
+        streamed = [
+            member.member_id async for member in service.iter_team_members(TEAM_ID, page_size=2)
+        ]
+
+        assert [m.member_id for m in first.items + rest.items] == streamed
+        assert streamed == [f"M{i:03d}" for i in range(5)]
+        assert not rest.has_more
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Unit tests for role decisions made from the per-team role summary.
+"""
+
+import asyncio
+
+import pytest
+
+from kickai.core.enums import ChatType
+from kickai.database.mock_data_store import MockDataStore
+from kickai.features.team_administration.domain.entities.team_member import TeamMember
+from kickai.features.team_administration.domain.services.chat_role_assignment_service import (
+    ChatRoleAssignmentService,
+)
+from kickai.features.team_administration.domain.services.team_member_service import TeamMemberService
+from kickai.features.team_administration.infrastructure.firebase_team_member_repository import (
+    FirebaseTeamMemberRepository,
+)
+from kickai.features.team_administration.infrastructure.firebase_team_repository import (
+    FirebaseTeamRepository,
+)
+
+TEAM_ID = "KTI"
+
+
+class InterleavingStore(MockDataStore):
+    """MockDataStore that yields to the event loop after every read, so concurrent joins interleave."""
+
+    def __init__(self):
+        super().__init__()
+        self.queries = []
+
+    async def get_document(self, collection, document_id=None, doc_id=None):
+        document = await super().get_document(collection, document_id, doc_id)
+        await asyncio.sleep(0)
+        return document
+
+    async def query_documents(self, collection, filters=None, order_by=None, limit=None):
+        self.queries.append([f["field"] for f in filters or []])
+        documents = await super().query_documents(collection, filters, order_by, limit)
+        await asyncio.sleep(0)
+        return documents
+
+
+def _service():
+    store = InterleavingStore()
+    team_member_service = TeamMemberService(FirebaseTeamMemberRepository(store))
+    return ChatRoleAssignmentService(store, team_member_service=team_member_service, player_service=object()), store
+
+
+async def _join(service, user_id):
+    return await service.add_user_to_chat(TEAM_ID, str(user_id), ChatType.LEADERSHIP.value, f"user{user_id}")
+
+
+class TestFirstJoiner:
+    """Test cases for first-user admin assignment."""
+
+    @pytest.mark.asyncio
+    async def test_simultaneous_first_joiners_cannot_both_become_admin(self):
+        service, _ = _service()
+
+        results = await asyncio.gather(_join(service, 101), _join(service, 102))
+
+        assert sorted(result["is_admin"] for result in results) == [False, True]
+        summary = await service.team_member_service.get_role_summary(TEAM_ID)
+        assert summary.member_count == 2
+        assert summary.admin_count == 1
+        assert summary.first_member["is_admin"] is True
+
+    @pytest.mark.asyncio
+    async def test_join_does_not_load_the_roster(self):
+        service, store = _service()
+        for user_id in range(101, 111):
+            await _join(service, user_id)
+
+        store.queries.clear()
+        result = await _join(service, 200)
+
+        assert result["is_admin"] is False
+        # Only the joiner's own lookup; the admin decision reads the summary document
+        assert store.queries == [["telegram_id", "team_id"]]
+
+
+class TestAdminSuccession:
+    """Test cases for promoting the longest-tenured member when the last admin leaves."""
+
+    @pytest.mark.asyncio
+    async def test_longest_tenured_member_is_promoted(self):
+        service, store = _service()
+        for user_id in (101, 102, 103):
+            await _join(service, user_id)
+
+        store.queries.clear()
+        await service._handle_admin_leaving_leadership(TEAM_ID, 101)
+
+        summary = await service.team_member_service.get_role_summary(TEAM_ID)
+        assert [entry["telegram_id"] for entry in summary.admins()] == [101, 102]
+        assert store.queries == []
+
+
+class TestTeamRepositoryMemberWrites:
+    """Test cases for member writes made through the team repository."""
+
+    @pytest.mark.asyncio
+    async def test_writes_keep_the_role_summary_in_step(self):
+        store = MockDataStore()
+        team_repository = FirebaseTeamRepository(store)
+        member_repository = FirebaseTeamMemberRepository(store)
+
+        member = TeamMember(team_id=TEAM_ID, telegram_id=101, member_id="M01AB", name="Alex")
+        await team_repository.create_team_member(member)
+        member.is_admin = True
+        await team_repository.update_team_member(member)
+
+        summary = await member_repository.get_role_summary(TEAM_ID)
+        assert summary.member_count == 1
+        assert summary.admin_count == 1
+
+        assert await team_repository.delete_team_member("M01AB", TEAM_ID)
+        summary = await member_repository.get_role_summary(TEAM_ID)
+        assert summary.member_count == 0
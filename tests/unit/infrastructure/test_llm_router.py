@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the multi-provider LLM router, using stub endpoints.
+"""
+
+import time
+
+import pytest
+
+from kickai.agents.config.message_router_config import ADMISSION_MAX_CONCURRENT
+from kickai.core.token_accounting import TokenAccountant, token_accounting_scope
+from kickai.infrastructure.llm_providers.factory import LLMProviderFactory
+from kickai.infrastructure.llm_providers.router import (
+    HEDGE_MAX_WORKERS,
+    MIN_SAMPLES_FOR_HEDGING,
+    MIN_SAMPLES_FOR_RANKING,
+    LLMRouter,
+    LLMRouterError,
+    RoutedLLM,
+)
+
+
+class StubLLM:
+    """Endpoint stub with a fixed delay, optionally failing."""
+
+    def __init__(self, reply: str, delay: float = 0.0, fail: bool = False):
+        self.reply = reply
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    def call(self, messages, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.reply} unavailable")
+        return self.reply
+
+
+@pytest.fixture(autouse=True)
+def fresh_endpoint_health():
+    LLMProviderFactory._endpoint_health.clear()
+    yield
+    LLMProviderFactory._endpoint_health.clear()
+
+
+def _router(*stubs, hedge=False, failure_threshold=3):
+    endpoints = [
+        LLMProviderFactory.create_endpoint(stub.reply, stub, failure_threshold=failure_threshold)
+        for stub in stubs
+    ]
+    return LLMProviderFactory.create_router(endpoints, hedge=hedge)
+
+
+class TestFailover:
+    """Test cases for failover and circuit breaking."""
+
+    def test_primary_used_while_healthy(self):
+        primary, fallback = StubLLM("groq"), StubLLM("openai")
+        router = _router(primary, fallback)
+
+        assert router.call([{"role": "user", "content": "hi"}]) == "groq"
+        assert fallback.calls == 0
+
+    def test_fails_over_to_next_endpoint(self):
+        primary, fallback = StubLLM("groq", fail=True), StubLLM("openai")
+        router = _router(primary, fallback)
+
+        assert router.call("hi") == "openai"
+        assert router.failovers == 1
+
+    def test_open_breaker_skips_endpoint(self):
+        primary, fallback = StubLLM("groq", fail=True), StubLLM("openai")
+        router = _router(primary, fallback, failure_threshold=2)
+
+        for _ in range(2):
+            router.call("hi")
+        router.call("hi")
+
+        assert primary.calls == 2
+        assert router.get_stats()["endpoints"][0]["breaker"] == "OPEN"
+
+    def test_ranking_leaves_breaker_state_alone(self):
+        primary, fallback = StubLLM("groq", fail=True), StubLLM("openai")
+        router = _router(primary, fallback, failure_threshold=1)
+        router.call("hi")
+        breaker = router.endpoints[0].health.breaker
+        breaker.last_failure_time -= breaker.timeout
+
+        assert [endpoint.name for endpoint in router.ranked_endpoints()] == ["groq", "openai"]
+        assert breaker.state == "OPEN"
+
+    def test_all_endpoints_failing_raises(self):
+        router = _router(StubLLM("groq", fail=True), StubLLM("openai", fail=True))
+
+        with pytest.raises(LLMRouterError):
+            router.call("hi")
+
+
+class TestLatencyRanking:
+    """Test cases for latency-aware endpoint selection."""
+
+    def test_faster_endpoint_preferred_once_measured(self):
+        slow, fast = StubLLM("groq", delay=0.02), StubLLM("openai")
+        endpoints = [LLMProviderFactory.create_endpoint(stub.reply, stub) for stub in (slow, fast)]
+        for endpoint in endpoints:
+            for _ in range(MIN_SAMPLES_FOR_RANKING):
+                endpoint.call("warmup")
+
+        router = LLMRouter(endpoints)
+
+        assert [endpoint.name for endpoint in router.ranked_endpoints()] == ["openai", "groq"]
+        assert router.call("hi") == "openai"
+
+    def test_health_shared_between_routers(self):
+        stub = StubLLM("groq")
+        _router(stub).call("hi")
+
+        assert LLMProviderFactory.get_endpoint_health_status()["groq"]["total_calls"] == 1
+
+
+class TestHedging:
+    """Test cases for hedged requests."""
+
+    def test_slow_call_hedged_to_next_endpoint(self):
+        primary, fallback = StubLLM("groq", delay=0.001), StubLLM("openai")
+        router = _router(primary, fallback, hedge=True)
+        for _ in range(MIN_SAMPLES_FOR_HEDGING):
+            router.call("warmup")
+
+        primary.delay = 0.5
+        started = time.perf_counter()
+        result = router.call("hi")
+
+        assert result == "openai"
+        assert time.perf_counter() - started < 0.4
+        assert router.hedged_calls == 1
+        assert router.hedge_wins == 1
+
+        primary.delay = 0.5
+        response, endpoint = router.call_with_endpoint("hi")
+        assert (response, endpoint.model) == ("openai", "openai")
+
+    def test_hedge_pool_covers_every_admitted_request(self):
+        assert HEDGE_MAX_WORKERS >= 2 * ADMISSION_MAX_CONCURRENT
+
+    def test_no_hedge_without_enough_samples(self):
+        primary, fallback = StubLLM("groq", delay=0.01), StubLLM("openai")
+        router = _router(primary, fallback, hedge=True)
+
+        assert router.call("hi") == "groq"
+        assert router.hedged_calls == 0
+
+
+class TestUsageAttribution:
+    """Test cases for recording usage under the model that answered."""
+
+    def test_failover_usage_recorded_under_the_fallback_model(self):
+        accountant = TokenAccountant()
+        router = _router(StubLLM("groq/llama3", fail=True), StubLLM("openai/gpt-4o-mini"))
+        llm = RoutedLLM(model="groq/llama3", router=router, accountant=accountant)
+
+        with token_accounting_scope("KTI", "natural_language"):
+            assert llm.call("hi") == "openai/gpt-4o-mini"
+
+        calls = {row["model"]: row["calls"] for row in accountant.report(("model",))}
+        assert calls == {"openai/gpt-4o-mini": 1}
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the mock Telegram service's cached chat access index.
+"""
+
+from tests.mock_telegram.backend.mock_telegram_service import (
+    ChatType,
+    MemberRole,
+    MockChat,
+    MockTelegramService,
+    MockUser,
+)
+
+USER_ID = 9001
+MAIN_CHAT_ID = 2001
+LEADERSHIP_CHAT_ID = 2002
+
+
+def _service(role=MemberRole.PLAYER):
+    service = MockTelegramService()
+    service._add_user(MockUser(id=USER_ID, username="access_test", first_name="Access", role=role))
+    return service
+
+
+class TestChatAccessIndex:
+    """Test cases for invalidating cached accessible chats."""
+
+    def test_access_is_cached_until_membership_changes(self):
+        service = _service()
+
+        first = service.get_accessible_chat_ids(USER_ID)
+
+        assert service.get_accessible_chat_ids(USER_ID) is first
+        assert MAIN_CHAT_ID in first and LEADERSHIP_CHAT_ID not in first
+
+    def test_replacing_a_chat_invalidates_cached_access(self):
+        service = _service()
+        service.get_accessible_chat_ids(USER_ID)
+        chat_count = len(service.chats)
+
+        # Same number of chats, but the leadership chat is now open to everyone
+        service._add_chat(
+            MockChat(id=LEADERSHIP_CHAT_ID, type=ChatType.GROUP, title="Open", is_main_chat=True)
+        )
+
+        assert len(service.chats) == chat_count
+        assert LEADERSHIP_CHAT_ID in service.get_accessible_chat_ids(USER_ID)
+
+    def test_demoted_user_loses_the_leadership_chat(self):
+        service = _service(role=MemberRole.LEADERSHIP)
+        assert LEADERSHIP_CHAT_ID in service.get_accessible_chat_ids(USER_ID)
+
+        service._add_user(
+            MockUser(id=USER_ID, username="access_test", first_name="Access", role=MemberRole.PLAYER)
+        )
+
+        assert LEADERSHIP_CHAT_ID not in service.get_accessible_chat_ids(USER_ID)
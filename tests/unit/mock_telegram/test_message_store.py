@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the mock Telegram service's indexed message store.
+"""
+
+from types import SimpleNamespace
+
+from tests.mock_telegram.backend.message_store import IndexedMessageStore
+
+
+def _message(message_id, chat_id):
+    return SimpleNamespace(message_id=message_id, chat=SimpleNamespace(id=chat_id))
+
+
+def _fill(store, chat_ids, start=1):
+    message_id = start
+    for chat_id in chat_ids:
+        store.append(_message(message_id, chat_id))
+        message_id += 1
+    return message_id
+
+
+class TestEviction:
+    """Test cases for the per-chat and global bounds."""
+
+    def test_per_chat_cap_defaults_below_global_cap(self):
+        store = IndexedMessageStore(max_messages=1000)
+
+        assert store.max_messages_per_chat < store.max_messages
+
+    def test_busy_chat_evicts_only_its_own_oldest_messages(self):
+        store = IndexedMessageStore(max_messages=10, max_messages_per_chat=3)
+        _fill(store, [1, 2, 2, 2, 2])
+
+        assert [m.message_id for m in store.get_chat_messages(2)] == [3, 4, 5]
+        assert [m.message_id for m in store.get_chat_messages(1)] == [1]
+        assert len(store) == 4
+
+    def test_many_chats_are_bounded_globally(self):
+        store = IndexedMessageStore(max_messages=5, max_messages_per_chat=3)
+        _fill(store, range(100, 108))
+
+        assert len(store) == 5
+        assert [m.message_id for m in store.get_recent(limit=0)] == [4, 5, 6, 7, 8]
+        # The oldest chats are dropped entirely once their last message is evicted
+        assert store.get_chat_messages(100) == []
+        assert store.stats()["chats"] == 5
+        assert store.stats()["evicted"] == 3
+
+    def test_length_counts_retained_messages_across_chats(self):
+        store = IndexedMessageStore(max_messages=6, max_messages_per_chat=2)
+        _fill(store, [1, 1, 1, 2, 2, 3])
+
+        assert len(store) == sum(len(store.get_chat_messages(chat, limit=0)) for chat in (1, 2, 3))
+        assert len(store) == len(list(store)) == 5
+
+
+class TestReads:
+    """Test cases for limits and cursors after eviction."""
+
+    def test_cursor_pages_forward_through_retained_messages(self):
+        store = IndexedMessageStore(max_messages=8, max_messages_per_chat=8)
+        _fill(store, [1] * 12)
+
+        first = store.get_chat_messages(1, limit=3, since_message_id=0)
+        second = store.get_chat_messages(1, limit=3, since_message_id=first[-1].message_id)
+
+        assert [m.message_id for m in first] == [5, 6, 7]
+        assert [m.message_id for m in second] == [8, 9, 10]
+
+    def test_merged_chats_respect_limit(self):
+        store = IndexedMessageStore(max_messages=20, max_messages_per_chat=5)
+        _fill(store, [1, 2, 1, 2, 3, 1])
+
+        merged = store.get_messages_for_chats([1, 2], limit=3)
+
+        assert [m.message_id for m in merged] == [3, 4, 6]
@@ -1 +0,0 @@
-# Test telegram module 
\ No newline at end of file
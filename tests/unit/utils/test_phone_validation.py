@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Unit tests for E.164 phone canonicalisation.
+"""
+
+import pytest
+
+from kickai.utils.phone_validation import (
+    LEGACY_PHONE_FORMS_LIMIT,
+    _cached_to_e164,
+    clear_phone_cache,
+    legacy_phone_forms,
+    to_e164,
+)
+
+
+class TestToE164:
+    """Test cases for to_e164 and its parse cache."""
+
+    def setup_method(self):
+        clear_phone_cache()
+
+    @pytest.mark.parametrize(
+        "phone",
+        ["07871521581", "+447871521581", "+44 7871 521581", "07871 521 581"],
+    )
+    def test_formats_canonicalise_to_same_value(self, phone):
+        """Every way of writing the same UK number maps to one E.164 string."""
+        assert to_e164(phone) == "+447871521581"
+
+    @pytest.mark.parametrize("phone", [None, "", "   ", "123", "not a number"])
+    def test_invalid_numbers_return_none(self, phone):
+        """Missing or unparseable numbers have no canonical form."""
+        assert to_e164(phone) is None
+
+    def test_repeated_lookups_are_memoised(self):
+        """Each distinct input is parsed once."""
+        for _ in range(5):
+            to_e164("07871521581")
+
+        info = _cached_to_e164.cache_info()
+        assert info.misses == 1
+        assert info.hits == 4
+
+
+class TestLegacyPhoneForms:
+    """Test cases for the phone_number formats matched before backfill."""
+
+    def setup_method(self):
+        clear_phone_cache()
+
+    def test_forms_include_the_number_as_given(self):
+        forms = legacy_phone_forms(" 07871 521 581 ")
+
+        assert forms[0] == "07871 521 581"
+        assert len(forms) == len(set(forms))
+        assert len(forms) <= LEGACY_PHONE_FORMS_LIMIT
+
+    @pytest.mark.parametrize("phone", [None, "", "   "])
+    def test_missing_number_has_no_forms(self, phone):
+        assert legacy_phone_forms(phone) == []